@@ -21,6 +21,7 @@ from agno.run.agent import (
     RunOutputEvent,
     RunPausedEvent,
     RunStartedEvent,
+    SemanticCacheHitEvent,
     ToolCallCompletedEvent,
     ToolCallStartedEvent,
 )
@@ -48,4 +49,5 @@ __all__ = [
     "ReasoningCompletedEvent",
     "ToolCallStartedEvent",
     "ToolCallCompletedEvent",
+    "SemanticCacheHitEvent",
 ]
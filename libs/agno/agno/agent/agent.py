@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -27,9 +28,8 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
-from agno.culture.manager import CultureManager
+from agno.agent.cache import SemanticCache, SemanticCacheHit, get_scope_key
 from agno.db.base import AsyncBaseDb, BaseDb, SessionType, UserMemory
-from agno.db.schemas.culture import CulturalKnowledge
 from agno.exceptions import (
     InputCheckError,
     ModelProviderError,
@@ -37,13 +37,12 @@ from agno.exceptions import (
     RunCancelledException,
     StopAgentRun,
 )
-from agno.guardrails import BaseGuardrail
-from agno.knowledge.knowledge import Knowledge
+from agno.guardrails.base import BaseGuardrail
 from agno.knowledge.types import KnowledgeFilter
 from agno.media import Audio, File, Image, Video
-from agno.memory import MemoryManager
+from agno.media_store import MediaStore
 from agno.models.base import Model
-from agno.models.message import Message, MessageReferences
+from agno.models.message import Message, MessageReferences, to_message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
@@ -64,16 +63,21 @@ from agno.run.cancel import (
 )
 from agno.run.messages import RunMessages
 from agno.run.team import TeamRunOutputEvent
+from agno.run.timing import RunPhase, RunTimings, publish_run_timings, time_phase
 from agno.session import AgentSession, SessionSummaryManager, TeamSession, WorkflowSession
 from agno.tools import Toolkit
 from agno.tools.function import Function
+from agno.tools.output import ToolOutputManager
 from agno.utils.agent import (
+    aoffload_media_from_run_output,
     await_for_background_tasks,
     await_for_background_tasks_stream,
     collect_joint_audios,
     collect_joint_files,
     collect_joint_images,
     collect_joint_videos,
+    offload_media_from_run_output,
+    resolve_media_from_messages,
     scrub_history_messages_from_run_output,
     scrub_media_from_run_output,
     scrub_tool_results_from_run_output,
@@ -81,6 +85,7 @@ from agno.utils.agent import (
     wait_for_background_tasks_stream,
 )
 from agno.utils.common import is_typed_dict, validate_typed_dict
+from agno.utils.context_budget import ContextBudget, apply_context_budget
 from agno.utils.events import (
     create_parser_model_response_completed_event,
     create_parser_model_response_started_event,
@@ -99,13 +104,14 @@ from agno.utils.events import (
     create_run_output_content_event,
     create_run_paused_event,
     create_run_started_event,
+    create_semantic_cache_hit_event,
     create_session_summary_completed_event,
     create_session_summary_started_event,
     create_tool_call_completed_event,
     create_tool_call_started_event,
     handle_event,
 )
-from agno.utils.hooks import filter_hook_args, normalize_hooks
+from agno.utils.hooks import filter_hook_args, is_session_independent_hook, normalize_hooks
 from agno.utils.knowledge import get_agentic_or_user_search_filters
 from agno.utils.log import (
     log_debug,
@@ -118,12 +124,6 @@ from agno.utils.log import (
 )
 from agno.utils.merge_dict import merge_dictionaries
 from agno.utils.message import filter_tool_calls, get_text_from_message
-from agno.utils.print_response.agent import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.utils.prompts import get_json_output_prompt, get_response_model_format_prompt
 from agno.utils.reasoning import (
     add_reasoning_metrics_to_metadata,
@@ -140,6 +140,13 @@ from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import generate_id_from_name, parse_response_model_str
 from agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    from agno.culture.manager import CultureManager
+    from agno.db.schemas.culture import CulturalKnowledge
+    from agno.knowledge.knowledge import Knowledge
+    from agno.memory import MemoryManager
+    from agno.memory.queue import MemoryExtractionQueue
+
 
 @dataclass(init=False)
 class Agent:
@@ -191,6 +198,9 @@ class Agent:
     enable_agentic_memory: bool = False
     # If True, the agent creates/updates user memories at the end of runs
     enable_user_memories: bool = False
+    # Queue coalescing the memory extraction of several runs of a user into one model call.
+    # If None, memories are extracted from each run.
+    memory_extraction_queue: Optional[MemoryExtractionQueue] = None
     # If True, the agent adds a reference to the user memories in the response
     add_memories_to_context: Optional[bool] = None
 
@@ -205,6 +215,8 @@ class Agent:
     num_history_runs: int = 3
     # Maximum number of tool calls to include from history (None = no limit)
     max_tool_calls_from_history: Optional[int] = None
+    # Token budget for the messages sent to the Model. History that does not fit is dropped, oldest turns first.
+    context_budget: Optional[ContextBudget] = None
 
     # --- Knowledge ---
     knowledge: Optional[Knowledge] = None
@@ -222,6 +234,10 @@ class Agent:
     knowledge_retriever: Optional[Callable[..., Optional[List[Union[Dict, str]]]]] = None
     references_format: Literal["json", "yaml"] = "json"
 
+    # --- Semantic Cache ---
+    # Return the response of a previous run for similar inputs, skipping the model call
+    semantic_cache: Optional[SemanticCache] = None
+
     # --- Agent Tools ---
     # A list of tools provided to the Model.
     # Tools are functions the model may generate JSON inputs for.
@@ -239,12 +255,17 @@ class Agent:
 
     # A function that acts as middleware and is called around tool calls.
     tool_hooks: Optional[List[Callable]] = None
+    # Stores tool outputs that are too large for the context, and adds tools to read them
+    tool_output_manager: Optional[ToolOutputManager] = None
 
     # --- Agent Hooks ---
     # Functions called right after agent-session is loaded, before processing starts
     pre_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None
     # Functions called after output is generated but before the response is returned
     post_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None
+    # Run the pre-hooks concurrently in arun(). Pre-hooks that don't take the session, its state or the dependencies
+    # (like guardrails) also run while the session is loaded. Pre-hooks must not rely on each other's input changes.
+    concurrent_pre_hooks: bool = False
 
     # --- Agent Reasoning ---
     # Enable reasoning by working through the problem step by step.
@@ -268,6 +289,8 @@ class Agent:
     send_media_to_model: bool = True
     # If True, store media in run output
     store_media: bool = True
+    # Store media content in this MediaStore and keep only content references in the stored runs
+    media_store: Optional[MediaStore] = None
     # If True, store tool results in run output
     store_tool_messages: bool = True
     # If True, store history messages in run output
@@ -358,6 +381,8 @@ class Agent:
     # Persist the events on the run response
     store_events: bool = False
     events_to_skip: Optional[List[RunEvent]] = None
+    # Record the time spent in each phase of the run (session read, model calls, tool calls...) on RunOutput.timings
+    record_timings: bool = False
 
     # --- If this Agent is part of a team ---
     # If this Agent is part of a team, this is the role of the agent in the team
@@ -416,13 +441,16 @@ class Agent:
         enable_agentic_memory: bool = False,
         enable_user_memories: bool = False,
         add_memories_to_context: Optional[bool] = None,
+        memory_extraction_queue: Optional[MemoryExtractionQueue] = None,
         enable_session_summaries: bool = False,
         add_session_summary_to_context: Optional[bool] = None,
         session_summary_manager: Optional[SessionSummaryManager] = None,
         add_history_to_context: bool = False,
         num_history_runs: int = 3,
         max_tool_calls_from_history: Optional[int] = None,
+        context_budget: Optional[ContextBudget] = None,
         store_media: bool = True,
+        media_store: Optional[MediaStore] = None,
         store_tool_messages: bool = True,
         store_history_messages: bool = True,
         knowledge: Optional[Knowledge] = None,
@@ -431,13 +459,16 @@ class Agent:
         add_knowledge_to_context: bool = False,
         knowledge_retriever: Optional[Callable[..., Optional[List[Union[Dict, str]]]]] = None,
         references_format: Literal["json", "yaml"] = "json",
+        semantic_cache: Optional[SemanticCache] = None,
         metadata: Optional[Dict[str, Any]] = None,
         tools: Optional[Sequence[Union[Toolkit, Callable, Function, Dict]]] = None,
         tool_call_limit: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
+        tool_output_manager: Optional[ToolOutputManager] = None,
         pre_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None,
         post_hooks: Optional[Union[List[Callable[..., Any]], List[BaseGuardrail]]] = None,
+        concurrent_pre_hooks: bool = False,
         reasoning: bool = False,
         reasoning_model: Optional[Model] = None,
         reasoning_agent: Optional[Agent] = None,
@@ -482,6 +513,7 @@ class Agent:
         stream_intermediate_steps: Optional[bool] = None,
         store_events: bool = False,
         events_to_skip: Optional[List[RunEvent]] = None,
+        record_timings: bool = False,
         role: Optional[str] = None,
         culture_manager: Optional[CultureManager] = None,
         enable_agentic_culture: bool = False,
@@ -515,6 +547,7 @@ class Agent:
         self.memory_manager = memory_manager
         self.enable_agentic_memory = enable_agentic_memory
         self.enable_user_memories = enable_user_memories
+        self.memory_extraction_queue = memory_extraction_queue
         self.add_memories_to_context = add_memories_to_context
 
         self.session_summary_manager = session_summary_manager
@@ -524,8 +557,10 @@ class Agent:
         self.add_history_to_context = add_history_to_context
         self.num_history_runs = num_history_runs
         self.max_tool_calls_from_history = max_tool_calls_from_history
+        self.context_budget = context_budget
 
         self.store_media = store_media
+        self.media_store = media_store
         self.store_tool_messages = store_tool_messages
         self.store_history_messages = store_history_messages
 
@@ -535,6 +570,7 @@ class Agent:
         self.add_knowledge_to_context = add_knowledge_to_context
         self.knowledge_retriever = knowledge_retriever
         self.references_format = references_format
+        self.semantic_cache = semantic_cache
 
         self.metadata = metadata
 
@@ -542,10 +578,12 @@ class Agent:
         self.tool_call_limit = tool_call_limit
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
+        self.tool_output_manager = tool_output_manager
 
         # Initialize hooks with backward compatibility
         self.pre_hooks = pre_hooks
         self.post_hooks = post_hooks
+        self.concurrent_pre_hooks = concurrent_pre_hooks
 
         self.reasoning = reasoning
         self.reasoning_model = reasoning_model
@@ -601,6 +639,7 @@ class Agent:
         self.events_to_skip = events_to_skip
         if self.events_to_skip is None:
             self.events_to_skip = [RunEvent.run_content]
+        self.record_timings = record_timings
 
         self.culture_manager = culture_manager
         self.enable_agentic_culture = enable_agentic_culture
@@ -731,6 +770,8 @@ class Agent:
             log_warning("Database not provided. Cultural knowledge will not be stored.")
 
         if self.culture_manager is None:
+            from agno.culture.manager import CultureManager
+
             self.culture_manager = CultureManager(model=self.model, db=self.db)
         else:
             if self.culture_manager.model is None:
@@ -748,6 +789,8 @@ class Agent:
             log_warning("Database not provided. Memories will not be stored.")
 
         if self.memory_manager is None:
+            from agno.memory import MemoryManager
+
             self.memory_manager = MemoryManager(model=self.model, db=self.db)
         else:
             if self.memory_manager.model is None:
@@ -908,6 +951,27 @@ class Agent:
             # Consume the generator without yielding
             deque(pre_hook_iterator, maxlen=0)
 
+        # Return the response cached for a similar input, skipping the model call
+        semantic_cache_entry = self._get_semantic_cache_entry(
+            run_input,
+            user_id=user_id,
+            knowledge_filters=knowledge_filters,
+            add_history_to_context=add_history_to_context,
+            add_session_state_to_context=add_session_state_to_context,
+            add_dependencies_to_context=add_dependencies_to_context,
+        )
+        if semantic_cache_entry is not None:
+            semantic_cache_hit = self.semantic_cache.lookup(*semantic_cache_entry)  # type: ignore
+            self._set_semantic_cache_metrics(run_response, semantic_cache_hit)
+            if semantic_cache_hit is not None:
+                try:
+                    self._apply_semantic_cache_hit(run_response, run_input, semantic_cache_hit)
+                    run_response.status = RunStatus.completed
+                    self._cleanup_and_store(run_response=run_response, session=session, user_id=user_id)
+                    return run_response
+                finally:
+                    cleanup_run(run_response.run_id)  # type: ignore
+
         # 2. Determine tools for model
         self._determine_tools_for_model(
             model=self.model,
@@ -948,10 +1012,14 @@ class Agent:
         memory_future = None
         # 4. Start memory creation in background thread if memory manager is enabled and agentic memory is disabled
         if run_messages.user_message is not None and self.memory_manager is not None and not self.enable_agentic_memory:
-            log_debug("Starting memory creation in background thread.")
-            memory_future = self.background_executor.submit(
-                self._make_memories, run_messages=run_messages, user_id=user_id
-            )
+            if self.memory_extraction_queue is not None:
+                # Queueing the turn is cheap, the queue runs the extraction on its own workers
+                self._make_memories(run_messages=run_messages, user_id=user_id)
+            else:
+                log_debug("Starting memory creation in background thread.")
+                memory_future = self.background_executor.submit(
+                    self._make_memories, run_messages=run_messages, user_id=user_id
+                )
 
         # Start cultural knowledge creation on a separate thread (runs concurrently with the main execution loop)
         cultural_knowledge_future = None
@@ -1004,7 +1072,9 @@ class Agent:
             # We should break out of the run function
             if any(tool_call.is_paused for tool_call in run_response.tools or []):
                 wait_for_background_tasks(
-                    memory_future=memory_future, cultural_knowledge_future=cultural_knowledge_future
+                    memory_future=memory_future,
+                    cultural_knowledge_future=cultural_knowledge_future,
+                    run_response=run_response,
                 )
 
                 return self._handle_agent_run_paused(run_response=run_response, session=session, user_id=user_id)
@@ -1035,7 +1105,11 @@ class Agent:
             raise_if_cancelled(run_response.run_id)  # type: ignore
 
             # 11. Wait for background memory creation and cultural knowledge creation
-            wait_for_background_tasks(memory_future=memory_future, cultural_knowledge_future=cultural_knowledge_future)
+            wait_for_background_tasks(
+                memory_future=memory_future,
+                cultural_knowledge_future=cultural_knowledge_future,
+                run_response=run_response,
+            )
 
             # 12. Create session summary
             if self.session_summary_manager is not None:
@@ -1046,6 +1120,11 @@ class Agent:
                 except Exception as e:
                     log_warning(f"Error in session summary creation: {str(e)}")
 
+            # Cache the response for similar inputs
+            if semantic_cache_entry is not None and run_response.content is not None:
+                query, scope_key = semantic_cache_entry
+                self.semantic_cache.store(query, run_response, scope_key)  # type: ignore
+
             run_response.status = RunStatus.completed
 
             # 13. Cleanup and store the run response and session
@@ -1127,6 +1206,31 @@ class Agent:
             for event in pre_hook_iterator:
                 yield event
 
+        # Return the response cached for a similar input, skipping the model call
+        semantic_cache_entry = self._get_semantic_cache_entry(
+            run_input,
+            user_id=user_id,
+            knowledge_filters=knowledge_filters,
+            add_history_to_context=add_history_to_context,
+            add_session_state_to_context=add_session_state_to_context,
+            add_dependencies_to_context=add_dependencies_to_context,
+        )
+        if semantic_cache_entry is not None:
+            semantic_cache_hit = self.semantic_cache.lookup(*semantic_cache_entry)  # type: ignore
+            self._set_semantic_cache_metrics(run_response, semantic_cache_hit)
+            if semantic_cache_hit is not None:
+                try:
+                    self._apply_semantic_cache_hit(run_response, run_input, semantic_cache_hit)
+                    run_response.status = RunStatus.completed
+                    events = self._get_semantic_cache_hit_events(run_response, semantic_cache_hit, stream_events)
+                    self._cleanup_and_store(run_response=run_response, session=session, user_id=user_id)
+                    yield from events
+                    if yield_run_response:
+                        yield run_response
+                    return
+                finally:
+                    cleanup_run(run_response.run_id)  # type: ignore
+
         # 2. Determine tools for model
         self._determine_tools_for_model(
             model=self.model,
@@ -1167,10 +1271,14 @@ class Agent:
         memory_future = None
         # 4. Start memory creation in background thread if memory manager is enabled and agentic memory is disabled
         if run_messages.user_message is not None and self.memory_manager is not None and not self.enable_agentic_memory:
-            log_debug("Starting memory creation in background thread.")
-            memory_future = self.background_executor.submit(
-                self._make_memories, run_messages=run_messages, user_id=user_id
-            )
+            if self.memory_extraction_queue is not None:
+                # Queueing the turn is cheap, the queue runs the extraction on its own workers
+                self._make_memories(run_messages=run_messages, user_id=user_id)
+            else:
+                log_debug("Starting memory creation in background thread.")
+                memory_future = self.background_executor.submit(
+                    self._make_memories, run_messages=run_messages, user_id=user_id
+                )
 
         # Start cultural knowledge creation on a separate thread (runs concurrently with the main execution loop)
         cultural_knowledge_future = None
@@ -1330,6 +1438,11 @@ class Agent:
                         store_events=self.store_events,
                     )
 
+            # Cache the response for similar inputs
+            if semantic_cache_entry is not None and run_response.content is not None:
+                query, scope_key = semantic_cache_entry
+                self.semantic_cache.store(query, run_response, scope_key)  # type: ignore
+
             # Create the run completed event
             completed_event = handle_event(  # type: ignore
                 create_run_completed_event(from_run_response=run_response),
@@ -1476,6 +1589,8 @@ class Agent:
         # Normalise hook & guardails
         if not self._hooks_normalised:
             if self.pre_hooks:
+                if self.concurrent_pre_hooks:
+                    log_warning("concurrent_pre_hooks only applies to arun(), run() executes the pre-hooks in order")
                 self.pre_hooks = normalize_hooks(self.pre_hooks)
             if self.post_hooks:
                 self.post_hooks = normalize_hooks(self.post_hooks)
@@ -1499,8 +1614,11 @@ class Agent:
             files=file_artifacts,
         )
 
+        run_timings = RunTimings() if self.record_timings else None
+
         # Read existing session from database
-        agent_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
+        with time_phase(run_timings, RunPhase.session_read):
+            agent_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=agent_session)
 
         # Initialize session state
@@ -1570,6 +1688,7 @@ class Agent:
             agent_name=self.name,
             metadata=metadata,
             input=run_input,
+            timings=run_timings,
         )
 
         run_response.model = self.model.id if self.model is not None else None
@@ -1708,43 +1827,92 @@ class Agent:
         # Register run for cancellation tracking
         register_run(run_response.run_id)  # type: ignore
 
-        # 1. Read or create session. Reads from the database if provided.
-        agent_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
-
-        # 2. Update metadata and session state
-        self._update_metadata(session=agent_session)
-        # Initialize session state
-        session_state = self._initialize_session_state(
-            session_state=session_state or {}, user_id=user_id, session_id=session_id, run_id=run_response.run_id
+        run_input = cast(RunInput, run_response.input)
+        # Start the pre-hooks that don't need the session, to run them while the session is loaded
+        pre_hooks, early_pre_hooks_task = self._astart_session_independent_pre_hooks(
+            run_response=run_response, run_input=run_input, metadata=metadata, user_id=user_id, debug_mode=debug_mode
         )
-        # Update session state from DB
-        if session_state is not None:
-            session_state = self._load_session_state(session=agent_session, session_state=session_state)
-
-        # 3. Resolve dependencies
-        if dependencies is not None:
-            await self._aresolve_run_dependencies(dependencies=dependencies)
 
-        # 4. Execute pre-hooks
-        run_input = cast(RunInput, run_response.input)
-        self.model = cast(Model, self.model)
-        if self.pre_hooks is not None:
-            # Can modify the run input
-            pre_hook_iterator = self._aexecute_pre_hooks(
-                hooks=self.pre_hooks,  # type: ignore
-                run_response=run_response,
-                run_input=run_input,
-                session_state=session_state,
-                dependencies=dependencies,
-                metadata=metadata,
-                session=agent_session,
-                user_id=user_id,
-                debug_mode=debug_mode,
-                **kwargs,
+        try:
+            # 1. Read or create session. Reads from the database if provided.
+            with time_phase(run_response, RunPhase.session_read):
+                agent_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
+
+            # 2. Update metadata and session state
+            self._update_metadata(session=agent_session)
+            # Initialize session state
+            session_state = self._initialize_session_state(
+                session_state=session_state or {}, user_id=user_id, session_id=session_id, run_id=run_response.run_id
             )
-            # Consume the async iterator without yielding
-            async for _ in pre_hook_iterator:
-                pass
+            # Update session state from DB
+            if session_state is not None:
+                session_state = self._load_session_state(session=agent_session, session_state=session_state)
+
+            # 3. Resolve dependencies
+            if dependencies is not None:
+                await self._aresolve_run_dependencies(dependencies=dependencies)
+
+            # 4. Execute pre-hooks
+            self.model = cast(Model, self.model)
+            if early_pre_hooks_task is not None:
+                await early_pre_hooks_task
+            if self.concurrent_pre_hooks and pre_hooks:
+                await self._aexecute_pre_hooks_concurrently(
+                    hooks=pre_hooks,  # type: ignore
+                    run_response=run_response,
+                    run_input=run_input,
+                    session_state=session_state,
+                    dependencies=dependencies,
+                    metadata=metadata,
+                    session=agent_session,
+                    user_id=user_id,
+                    debug_mode=debug_mode,
+                    **kwargs,
+                )
+            elif pre_hooks is not None:
+                # Can modify the run input
+                pre_hook_iterator = self._aexecute_pre_hooks(
+                    hooks=pre_hooks,  # type: ignore
+                    run_response=run_response,
+                    run_input=run_input,
+                    session_state=session_state,
+                    dependencies=dependencies,
+                    metadata=metadata,
+                    session=agent_session,
+                    user_id=user_id,
+                    debug_mode=debug_mode,
+                    **kwargs,
+                )
+                # Consume the async iterator without yielding
+                async for _ in pre_hook_iterator:
+                    pass
+        except BaseException:
+            if early_pre_hooks_task is not None:
+                early_pre_hooks_task.cancel()
+            # The run ends here, e.g. when an input check fails
+            cleanup_run(run_response.run_id)  # type: ignore
+            raise
+
+        # Return the response cached for a similar input, skipping the model call
+        semantic_cache_entry = await self._aget_semantic_cache_entry(
+            run_input,
+            user_id=user_id,
+            knowledge_filters=knowledge_filters,
+            add_history_to_context=add_history_to_context,
+            add_session_state_to_context=add_session_state_to_context,
+            add_dependencies_to_context=add_dependencies_to_context,
+        )
+        if semantic_cache_entry is not None:
+            semantic_cache_hit = await self.semantic_cache.alookup(*semantic_cache_entry)  # type: ignore
+            self._set_semantic_cache_metrics(run_response, semantic_cache_hit)
+            if semantic_cache_hit is not None:
+                try:
+                    self._apply_semantic_cache_hit(run_response, run_input, semantic_cache_hit)
+                    run_response.status = RunStatus.completed
+                    await self._acleanup_and_store(run_response=run_response, session=agent_session, user_id=user_id)
+                    return run_response
+                finally:
+                    cleanup_run(run_response.run_id)  # type: ignore
 
         # 5. Determine tools for model
         self.model = cast(Model, self.model)
@@ -1784,8 +1952,6 @@ class Agent:
         # 7. Start memory creation as a background task (runs concurrently with the main execution)
         memory_task = None
         if run_messages.user_message is not None and self.memory_manager is not None and not self.enable_agentic_memory:
-            import asyncio
-
             log_debug("Starting memory creation in background task.")
             memory_task = asyncio.create_task(self._amake_memories(run_messages=run_messages, user_id=user_id))
 
@@ -1796,8 +1962,6 @@ class Agent:
             and self.culture_manager is not None
             and self.update_cultural_knowledge
         ):
-            import asyncio
-
             log_debug("Starting cultural knowledge creation in background thread.")
             cultural_knowledge_task = asyncio.create_task(self._acreate_cultural_knowledge(run_messages=run_messages))
 
@@ -1820,6 +1984,7 @@ class Agent:
                 tool_call_limit=self.tool_call_limit,
                 response_format=response_format,
                 send_media_to_model=self.send_media_to_model,
+                run_response=run_response,
             )
 
             # Check for cancellation after model call
@@ -1841,7 +2006,7 @@ class Agent:
             # We should break out of the run function
             if any(tool_call.is_paused for tool_call in run_response.tools or []):
                 await await_for_background_tasks(
-                    memory_task=memory_task, cultural_knowledge_task=cultural_knowledge_task
+                    memory_task=memory_task, cultural_knowledge_task=cultural_knowledge_task, run_response=run_response
                 )
                 return await self._ahandle_agent_run_paused(
                     run_response=run_response, session=agent_session, user_id=user_id
@@ -1873,7 +2038,9 @@ class Agent:
             raise_if_cancelled(run_response.run_id)  # type: ignore
 
             # 14. Wait for background memory creation
-            await await_for_background_tasks(memory_task=memory_task, cultural_knowledge_task=cultural_knowledge_task)
+            await await_for_background_tasks(
+                memory_task=memory_task, cultural_knowledge_task=cultural_knowledge_task, run_response=run_response
+            )
 
             # 15. Create session summary
             if self.session_summary_manager is not None:
@@ -1884,6 +2051,11 @@ class Agent:
                 except Exception as e:
                     log_warning(f"Error in session summary creation: {str(e)}")
 
+            # Cache the response for similar inputs
+            if semantic_cache_entry is not None and run_response.content is not None:
+                query, scope_key = semantic_cache_entry
+                await self.semantic_cache.astore(query, run_response, scope_key)  # type: ignore
+
             run_response.status = RunStatus.completed
 
             # 16. Cleanup and store the run response and session
@@ -1910,8 +2082,6 @@ class Agent:
         finally:
             # Cancel the memory task if it's still running
             if memory_task is not None and not memory_task.done():
-                import asyncio
-
                 memory_task.cancel()
                 try:
                     await memory_task
@@ -1919,8 +2089,6 @@ class Agent:
                     pass
             # Cancel the cultural knowledge task if it's still running
             if cultural_knowledge_task is not None and not cultural_knowledge_task.done():
-                import asyncio
-
                 cultural_knowledge_task.cancel()
                 try:
                     await cultural_knowledge_task
@@ -1975,42 +2143,97 @@ class Agent:
                 store_events=self.store_events,
             )
 
-        # 1. Read or create session. Reads from the database if provided.
-        agent_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
-
-        # 2. Update metadata and session state
-        self._update_metadata(session=agent_session)
-        # Initialize session state
-        session_state = self._initialize_session_state(
-            session_state=session_state or {}, user_id=user_id, session_id=session_id, run_id=run_response.run_id
+        run_input = cast(RunInput, run_response.input)
+        # Start the pre-hooks that don't need the session, to run them while the session is loaded
+        pre_hooks, early_pre_hooks_task = self._astart_session_independent_pre_hooks(
+            run_response=run_response, run_input=run_input, metadata=metadata, user_id=user_id, debug_mode=debug_mode
         )
-        # Update session state from DB
-        if session_state is not None:
-            session_state = self._load_session_state(session=agent_session, session_state=session_state)
-
-        # 3. Resolve dependencies
-        if dependencies is not None:
-            await self._aresolve_run_dependencies(dependencies=dependencies)
 
-        # 4. Execute pre-hooks
-        run_input = cast(RunInput, run_response.input)
-        self.model = cast(Model, self.model)
-        if self.pre_hooks is not None:
-            # Can modify the run input
-            pre_hook_iterator = self._aexecute_pre_hooks(
-                hooks=self.pre_hooks,  # type: ignore
-                run_response=run_response,
-                run_input=run_input,
-                session=agent_session,
-                session_state=session_state,
-                dependencies=dependencies,
-                metadata=metadata,
-                user_id=user_id,
-                debug_mode=debug_mode,
-                **kwargs,
+        try:
+            # 1. Read or create session. Reads from the database if provided.
+            with time_phase(run_response, RunPhase.session_read):
+                agent_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
+
+            # 2. Update metadata and session state
+            self._update_metadata(session=agent_session)
+            # Initialize session state
+            session_state = self._initialize_session_state(
+                session_state=session_state or {}, user_id=user_id, session_id=session_id, run_id=run_response.run_id
             )
-            async for event in pre_hook_iterator:
-                yield event
+            # Update session state from DB
+            if session_state is not None:
+                session_state = self._load_session_state(session=agent_session, session_state=session_state)
+
+            # 3. Resolve dependencies
+            if dependencies is not None:
+                await self._aresolve_run_dependencies(dependencies=dependencies)
+
+            # 4. Execute pre-hooks
+            self.model = cast(Model, self.model)
+            if early_pre_hooks_task is not None:
+                for event in await early_pre_hooks_task:
+                    yield event
+            if self.concurrent_pre_hooks and pre_hooks:
+                pre_hook_events = await self._aexecute_pre_hooks_concurrently(
+                    hooks=pre_hooks,  # type: ignore
+                    run_response=run_response,
+                    run_input=run_input,
+                    session_state=session_state,
+                    dependencies=dependencies,
+                    metadata=metadata,
+                    session=agent_session,
+                    user_id=user_id,
+                    debug_mode=debug_mode,
+                    **kwargs,
+                )
+                for event in pre_hook_events:
+                    yield event
+            elif pre_hooks is not None:
+                # Can modify the run input
+                pre_hook_iterator = self._aexecute_pre_hooks(
+                    hooks=pre_hooks,  # type: ignore
+                    run_response=run_response,
+                    run_input=run_input,
+                    session=agent_session,
+                    session_state=session_state,
+                    dependencies=dependencies,
+                    metadata=metadata,
+                    user_id=user_id,
+                    debug_mode=debug_mode,
+                    **kwargs,
+                )
+                async for event in pre_hook_iterator:
+                    yield event
+        except BaseException:
+            if early_pre_hooks_task is not None:
+                early_pre_hooks_task.cancel()
+            raise
+
+        # Return the response cached for a similar input, skipping the model call
+        semantic_cache_entry = await self._aget_semantic_cache_entry(
+            run_input,
+            user_id=user_id,
+            knowledge_filters=knowledge_filters,
+            add_history_to_context=add_history_to_context,
+            add_session_state_to_context=add_session_state_to_context,
+            add_dependencies_to_context=add_dependencies_to_context,
+        )
+        if semantic_cache_entry is not None:
+            semantic_cache_hit = await self.semantic_cache.alookup(*semantic_cache_entry)  # type: ignore
+            self._set_semantic_cache_metrics(run_response, semantic_cache_hit)
+            if semantic_cache_hit is not None:
+                try:
+                    self._apply_semantic_cache_hit(run_response, run_input, semantic_cache_hit)
+                    run_response.status = RunStatus.completed
+                    events = self._get_semantic_cache_hit_events(run_response, semantic_cache_hit, stream_events)
+                    await self._acleanup_and_store(run_response=run_response, session=agent_session, user_id=user_id)
+                    for event in events:
+                        yield event
+                    if yield_run_response:
+                        yield run_response
+                    return
+                finally:
+                    cleanup_run(run_response.run_id)  # type: ignore
 
         # 5. Determine tools for model
         self.model = cast(Model, self.model)
@@ -2211,6 +2434,11 @@ class Agent:
                         store_events=self.store_events,
                     )
 
+            # Cache the response for similar inputs
+            if semantic_cache_entry is not None and run_response.content is not None:
+                query, scope_key = semantic_cache_entry
+                await self.semantic_cache.astore(query, run_response, scope_key)  # type: ignore
+
             # Create the run completed event
             completed_event = handle_event(
                 create_run_completed_event(from_run_response=run_response),
@@ -2448,6 +2676,7 @@ class Agent:
             agent_name=self.name,
             metadata=metadata,
             input=run_input,
+            timings=RunTimings() if self.record_timings else None,
         )
 
         run_response.model = self.model.id if self.model is not None else None
@@ -2696,12 +2925,11 @@ class Agent:
             if updated_tools is None:
                 raise ValueError("Updated tools are required to continue a run from a run_id.")
 
-            runs = agent_session.runs
-            run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
+            run_response = agent_session.get_run(run_id=run_id)  # type: ignore
             if run_response is None:
                 raise RuntimeError(f"No runs found for run ID {run_id}")
             run_response.tools = updated_tools
-            input = run_response.messages or []
+            input = [to_message(message) for message in run_response.messages or []]
         else:
             raise ValueError("Either run_response or run_id must be provided.")
 
@@ -2849,6 +3077,7 @@ class Agent:
                 functions=self._functions_for_model,
                 tool_choice=self.tool_choice,
                 tool_call_limit=self.tool_call_limit,
+                run_response=run_response,
             )
 
             # Check for cancellation after model processing
@@ -3344,12 +3573,11 @@ class Agent:
             if updated_tools is None:
                 raise ValueError("Updated tools are required to continue a run from a run_id.")
 
-            runs = agent_session.runs
-            run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
+            run_response = agent_session.get_run(run_id=run_id)  # type: ignore
             if run_response is None:
                 raise RuntimeError(f"No runs found for run ID {run_id}")
             run_response.tools = updated_tools
-            input = run_response.messages or []
+            input = [to_message(message) for message in run_response.messages or []]
         else:
             raise ValueError("Either run_response or run_id must be provided.")
 
@@ -3389,6 +3617,7 @@ class Agent:
                 functions=self._functions_for_model,
                 tool_choice=self.tool_choice,
                 tool_call_limit=self.tool_call_limit,
+                run_response=run_response,
             )
             # Check for cancellation after model call
             raise_if_cancelled(run_response.run_id)  # type: ignore
@@ -3535,12 +3764,11 @@ class Agent:
             if updated_tools is None:
                 raise ValueError("Updated tools are required to continue a run from a run_id.")
 
-            runs = agent_session.runs
-            run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
+            run_response = agent_session.get_run(run_id=run_id)  # type: ignore
             if run_response is None:
                 raise RuntimeError(f"No runs found for run ID {run_id}")
             run_response.tools = updated_tools
-            input = run_response.messages or []
+            input = [to_message(message) for message in run_response.messages or []]
         else:
             raise ValueError("Either run_response or run_id must be provided.")
 
@@ -3787,7 +4015,8 @@ class Agent:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                hook(**filtered_args)
+                with time_phase(run_response, RunPhase.pre_hooks, hook=hook.__name__):
+                    hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_response,
@@ -3857,11 +4086,12 @@ class Agent:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                if asyncio.iscoroutinefunction(hook):
-                    await hook(**filtered_args)
-                else:
-                    # Synchronous function
-                    hook(**filtered_args)
+                with time_phase(run_response, RunPhase.pre_hooks, hook=hook.__name__):
+                    if asyncio.iscoroutinefunction(hook):
+                        await hook(**filtered_args)
+                    else:
+                        # Synchronous function
+                        hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_response,
@@ -3886,6 +4116,74 @@ class Agent:
         # Update the input on the run_response
         run_response.input = run_input
 
+    async def _aexecute_pre_hooks_concurrently(
+        self,
+        hooks: List[Callable[..., Any]],
+        run_response: RunOutput,
+        run_input: RunInput,
+        session: Optional[AgentSession] = None,
+        **kwargs: Any,
+    ) -> List[RunOutputEvent]:
+        """
+        Execute multiple pre-hook functions concurrently. The first input check error cancels the other pre-hooks.
+
+        Returns the events of the pre-hooks, in the order of the hooks.
+        """
+
+        async def execute_pre_hook(hook: Callable[..., Any]) -> List[RunOutputEvent]:
+            return [
+                event
+                async for event in self._aexecute_pre_hooks(
+                    hooks=[hook],
+                    run_response=run_response,
+                    run_input=run_input,
+                    session=session,  # type: ignore
+                    **kwargs,
+                )
+            ]
+
+        tasks = [asyncio.create_task(execute_pre_hook(hook)) for hook in hooks]
+        try:
+            hook_events = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return [event for events in hook_events for event in events]
+
+    def _astart_session_independent_pre_hooks(
+        self,
+        run_response: RunOutput,
+        run_input: RunInput,
+        metadata: Optional[Dict[str, Any]] = None,
+        user_id: Optional[str] = None,
+        debug_mode: Optional[bool] = None,
+    ) -> Tuple[Optional[List[Any]], Optional["asyncio.Task[List[RunOutputEvent]]"]]:
+        """
+        With concurrent_pre_hooks, start the pre-hooks that don't need the session in a task.
+
+        Returns the pre-hooks left to run once the session is loaded, and the task, if any.
+        """
+        if not self.concurrent_pre_hooks or self.pre_hooks is None:
+            return self.pre_hooks, None
+
+        # Guardrails were normalized to their check functions by arun()
+        hooks = cast(List[Callable[..., Any]], self.pre_hooks)
+        early_pre_hooks = [hook for hook in hooks if is_session_independent_hook(hook)]
+        pre_hooks = [hook for hook in hooks if hook not in early_pre_hooks]
+        if not early_pre_hooks:
+            return pre_hooks, None
+        early_pre_hooks_task = asyncio.create_task(
+            self._aexecute_pre_hooks_concurrently(
+                hooks=early_pre_hooks,
+                run_response=run_response,
+                run_input=run_input,
+                metadata=metadata,
+                user_id=user_id,
+                debug_mode=debug_mode,
+            )
+        )
+        return pre_hooks, early_pre_hooks_task
+
     def _execute_post_hooks(
         self,
         hooks: Optional[List[Callable[..., Any]]],
@@ -3929,7 +4227,8 @@ class Agent:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                hook(**filtered_args)
+                with time_phase(run_output, RunPhase.post_hooks, hook=hook.__name__):
+                    hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_output,
@@ -3992,10 +4291,11 @@ class Agent:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                if asyncio.iscoroutinefunction(hook):
-                    await hook(**filtered_args)
-                else:
-                    hook(**filtered_args)
+                with time_phase(run_output, RunPhase.post_hooks, hook=hook.__name__):
+                    if asyncio.iscoroutinefunction(hook):
+                        await hook(**filtered_args)
+                    else:
+                        hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_output,
@@ -4112,6 +4412,163 @@ class Agent:
 
         log_debug(f"Agent Run Paused: {run_response.run_id}", center=True, symbol="*")
 
+    def _get_semantic_cache_query(self, run_input: RunInput) -> Optional[str]:
+        """The input looked up in the semantic cache. Only text inputs without media are cached."""
+        if self.semantic_cache is None:
+            return None
+        if run_input.images or run_input.videos or run_input.audios or run_input.files:
+            return None
+        if not isinstance(run_input.input_content, str) or not run_input.input_content.strip():
+            return None
+        return run_input.input_content
+
+    def _get_semantic_cache_scope_key(
+        self,
+        user_id: Optional[str] = None,
+        knowledge_filters: Optional[Dict[str, Any]] = None,
+        knowledge_version: Optional[str] = None,
+    ) -> str:
+        return get_scope_key(
+            agent_id=self.id,
+            user_id=user_id,
+            knowledge_filters=knowledge_filters or self.knowledge_filters,
+            knowledge_version=knowledge_version,
+            output_schema=self.output_schema.__name__ if self.output_schema is not None else None,
+        )
+
+    def _uses_conversation_context(
+        self,
+        add_history_to_context: Optional[bool] = None,
+        add_session_state_to_context: Optional[bool] = None,
+        add_dependencies_to_context: Optional[bool] = None,
+    ) -> bool:
+        """Whether the context of a run depends on the session or the user memories, not only on the input"""
+        return any(
+            (
+                add_history_to_context if add_history_to_context is not None else self.add_history_to_context,
+                add_session_state_to_context
+                if add_session_state_to_context is not None
+                else self.add_session_state_to_context,
+                add_dependencies_to_context
+                if add_dependencies_to_context is not None
+                else self.add_dependencies_to_context,
+                self.add_memories_to_context,
+                self.add_session_summary_to_context,
+                self.read_chat_history,
+                self.search_session_history,
+            )
+        )
+
+    def _get_semantic_cache_entry(
+        self,
+        run_input: RunInput,
+        user_id: Optional[str] = None,
+        knowledge_filters: Optional[Dict[str, Any]] = None,
+        add_history_to_context: Optional[bool] = None,
+        add_session_state_to_context: Optional[bool] = None,
+        add_dependencies_to_context: Optional[bool] = None,
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Return the query and scope key of the run in the semantic cache, or None if the run is not cacheable.
+        Runs whose context includes the chat history, session state, dependencies or memories are not cached, as their
+        response depends on more than the input.
+        """
+        query = self._get_semantic_cache_query(run_input)
+        if query is None:
+            return None
+        if self._uses_conversation_context(
+            add_history_to_context, add_session_state_to_context, add_dependencies_to_context
+        ):
+            return None
+        knowledge_version = None
+        if self.knowledge is not None and hasattr(self.knowledge, "get_version"):
+            knowledge_version = self.knowledge.get_version()
+        return query, self._get_semantic_cache_scope_key(user_id, knowledge_filters, knowledge_version)
+
+    async def _aget_semantic_cache_entry(
+        self,
+        run_input: RunInput,
+        user_id: Optional[str] = None,
+        knowledge_filters: Optional[Dict[str, Any]] = None,
+        add_history_to_context: Optional[bool] = None,
+        add_session_state_to_context: Optional[bool] = None,
+        add_dependencies_to_context: Optional[bool] = None,
+    ) -> Optional[Tuple[str, str]]:
+        query = self._get_semantic_cache_query(run_input)
+        if query is None:
+            return None
+        if self._uses_conversation_context(
+            add_history_to_context, add_session_state_to_context, add_dependencies_to_context
+        ):
+            return None
+        knowledge_version = None
+        if self.knowledge is not None and hasattr(self.knowledge, "aget_version"):
+            knowledge_version = await self.knowledge.aget_version()
+        return query, self._get_semantic_cache_scope_key(user_id, knowledge_filters, knowledge_version)
+
+    def _set_semantic_cache_metrics(self, run_response: RunOutput, hit: Optional[SemanticCacheHit]) -> None:
+        if run_response.metrics is None:
+            return
+        if run_response.metrics.additional_metrics is None:
+            run_response.metrics.additional_metrics = {}
+        semantic_cache_metrics: Dict[str, Any] = {"hit": hit is not None}
+        if hit is not None:
+            semantic_cache_metrics["similarity"] = round(hit.similarity, 4)
+            semantic_cache_metrics["cached_run_id"] = hit.run_output.get("run_id")
+        run_response.metrics.additional_metrics["semantic_cache"] = semantic_cache_metrics
+
+    def _apply_semantic_cache_hit(self, run_response: RunOutput, run_input: RunInput, hit: SemanticCacheHit) -> None:
+        """Fill the run response with the cached response, as if the model had generated it"""
+        import json
+
+        self.model = cast(Model, self.model)
+        content = hit.run_output.get("content")
+        run_response.content = content
+        run_response.content_type = hit.run_output.get("content_type") or "str"
+        run_response.reasoning_content = hit.run_output.get("reasoning_content")
+        run_response.messages = [
+            Message(role=self.user_message_role, content=run_input.input_content),
+            Message(
+                role=self.model.assistant_message_role,
+                content=content if content is None or isinstance(content, str) else json.dumps(content),
+            ),
+        ]
+        self._set_semantic_cache_metrics(run_response, hit)
+        self._convert_response_to_structured_format(run_response)
+        log_debug(f"Semantic cache hit for run {run_response.run_id} (similarity {hit.similarity:.4f})")
+
+    def _get_semantic_cache_hit_events(
+        self, run_response: RunOutput, hit: SemanticCacheHit, stream_events: bool = False
+    ) -> List[RunOutputEvent]:
+        """The events streamed for a run served from the semantic cache"""
+        events: List[RunOutputEvent] = []
+        if stream_events:
+            events.append(create_run_started_event(run_response))
+            events.append(
+                create_semantic_cache_hit_event(
+                    run_response, similarity=hit.similarity, cached_run_id=hit.run_output.get("run_id")
+                )
+            )
+        events.append(
+            create_run_output_content_event(
+                run_response,
+                content=run_response.content,
+                content_type=run_response.content_type,
+                reasoning_content=run_response.reasoning_content,
+            )
+        )
+        if stream_events:
+            events.append(create_run_completed_event(from_run_response=run_response))
+        return [
+            handle_event(  # type: ignore
+                event,
+                run_response,
+                events_to_skip=self.events_to_skip,  # type: ignore
+                store_events=self.store_events,
+            )
+            for event in events
+        ]
+
     def _convert_response_to_structured_format(self, run_response: Union[RunOutput, ModelResponse]):
         # Convert the response to the structured format if needed
         if self.output_schema is not None and not isinstance(run_response.content, self.output_schema):
@@ -4199,6 +4656,7 @@ class Agent:
         for call_result in self.model.run_function_call(
             function_call=function_call,
             function_call_results=function_call_results,
+            run_response=run_response,
         ):
             if isinstance(call_result, ModelResponse):
                 if call_result.event == ModelResponseEvent.tool_call_started.value:
@@ -4254,6 +4712,7 @@ class Agent:
             function_calls=[function_call],
             function_call_results=function_call_results,
             skip_pause_check=True,
+            run_response=run_response,
         ):
             if isinstance(call_result, ModelResponse):
                 if call_result.event == ModelResponseEvent.tool_call_started.value:
@@ -5018,11 +5477,53 @@ class Agent:
                 message=run_messages.user_message.get_content_string()
             )
 
+    def _parse_memory_messages(self, extra_messages: Sequence[Union[Message, Dict]]) -> List[Message]:
+        """Parse the extra messages of a run, and drop the ones with empty content"""
+        parsed_messages = []
+        for _im in extra_messages:
+            if isinstance(_im, Message):
+                parsed_messages.append(_im)
+            elif isinstance(_im, dict):
+                try:
+                    parsed_messages.append(Message(**_im))
+                except Exception as e:
+                    log_warning(f"Failed to validate message during memory update: {e}")
+            else:
+                log_warning(f"Unsupported message type: {type(_im)}")
+                continue
+
+        # Filter out messages with empty content before passing to memory manager
+        return [
+            msg
+            for msg in parsed_messages
+            if msg.content and (not isinstance(msg.content, str) or msg.content.strip() != "")
+        ]
+
+    def _get_memory_turn_messages(self, run_messages: RunMessages) -> List[Message]:
+        """Messages of a run to queue for memory extraction"""
+        turn_messages = []
+        user_message_str = (
+            run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+        )
+        if user_message_str is not None and user_message_str.strip() != "":
+            turn_messages.append(Message(role="user", content=user_message_str))
+        if run_messages.extra_messages is not None and len(run_messages.extra_messages) > 0:
+            turn_messages.extend(self._parse_memory_messages(run_messages.extra_messages))
+        return turn_messages
+
     def _make_memories(
         self,
         run_messages: RunMessages,
         user_id: Optional[str] = None,
     ):
+        if self.memory_extraction_queue is not None and self.memory_manager is not None:
+            turn_messages = self._get_memory_turn_messages(run_messages)
+            if len(turn_messages) > 0:
+                self.memory_extraction_queue.submit(
+                    self.memory_manager, turn_messages, user_id=user_id, agent_id=self.id
+                )
+            return
+
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
         )
@@ -5035,25 +5536,7 @@ class Agent:
             )
 
         if run_messages.extra_messages is not None and len(run_messages.extra_messages) > 0:
-            parsed_messages = []
-            for _im in run_messages.extra_messages:
-                if isinstance(_im, Message):
-                    parsed_messages.append(_im)
-                elif isinstance(_im, dict):
-                    try:
-                        parsed_messages.append(Message(**_im))
-                    except Exception as e:
-                        log_warning(f"Failed to validate message during memory update: {e}")
-                else:
-                    log_warning(f"Unsupported message type: {type(_im)}")
-                    continue
-
-            # Filter out messages with empty content before passing to memory manager
-            non_empty_messages = [
-                msg
-                for msg in parsed_messages
-                if msg.content and (not isinstance(msg.content, str) or msg.content.strip() != "")
-            ]
+            non_empty_messages = self._parse_memory_messages(run_messages.extra_messages)
             if len(non_empty_messages) > 0 and self.memory_manager is not None:
                 self.memory_manager.create_user_memories(messages=non_empty_messages, user_id=user_id, agent_id=self.id)  # type: ignore
             else:
@@ -5064,6 +5547,14 @@ class Agent:
         run_messages: RunMessages,
         user_id: Optional[str] = None,
     ):
+        if self.memory_extraction_queue is not None and self.memory_manager is not None:
+            turn_messages = self._get_memory_turn_messages(run_messages)
+            if len(turn_messages) > 0:
+                await self.memory_extraction_queue.asubmit(
+                    self.memory_manager, turn_messages, user_id=user_id, agent_id=self.id
+                )
+            return
+
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
         )
@@ -5076,25 +5567,7 @@ class Agent:
             )
 
         if run_messages.extra_messages is not None and len(run_messages.extra_messages) > 0:
-            parsed_messages = []
-            for _im in run_messages.extra_messages:
-                if isinstance(_im, Message):
-                    parsed_messages.append(_im)
-                elif isinstance(_im, dict):
-                    try:
-                        parsed_messages.append(Message(**_im))
-                    except Exception as e:
-                        log_warning(f"Failed to validate message during memory update: {e}")
-                else:
-                    log_warning(f"Unsupported message type: {type(_im)}")
-                    continue
-
-            # Filter out messages with empty content before passing to memory manager
-            non_empty_messages = [
-                msg
-                for msg in parsed_messages
-                if msg.content and (not isinstance(msg.content, str) or msg.content.strip() != "")
-            ]
+            non_empty_messages = self._parse_memory_messages(run_messages.extra_messages)
             if len(non_empty_messages) > 0 and self.memory_manager is not None:
                 await self.memory_manager.acreate_user_memories(  # type: ignore
                     messages=non_empty_messages, user_id=user_id, agent_id=self.id
@@ -5201,6 +5674,15 @@ class Agent:
         if self.enable_agentic_state:
             agent_tools.append(Function(name="update_session_state", entrypoint=self._update_session_state_tool))
 
+        # Add tools for reading tool outputs that were too large for the context
+        if self.tool_output_manager is not None:
+            agent_tools.append(
+                self.tool_output_manager.get_toolkit(
+                    self.tool_output_manager.get_namespace(run_id=run_response.run_id, session_id=session.session_id)
+                )
+            )
+            self._rebuild_tools = True
+
         # Add tools for accessing knowledge
         if self.knowledge is not None or self.knowledge_retriever is not None:
             # Check if knowledge retriever is an async function but used in sync mode
@@ -5299,6 +5781,15 @@ class Agent:
         if self.enable_agentic_state:
             agent_tools.append(Function(name="update_session_state", entrypoint=self._update_session_state_tool))
 
+        # Add tools for reading tool outputs that were too large for the context
+        if self.tool_output_manager is not None:
+            agent_tools.append(
+                self.tool_output_manager.get_toolkit(
+                    self.tool_output_manager.get_namespace(run_id=run_response.run_id, session_id=session.session_id)
+                )
+            )
+            self._rebuild_tools = True
+
         # Add tools for accessing knowledge
         if self.knowledge is not None or self.knowledge_retriever is not None:
             # Check if knowledge retriever is an async function but used in sync mode
@@ -5456,6 +5947,11 @@ class Agent:
                 func._files = joint_files
                 func._audios = joint_audios
                 func._videos = joint_videos
+                if self.tool_output_manager is not None:
+                    func._tool_output_manager = self.tool_output_manager
+                    func._tool_output_namespace = self.tool_output_manager.get_namespace(
+                        run_id=run_response.run_id, session_id=session.session_id
+                    )
 
     async def _adetermine_tools_for_model(
         self,
@@ -5578,6 +6074,11 @@ class Agent:
                 func._files = joint_files
                 func._audios = joint_audios
                 func._videos = joint_videos
+                if self.tool_output_manager is not None:
+                    func._tool_output_manager = self.tool_output_manager
+                    func._tool_output_namespace = self.tool_output_manager.get_namespace(
+                        run_id=run_response.run_id, session_id=session.session_id
+                    )
 
     def _model_should_return_structured_output(self):
         self.model = cast(Model, self.model)
@@ -6374,6 +6875,7 @@ class Agent:
         dependencies: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         add_session_state_to_context: Optional[bool] = None,
+        run_response: Optional[RunOutput] = None,
     ) -> Optional[Message]:
         """Return the system message for the Agent.
 
@@ -6572,7 +7074,8 @@ class Agent:
                 self._set_memory_manager()
                 _memory_manager_not_set = True
 
-            user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
+            with time_phase(run_response, RunPhase.memory_retrieval):
+                user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
 
             if user_memories and len(user_memories) > 0:
                 system_message_content += "You have access to user info and preferences from previous interactions that you can use to personalize your response:\n\n"
@@ -6715,6 +7218,7 @@ class Agent:
         user_id: Optional[str] = None,
         dependencies: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        run_response: Optional[RunOutput] = None,
     ) -> Optional[Message]:
         """Return the system message for the Agent.
 
@@ -6913,10 +7417,11 @@ class Agent:
                 self._set_memory_manager()
                 _memory_manager_not_set = True
 
-            if self._has_async_db():
-                user_memories = await self.memory_manager.aget_user_memories(user_id=user_id)  # type: ignore
-            else:
-                user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
+            with time_phase(run_response, RunPhase.memory_retrieval):
+                if self._has_async_db():
+                    user_memories = await self.memory_manager.aget_user_memories(user_id=user_id)  # type: ignore
+                else:
+                    user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
 
             if user_memories and len(user_memories) > 0:
                 system_message_content += "You have access to user info and preferences from previous interactions that you can use to personalize your response:\n\n"
@@ -7161,9 +7666,10 @@ class Agent:
                     try:
                         retrieval_timer = Timer()
                         retrieval_timer.start()
-                        docs_from_knowledge = self.get_relevant_docs_from_knowledge(
-                            query=user_msg_content, filters=knowledge_filters, **kwargs
-                        )
+                        with time_phase(run_response, RunPhase.knowledge_retrieval):
+                            docs_from_knowledge = self.get_relevant_docs_from_knowledge(
+                                query=user_msg_content, filters=knowledge_filters, **kwargs
+                            )
                         if docs_from_knowledge is not None:
                             references = MessageReferences(
                                 query=user_msg_content,
@@ -7222,6 +7728,61 @@ class Agent:
                     **kwargs,
                 )
 
+    def _get_history_messages_for_run(self, history: List[Message]) -> List[Message]:
+        """Copy the history messages to add to this run, tagged as history and with tool calls filtered"""
+        from copy import deepcopy
+
+        # Load media stored by reference so it can be sent to the model
+        resolve_media_from_messages(history)
+
+        # Create a deep copy of the history messages to avoid modifying the original messages
+        history_copy = [deepcopy(msg) for msg in history]
+
+        # Tag each message as coming from history
+        for _msg in history_copy:
+            _msg.from_history = True
+
+        # Filter tool calls from history if limit is set (before adding to run_messages)
+        if self.max_tool_calls_from_history is not None:
+            filter_tool_calls(history_copy, self.max_tool_calls_from_history)
+
+        log_debug(f"Adding {len(history_copy)} messages from history")
+        return history_copy
+
+    def _add_history_within_context_budget(
+        self, run_messages: RunMessages, history: List[Message], history_index: int, run_response: RunOutput
+    ) -> None:
+        """Add the history that fits in the context budget, and drop the additional input if it does not fit"""
+        if self.context_budget is None:
+            return
+
+        # Additional input messages sit between the system message and the history
+        additional_start = 1 if run_messages.system_message is not None else 0
+        additional_messages = run_messages.messages[additional_start:history_index]
+        required_messages = run_messages.messages[:additional_start] + run_messages.messages[history_index:]
+
+        selected_history, include_additional, breakdown = apply_context_budget(
+            budget=self.context_budget,
+            required_messages=required_messages,
+            history=history,
+            additional_messages=additional_messages,
+            model_id=self.model.id if self.model is not None else None,
+        )
+
+        if not include_additional and len(additional_messages) > 0:
+            del run_messages.messages[additional_start:history_index]
+            history_index = additional_start
+            if run_messages.extra_messages is not None:
+                dropped_ids = {id(m) for m in additional_messages}
+                run_messages.extra_messages = [m for m in run_messages.extra_messages if id(m) not in dropped_ids]
+        if len(selected_history) > 0:
+            run_messages.messages[history_index:history_index] = self._get_history_messages_for_run(selected_history)
+
+        if run_response.metrics is not None:
+            if run_response.metrics.additional_metrics is None:
+                run_response.metrics.additional_metrics = {}
+            run_response.metrics.additional_metrics["context_budget"] = breakdown
+
     def _get_run_messages(
         self,
         *,
@@ -7270,14 +7831,16 @@ class Agent:
         run_messages = RunMessages()
 
         # 1. Add system message to run_messages
-        system_message = self.get_system_message(
-            session=session,
-            session_state=session_state,
-            user_id=user_id,
-            dependencies=dependencies,
-            metadata=metadata,
-            add_session_state_to_context=add_session_state_to_context,
-        )
+        with time_phase(run_response, RunPhase.system_message):
+            system_message = self.get_system_message(
+                session=session,
+                session_state=session_state,
+                user_id=user_id,
+                dependencies=dependencies,
+                metadata=metadata,
+                add_session_state_to_context=add_session_state_to_context,
+                run_response=run_response,
+            )
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -7310,9 +7873,9 @@ class Agent:
                     run_response.additional_input.extend(messages_to_add_to_run_response)
 
         # 3. Add history to run_messages
+        history: List[Message] = []
+        history_index = len(run_messages.messages)
         if add_history_to_context:
-            from copy import deepcopy
-
             # Only skip messages from history when system_message_role is NOT a standard conversation role.
             # Standard conversation roles ("user", "assistant", "tool") should never be filtered
             # to preserve conversation continuity.
@@ -7320,27 +7883,15 @@ class Agent:
                 self.system_message_role if self.system_message_role not in ["user", "assistant", "tool"] else None
             )
 
-            history: List[Message] = session.get_messages_from_last_n_runs(
+            history = session.get_messages_from_last_n_runs(
                 last_n=self.num_history_runs,
                 skip_role=skip_role,
                 agent_id=self.id if self.team_id is not None else None,
             )
 
-            if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
-
-                # Filter tool calls from history if limit is set (before adding to run_messages)
-                if self.max_tool_calls_from_history is not None:
-                    filter_tool_calls(history_copy, self.max_tool_calls_from_history)
-
-                log_debug(f"Adding {len(history_copy)} messages from history")
-
-                run_messages.messages += history_copy
+            # With a context budget, history is added once the size of the input is known
+            if len(history) > 0 and self.context_budget is None:
+                run_messages.messages += self._get_history_messages_for_run(history)
 
         # 4. Add user message to run_messages
         user_message: Optional[Message] = None
@@ -7425,6 +7976,9 @@ class Agent:
             run_messages.user_message = user_message
             run_messages.messages.append(user_message)
 
+        if self.context_budget is not None:
+            self._add_history_within_context_budget(run_messages, history, history_index, run_response)
+
         return run_messages
 
     async def _aget_run_messages(
@@ -7475,13 +8029,15 @@ class Agent:
         run_messages = RunMessages()
 
         # 1. Add system message to run_messages
-        system_message = await self.aget_system_message(
-            session=session,
-            session_state=session_state,
-            user_id=user_id,
-            dependencies=dependencies,
-            metadata=metadata,
-        )
+        with time_phase(run_response, RunPhase.system_message):
+            system_message = await self.aget_system_message(
+                session=session,
+                session_state=session_state,
+                user_id=user_id,
+                dependencies=dependencies,
+                metadata=metadata,
+                run_response=run_response,
+            )
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -7514,30 +8070,18 @@ class Agent:
                     run_response.additional_input.extend(messages_to_add_to_run_response)
 
         # 3. Add history to run_messages
+        history: List[Message] = []
+        history_index = len(run_messages.messages)
         if add_history_to_context:
-            from copy import deepcopy
-
-            history: List[Message] = session.get_messages_from_last_n_runs(
+            history = session.get_messages_from_last_n_runs(
                 last_n=self.num_history_runs,
                 skip_role=self.system_message_role,
                 agent_id=self.id if self.team_id is not None else None,
             )
 
-            if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
-
-                # Filter tool calls from history if limit is set (before adding to run_messages)
-                if self.max_tool_calls_from_history is not None:
-                    filter_tool_calls(history_copy, self.max_tool_calls_from_history)
-
-                log_debug(f"Adding {len(history_copy)} messages from history")
-
-                run_messages.messages += history_copy
+            # With a context budget, history is added once the size of the input is known
+            if len(history) > 0 and self.context_budget is None:
+                run_messages.messages += self._get_history_messages_for_run(history)
 
         # 4. Add user message to run_messages
         user_message: Optional[Message] = None
@@ -7616,6 +8160,9 @@ class Agent:
             run_messages.user_message = user_message
             run_messages.messages.append(user_message)
 
+        if self.context_budget is not None:
+            self._add_history_within_context_budget(run_messages, history, history_index, run_response)
+
         return run_messages
 
     def _get_continue_run_messages(
@@ -7773,6 +8320,8 @@ class Agent:
                 return None
 
             if num_documents is None:
+                from agno.knowledge.knowledge import Knowledge
+
                 if isinstance(self.knowledge, Knowledge):
                     num_documents = self.knowledge.max_results
 
@@ -9042,7 +9591,7 @@ class Agent:
             Returns:
                 str: A string indicating the status of the task.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = self.memory_manager.update_memory_task(task=task, user_id=user_id)
 
             return response
@@ -9058,7 +9607,7 @@ class Agent:
             Returns:
                 str: A string indicating the status of the task.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = await self.memory_manager.aupdate_memory_task(task=task, user_id=user_id)
             return response
 
@@ -9072,14 +9621,14 @@ class Agent:
     def _get_update_cultural_knowledge_function(self, async_mode: bool = False) -> Function:
         def update_cultural_knowledge(task: str) -> str:
             """Use this function to update a cultural knowledge."""
-            self.culture_manager = cast(CultureManager, self.culture_manager)
+            self.culture_manager = cast("CultureManager", self.culture_manager)
             response = self.culture_manager.update_culture_task(task=task)
 
             return response
 
         async def aupdate_cultural_knowledge(task: str) -> str:
             """Use this function to update a cultural knowledge asynchronously."""
-            self.culture_manager = cast(CultureManager, self.culture_manager)
+            self.culture_manager = cast("CultureManager", self.culture_manager)
             response = await self.culture_manager.aupdate_culture_task(task=task)
             return response
 
@@ -9409,8 +9958,8 @@ class Agent:
                                         msg_pair_id = f"{user_content}:{assistant_content}"
                                         if msg_pair_id not in seen_message_pairs:
                                             seen_message_pairs.add(msg_pair_id)
-                                            all_messages.append(Message.model_validate(user_msg))
-                                            all_messages.append(Message.model_validate(assistant_msg))
+                                            all_messages.append(to_message(user_msg))
+                                            all_messages.append(to_message(assistant_msg))
                                             message_count += 1
                                     except Exception as e:
                                         log_warning(f"Error processing message pair: {e}")
@@ -9472,8 +10021,8 @@ class Agent:
                                         msg_pair_id = f"{user_content}:{assistant_content}"
                                         if msg_pair_id not in seen_message_pairs:
                                             seen_message_pairs.add(msg_pair_id)
-                                            all_messages.append(Message.model_validate(user_msg))
-                                            all_messages.append(Message.model_validate(assistant_msg))
+                                            all_messages.append(to_message(user_msg))
+                                            all_messages.append(to_message(assistant_msg))
                                             message_count += 1
                                     except Exception as e:
                                         log_warning(f"Error processing message pair: {e}")
@@ -9545,6 +10094,8 @@ class Agent:
         if stream_events is None:
             stream_events = False if self.stream_events is None else self.stream_events
 
+        from agno.utils.print_response.agent import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 agent=self,
@@ -9653,6 +10204,8 @@ class Agent:
         if stream_events is None:
             stream_events = False if self.stream_events is None else self.stream_events
 
+        from agno.utils.print_response.agent import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 agent=self,
@@ -9830,6 +10383,10 @@ class Agent:
         #  Scrub the stored run based on storage flags
         self._scrub_run_output_for_storage(run_response)
 
+        # Drop the tool outputs stored during the run, if they are scoped to it and the run won't continue
+        if self.tool_output_manager is not None and not run_response.is_paused:
+            self.tool_output_manager.release_run(run_response.run_id)
+
         # Stop the timer for the Run duration
         if run_response.metrics:
             run_response.metrics.stop_timer()
@@ -9848,15 +10405,31 @@ class Agent:
         # Calculate session metrics
         self._update_session_metrics(session=session, run_response=run_response)
 
-        # Save session to memory
-        self.save_session(session=session)
+        # Add the session summary if its background update finished, so it is stored with the session
+        if self.session_summary_manager is not None:
+            self.session_summary_manager.merge_background_summary(session)
+
+        # Save session to memory. The stored run can't include the time spent writing it.
+        with time_phase(run_response, RunPhase.session_write):
+            self.save_session(session=session)
+
+        # Export the timings of the run
+        publish_run_timings(run_response)
 
     async def _acleanup_and_store(
         self, run_response: RunOutput, session: AgentSession, user_id: Optional[str] = None
     ) -> None:
+        # Move the media to the media store off the event loop, the scrub below skips the media already stored
+        if self.store_media and self.media_store is not None:
+            await aoffload_media_from_run_output(run_response, self.media_store)
+
         #  Scrub the stored run based on storage flags
         self._scrub_run_output_for_storage(run_response)
 
+        # Drop the tool outputs stored during the run, if they are scoped to it and the run won't continue
+        if self.tool_output_manager is not None and not run_response.is_paused:
+            self.tool_output_manager.release_run(run_response.run_id)
+
         # Stop the timer for the Run duration
         if run_response.metrics:
             run_response.metrics.stop_timer()
@@ -9875,8 +10448,16 @@ class Agent:
         # Calculate session metrics
         self._update_session_metrics(session=session, run_response=run_response)
 
-        # Save session to storage
-        await self.asave_session(session=session)
+        # Add the session summary if its background update finished, so it is stored with the session
+        if self.session_summary_manager is not None:
+            self.session_summary_manager.merge_background_summary(session)
+
+        # Save session to storage. The stored run can't include the time spent writing it.
+        with time_phase(run_response, RunPhase.session_write):
+            await self.asave_session(session=session)
+
+        # Export the timings of the run
+        publish_run_timings(run_response)
 
     def _scrub_run_output_for_storage(self, run_response: RunOutput) -> None:
         """
@@ -9884,6 +10465,8 @@ class Agent:
         """
         if not self.store_media:
             scrub_media_from_run_output(run_response)
+        elif self.media_store is not None:
+            offload_media_from_run_output(run_response, self.media_store)
 
         if not self.store_tool_messages:
             scrub_tool_results_from_run_output(run_response)
@@ -0,0 +1,185 @@
+import json
+import math
+import re
+from dataclasses import dataclass
+from hashlib import sha256
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from agno.run.agent import RunOutput
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.knowledge.document import Document
+    from agno.knowledge.embedder import Embedder
+    from agno.vectordb.base import VectorDb
+
+# Metadata keys of the cache entries stored in the vector db
+SCOPE_KEY = "semantic_cache_scope"
+RUN_OUTPUT_KEY = "semantic_cache_run_output"
+EMBEDDING_KEY = "semantic_cache_embedding"
+CREATED_AT_KEY = "semantic_cache_created_at"
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, collapse whitespace and strip surrounding punctuation"""
+    query = re.sub(r"\s+", " ", query.lower()).strip()
+    return query.strip(" .,!?;:")
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def get_scope_key(**scope: Any) -> str:
+    """Hash the values an entry is scoped by, like the agent, user and knowledge filters"""
+    return sha256(json.dumps(scope, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class SemanticCacheHit:
+    # Content of the cached run output
+    run_output: Dict[str, Any]
+    similarity: float
+    # Normalized input the cached response was generated for
+    query: str
+
+
+@dataclass
+class SemanticCache:
+    """
+    Returns the response of a previous run for inputs similar to the current one, skipping the model call.
+
+    Entries are stored in any VectorDb and scoped, so a response is only reused for the same agent, user,
+    knowledge filters and knowledge content.
+    """
+
+    vector_db: "VectorDb"
+    # Embedder used to measure similarity. Defaults to the embedder of the vector db.
+    embedder: Optional["Embedder"] = None
+    # Minimum cosine similarity between inputs to return a cached response
+    similarity_threshold: float = 0.95
+    # Time-to-live for entries in seconds. None means entries don't expire.
+    ttl: Optional[int] = None
+    # Number of candidates fetched from the vector db
+    num_candidates: int = 3
+    # Function normalizing the input before embedding
+    normalize: Callable[[str], str] = normalize_query
+
+    def __post_init__(self):
+        if self.embedder is None:
+            self.embedder = getattr(self.vector_db, "embedder", None)
+        if self.embedder is None:
+            raise ValueError("SemanticCache requires an embedder, or a vector_db with an embedder")
+        if not self.vector_db.exists():
+            self.vector_db.create()
+
+    def __deepcopy__(self, memo):
+        # The cache is shared by all copies of an agent
+        return self
+
+    def _select_hit(self, documents: List["Document"], embedding: List[float]) -> Optional[SemanticCacheHit]:
+        best_hit: Optional[SemanticCacheHit] = None
+        for document in documents:
+            meta_data = document.meta_data or {}
+            created_at = meta_data.get(CREATED_AT_KEY)
+            if self.ttl is not None and created_at is not None and created_at + self.ttl < time():
+                continue
+            try:
+                cached_embedding = json.loads(meta_data[EMBEDDING_KEY])
+                run_output = json.loads(meta_data[RUN_OUTPUT_KEY])
+            except (KeyError, TypeError, ValueError):
+                continue
+            similarity = cosine_similarity(embedding, cached_embedding)
+            if similarity >= self.similarity_threshold and (best_hit is None or similarity > best_hit.similarity):
+                best_hit = SemanticCacheHit(run_output=run_output, similarity=similarity, query=document.content)
+        return best_hit
+
+    def _get_search_db(self, normalized_query: str, embedding: List[float]) -> "VectorDb":
+        """The vector db to search, reusing the embedding of the query if the vector db embeds with the same embedder"""
+        from agno.knowledge.embedder.precomputed import with_precomputed_embeddings
+
+        if getattr(self.vector_db, "embedder", None) is not self.embedder:
+            return self.vector_db
+        return with_precomputed_embeddings(self.vector_db, {normalized_query: embedding})
+
+    def lookup(self, query: str, scope_key: str) -> Optional[SemanticCacheHit]:
+        """Return the cached response for the most similar input in scope, if it is above the threshold"""
+        normalized_query = self.normalize(query)
+        try:
+            embedding = self.embedder.get_embedding(normalized_query)  # type: ignore
+            documents = self._get_search_db(normalized_query, embedding).search(
+                normalized_query, limit=self.num_candidates, filters={SCOPE_KEY: scope_key}
+            )
+        except Exception as e:
+            log_warning(f"Semantic cache lookup failed: {e}")
+            return None
+        return self._select_hit(documents, embedding)
+
+    async def alookup(self, query: str, scope_key: str) -> Optional[SemanticCacheHit]:
+        normalized_query = self.normalize(query)
+        try:
+            embedding = await self.embedder.async_get_embedding(normalized_query)  # type: ignore
+            documents = await self._get_search_db(normalized_query, embedding).async_search(
+                normalized_query, limit=self.num_candidates, filters={SCOPE_KEY: scope_key}
+            )
+        except Exception as e:
+            log_warning(f"Semantic cache lookup failed: {e}")
+            return None
+        return self._select_hit(documents, embedding)
+
+    def _build_document(self, normalized_query: str, embedding: List[float], run_output: RunOutput, scope_key: str):
+        from agno.knowledge.document import Document
+
+        content = run_output.content
+        if isinstance(content, BaseModel):
+            content = content.model_dump_json()
+        cached_run_output = {
+            "run_id": run_output.run_id,
+            "content": content,
+            "content_type": run_output.content_type,
+            "reasoning_content": run_output.reasoning_content,
+        }
+        return Document(
+            content=normalized_query,
+            embedding=embedding,
+            meta_data={
+                SCOPE_KEY: scope_key,
+                RUN_OUTPUT_KEY: json.dumps(cached_run_output, default=str),
+                EMBEDDING_KEY: json.dumps(embedding),
+                CREATED_AT_KEY: int(time()),
+            },
+        )
+
+    def store(self, query: str, run_output: RunOutput, scope_key: str) -> None:
+        """Cache the response of a run for its input"""
+        normalized_query = self.normalize(query)
+        content_hash = get_scope_key(scope=scope_key, query=normalized_query)
+        try:
+            embedding = self.embedder.get_embedding(normalized_query)  # type: ignore
+            document = self._build_document(normalized_query, embedding, run_output, scope_key)
+            if self.vector_db.upsert_available():
+                self.vector_db.upsert(content_hash, [document], filters=document.meta_data)
+            else:
+                self.vector_db.insert(content_hash, [document], filters=document.meta_data)
+            log_debug(f"Semantic cache: stored response for run {run_output.run_id}")
+        except Exception as e:
+            log_warning(f"Semantic cache store failed: {e}")
+
+    async def astore(self, query: str, run_output: RunOutput, scope_key: str) -> None:
+        normalized_query = self.normalize(query)
+        content_hash = get_scope_key(scope=scope_key, query=normalized_query)
+        try:
+            embedding = await self.embedder.async_get_embedding(normalized_query)  # type: ignore
+            document = self._build_document(normalized_query, embedding, run_output, scope_key)
+            if self.vector_db.upsert_available():
+                await self.vector_db.async_upsert(content_hash, [document], filters=document.meta_data)
+            else:
+                await self.vector_db.async_insert(content_hash, [document], filters=document.meta_data)
+            log_debug(f"Semantic cache: stored response for run {run_output.run_id}")
+        except Exception as e:
+            log_warning(f"Semantic cache store failed: {e}")
@@ -1,7 +1,8 @@
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 
 __all__ = [
     "BaseDb",
+    "SessionProjection",
     "SessionType",
 ]
 
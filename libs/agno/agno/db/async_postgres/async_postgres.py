@@ -12,11 +12,12 @@ from agno.db.async_postgres.utils import (
     deserialize_cultural_knowledge,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_projected_session_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge,
 )
-from agno.db.base import AsyncBaseDb, SessionType
+from agno.db.base import AsyncBaseDb, SessionProjection, SessionType
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
@@ -328,6 +329,7 @@ class AsyncPostgresDb(AsyncBaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -337,6 +339,7 @@ class AsyncPostgresDb(AsyncBaseDb):
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             session_type (Optional[SessionType]): Type of session to read. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -350,7 +353,7 @@ class AsyncPostgresDb(AsyncBaseDb):
             table = await self._get_table(table_type="sessions")
 
             async with self.async_session_factory() as sess:
-                stmt = select(table).where(table.c.session_id == session_id)
+                stmt = select(*get_projected_session_columns(table, projection)).where(table.c.session_id == session_id)
 
                 if user_id is not None:
                     stmt = stmt.where(table.c.user_id == user_id)
@@ -393,6 +396,7 @@ class AsyncPostgresDb(AsyncBaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -408,6 +412,7 @@ class AsyncPostgresDb(AsyncBaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -421,7 +426,7 @@ class AsyncPostgresDb(AsyncBaseDb):
             table = await self._get_table(table_type="sessions")
 
             async with self.async_session_factory() as sess, sess.begin():
-                stmt = select(table)
+                stmt = select(*get_projected_session_columns(table, projection))
 
                 # Filtering
                 if user_id is not None:
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -17,6 +18,68 @@ class SessionType(str, Enum):
     WORKFLOW = "workflow"
 
 
+@dataclass
+class SessionProjection:
+    """
+    Parts of a session to read from the database, so reads that only need the session metadata or a few runs don't
+    load every run of the session.
+
+    Sessions read with a projection are partial and must not be saved back to the database.
+    """
+
+    # Read the runs of the session
+    runs: bool = True
+    # Read the summary of the session
+    summary: bool = True
+    # Only read the run with this ID
+    run_id: Optional[str] = None
+    # Only read the runs created in this window, as epoch seconds
+    runs_created_after: Optional[int] = None
+    runs_created_before: Optional[int] = None
+    # Only read the runs without a parent run, skipping the runs of team members and workflow steps
+    top_level_runs_only: bool = False
+    # Only read the first N runs left after the filters above
+    runs_limit: Optional[int] = None
+
+    @classmethod
+    def metadata_only(cls) -> "SessionProjection":
+        """Read the session columns without its runs and summary"""
+        return cls(runs=False, summary=False)
+
+    @classmethod
+    def summary_only(cls) -> "SessionProjection":
+        """Read the session columns and its summary, without its runs"""
+        return cls(runs=False)
+
+    @classmethod
+    def runs_window(
+        cls, created_after: Optional[int] = None, created_before: Optional[int] = None
+    ) -> "SessionProjection":
+        """Read the session columns and the runs created in the window, without its summary"""
+        return cls(summary=False, runs_created_after=created_after, runs_created_before=created_before)
+
+    @classmethod
+    def single_run(cls, run_id: str) -> "SessionProjection":
+        """Read the session columns and one run, without its summary"""
+        return cls(summary=False, run_id=run_id)
+
+    @classmethod
+    def listing(cls) -> "SessionProjection":
+        """Read the session columns and the first top-level run, which is enough to name the session in a list"""
+        return cls(summary=False, top_level_runs_only=True, runs_limit=1)
+
+    @property
+    def filters_runs(self) -> bool:
+        """True if only some of the runs of the session are read"""
+        return self.runs and (
+            self.run_id is not None
+            or self.runs_created_after is not None
+            or self.runs_created_before is not None
+            or self.top_level_runs_only
+            or self.runs_limit is not None
+        )
+
+
 class BaseDb(ABC):
     """Base abstract class for all our Database implementations."""
 
@@ -54,6 +117,7 @@ class BaseDb(ABC):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
@@ -71,6 +135,7 @@ class BaseDb(ABC):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
@@ -344,6 +409,7 @@ class AsyncBaseDb(ABC):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
@@ -361,6 +427,7 @@ class AsyncBaseDb(ABC):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
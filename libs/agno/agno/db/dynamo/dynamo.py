@@ -4,12 +4,13 @@ from datetime import date, datetime, timedelta, timezone
 from os import getenv
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.dynamo.schemas import get_table_schema_definition
 from agno.db.dynamo.utils import (
     apply_pagination,
     apply_sorting,
     build_query_filter_expression,
+    build_session_projection_expression,
     build_topic_filter_expression,
     calculate_date_metrics,
     create_table_if_not_exists,
@@ -33,6 +34,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_session_projection
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -248,6 +250,7 @@ class DynamoDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Get a session from the database as a Session object.
@@ -257,6 +260,7 @@ class DynamoDb(BaseDb):
             session_type (SessionType): The type of session to get.
             user_id (Optional[str]): The ID of the user to get the session for.
             deserialize (Optional[bool]): Whether to deserialize the session.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Optional[Session]: The session data as a Session object.
@@ -266,10 +270,12 @@ class DynamoDb(BaseDb):
         """
         try:
             table_name = self._get_table("sessions")
-            response = self.client.get_item(
-                TableName=table_name,
-                Key={"session_id": {"S": session_id}},
-            )
+            get_item_kwargs: Dict[str, Any] = {"TableName": table_name, "Key": {"session_id": {"S": session_id}}}
+            projection_expression, projected_attribute_names = build_session_projection_expression(projection)
+            if projection_expression is not None:
+                get_item_kwargs["ProjectionExpression"] = projection_expression
+                get_item_kwargs["ExpressionAttributeNames"] = projected_attribute_names
+            response = self.client.get_item(**get_item_kwargs)
 
             item = response.get("Item")
             if not item:
@@ -285,6 +291,7 @@ class DynamoDb(BaseDb):
             if not session:
                 return None
 
+            session = apply_session_projection(session, projection)
             if not deserialize:
                 return session
 
@@ -314,6 +321,7 @@ class DynamoDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         try:
             table_name = self._get_table("sessions")
@@ -367,6 +375,10 @@ class DynamoDb(BaseDb):
             }
             if filter_expression:
                 query_kwargs["FilterExpression"] = filter_expression
+            projection_expression, projected_attribute_names = build_session_projection_expression(projection)
+            if projection_expression is not None:
+                query_kwargs["ProjectionExpression"] = projection_expression
+                expression_attribute_names.update(projected_attribute_names)
             if expression_attribute_names:
                 query_kwargs["ExpressionAttributeNames"] = expression_attribute_names
 
@@ -406,6 +418,7 @@ class DynamoDb(BaseDb):
             if page:
                 sessions_data = apply_pagination(sessions_data, limit, page)
 
+            sessions_data = [apply_session_projection(session_data, projection) for session_data in sessions_data]
             if not deserialize:
                 return sessions_data, total_count
 
@@ -1,10 +1,11 @@
 import json
 import time
+from dataclasses import fields
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import SessionType
+from agno.db.base import SessionProjection, SessionType
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalRunRecord
 from agno.db.schemas.knowledge import KnowledgeRow
@@ -234,6 +235,32 @@ def merge_with_existing_session(new_session: Dict[str, Any], existing_item: Dict
     return merged_session
 
 
+def build_session_projection_expression(
+    projection: Optional[SessionProjection],
+) -> Tuple[Optional[str], Dict[str, str]]:
+    """Build the ProjectionExpression reading the session attributes included by the projection.
+
+    Returns:
+        The projection expression and its attribute names, or (None, {}) to read all attributes.
+    """
+    from agno.session import AgentSession, TeamSession, WorkflowSession
+
+    if projection is None or (projection.runs and projection.summary):
+        return None, {}
+
+    # DynamoDB projections list the attributes to read, so list every session attribute but the excluded ones
+    attributes = {"session_type"}
+    for session_class in (AgentSession, TeamSession, WorkflowSession):
+        attributes.update(session_field.name for session_field in fields(session_class))
+    if not projection.runs:
+        attributes.discard("runs")
+    if not projection.summary:
+        attributes.discard("summary")
+
+    attribute_names = {f"#projected_{name}": name for name in sorted(attributes)}
+    return ", ".join(attribute_names), attribute_names
+
+
 def merge_session_data(existing_data: Any, new_data: Any) -> Dict[str, Any]:
     """Merge session_data fields, handling JSON string conversion."""
 
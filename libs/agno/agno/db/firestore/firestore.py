@@ -3,7 +3,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.firestore.utils import (
     apply_pagination,
     apply_pagination_to_records,
@@ -21,7 +21,11 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
-from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
+from agno.db.utils import (
+    apply_session_projection,
+    deserialize_session_json_fields,
+    serialize_session_json_fields,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -257,6 +261,7 @@ class FirestoreDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Read a session from the database.
 
@@ -265,6 +270,7 @@ class FirestoreDb(BaseDb):
             session_type (SessionType): The type of session to get.
             user_id (Optional[str]): The ID of the user to get the session for.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -294,6 +300,7 @@ class FirestoreDb(BaseDb):
 
             session = deserialize_session_json_fields(result)
 
+            session = apply_session_projection(session, projection)
             if not deserialize:
                 return session
 
@@ -323,6 +330,7 @@ class FirestoreDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions.
 
@@ -338,6 +346,7 @@ class FirestoreDb(BaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
 
         Returns:
             Union[List[AgentSession], List[TeamSession], List[WorkflowSession], Tuple[List[Dict[str, Any]], int]]:
@@ -397,6 +406,7 @@ class FirestoreDb(BaseDb):
             else:
                 sessions_raw = all_sessions_raw
 
+            sessions_raw = [apply_session_projection(session, projection) for session in sessions_raw]
             if not deserialize:
                 return sessions_raw, total_count
 
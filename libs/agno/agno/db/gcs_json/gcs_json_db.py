@@ -4,7 +4,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.gcs_json.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -17,6 +17,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_session_projection
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -195,6 +196,7 @@ class GcsJsonDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
         """Read a session from the GCS JSON file.
 
@@ -203,6 +205,7 @@ class GcsJsonDb(BaseDb):
             session_type (SessionType): The type of the session to read.
             user_id (Optional[str]): The ID of the user to read the session for.
             deserialize (Optional[bool]): Whether to deserialize the session.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -224,6 +227,7 @@ class GcsJsonDb(BaseDb):
                     if session_data.get("session_type") != session_type_value:
                         continue
 
+                    session_data = apply_session_projection(session_data, projection)
                     if not deserialize:
                         return session_data
 
@@ -255,6 +259,7 @@ class GcsJsonDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions from the GCS JSON file with filtering and pagination.
 
@@ -270,6 +275,7 @@ class GcsJsonDb(BaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to deserialize the sessions.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
             create_table_if_not_found (Optional[bool]): Whether to create a file to track sessions if it doesn't exist.
 
         Returns:
@@ -321,6 +327,7 @@ class GcsJsonDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
 
+            filtered_sessions = [apply_session_projection(session, projection) for session in filtered_sessions]
             if not deserialize:
                 return filtered_sessions, total_count
 
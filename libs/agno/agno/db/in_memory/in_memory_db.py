@@ -4,7 +4,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.in_memory.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -17,6 +17,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_session_projection
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 
@@ -86,6 +87,7 @@ class InMemoryDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
         """Read a session from in-memory storage.
 
@@ -94,6 +96,7 @@ class InMemoryDb(BaseDb):
             session_type (SessionType): The type of the session to read.
             user_id (Optional[str]): The ID of the user to read the session for.
             deserialize (Optional[bool]): Whether to deserialize the session.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -112,7 +115,7 @@ class InMemoryDb(BaseDb):
                     if session_data.get("session_type") != session_type_value:
                         continue
 
-                    session_data_copy = deepcopy(session_data)
+                    session_data_copy = deepcopy(apply_session_projection(session_data, projection))
 
                     if not deserialize:
                         return session_data_copy
@@ -146,6 +149,7 @@ class InMemoryDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions from in-memory storage with filtering and pagination.
 
@@ -161,6 +165,7 @@ class InMemoryDb(BaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to deserialize the sessions.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
 
         Returns:
             Union[List[AgentSession], List[TeamSession], List[WorkflowSession], Tuple[List[Dict[str, Any]], int]]:
@@ -195,7 +200,7 @@ class InMemoryDb(BaseDb):
                 if session_data.get("session_type") != session_type_value:
                     continue
 
-                filtered_sessions.append(deepcopy(session_data))
+                filtered_sessions.append(session_data)
 
             total_count = len(filtered_sessions)
 
@@ -209,6 +214,11 @@ class InMemoryDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
 
+            # Copy only the sessions of the page, after projecting them
+            filtered_sessions = [
+                deepcopy(apply_session_projection(session, projection)) for session in filtered_sessions
+            ]
+
             if not deserialize:
                 return filtered_sessions, total_count
 
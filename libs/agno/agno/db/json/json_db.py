@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.json.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -19,6 +19,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_session_projection
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -177,6 +178,7 @@ class JsonDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
         """Read a session from the JSON file.
 
@@ -185,6 +187,7 @@ class JsonDb(BaseDb):
             session_type (SessionType): The type of the session to read.
             user_id (Optional[str]): The ID of the user to read the session for.
             deserialize (Optional[bool]): Whether to deserialize the session.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -205,6 +208,7 @@ class JsonDb(BaseDb):
                     if session_data.get("session_type") != session_type_value:
                         continue
 
+                    session_data = apply_session_projection(session_data, projection)
                     if not deserialize:
                         return session_data
 
@@ -236,6 +240,7 @@ class JsonDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions from the JSON file with filtering and pagination.
 
@@ -251,6 +256,7 @@ class JsonDb(BaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to deserialize the sessions.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
             create_table_if_not_found (Optional[bool]): Whether to create a json file to track sessions if it doesn't exist.
 
         Returns:
@@ -302,6 +308,7 @@ class JsonDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
 
+            filtered_sessions = [apply_session_projection(session, projection) for session in filtered_sessions]
             if not deserialize:
                 return filtered_sessions, total_count
 
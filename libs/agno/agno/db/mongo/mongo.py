@@ -3,7 +3,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.mongo.utils import (
     apply_pagination,
     apply_sorting,
@@ -13,6 +13,8 @@ from agno.db.mongo.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_session_excluded_fields,
+    get_session_projection_stages,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.schemas.culture import CulturalKnowledge
@@ -266,6 +268,7 @@ class MongoDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Read a session from the database.
 
@@ -274,6 +277,7 @@ class MongoDb(BaseDb):
             session_type (SessionType): The type of session to get.
             user_id (Optional[str]): The ID of the user to get the session for.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -294,7 +298,13 @@ class MongoDb(BaseDb):
             if session_type is not None:
                 query["session_type"] = session_type
 
-            result = collection.find_one(query)
+            if projection is not None and projection.filters_runs:
+                results = list(
+                    collection.aggregate([{"$match": query}, {"$limit": 1}, *get_session_projection_stages(projection)])
+                )
+                result = results[0] if results else None
+            else:
+                result = collection.find_one(query, get_session_excluded_fields(projection) or None)
             if result is None:
                 return None
 
@@ -328,6 +338,7 @@ class MongoDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions.
 
@@ -343,6 +354,7 @@ class MongoDb(BaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
             create_table_if_not_found (Optional[bool]): Whether to create the collection if it doesn't exist.
 
         Returns:
@@ -384,21 +396,34 @@ class MongoDb(BaseDb):
             # Get total count
             total_count = collection.count_documents(query)
 
-            cursor = collection.find(query)
-
-            # Sorting
             sort_criteria = apply_sorting({}, sort_by, sort_order)
-            if sort_criteria:
-                cursor = cursor.sort(sort_criteria)
-
-            # Pagination
             query_args = apply_pagination({}, limit, page)
-            if query_args.get("skip"):
-                cursor = cursor.skip(query_args["skip"])
-            if query_args.get("limit"):
-                cursor = cursor.limit(query_args["limit"])
 
-            records = list(cursor)
+            if projection is not None and projection.filters_runs:
+                # Filter the runs in an aggregation, after sorting and paginating the sessions
+                pipeline: List[Dict[str, Any]] = [{"$match": query}]
+                if sort_criteria:
+                    pipeline.append({"$sort": dict(sort_criteria)})
+                if query_args.get("skip"):
+                    pipeline.append({"$skip": query_args["skip"]})
+                if query_args.get("limit"):
+                    pipeline.append({"$limit": query_args["limit"]})
+                pipeline.extend(get_session_projection_stages(projection))
+                records = list(collection.aggregate(pipeline))
+            else:
+                cursor = collection.find(query, get_session_excluded_fields(projection) or None)
+
+                # Sorting
+                if sort_criteria:
+                    cursor = cursor.sort(sort_criteria)
+
+                # Pagination
+                if query_args.get("skip"):
+                    cursor = cursor.skip(query_args["skip"])
+                if query_args.get("limit"):
+                    cursor = cursor.limit(query_args["limit"])
+
+                records = list(cursor)
             if records is None:
                 return [] if deserialize else ([], 0)
             sessions_raw = [deserialize_session_json_fields(record) for record in records]
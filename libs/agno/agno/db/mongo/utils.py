@@ -6,6 +6,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+from agno.db.base import SessionProjection
 from agno.db.mongo.schemas import get_collection_indexes
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.utils.log import log_error, log_warning
@@ -56,6 +57,55 @@ def apply_pagination(
     return query_args
 
 
+def get_session_projection_stages(projection: Optional[SessionProjection]) -> List[Dict[str, Any]]:
+    """Get the aggregation stages applying the given projection to session documents.
+
+    Runs are filtered in the database when the projection reads only some of them.
+    """
+    if projection is None:
+        return []
+
+    stages: List[Dict[str, Any]] = []
+    if projection.filters_runs:
+        conditions: List[Dict[str, Any]] = []
+        if projection.run_id is not None:
+            conditions.append({"$eq": ["$$run.run_id", projection.run_id]})
+        if projection.top_level_runs_only:
+            conditions.append({"$eq": [{"$ifNull": ["$$run.parent_run_id", None]}, None]})
+        # Runs without a creation time are kept, as they can't be placed outside the window
+        run_created_at = {"$ifNull": ["$$run.created_at", None]}
+        if projection.runs_created_after is not None:
+            conditions.append(
+                {"$or": [{"$eq": [run_created_at, None]}, {"$gte": [run_created_at, projection.runs_created_after]}]}
+            )
+        if projection.runs_created_before is not None:
+            conditions.append(
+                {"$or": [{"$eq": [run_created_at, None]}, {"$lte": [run_created_at, projection.runs_created_before]}]}
+            )
+
+        runs: Dict[str, Any] = {
+            "$filter": {"input": {"$ifNull": ["$runs", []]}, "as": "run", "cond": {"$and": conditions}}
+        }
+        if projection.runs_limit is not None:
+            runs = {"$slice": [runs, projection.runs_limit]}
+        stages.append({"$addFields": {"runs": runs}})
+
+    excluded_fields = get_session_excluded_fields(projection)
+    if excluded_fields:
+        stages.append({"$project": excluded_fields})
+    return stages
+
+
+def get_session_excluded_fields(projection: Optional[SessionProjection]) -> Dict[str, int]:
+    """Get the fields of session documents excluded by the given projection, as a find() projection"""
+    excluded_fields: Dict[str, int] = {}
+    if projection is not None and not projection.runs:
+        excluded_fields["runs"] = 0
+    if projection is not None and not projection.summary:
+        excluded_fields["summary"] = 0
+    return excluded_fields
+
+
 # -- Metrics util methods --
 def calculate_date_metrics(date_to_process: date, sessions_data: dict) -> dict:
     """Calculate metrics for the given single date."""
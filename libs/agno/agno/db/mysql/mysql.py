@@ -5,7 +5,7 @@ from uuid import uuid4
 
 from sqlalchemy import Index, UniqueConstraint
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.mysql.schemas import get_table_schema_definition
 from agno.db.mysql.utils import (
     apply_sorting,
@@ -15,6 +15,7 @@ from agno.db.mysql.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_projected_session_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
@@ -23,6 +24,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_session_projection
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -359,6 +361,7 @@ class MySQLDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -368,6 +371,7 @@ class MySQLDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -383,7 +387,7 @@ class MySQLDb(BaseDb):
                 return None
 
             with self.Session() as sess:
-                stmt = select(table).where(table.c.session_id == session_id)
+                stmt = select(*get_projected_session_columns(table, projection)).where(table.c.session_id == session_id)
 
                 if user_id is not None:
                     stmt = stmt.where(table.c.user_id == user_id)
@@ -394,7 +398,7 @@ class MySQLDb(BaseDb):
                 if result is None:
                     return None
 
-                session = dict(result._mapping)
+                session = apply_session_projection(dict(result._mapping), projection)
 
             if not deserialize:
                 return session
@@ -425,6 +429,7 @@ class MySQLDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -441,6 +446,7 @@ class MySQLDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
             create_table_if_not_found (Optional[bool]): Whether to create the table if it doesn't exist.
 
         Returns:
@@ -457,7 +463,7 @@ class MySQLDb(BaseDb):
                 return [] if deserialize else ([], 0)
 
             with self.Session() as sess, sess.begin():
-                stmt = select(table)
+                stmt = select(*get_projected_session_columns(table, projection))
 
                 # Filtering
                 if user_id is not None:
@@ -500,7 +506,7 @@ class MySQLDb(BaseDb):
                 if not result:
                     return [] if deserialize else ([], 0)
 
-                session_dicts = [dict(row._mapping) for row in result]
+                session_dicts = [apply_session_projection(dict(row._mapping), projection) for row in result]
                 if not deserialize:
                     return session_dicts, total_count
 
@@ -3,7 +3,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.postgres.utils import (
     apply_sorting,
@@ -13,6 +13,7 @@ from agno.db.postgres.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_projected_session_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
@@ -355,6 +356,7 @@ class PostgresDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -364,6 +366,7 @@ class PostgresDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -379,7 +382,7 @@ class PostgresDb(BaseDb):
                 return None
 
             with self.Session() as sess:
-                stmt = select(table).where(table.c.session_id == session_id)
+                stmt = select(*get_projected_session_columns(table, projection)).where(table.c.session_id == session_id)
 
                 if user_id is not None:
                     stmt = stmt.where(table.c.user_id == user_id)
@@ -421,6 +424,7 @@ class PostgresDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -437,6 +441,7 @@ class PostgresDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -452,7 +457,7 @@ class PostgresDb(BaseDb):
                 return [] if deserialize else ([], 0)
 
             with self.Session() as sess, sess.begin():
-                stmt = select(table)
+                stmt = select(*get_projected_session_columns(table, projection))
 
                 # Filtering
                 if user_id is not None:
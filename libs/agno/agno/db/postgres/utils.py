@@ -7,12 +7,13 @@ from uuid import uuid4
 
 from sqlalchemy import Engine
 
+from agno.db.base import SessionProjection
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table
+    from sqlalchemy import BigInteger, Table, case, cast, func, literal_column, or_, select, type_coerce
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session
@@ -49,6 +50,61 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def get_projected_session_columns(table: Table, projection: Optional[SessionProjection] = None) -> List[Any]:
+    """Get the columns to select from the sessions table for the given projection.
+
+    Runs are filtered in the query when the projection reads only some of them, so the other runs are not
+    sent over the wire.
+
+    Args:
+        table: The sessions table
+        projection: The parts of the session to read. Reads the full session if None.
+    Returns:
+        The columns to select
+    """
+    columns: List[Any] = []
+    for column in table.c:
+        if projection is not None and column.name == "summary" and not projection.summary:
+            continue
+        if projection is not None and column.name == "runs":
+            if not projection.runs:
+                continue
+            if projection.filters_runs:
+                columns.append(_get_projected_runs_column(table, projection))
+                continue
+        columns.append(column)
+    return columns
+
+
+def _get_projected_runs_column(table: Table, projection: SessionProjection):
+    """Build a subquery aggregating the runs of the session matching the projection, keeping their order"""
+    runs = case((func.json_typeof(table.c.runs) == "array", table.c.runs), else_=literal_column("'[]'::json"))
+    run = func.json_array_elements(runs).table_valued("value", with_ordinality="ordinality").render_derived("run")
+
+    conditions = []
+    if projection.run_id is not None:
+        conditions.append(run.c.value.op("->>")("run_id") == projection.run_id)
+    if projection.top_level_runs_only:
+        conditions.append(run.c.value.op("->>")("parent_run_id").is_(None))
+    # Runs without a creation time are kept, as they can't be placed outside the window
+    run_created_at = cast(run.c.value.op("->>")("created_at"), BigInteger)
+    if projection.runs_created_after is not None:
+        conditions.append(or_(run_created_at.is_(None), run_created_at >= projection.runs_created_after))
+    if projection.runs_created_before is not None:
+        conditions.append(or_(run_created_at.is_(None), run_created_at <= projection.runs_created_before))
+
+    runs_stmt = select(run.c.value, run.c.ordinality).where(*conditions).order_by(run.c.ordinality)
+    if projection.runs_limit is not None:
+        runs_stmt = runs_stmt.limit(projection.runs_limit)
+    runs_window = runs_stmt.correlate(table).subquery("runs_window")
+
+    aggregated_runs = func.coalesce(
+        func.json_agg(postgresql.aggregate_order_by(runs_window.c.value, runs_window.c.ordinality)),
+        literal_column("'[]'::json"),
+    )
+    return type_coerce(select(aggregated_runs).scalar_subquery(), table.c.runs.type).label("runs")
+
+
 def create_schema(session: Session, db_schema: str) -> None:
     """Create the database schema if it doesn't exist.
 
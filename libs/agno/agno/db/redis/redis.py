@@ -3,7 +3,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.redis.utils import (
     apply_filters,
     apply_pagination,
@@ -24,6 +24,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_session_projection
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -305,6 +306,7 @@ class RedisDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Read a session from Redis.
 
@@ -312,6 +314,7 @@ class RedisDb(BaseDb):
             session_id (str): The ID of the session to get.
             session_type (SessionType): The type of session to get.
             user_id (Optional[str]): The ID of the user to filter by.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Optional[Union[AgentSession, TeamSession, WorkflowSession]]: The session if found, None otherwise.
@@ -330,6 +333,7 @@ class RedisDb(BaseDb):
             if session_type is not None and session.get("session_type") != session_type:
                 return None
 
+            session = apply_session_projection(session, projection)
             if not deserialize:
                 return session
 
@@ -360,6 +364,7 @@ class RedisDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
         create_index_if_not_found: Optional[bool] = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions matching the given filters.
@@ -373,6 +378,7 @@ class RedisDb(BaseDb):
             page (Optional[int]): The page number to return.
             sort_by (Optional[str]): The field to sort by.
             sort_order (Optional[str]): The order to sort by.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
 
         Returns:
             List[Union[AgentSession, TeamSession, WorkflowSession]]: The list of sessions.
@@ -409,7 +415,7 @@ class RedisDb(BaseDb):
 
             sorted_sessions = apply_sorting(records=filtered_sessions, sort_by=sort_by, sort_order=sort_order)
             sessions = apply_pagination(records=sorted_sessions, limit=limit, page=page)
-            sessions = [record for record in sessions]
+            sessions = [apply_session_projection(record, projection) for record in sessions]
 
             if not deserialize:
                 return sessions, len(filtered_sessions)
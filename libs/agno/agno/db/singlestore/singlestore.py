@@ -4,7 +4,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
@@ -18,10 +18,12 @@ from agno.db.singlestore.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_projected_session_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
 )
+from agno.db.utils import apply_session_projection
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -441,6 +443,7 @@ class SingleStoreDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -450,6 +453,7 @@ class SingleStoreDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -465,7 +469,7 @@ class SingleStoreDb(BaseDb):
                 return None
 
             with self.Session() as sess:
-                stmt = select(table).where(table.c.session_id == session_id)
+                stmt = select(*get_projected_session_columns(table, projection)).where(table.c.session_id == session_id)
 
                 if user_id is not None:
                     stmt = stmt.where(table.c.user_id == user_id)
@@ -476,7 +480,7 @@ class SingleStoreDb(BaseDb):
                 if result is None:
                     return None
 
-                session = dict(result._mapping)
+                session = apply_session_projection(dict(result._mapping), projection)
 
             if not deserialize:
                 return session
@@ -507,6 +511,7 @@ class SingleStoreDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -523,6 +528,7 @@ class SingleStoreDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
             create_table_if_not_found (Optional[bool]): Whether to create the table if it doesn't exist.
 
         Returns:
@@ -539,7 +545,7 @@ class SingleStoreDb(BaseDb):
                 return [] if deserialize else ([], 0)
 
             with self.Session() as sess, sess.begin():
-                stmt = select(table)
+                stmt = select(*get_projected_session_columns(table, projection))
 
                 # Filtering
                 if user_id is not None:
@@ -582,7 +588,7 @@ class SingleStoreDb(BaseDb):
                 if records is None:
                     return [] if deserialize else ([], 0)
 
-                session = [dict(record._mapping) for record in records]
+                session = [apply_session_projection(dict(record._mapping), projection) for record in records]
                 if not deserialize:
                     return session, total_count
 
@@ -7,6 +7,7 @@ from uuid import uuid4
 
 from sqlalchemy import Engine
 
+from agno.db.base import SessionProjection
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.singlestore.schemas import get_table_schema_definition
 from agno.utils.log import log_debug, log_error, log_warning
@@ -48,6 +49,27 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def get_projected_session_columns(table: Table, projection: Optional[SessionProjection] = None) -> List[Any]:
+    """Get the columns to select from the sessions table for the given projection.
+
+    The runs column is read in full when included. Use `apply_session_projection` to filter the runs after reading.
+
+    Args:
+        table: The sessions table
+        projection: The parts of the session to read. Reads the full session if None.
+    Returns:
+        The columns to select
+    """
+    if projection is None:
+        return list(table.c)
+    return [
+        column
+        for column in table.c
+        if not (column.name == "runs" and not projection.runs)
+        and not (column.name == "summary" and not projection.summary)
+    ]
+
+
 def create_schema(session: Session, db_schema: str) -> None:
     """Create the database schema if it doesn't exist.
 
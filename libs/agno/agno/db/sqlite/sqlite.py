@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 from uuid import uuid4
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
@@ -17,6 +17,7 @@ from agno.db.sqlite.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_projected_session_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
@@ -345,6 +346,7 @@ class SqliteDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -354,6 +356,7 @@ class SqliteDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Optional[Union[Session, Dict[str, Any]]]:
@@ -369,7 +372,7 @@ class SqliteDb(BaseDb):
                 return None
 
             with self.Session() as sess, sess.begin():
-                stmt = select(table).where(table.c.session_id == session_id)
+                stmt = select(*get_projected_session_columns(table, projection)).where(table.c.session_id == session_id)
 
                 # Filtering
                 if user_id is not None:
@@ -411,6 +414,7 @@ class SqliteDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -426,6 +430,7 @@ class SqliteDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
             create_table_if_not_found (Optional[bool]): Whether to create the table if it doesn't exist.
 
         Returns:
@@ -442,7 +447,7 @@ class SqliteDb(BaseDb):
                 return [] if deserialize else ([], 0)
 
             with self.Session() as sess, sess.begin():
-                stmt = select(table)
+                stmt = select(*get_projected_session_columns(table, projection))
 
                 # Filtering
                 if user_id is not None:
@@ -4,12 +4,13 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+from agno.db.base import SessionProjection
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table
+    from sqlalchemy import JSON, Table, case, func, or_, select, type_coerce
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine
     from sqlalchemy.inspection import inspect
@@ -46,6 +47,59 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def get_projected_session_columns(table: Table, projection: Optional[SessionProjection] = None) -> List[Any]:
+    """Get the columns to select from the sessions table for the given projection.
+
+    Runs are filtered in the query when the projection reads only some of them, so the other runs are not
+    loaded from the database.
+
+    Args:
+        table: The sessions table
+        projection: The parts of the session to read. Reads the full session if None.
+    Returns:
+        The columns to select
+    """
+    columns: List[Any] = []
+    for column in table.c:
+        if projection is not None and column.name == "summary" and not projection.summary:
+            continue
+        if projection is not None and column.name == "runs":
+            if not projection.runs:
+                continue
+            if projection.filters_runs:
+                columns.append(_get_projected_runs_column(table, projection))
+                continue
+        columns.append(column)
+    return columns
+
+
+def _get_projected_runs_column(table: Table, projection: SessionProjection):
+    """Build a subquery aggregating the runs of the session matching the projection, keeping their order"""
+    # Runs are stored as a JSON encoded string, unwrap it to get the array
+    runs = case((func.json_type(table.c.runs) == "text", func.json_extract(table.c.runs, "$")), else_=table.c.runs)
+    run = func.json_each(runs).table_valued("key", "value").alias("run")
+
+    conditions = [func.json_type(runs) == "array"]
+    if projection.run_id is not None:
+        conditions.append(func.json_extract(run.c.value, "$.run_id") == projection.run_id)
+    if projection.top_level_runs_only:
+        conditions.append(func.json_extract(run.c.value, "$.parent_run_id").is_(None))
+    # Runs without a creation time are kept, as they can't be placed outside the window
+    run_created_at = func.json_extract(run.c.value, "$.created_at")
+    if projection.runs_created_after is not None:
+        conditions.append(or_(run_created_at.is_(None), run_created_at >= projection.runs_created_after))
+    if projection.runs_created_before is not None:
+        conditions.append(or_(run_created_at.is_(None), run_created_at <= projection.runs_created_before))
+
+    runs_stmt = select(run.c.key, run.c.value).where(*conditions).order_by(run.c.key)
+    if projection.runs_limit is not None:
+        runs_stmt = runs_stmt.limit(projection.runs_limit)
+    runs_window = runs_stmt.correlate(table).subquery("runs_window")
+
+    aggregated_runs = func.json_group_array(func.json(runs_window.c.value))
+    return type_coerce(select(aggregated_runs).scalar_subquery(), JSON).label("runs")
+
+
 def is_table_available(session: Session, table_name: str, db_schema: Optional[str] = None) -> bool:
     """
     Check if a table with the given name exists.
@@ -1,6 +1,8 @@
 from textwrap import dedent
 from typing import Any, Final, Literal, Optional
 
+from agno.db.base import SessionProjection
+
 OPERATOR = Literal["=", "!=", "<=", ">=", "~", "IN", "CONTAINSANY"]
 
 COUNT_QUERY: Final[str] = dedent("""
@@ -69,3 +71,15 @@ def order_limit_start(
 
     clauses = [order_clause, limit_clause, start_clause]
     return " ".join(clause for clause in clauses if clause)
+
+
+def session_omit_clause(projection: Optional[SessionProjection]) -> str:
+    """Build the OMIT clause skipping the session fields excluded by the projection"""
+    if projection is None:
+        return ""
+    omitted_fields = []
+    if not projection.runs:
+        omitted_fields.append("runs")
+    if not projection.summary:
+        omitted_fields.append("summary")
+    return f"OMIT {', '.join(omitted_fields)}" if omitted_fields else ""
@@ -2,7 +2,7 @@ from datetime import date, datetime, timedelta, timezone
 from textwrap import dedent
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from agno.db.base import BaseDb, SessionType
+from agno.db.base import BaseDb, SessionProjection, SessionType
 from agno.db.postgres.utils import (
     get_dates_to_calculate_metrics_for,
 )
@@ -38,8 +38,9 @@ from agno.db.surrealdb.models import (
     serialize_session,
     serialize_user_memory,
 )
-from agno.db.surrealdb.queries import COUNT_QUERY, WhereClause, order_limit_start
+from agno.db.surrealdb.queries import COUNT_QUERY, WhereClause, order_limit_start, session_omit_clause
 from agno.db.surrealdb.utils import build_client
+from agno.db.utils import apply_session_projection
 from agno.session import Session
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -215,6 +216,7 @@ class SurrealDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         r"""
         Read a session from the database.
@@ -224,6 +226,7 @@ class SurrealDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the session to read. Defaults to the full session.
 
         Returns:
             Optional[Union[Session, Dict[str, Any]]]:
@@ -246,12 +249,14 @@ class SurrealDb(BaseDb):
             where = where.and_("workflow", None, "!=")
         where_clause, where_vars = where.build()
         query = dedent(f"""
-            SELECT *
+            SELECT * {session_omit_clause(projection)}
             FROM ONLY $record
             {where_clause}
         """)
         vars = {"record": record, **where_vars}
         raw = self._query_one(query, vars, dict)
+        if raw is not None:
+            raw = apply_session_projection(raw, projection)
         if raw is None or not deserialize:
             return raw
 
@@ -270,6 +275,7 @@ class SurrealDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        projection: Optional[SessionProjection] = None,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         r"""
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -286,6 +292,7 @@ class SurrealDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            projection (Optional[SessionProjection]): The parts of the sessions to read. Defaults to the full sessions.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -337,12 +344,14 @@ class SurrealDb(BaseDb):
         # Query
         order_limit_start_clause = order_limit_start(sort_by, sort_order, limit, page)
         query = dedent(f"""
-            SELECT *
+            SELECT * {session_omit_clause(projection)}
             FROM {table}
             {where_clause}
             {order_limit_start_clause}
         """)
-        sessions_raw = self._query(query, where_vars, dict)
+        sessions_raw = [
+            apply_session_projection(session, projection) for session in self._query(query, where_vars, dict)
+        ]
         converted_sessions_raw = [desurrealize_session(session, session_type) for session in sessions_raw]
 
         if not deserialize:
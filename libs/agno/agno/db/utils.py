@@ -2,11 +2,15 @@
 
 import json
 from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID
 
-from agno.models.message import Message
+from agno.models.message import CompactMessage, Message
 from agno.models.metrics import Metrics
 
+if TYPE_CHECKING:
+    from agno.db.base import SessionProjection
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     """Custom encoder to handle non JSON serializable types."""
@@ -16,7 +20,7 @@ class CustomJSONEncoder(json.JSONEncoder):
             return str(obj)
         elif isinstance(obj, (date, datetime)):
             return obj.isoformat()
-        elif isinstance(obj, Message):
+        elif isinstance(obj, (Message, CompactMessage)):
             return obj.to_dict()
         elif isinstance(obj, Metrics):
             return obj.to_dict()
@@ -114,3 +118,52 @@ def deserialize_session_json_fields(session: dict) -> dict:
             log_warning(f"Warning: Could not parse runs as JSON, keeping as string: {e}")
 
     return session
+
+
+def filter_session_runs(
+    runs: Optional[List[Dict[str, Any]]], projection: Optional["SessionProjection"]
+) -> Optional[List[Dict[str, Any]]]:
+    """Return the serialized runs matching the run filters of the given projection, keeping their order."""
+    if runs is None or projection is None or not projection.filters_runs:
+        return runs
+
+    filtered_runs = []
+    for run in runs:
+        if projection.run_id is not None and run.get("run_id") != projection.run_id:
+            continue
+        if projection.top_level_runs_only and run.get("parent_run_id") is not None:
+            continue
+        # Runs without a creation time are kept, as they can't be placed outside the window
+        run_created_at = run.get("created_at")
+        if run_created_at is not None:
+            if projection.runs_created_after is not None and run_created_at < projection.runs_created_after:
+                continue
+            if projection.runs_created_before is not None and run_created_at > projection.runs_created_before:
+                continue
+        filtered_runs.append(run)
+        if projection.runs_limit is not None and len(filtered_runs) >= projection.runs_limit:
+            break
+    return filtered_runs
+
+
+def apply_session_projection(session: Dict[str, Any], projection: Optional["SessionProjection"]) -> Dict[str, Any]:
+    """Apply the given projection to a session dictionary, for databases that can't project sessions natively.
+
+    Args:
+        session (Dict[str, Any]): The session dictionary, read in full.
+        projection (Optional[SessionProjection]): The parts of the session to keep.
+
+    Returns:
+        Dict[str, Any]: The session dictionary without the parts excluded by the projection.
+    """
+    if projection is None:
+        return session
+
+    session = dict(session)
+    if not projection.runs:
+        session.pop("runs", None)
+    elif projection.filters_runs and isinstance(session.get("runs"), list):
+        session["runs"] = filter_session_runs(session["runs"], projection)
+    if not projection.summary:
+        session.pop("summary", None)
+    return session
@@ -0,0 +1,81 @@
+import re
+from re import Pattern
+from typing import Any, Dict, Iterable, List, Optional
+
+# Flags that can be scoped to a part of a pattern with an inline group like (?i:...)
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _build_trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex matching any of the keywords, with the keywords merged in a prefix tree"""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        # The empty key marks the end of a keyword
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        alternatives = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        is_end = "" in node
+        if not alternatives:
+            return ""
+        if len(alternatives) == 1 and not is_end:
+            return alternatives[0]
+        pattern = "(?:" + "|".join(alternatives) + ")"
+        return pattern + "?" if is_end else pattern
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Case-insensitive matcher for a set of keywords.
+
+    Large sets of keywords are compiled into a single regex, with the keywords merged in a prefix tree, so the input
+    is scanned once whatever the number of keywords. Small sets are faster to check with a substring search per
+    keyword.
+
+    Args:
+        keywords: The keywords to match.
+        compile_threshold: The number of keywords from which the keywords are compiled into a regex.
+    """
+
+    def __init__(self, keywords: Iterable[str], compile_threshold: int = 50):
+        self.keywords: List[str] = [keyword.lower() for keyword in keywords]
+        self.pattern: Optional[Pattern[str]] = None
+        if len(self.keywords) >= compile_threshold:
+            self.pattern = re.compile(_build_trie_pattern(self.keywords))
+
+    def search(self, text: str) -> Optional[str]:
+        """Returns the first keyword found in the text, or None."""
+        text = text.lower()
+        if self.pattern is not None:
+            match = self.pattern.search(text)
+            return match.group(0) if match is not None else None
+        return next((keyword for keyword in self.keywords if keyword in text), None)
+
+
+def combine_patterns(patterns: Iterable[Pattern[str]]) -> Optional[Pattern[str]]:
+    """
+    Combine regex patterns into one pattern matching any of them, to scan a text once instead of once per pattern.
+    Returns None if the patterns cannot be combined, e.g. if they use backreferences or conflicting group names.
+    """
+    parts = []
+    for pattern in patterns:
+        if _BACKREFERENCE.search(pattern.pattern):
+            return None
+        flags = ""
+        for flag, letter in _SCOPED_FLAGS.items():
+            if pattern.flags & flag:
+                flags += letter
+        if pattern.flags & ~(re.UNICODE | sum(_SCOPED_FLAGS)):
+            return None
+        parts.append(f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})")
+    if not parts:
+        return None
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
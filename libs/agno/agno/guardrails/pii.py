@@ -1,8 +1,9 @@
 from re import Pattern
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from agno.exceptions import CheckTrigger, InputCheckError
 from agno.guardrails.base import BaseGuardrail
+from agno.guardrails.matcher import combine_patterns
 from agno.run.agent import RunInput
 from agno.run.team import TeamRunInput
 
@@ -45,13 +46,19 @@ class PIIDetectionGuardrail(BaseGuardrail):
         if custom_patterns:
             self.pii_patterns.update(custom_patterns)
 
+        # Inputs without PII, the common case, are cleared with a single scan
+        self.any_pii_pattern = combine_patterns(self.pii_patterns.values())
+
+    def _detect_pii(self, content: str) -> List[str]:
+        """Returns the types of PII found in the content."""
+        if self.any_pii_pattern is not None and self.any_pii_pattern.search(content) is None:
+            return []
+        return [pii_type for pii_type, pattern in self.pii_patterns.items() if pattern.search(content)]
+
     def check(self, run_input: Union[RunInput, TeamRunInput]) -> None:
         """Check for PII patterns in the input."""
         content = run_input.input_content_string()
-        detected_pii = []
-        for pii_type, pattern in self.pii_patterns.items():
-            if pattern.search(content):
-                detected_pii.append(pii_type)
+        detected_pii = self._detect_pii(content)
         if detected_pii:
             if self.mask_pii:
                 for pii_type in detected_pii:
@@ -72,10 +79,7 @@ class PIIDetectionGuardrail(BaseGuardrail):
     async def async_check(self, run_input: Union[RunInput, TeamRunInput]) -> None:
         """Asynchronously check for PII patterns in the input."""
         content = run_input.input_content_string()
-        detected_pii = []
-        for pii_type, pattern in self.pii_patterns.items():
-            if pattern.search(content):
-                detected_pii.append(pii_type)
+        detected_pii = self._detect_pii(content)
         if detected_pii:
             if self.mask_pii:
                 for pii_type in detected_pii:
@@ -2,6 +2,7 @@ from typing import List, Optional, Union
 
 from agno.exceptions import CheckTrigger, InputCheckError
 from agno.guardrails.base import BaseGuardrail
+from agno.guardrails.matcher import KeywordMatcher
 from agno.run.agent import RunInput
 from agno.run.team import TeamRunInput
 
@@ -33,10 +34,12 @@ class PromptInjectionGuardrail(BaseGuardrail):
             "admin override",
             "root access",
         ]
+        # Matches the patterns in a single pass over the input
+        self.matcher = KeywordMatcher(self.injection_patterns)
 
     def check(self, run_input: Union[RunInput, TeamRunInput]) -> None:
         """Check for prompt injection patterns in the input."""
-        if any(keyword in run_input.input_content_string().lower() for keyword in self.injection_patterns):
+        if self.matcher.search(run_input.input_content_string()) is not None:
             raise InputCheckError(
                 "Potential jailbreaking or prompt injection detected.",
                 check_trigger=CheckTrigger.PROMPT_INJECTION,
@@ -44,7 +47,7 @@ class PromptInjectionGuardrail(BaseGuardrail):
 
     async def async_check(self, run_input: Union[RunInput, TeamRunInput]) -> None:
         """Asynchronously check for prompt injection patterns in the input."""
-        if any(keyword in run_input.input_content_string().lower() for keyword in self.injection_patterns):
+        if self.matcher.search(run_input.input_content_string()) is not None:
             raise InputCheckError(
                 "Potential jailbreaking or prompt injection detected.",
                 check_trigger=CheckTrigger.PROMPT_INJECTION,
@@ -1,5 +1,17 @@
-from agno.knowledge.knowledge import Knowledge
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agno.knowledge.knowledge import Knowledge
 
 __all__ = [
     "Knowledge",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import for Knowledge, so importing a knowledge submodule doesn't load readers and vector dbs."""
+    if name == "Knowledge":
+        from agno.knowledge.knowledge import Knowledge
+
+        return Knowledge
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
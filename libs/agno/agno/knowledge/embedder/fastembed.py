@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.model_manager import MicroBatcher, get_local_model_manager
 from agno.utils.log import logger
 
 try:
@@ -24,16 +25,35 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: Optional[int] = 384
+    # Concurrent requests are embedded together, in batches of up to max_batch_size texts
+    max_batch_size: int = 32
+    # How long a request waits for other requests to join its batch, in seconds
+    max_batch_wait: float = 0.005
+
+    def _get_model(self) -> TextEmbedding:
+        # The model is loaded once per process and shared by all embedders using it
+        return get_local_model_manager().get_model(("fastembed", self.id), lambda: TextEmbedding(model_name=self.id))
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings = []
+        for embedding in self._get_model().embed(texts, batch_size=self.max_batch_size):
+            if isinstance(embedding, np.ndarray):
+                embeddings.append(embedding.tolist())
+            else:
+                embeddings.append(list(embedding))
+        return embeddings
+
+    def _get_batcher(self) -> MicroBatcher:
+        return get_local_model_manager().get_batcher(
+            ("fastembed", self.id),
+            batch_fn=self._embed_batch,
+            max_batch_size=self.max_batch_size,
+            max_wait=self.max_batch_wait,
+        )
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)[0]
-        if isinstance(embedding_list, np.ndarray):
-            return embedding_list.tolist()
-
         try:
-            return list(embedding_list)
+            return self._get_batcher().submit([text])[0]
         except Exception as e:
             logger.warning(e)
             return []
@@ -46,17 +66,19 @@ class FastEmbedEmbedder(Embedder):
         return embedding, usage
 
     async def async_get_embedding(self, text: str) -> List[float]:
-        """Async version using thread executor for CPU-bound operations."""
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        # Run the CPU-bound operation in a thread executor
-        return await loop.run_in_executor(None, self.get_embedding, text)
+        """Async version, waiting for the batch on the model thread without blocking the event loop."""
+        try:
+            return (await self._get_batcher().asubmit([text]))[0]
+        except Exception as e:
+            logger.warning(e)
+            return []
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
-        """Async version using thread executor for CPU-bound operations."""
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        # Run the CPU-bound operation in a thread executor
-        return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+        return await self.async_get_embedding(text), None
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed multiple texts, in the batches shared with concurrent requests."""
+        embeddings = await self._get_batcher().asubmit(texts)
+        return embeddings, [None] * len(embeddings)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -63,7 +63,7 @@ class OpenAIEmbedder(Embedder):
         self.async_client = AsyncOpenAI(**filtered_params)
         return self.async_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -98,6 +98,38 @@ class OpenAIEmbedder(Embedder):
             logger.warning(e)
             return [], None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        all_usage: List[Optional[Dict]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            try:
+                response: CreateEmbeddingResponse = self.response(text=batch_texts)
+                batch_embeddings = [data.embedding for data in response.data]
+                all_embeddings.extend(batch_embeddings)
+
+                # For each embedding in the batch, add the same usage information
+                usage_dict = response.usage.model_dump() if response.usage else None
+                all_usage.extend([usage_dict] * len(batch_embeddings))
+            except Exception as e:
+                logger.warning(f"Error in batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    embedding, usage = self.get_embedding_and_usage(text)
+                    all_embeddings.append(embedding)
+                    all_usage.append(usage)
+
+        return all_embeddings, all_usage
+
     async def async_get_embedding(self, text: str) -> List[float]:
         req: Dict[str, Any] = {
             "input": text,
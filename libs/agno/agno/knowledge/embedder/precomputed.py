@@ -0,0 +1,72 @@
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.knowledge.embedder.base import Embedder
+
+
+@dataclass
+class PrecomputedEmbedder(Embedder):
+    """
+    Wraps an embedder to return embeddings computed ahead of their use, like the embeddings of the queries of a
+    batch search. Other texts are embedded by the wrapped embedder.
+    """
+
+    embedder: Optional[Embedder] = None
+    embeddings: Dict[str, List[float]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.embedder is not None:
+            self.dimensions = self.embedder.dimensions
+            self.enable_batch = self.embedder.enable_batch
+            self.batch_size = self.embedder.batch_size
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set on the wrapper, like the model id of the wrapped embedder
+        if name in ("embedder", "embeddings"):
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    def get_embedding(self, text: str) -> List[float]:
+        embedding = self.embeddings.get(text)
+        return embedding if embedding is not None else self.embedder.get_embedding(text)  # type: ignore
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        embedding = self.embeddings.get(text)
+        if embedding is not None:
+            return embedding, None
+        return self.embedder.get_embedding_and_usage(text)  # type: ignore
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        embedding = self.embeddings.get(text)
+        return embedding if embedding is not None else await self.embedder.async_get_embedding(text)  # type: ignore
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        embedding = self.embeddings.get(text)
+        if embedding is not None:
+            return embedding, None
+        return await self.embedder.async_get_embedding_and_usage(text)  # type: ignore
+
+
+def with_precomputed_embeddings(vector_db: Any, embeddings: Dict[str, List[float]]) -> Any:
+    """
+    Return a shallow copy of the vector db, sharing its clients and connections, that embeds the given texts with
+    their precomputed embeddings. Returns the vector db itself if there is nothing to precompute.
+    """
+    embeddings = {text: embedding for text, embedding in embeddings.items() if embedding}
+    if vector_db is None or not embeddings:
+        return vector_db
+    if "embedder" not in vars(vector_db) and "vector_db" in vars(vector_db):
+        # Wrappers like HybridSearch embed with the vector db they wrap
+        wrapper_copy = copy(vector_db)
+        wrapper_copy.vector_db = with_precomputed_embeddings(vector_db.vector_db, embeddings)
+        return wrapper_copy
+    embedder = getattr(vector_db, "embedder", None)
+    if embedder is None:
+        return vector_db
+    if isinstance(embedder, PrecomputedEmbedder):
+        embeddings = {**embedder.embeddings, **embeddings}
+        embedder = embedder.embedder
+    vector_db_copy = copy(vector_db)
+    vector_db_copy.embedder = PrecomputedEmbedder(embedder=embedder, embeddings=embeddings)
+    return vector_db_copy
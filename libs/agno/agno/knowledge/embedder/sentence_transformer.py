@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Union
 
 from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.model_manager import MicroBatcher, get_local_model_manager
 from agno.utils.log import logger
 
 try:
@@ -25,17 +26,42 @@ class SentenceTransformerEmbedder(Embedder):
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
 
-    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+    # Concurrent requests are embedded together, in batches of up to max_batch_size texts
+    max_batch_size: int = 32
+    # How long a request waits for other requests to join its batch, in seconds
+    max_batch_wait: float = 0.005
+
+    def _get_model(self) -> SentenceTransformer:
         if not self.sentence_transformer_client:
-            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+            # The model is loaded once per process and shared by all embedders using it
+            self.sentence_transformer_client = get_local_model_manager().get_model(
+                ("sentence_transformers", self.id), lambda: SentenceTransformer(model_name_or_path=self.id)
+            )
+        return self.sentence_transformer_client
 
-        model = self.sentence_transformer_client
-        embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
-        try:
-            if isinstance(embedding, np.ndarray):
-                return embedding.tolist()
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings = self._get_model().encode(
+            texts, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings, batch_size=self.max_batch_size
+        )
+        if isinstance(embeddings, np.ndarray):
+            return embeddings.tolist()
+        return [list(embedding) for embedding in embeddings]
 
-            return embedding  # type: ignore
+    def _get_batcher(self) -> MicroBatcher:
+        model = self._get_model()
+        # Requests are only batched together if they use the same model and encoding options
+        return get_local_model_manager().get_batcher(
+            ("sentence_transformers", self.id, id(model), self.prompt, self.normalize_embeddings),
+            batch_fn=self._embed_batch,
+            max_batch_size=self.max_batch_size,
+            max_wait=self.max_batch_wait,
+        )
+
+    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        try:
+            if isinstance(text, list):
+                return self._get_batcher().submit(text)  # type: ignore
+            return self._get_batcher().submit([text])[0]
         except Exception as e:
             logger.warning(e)
             return []
@@ -44,16 +70,21 @@ class SentenceTransformerEmbedder(Embedder):
         return self.get_embedding(text=text), None
 
     async def async_get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        """Async version using thread executor for CPU-bound operations."""
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        # Run the CPU-bound operation in a thread executor
-        return await loop.run_in_executor(None, self.get_embedding, text)
+        """Async version, waiting for the batch on the model thread without blocking the event loop."""
+        try:
+            if isinstance(text, list):
+                return await self._get_batcher().asubmit(text)  # type: ignore
+            return (await self._get_batcher().asubmit([text]))[0]
+        except Exception as e:
+            logger.warning(e)
+            return []
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
-        """Async version using thread executor for CPU-bound operations."""
-        import asyncio
+        return await self.async_get_embedding(text), None
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed multiple texts, in the batches shared with concurrent requests."""
+        embeddings = await self._get_batcher().asubmit(texts)
+        return embeddings, [None] * len(embeddings)
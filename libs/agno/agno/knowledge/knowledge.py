@@ -8,7 +8,7 @@ from functools import cached_property
 from io import BytesIO
 from os.path import basename
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple, Union, cast, overload
 
 from httpx import AsyncClient
 
@@ -18,6 +18,7 @@ from agno.knowledge.content import Content, ContentAuth, ContentStatus, FileData
 from agno.knowledge.document import Document
 from agno.knowledge.reader import Reader, ReaderFactory
 from agno.knowledge.remote_content.remote_content import GCSContent, RemoteContent, S3Content
+from agno.knowledge.search import SearchCoalescer, aembed_queries, embed_queries
 from agno.utils.http import async_fetch_with_retry
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -25,6 +26,16 @@ from agno.utils.string import generate_id
 ContentDict = Dict[str, Union[str, Dict[str, str]]]
 
 
+@dataclass
+class IngestionLimits:
+    """Semaphores bounding the stages of the ingestion pipeline"""
+
+    loop: asyncio.AbstractEventLoop
+    contents: asyncio.Semaphore
+    reads: asyncio.Semaphore
+    inserts: asyncio.Semaphore
+
+
 class KnowledgeContentOrigin(Enum):
     PATH = "path"
     URL = "url"
@@ -42,6 +53,17 @@ class Knowledge:
     contents_db: Optional[Union[BaseDb, AsyncBaseDb]] = None
     max_results: int = 10
     readers: Optional[Dict[str, Reader]] = None
+    # Maximum number of contents (e.g. files of a directory) ingested at the same time
+    max_concurrency: int = 8
+    # Maximum number of readers parsing content at the same time, each in a worker thread
+    max_concurrent_reads: int = 4
+    # Maximum number of concurrent embedding and vector database insert calls
+    max_concurrent_inserts: int = 2
+    # Seconds the version read from the contents db is reused for. Content changed by other processes sharing the
+    # contents db is reflected in the version after this delay, local changes immediately.
+    version_cache_ttl: float = 10.0
+    # Batch the async searches started at the same time, e.g. by parallel tool calls, into one search_many call
+    coalesce_searches: bool = True
 
     def __post_init__(self):
         from agno.vectordb import VectorDb
@@ -52,6 +74,36 @@ class Knowledge:
 
         self.construct_readers()
         self.valid_metadata_filters = set()
+        self._ingestion_limits: Optional[IngestionLimits] = None
+        # Incremented on every content change, identifies the content when there is no contents db
+        self._version = 0
+        # Last version read from the contents db, with the local version and the time it was read at
+        self._cached_version: Optional[Tuple[int, float, str]] = None
+        self._search_coalescer: Optional[SearchCoalescer] = None
+
+    def _get_ingestion_limits(self) -> "IngestionLimits":
+        """Get the semaphores bounding each ingestion stage, shared by all contents ingested in the event loop."""
+        loop = asyncio.get_running_loop()
+        if self._ingestion_limits is None or self._ingestion_limits.loop is not loop:
+            self._ingestion_limits = IngestionLimits(
+                loop=loop,
+                contents=asyncio.Semaphore(max(1, self.max_concurrency)),
+                reads=asyncio.Semaphore(max(1, self.max_concurrent_reads)),
+                inserts=asyncio.Semaphore(max(1, self.max_concurrent_inserts)),
+            )
+        return self._ingestion_limits
+
+    async def _gather_contents(self, coroutines: List[Coroutine[Any, Any, None]]) -> None:
+        """Run ingestion coroutines concurrently. Errors are raised once all of them have finished."""
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _aread(self, reader: Reader, *args, **kwargs) -> List[Document]:
+        """Run a reader in a worker thread, so parsing does not block the event loop."""
+        async with self._get_ingestion_limits().reads:
+            return await asyncio.to_thread(reader.read, *args, **kwargs)
 
     # --- SDK Specific Methods ---
 
@@ -81,22 +133,26 @@ class Knowledge:
             arguments = args[0]
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
-            for argument in arguments:
-                await self.add_content_async(
-                    name=argument.get("name"),
-                    description=argument.get("description"),
-                    path=argument.get("path"),
-                    url=argument.get("url"),
-                    metadata=argument.get("metadata"),
-                    topics=argument.get("topics"),
-                    text_content=argument.get("text_content"),
-                    reader=argument.get("reader"),
-                    include=argument.get("include"),
-                    exclude=argument.get("exclude"),
-                    upsert=argument.get("upsert", upsert),
-                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
-                    remote_content=argument.get("remote_content", None),
-                )
+            await self._gather_contents(
+                [
+                    self.add_content_async(
+                        name=argument.get("name"),
+                        description=argument.get("description"),
+                        path=argument.get("path"),
+                        url=argument.get("url"),
+                        metadata=argument.get("metadata"),
+                        topics=argument.get("topics"),
+                        text_content=argument.get("text_content"),
+                        reader=argument.get("reader"),
+                        include=argument.get("include"),
+                        exclude=argument.get("exclude"),
+                        upsert=argument.get("upsert", upsert),
+                        skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
+                        remote_content=argument.get("remote_content", None),
+                    )
+                    for argument in arguments
+                ]
+            )
 
         elif kwargs:
             name = kwargs.get("name", [])
@@ -112,68 +168,81 @@ class Knowledge:
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
             remote_content = kwargs.get("remote_content", None)
+            coroutines: List[Coroutine[Any, Any, None]] = []
             for path in paths:
-                await self.add_content_async(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                coroutines.append(
+                    self.add_content_async(
+                        name=name,
+                        description=description,
+                        path=path,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
             for url in urls:
-                await self.add_content_async(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                coroutines.append(
+                    self.add_content_async(
+                        name=name,
+                        description=description,
+                        url=url,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
             for i, text_content in enumerate(text_contents):
                 content_name = f"{name}_{i}" if name else f"text_content_{i}"
                 log_debug(f"Adding text content: {content_name}")
-                await self.add_content_async(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                coroutines.append(
+                    self.add_content_async(
+                        name=content_name,
+                        description=description,
+                        text_content=text_content,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
             if topics:
-                await self.add_content_async(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                coroutines.append(
+                    self.add_content_async(
+                        name=name,
+                        description=description,
+                        topics=topics,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
 
             if remote_content:
-                await self.add_content_async(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
+                coroutines.append(
+                    self.add_content_async(
+                        name=name,
+                        metadata=metadata,
+                        description=description,
+                        remote_content=remote_content,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                    )
                 )
 
+            await self._gather_contents(coroutines)
+
         else:
             raise ValueError("Invalid usage of add_contents.")
 
@@ -387,10 +456,6 @@ class Knowledge:
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
     ):
-        from agno.vectordb import VectorDb
-
-        self.vector_db = cast(VectorDb, self.vector_db)
-
         log_info(f"Adding content from path, {content.id}, {content.name}, {content.path}, {content.description}")
         path = Path(content.path)  # type: ignore
 
@@ -398,62 +463,18 @@ class Knowledge:
             if self._should_include_file(str(path), include, exclude):
                 log_info(f"Adding file {path} due to include/exclude filters")
 
-                await self._add_to_contents_db(content)
-                if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
-                    content.status = ContentStatus.COMPLETED
-                    await self._aupdate_content(content)
-                    return
-
-                # Handle LightRAG special case - read file and upload directly
-                if self.vector_db.__class__.__name__ == "LightRag":
-                    await self._process_lightrag_content(content, KnowledgeContentOrigin.PATH)
-                    return
-
-                if content.reader:
-                    # TODO: We will refactor this to eventually pass authorization to all readers
-                    import inspect
-
-                    read_signature = inspect.signature(content.reader.read)
-                    if "password" in read_signature.parameters and content.auth and content.auth.password:
-                        read_documents = content.reader.read(
-                            path, name=content.name or path.name, password=content.auth.password
-                        )
-                    else:
-                        read_documents = content.reader.read(path, name=content.name or path.name)
-
-                else:
-                    reader = ReaderFactory.get_reader_for_extension(path.suffix)
-                    log_info(f"Using Reader: {reader.__class__.__name__}")
-                    if reader:
-                        # TODO: We will refactor this to eventually pass authorization to all readers
-                        import inspect
-
-                        read_signature = inspect.signature(reader.read)
-                        if "password" in read_signature.parameters and content.auth and content.auth.password:
-                            read_documents = reader.read(
-                                path, name=content.name or path.name, password=content.auth.password
-                            )
-                        else:
-                            read_documents = reader.read(path, name=content.name or path.name)
-
-                if not content.file_type:
-                    content.file_type = path.suffix
-
-                if not content.size and content.file_data:
-                    content.size = len(content.file_data.content)  # type: ignore
-                if not content.size:
+                async with self._get_ingestion_limits().contents:
                     try:
-                        content.size = path.stat().st_size
-                    except (OSError, IOError) as e:
-                        log_warning(f"Could not get file size for {path}: {e}")
-                        content.size = 0
-
-                for read_document in read_documents:
-                    read_document.content_id = content.id
-
-                await self._handle_vector_db_insert(content, read_documents, upsert)
+                        await self._load_from_file(content, path, upsert, skip_if_exists)
+                    except Exception as e:
+                        # A file that fails to load must not stop the rest of the directory
+                        log_error(f"Error loading file {path}: {e}")
+                        content.status = ContentStatus.FAILED
+                        content.status_message = f"Error loading file {path}: {str(e)}"
+                        await self._aupdate_content(content)
 
         elif path.is_dir():
+            file_contents = []
             for file_path in path.iterdir():
                 # Apply include/exclude filtering
                 if not self._should_include_file(str(file_path), include, exclude):
@@ -469,11 +490,69 @@ class Knowledge:
                 )
                 file_content.content_hash = self._build_content_hash(file_content)
                 file_content.id = generate_id(file_content.content_hash)
-
-                await self._load_from_path(file_content, upsert, skip_if_exists, include, exclude)
+                file_contents.append(file_content)
+
+            # Files are loaded concurrently, bounded by max_concurrency
+            await self._gather_contents(
+                [
+                    self._load_from_path(file_content, upsert, skip_if_exists, include, exclude)
+                    for file_content in file_contents
+                ]
+            )
         else:
             log_warning(f"Invalid path: {path}")
 
+    async def _load_from_file(self, content: Content, path: Path, upsert: bool, skip_if_exists: bool):
+        """Read a single file and insert its documents in the vector database"""
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        await self._add_to_contents_db(content)
+        if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
+            content.status = ContentStatus.COMPLETED
+            await self._aupdate_content(content)
+            return
+
+        # Handle LightRAG special case - read file and upload directly
+        if self.vector_db.__class__.__name__ == "LightRag":
+            await self._process_lightrag_content(content, KnowledgeContentOrigin.PATH)
+            return
+
+        read_documents: List[Document] = []
+        reader = content.reader
+        if reader is None:
+            reader = ReaderFactory.get_reader_for_extension(path.suffix)
+            log_info(f"Using Reader: {reader.__class__.__name__}")
+        if reader:
+            # TODO: We will refactor this to eventually pass authorization to all readers
+            import inspect
+
+            read_signature = inspect.signature(reader.read)
+            if "password" in read_signature.parameters and content.auth and content.auth.password:
+                read_documents = await self._aread(
+                    reader, path, name=content.name or path.name, password=content.auth.password
+                )
+            else:
+                read_documents = await self._aread(reader, path, name=content.name or path.name)
+
+        if not content.file_type:
+            content.file_type = path.suffix
+
+        if not content.size and content.file_data:
+            content.size = len(content.file_data.content)  # type: ignore
+        if not content.size:
+            try:
+                content.size = path.stat().st_size
+            except (OSError, IOError) as e:
+                log_warning(f"Could not get file size for {path}: {e}")
+                content.size = 0
+
+        for read_document in read_documents:
+            read_document.content_id = content.id
+
+        await self._handle_vector_db_insert(content, read_documents, upsert)
+
     async def _load_from_url(
         self,
         content: Content,
@@ -556,6 +635,11 @@ class Knowledge:
             else:
                 reader = self.text_reader
 
+        # Readers that crawl many pages stream them, so they can be embedded while the crawl continues
+        if bytes_content is None and reader is not None and hasattr(reader, "async_read_stream"):
+            await self._load_from_url_stream(content, reader, name, upsert)
+            return
+
         # 5. Read content
         try:
             read_documents = []
@@ -565,17 +649,21 @@ class Knowledge:
 
                 read_signature = inspect.signature(reader.read)
                 if reader.__class__.__name__ == "YouTubeReader":
-                    read_documents = reader.read(content.url, name=name)
+                    read_documents = await self._aread(reader, content.url, name=name)
                 elif "password" in read_signature.parameters and content.auth and content.auth.password:
                     if bytes_content:
-                        read_documents = reader.read(bytes_content, name=name, password=content.auth.password)
+                        read_documents = await self._aread(
+                            reader, bytes_content, name=name, password=content.auth.password
+                        )
                     else:
-                        read_documents = reader.read(content.url, name=name, password=content.auth.password)
+                        read_documents = await self._aread(
+                            reader, content.url, name=name, password=content.auth.password
+                        )
                 else:
                     if bytes_content:
-                        read_documents = reader.read(bytes_content, name=name)
+                        read_documents = await self._aread(reader, bytes_content, name=name)
                     else:
-                        read_documents = reader.read(content.url, name=name)
+                        read_documents = await self._aread(reader, content.url, name=name)
 
         except Exception as e:
             log_error(f"Error reading URL: {content.url} - {str(e)}")
@@ -596,6 +684,51 @@ class Knowledge:
                 read_document.content_id = content.id
         await self._handle_vector_db_insert(content, read_documents, upsert)
 
+    async def _load_from_url_stream(self, content: Content, reader: Reader, name: Optional[str], upsert: bool):
+        """Insert the documents of each page in the vector database as soon as the reader yields them"""
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        use_upsert = self.vector_db.upsert_available() and upsert
+        num_batches = 0
+        try:
+            async for read_documents in reader.async_read_stream(content.url, name=name):  # type: ignore[attr-defined]
+                if not reader.chunk:
+                    read_documents = await reader.chunk_documents_async(read_documents)
+                for read_document in read_documents:
+                    read_document.content_id = content.id
+                if not read_documents:
+                    continue
+
+                async with self._get_ingestion_limits().inserts:
+                    if use_upsert:
+                        if num_batches == 0 and content.id is not None:
+                            # Drop the batches of a previous crawl, which may have returned more pages
+                            await asyncio.to_thread(self.vector_db.delete_by_content_id, content.id)
+                        # Upserting replaces everything stored for the content hash, so each batch is upserted under
+                        # its own hash. The first batch keeps the content hash, which skip_if_exists looks up.
+                        batch_hash = (
+                            content.content_hash if num_batches == 0 else f"{content.content_hash}_{num_batches}"
+                        )
+                        await self.vector_db.async_upsert(batch_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                        num_batches += 1
+                    else:
+                        await self.vector_db.async_insert(
+                            content.content_hash,  # type: ignore[arg-type]
+                            documents=read_documents,
+                            filters=content.metadata,  # type: ignore[arg-type]
+                        )
+        except Exception as e:
+            log_error(f"Error reading URL: {content.url} - {str(e)}")
+            content.status = ContentStatus.FAILED
+            content.status_message = f"Error reading URL: {content.url} - {str(e)}"
+            await self._aupdate_content(content)
+            return
+
+        content.status = ContentStatus.COMPLETED
+        await self._aupdate_content(content)
+
     async def _load_from_content(
         self,
         content: Content,
@@ -645,11 +778,11 @@ class Knowledge:
 
             if content.reader:
                 log_info(f"Using reader: {content.reader.__class__.__name__} to read content")
-                read_documents = content.reader.read(content_io, name=name)
+                read_documents = await self._aread(content.reader, content_io, name=name)
             else:
                 text_reader = self.text_reader
                 if text_reader:
-                    read_documents = text_reader.read(content_io, name=name)
+                    read_documents = await self._aread(text_reader, content_io, name=name)
                 else:
                     content.status = ContentStatus.FAILED
                     content.status_message = "Text reader not available"
@@ -673,7 +806,7 @@ class Knowledge:
                 else:
                     reader = self._select_reader(content.file_data.type)
                 name = content.name if content.name else f"content_{content.file_data.type}"
-                read_documents = reader.read(content_io, name=name)
+                read_documents = await self._aread(reader, content_io, name=name)
                 for read_document in read_documents:
                     if content.metadata:
                         read_document.meta_data.update(content.metadata)
@@ -744,7 +877,7 @@ class Knowledge:
                 self._update_content(content)
                 continue
 
-            read_documents = content.reader.read(topic)
+            read_documents = await self._aread(content.reader, topic)
             if len(read_documents) > 0:
                 for read_document in read_documents:
                     read_document.content_id = content.id
@@ -859,7 +992,7 @@ class Knowledge:
                 s3_object.download(readable_content)  # type: ignore
 
             # 6. Read the content
-            read_documents = reader.read(readable_content, name=obj_name)
+            read_documents = await self._aread(reader, readable_content, name=obj_name)
 
             # 7. Prepare and insert the content in the vector database
             for read_document in read_documents:
@@ -935,7 +1068,7 @@ class Knowledge:
             readable_content = BytesIO(gcs_object.download_as_bytes())
 
             # 6. Read the content
-            read_documents = reader.read(readable_content, name=name)
+            read_documents = await self._aread(reader, readable_content, name=name)
 
             # 7. Prepare and insert the content in the vector database
             for read_document in read_documents:
@@ -956,7 +1089,8 @@ class Knowledge:
 
         if self.vector_db.upsert_available() and upsert:
             try:
-                await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                async with self._get_ingestion_limits().inserts:
+                    await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
             except Exception as e:
                 log_error(f"Error upserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -965,11 +1099,12 @@ class Knowledge:
                 return
         else:
             try:
-                await self.vector_db.async_insert(
-                    content.content_hash,  # type: ignore[arg-type]
-                    documents=read_documents,
-                    filters=content.metadata,  # type: ignore[arg-type]
-                )
+                async with self._get_ingestion_limits().inserts:
+                    await self.vector_db.async_insert(
+                        content.content_hash,  # type: ignore[arg-type]
+                        documents=read_documents,
+                        filters=content.metadata,  # type: ignore[arg-type]
+                    )
             except Exception as e:
                 log_error(f"Error inserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -994,19 +1129,24 @@ class Knowledge:
             self.add_filters(content.metadata)
 
         if content.path:
+            # Each file of a directory takes its own slot, so the path is not loaded under a slot
             await self._load_from_path(content, upsert, skip_if_exists, include, exclude)
 
-        if content.url:
-            await self._load_from_url(content, upsert, skip_if_exists)
+        if not (content.url or content.file_data or content.topics or content.remote_content):
+            return
+
+        async with self._get_ingestion_limits().contents:
+            if content.url:
+                await self._load_from_url(content, upsert, skip_if_exists)
 
-        if content.file_data:
-            await self._load_from_content(content, upsert, skip_if_exists)
+            if content.file_data:
+                await self._load_from_content(content, upsert, skip_if_exists)
 
-        if content.topics:
-            await self._load_from_topics(content, upsert, skip_if_exists)
+            if content.topics:
+                await self._load_from_topics(content, upsert, skip_if_exists)
 
-        if content.remote_content:
-            await self._load_from_remote_content(content, upsert, skip_if_exists)
+            if content.remote_content:
+                await self._load_from_remote_content(content, upsert, skip_if_exists)
 
     def _build_content_hash(self, content: Content) -> str:
         """
@@ -1079,6 +1219,7 @@ class Knowledge:
         return value
 
     async def _add_to_contents_db(self, content: Content):
+        self._version += 1
         if self.contents_db:
             created_at = content.created_at if content.created_at else int(time.time())
             updated_at = content.updated_at if content.updated_at else int(time.time())
@@ -1124,6 +1265,7 @@ class Knowledge:
     def _update_content(self, content: Content) -> Optional[Dict[str, Any]]:
         from agno.vectordb import VectorDb
 
+        self._version += 1
         self.vector_db = cast(VectorDb, self.vector_db)
         if self.contents_db:
             if isinstance(self.contents_db, AsyncBaseDb):
@@ -1179,6 +1321,7 @@ class Knowledge:
             return None
 
     async def _aupdate_content(self, content: Content) -> Optional[Dict[str, Any]]:
+        self._version += 1
         if self.contents_db:
             if not content.id:
                 log_warning("Content id is required to update Knowledge content")
@@ -1381,6 +1524,53 @@ class Knowledge:
                 log_warning(f"No documents found for LightRAG upload: {content.name}")
                 return
 
+    def get_version(self) -> str:
+        """
+        Identifies the current content of the knowledge base, changing whenever content is added, updated or removed.
+        Read from the contents db if there is one, so all processes sharing it get the same version.
+        """
+        if self.contents_db is not None and not isinstance(self.contents_db, AsyncBaseDb):
+            cached_version = self._get_cached_version()
+            if cached_version is not None:
+                return cached_version
+            try:
+                rows, total_count = self.contents_db.get_knowledge_contents(
+                    limit=1, sort_by="updated_at", sort_order="desc"
+                )
+                return self._cache_version(f"{total_count}:{rows[0].updated_at if rows else None}")
+            except Exception as e:
+                log_warning(f"Error getting knowledge version: {e}")
+        return f"local:{self._version}"
+
+    async def aget_version(self) -> str:
+        """Async version of get_version"""
+        if isinstance(self.contents_db, AsyncBaseDb):
+            cached_version = self._get_cached_version()
+            if cached_version is not None:
+                return cached_version
+            try:
+                rows, total_count = await self.contents_db.get_knowledge_contents(
+                    limit=1, sort_by="updated_at", sort_order="desc"
+                )
+                return self._cache_version(f"{total_count}:{rows[0].updated_at if rows else None}")
+            except Exception as e:
+                log_warning(f"Error getting knowledge version: {e}")
+                return f"local:{self._version}"
+        return self.get_version()
+
+    def _get_cached_version(self) -> Optional[str]:
+        if self._cached_version is None:
+            return None
+        local_version, read_at, version = self._cached_version
+        # Local changes invalidate the cached version right away
+        if local_version != self._version or time.monotonic() - read_at > self.version_cache_ttl:
+            return None
+        return version
+
+    def _cache_version(self, version: str) -> str:
+        self._cached_version = (self._version, time.monotonic(), version)
+        return version
+
     def search(
         self,
         query: str,
@@ -1389,29 +1579,117 @@ class Knowledge:
         search_type: Optional[str] = None,
     ) -> List[Document]:
         """Returns relevant documents matching a query"""
-        from agno.vectordb import VectorDb
-        from agno.vectordb.search import SearchType
+        return self._search(self.vector_db, query, max_results, filters, search_type)
 
-        self.vector_db = cast(VectorDb, self.vector_db)
+    def _search(
+        self,
+        vector_db: Any,
+        query: str,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        search_type: Optional[str] = None,
+    ) -> List[Document]:
+        from agno.vectordb.search import SearchType
 
-        if (
-            hasattr(self.vector_db, "search_type")
-            and isinstance(self.vector_db.search_type, SearchType)
-            and search_type
-        ):
-            self.vector_db.search_type = SearchType(search_type)
+        if hasattr(vector_db, "search_type") and isinstance(vector_db.search_type, SearchType) and search_type:
+            vector_db.search_type = SearchType(search_type)
         try:
-            if self.vector_db is None:
+            if vector_db is None:
                 log_warning("No vector db provided")
                 return []
 
             _max_results = max_results or self.max_results
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_max_results, filters=filters)
+            return vector_db.search(query=query, limit=_max_results, filters=filters)
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
 
+    def search_batch(
+        self,
+        queries: List[str],
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        search_type: Optional[str] = None,
+    ) -> List[List[Document]]:
+        """
+        Returns the relevant documents matching each query.
+        The queries are embedded in one batch request and searched concurrently.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from agno.knowledge.embedder.precomputed import with_precomputed_embeddings
+
+        unique_queries = list(dict.fromkeys(queries))
+        if len(unique_queries) < 2:
+            return [self.search(query, max_results, filters, search_type) for query in queries]
+
+        embeddings = embed_queries(getattr(self.vector_db, "embedder", None), unique_queries)
+        # Search a copy of the vector db that embeds the queries with their precomputed embeddings
+        vector_db = with_precomputed_embeddings(self.vector_db, embeddings)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(unique_queries)))) as executor:
+            futures = [
+                executor.submit(self._search, vector_db, query, max_results, filters, search_type)
+                for query in unique_queries
+            ]
+            results = dict(zip(unique_queries, [future.result() for future in futures]))
+        return [results[query] for query in queries]
+
+    def search_many(
+        self,
+        queries: List[str],
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        search_type: Optional[str] = None,
+    ) -> List[Document]:
+        """Returns the relevant documents matching any of the queries, de-duplicated and ranked with RRF"""
+        results = self.search_batch(queries, max_results=max_results, filters=filters, search_type=search_type)
+        return self._merge_results(queries, results, max_results)
+
+    async def async_search_batch(
+        self,
+        queries: List[str],
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        search_type: Optional[str] = None,
+    ) -> List[List[Document]]:
+        """Async version of search_batch"""
+        from agno.knowledge.embedder.precomputed import with_precomputed_embeddings
+
+        unique_queries = list(dict.fromkeys(queries))
+        if len(unique_queries) < 2:
+            return [await self._async_search(query, max_results, filters, search_type) for query in queries]
+
+        embeddings = await aembed_queries(getattr(self.vector_db, "embedder", None), unique_queries)
+        # Search a copy of the vector db that embeds the queries with their precomputed embeddings
+        vector_db = with_precomputed_embeddings(self.vector_db, embeddings)
+        searches = [
+            self._async_search(query, max_results, filters, search_type, vector_db=vector_db)
+            for query in unique_queries
+        ]
+        results = dict(zip(unique_queries, await asyncio.gather(*searches)))
+        return [results[query] for query in queries]
+
+    async def async_search_many(
+        self,
+        queries: List[str],
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        search_type: Optional[str] = None,
+    ) -> List[Document]:
+        """Async version of search_many"""
+        results = await self.async_search_batch(
+            queries, max_results=max_results, filters=filters, search_type=search_type
+        )
+        return self._merge_results(queries, results, max_results)
+
+    def _merge_results(
+        self, queries: List[str], results: List[List[Document]], max_results: Optional[int]
+    ) -> List[Document]:
+        from agno.vectordb.fusion import fuse_results
+
+        return fuse_results(dict(zip(queries, results)), limit=max_results or self.max_results)
+
     async def async_search(
         self,
         query: str,
@@ -1420,28 +1698,37 @@ class Knowledge:
         search_type: Optional[str] = None,
     ) -> List[Document]:
         """Returns relevant documents matching a query"""
-        from agno.vectordb import VectorDb
+        if not self.coalesce_searches:
+            return await self._async_search(query, max_results, filters, search_type)
+        if self._search_coalescer is None:
+            self._search_coalescer = SearchCoalescer(self.async_search_batch)
+        return await self._search_coalescer.search(query, max_results, filters, search_type)
+
+    async def _async_search(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        search_type: Optional[str] = None,
+        vector_db: Any = None,
+    ) -> List[Document]:
         from agno.vectordb.search import SearchType
 
-        self.vector_db = cast(VectorDb, self.vector_db)
-        if (
-            hasattr(self.vector_db, "search_type")
-            and isinstance(self.vector_db.search_type, SearchType)
-            and search_type
-        ):
-            self.vector_db.search_type = SearchType(search_type)
+        vector_db = vector_db if vector_db is not None else self.vector_db
+        if hasattr(vector_db, "search_type") and isinstance(vector_db.search_type, SearchType) and search_type:
+            vector_db.search_type = SearchType(search_type)
         try:
-            if self.vector_db is None:
+            if vector_db is None:
                 log_warning("No vector db provided")
                 return []
 
             _max_results = max_results or self.max_results
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
             try:
-                return await self.vector_db.async_search(query=query, limit=_max_results, filters=filters)
+                return await vector_db.async_search(query=query, limit=_max_results, filters=filters)
             except NotImplementedError:
                 log_info("Vector db does not support async search")
-                return self.search(query=query, max_results=_max_results, filters=filters)
+                return self._search(vector_db, query, max_results=_max_results, filters=filters)
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
@@ -1720,6 +2007,7 @@ class Knowledge:
     def remove_content_by_id(self, content_id: str):
         from agno.vectordb import VectorDb
 
+        self._version += 1
         self.vector_db = cast(VectorDb, self.vector_db)
         if self.vector_db is not None:
             if self.vector_db.__class__.__name__ == "LightRag":
@@ -1736,6 +2024,7 @@ class Knowledge:
             self.contents_db.delete_knowledge_content(content_id)
 
     async def aremove_content_by_id(self, content_id: str):
+        self._version += 1
         if self.vector_db is not None:
             if self.vector_db.__class__.__name__ == "LightRag":
                 # For LightRAG, get the content first to find the external_id
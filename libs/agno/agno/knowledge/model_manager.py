@@ -0,0 +1,234 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+from agno.utils.log import log_debug, log_error
+
+
+@dataclass
+class BatchMetrics:
+    """Queue and batch size metrics of a MicroBatcher"""
+
+    # Number of submitted requests, each holding one or more items
+    num_requests: int = 0
+    # Number of items processed
+    num_items: int = 0
+    # Number of batches run by the model
+    num_batches: int = 0
+    max_batch_size: int = 0
+    # Total time requests spent waiting for their batch to start, in seconds
+    total_queue_time: float = 0.0
+    # Total time spent running batches, in seconds
+    total_batch_time: float = 0.0
+    # Number of requests waiting for a batch
+    queue_size: int = 0
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.num_items / self.num_batches if self.num_batches else 0.0
+
+    @property
+    def avg_queue_time(self) -> float:
+        return self.total_queue_time / self.num_requests if self.num_requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_requests": self.num_requests,
+            "num_items": self.num_items,
+            "num_batches": self.num_batches,
+            "max_batch_size": self.max_batch_size,
+            "avg_batch_size": self.avg_batch_size,
+            "avg_queue_time": self.avg_queue_time,
+            "total_batch_time": self.total_batch_time,
+            "queue_size": self.queue_size,
+        }
+
+
+@dataclass
+class _BatchRequest:
+    items: Sequence[Any]
+    future: "Future[List[Any]]"
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatcher:
+    """
+    Batches concurrent requests to a local model into one forward pass.
+
+    A worker thread waits for the first request, then collects more requests for up to `max_wait` seconds or until
+    the batch holds `max_batch_size` items, and runs them together. Requests from threads and event loops can share
+    a batcher.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.005,
+        name: str = "model",
+    ):
+        # Function running the model on a list of items, returning one result per item
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.name = name
+        self.metrics = BatchMetrics()
+
+        self._queue: "Queue[_BatchRequest]" = Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name=f"micro_batcher_{self.name}", daemon=True)
+                self._worker.start()
+
+    def submit_future(self, items: Sequence[Any]) -> "Future[List[Any]]":
+        """Queue the items for the next batch, and return a future resolving to their results"""
+        future: "Future[List[Any]]" = Future()
+        if len(items) == 0:
+            future.set_result([])
+            return future
+        self._ensure_worker()
+        with self._lock:
+            self.metrics.num_requests += 1
+            self.metrics.queue_size += 1
+        self._queue.put(_BatchRequest(items=items, future=future))
+        return future
+
+    def submit(self, items: Sequence[Any]) -> List[Any]:
+        return self.submit_future(items).result()
+
+    async def asubmit(self, items: Sequence[Any]) -> List[Any]:
+        return await asyncio.wrap_future(self.submit_future(items))
+
+    def _collect_batch(self, first: _BatchRequest) -> List[_BatchRequest]:
+        batch = [first]
+        num_items = len(first.items)
+        deadline = time.perf_counter() + self.max_wait
+        while num_items < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except Empty:
+                break
+            batch.append(request)
+            num_items += len(request.items)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch(self._queue.get())
+
+            started_at = time.perf_counter()
+            with self._lock:
+                self.metrics.queue_size -= len(batch)
+                self.metrics.total_queue_time += sum(started_at - request.submitted_at for request in batch)
+
+            # Skip the requests cancelled while waiting
+            batch = [request for request in batch if request.future.set_running_or_notify_cancel()]
+            if len(batch) == 0:
+                continue
+            items = [item for request in batch for item in request.items]
+
+            try:
+                results = list(self.batch_fn(items))
+                if len(results) != len(items):
+                    raise ValueError(f"Expected {len(items)} results from {self.name}, got {len(results)}")
+            except Exception as e:
+                log_error(f"Error running batch of {len(items)} items on {self.name}: {e}")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            with self._lock:
+                self.metrics.num_batches += 1
+                self.metrics.num_items += len(items)
+                self.metrics.max_batch_size = max(self.metrics.max_batch_size, len(items))
+                self.metrics.total_batch_time += time.perf_counter() - started_at
+            log_debug(f"Ran batch of {len(items)} items from {len(batch)} requests on {self.name}")
+
+            start = 0
+            for request in batch:
+                request.future.set_result(results[start : start + len(request.items)])
+                start += len(request.items)
+
+
+class LocalModelManager:
+    """
+    Loads local models once per process and shares them, and their batchers, across embedders and rerankers.
+
+    Use `get_local_model_manager()` to get the process-wide instance.
+    """
+
+    def __init__(self):
+        self._models: Dict[Hashable, Any] = {}
+        self._batchers: Dict[Hashable, MicroBatcher] = {}
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_model(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the model stored under the key, loading it on first use"""
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        # Hold a lock per model while loading, so concurrent first requests load it once
+        with load_lock:
+            model = self._models.get(key)
+            if model is None:
+                log_debug(f"Loading local model: {key}")
+                model = self._models[key] = loader()
+        return model
+
+    def get_batcher(
+        self,
+        key: Hashable,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.005,
+    ) -> MicroBatcher:
+        """Return the batcher stored under the key, creating it with the batch function on first use"""
+        batcher = self._batchers.get(key)
+        if batcher is None:
+            with self._lock:
+                batcher = self._batchers.get(key)
+                if batcher is None:
+                    batcher = self._batchers[key] = MicroBatcher(
+                        batch_fn=batch_fn, max_batch_size=max_batch_size, max_wait=max_wait, name=str(key)
+                    )
+        return batcher
+
+    def unload(self, key: Hashable) -> None:
+        """Drop a model, so it is loaded again on next use"""
+        with self._lock:
+            self._models.pop(key, None)
+            self._load_locks.pop(key, None)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return the queue and batch size metrics of each batcher"""
+        return {str(key): batcher.metrics.to_dict() for key, batcher in self._batchers.items()}
+
+
+_local_model_manager: Optional[LocalModelManager] = None
+_local_model_manager_lock = threading.Lock()
+
+
+def get_local_model_manager() -> LocalModelManager:
+    global _local_model_manager
+    if _local_model_manager is None:
+        with _local_model_manager_lock:
+            if _local_model_manager is None:
+                _local_model_manager = LocalModelManager()
+    return _local_model_manager
@@ -1,5 +1,9 @@
 import asyncio
+import atexit
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from typing import IO, Any, List, Optional, Tuple, Union
 from uuid import uuid4
@@ -73,6 +77,41 @@ async def _async_ocr_reader(page: Any) -> str:
     return images_text
 
 
+def _split_page_ranges(num_pages: int, num_ranges: int) -> List[Tuple[int, int]]:
+    """Split the pages of a PDF into contiguous (start, end) ranges of roughly equal size."""
+    num_ranges = max(1, min(num_ranges, num_pages))
+    range_size, remainder = divmod(num_pages, num_ranges)
+    page_ranges = []
+    start = 0
+    for i in range(num_ranges):
+        end = start + range_size + (1 if i < remainder else 0)
+        page_ranges.append((start, end))
+        start = end
+    return page_ranges
+
+
+def _extract_page_range(
+    pdf_source: Union[str, bytes],
+    start: int,
+    end: int,
+    read_images: bool = False,
+    password: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Extract the text, and optionally the OCR text of the images, of a range of pages.
+
+    Runs in a worker process, so the PDF is opened again from its path or bytes.
+    """
+    doc_reader = DocumentReader(BytesIO(pdf_source) if isinstance(pdf_source, bytes) else pdf_source)
+    if doc_reader.is_encrypted and password:
+        doc_reader.decrypt(password)
+
+    page_texts = []
+    for page in doc_reader.pages[start:end]:
+        page_texts.append((page.extract_text(), _ocr_reader(page) if read_images else ""))
+    return page_texts
+
+
 def _clean_page_numbers(
     page_content_list: List[str],
     extra_content: List[str] = [],
@@ -185,6 +224,7 @@ class BasePDFReader(Reader):
         page_end_numbering_format: Optional[str] = None,
         password: Optional[str] = None,
         chunking_strategy: Optional[ChunkingStrategy] = DocumentChunking(chunk_size=5000),
+        max_workers: Optional[int] = None,
         **kwargs,
     ):
         if page_start_numbering_format is None:
@@ -196,6 +236,10 @@ class BasePDFReader(Reader):
         self.page_start_numbering_format = page_start_numbering_format
         self.page_end_numbering_format = page_end_numbering_format
         self.password = password
+        # Number of worker processes used to extract page texts and run OCR, each one handling a range of pages.
+        # By default pages are extracted in the current process.
+        self.max_workers = max_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
 
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
 
@@ -251,6 +295,60 @@ class BasePDFReader(Reader):
             log_error(f'Error decrypting PDF file "{doc_name}": {e}')
             return False
 
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # Readers run in threaded and async applications, where forking a process can deadlock on locks held by
+            # other threads, so workers are spawned
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(self._process_pool.shutdown, wait=False, cancel_futures=True)
+        return self._process_pool
+
+    def _use_process_pool(self, doc_reader: DocumentReader, pdf: Optional[Union[str, Path, IO[Any]]]) -> bool:
+        return bool(self.max_workers and self.max_workers > 1 and pdf is not None and len(doc_reader.pages) > 1)
+
+    def _get_pdf_source(self, pdf: Union[str, Path, IO[Any]]) -> Union[str, bytes]:
+        """Get the PDF as something that can be sent to a worker process: its path or its bytes."""
+        if isinstance(pdf, (str, Path)):
+            return str(pdf)
+        pdf.seek(0)
+        return pdf.read()
+
+    def _extract_pages_in_processes(
+        self,
+        pdf_source: Union[str, bytes],
+        num_pages: int,
+        read_images: bool = False,
+        password: Optional[str] = None,
+    ) -> List[Tuple[str, str]]:
+        process_pool = self._get_process_pool()
+        futures = [
+            process_pool.submit(_extract_page_range, pdf_source, start, end, read_images, password or self.password)
+            for start, end in _split_page_ranges(num_pages, self.max_workers)  # type: ignore[arg-type]
+        ]
+        # Page ranges are contiguous, so concatenating the results keeps the pages in order
+        return [page for future in futures for page in future.result()]
+
+    async def _async_extract_pages_in_processes(
+        self,
+        pdf_source: Union[str, bytes],
+        num_pages: int,
+        read_images: bool = False,
+        password: Optional[str] = None,
+    ) -> List[Tuple[str, str]]:
+        loop = asyncio.get_running_loop()
+        process_pool = self._get_process_pool()
+        page_ranges = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    process_pool, _extract_page_range, pdf_source, start, end, read_images, password or self.password
+                )
+                for start, end in _split_page_ranges(num_pages, self.max_workers)  # type: ignore[arg-type]
+            ]
+        )
+        return [page for page_range in page_ranges for page in page_range]
+
     def _create_documents(self, pdf_content: List[str], doc_name: str, use_uuid_for_id: bool, page_number_shift):
         if self.split_on_pages:
             shift = page_number_shift if page_number_shift is not None else 1
@@ -284,13 +382,26 @@ class BasePDFReader(Reader):
         doc_name,
         read_images=False,
         use_uuid_for_id=False,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
     ):
         pdf_content = []
         pdf_images_text = []
-        for page in doc_reader.pages:
-            pdf_content.append(page.extract_text())
-            if read_images:
-                pdf_images_text.append(_ocr_reader(page))
+        if self._use_process_pool(doc_reader, pdf):
+            for page_text, page_images_text in self._extract_pages_in_processes(
+                self._get_pdf_source(pdf),  # type: ignore[arg-type]
+                len(doc_reader.pages),
+                read_images=read_images,
+                password=password,
+            ):
+                pdf_content.append(page_text)
+                if read_images:
+                    pdf_images_text.append(page_images_text)
+        else:
+            for page in doc_reader.pages:
+                pdf_content.append(page.extract_text())
+                if read_images:
+                    pdf_images_text.append(_ocr_reader(page))
 
         pdf_content, shift = _clean_page_numbers(
             page_content_list=pdf_content,
@@ -306,7 +417,25 @@ class BasePDFReader(Reader):
         doc_name: str,
         read_images=False,
         use_uuid_for_id=False,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
     ):
+        if self._use_process_pool(doc_reader, pdf):
+            # Extraction and OCR are CPU bound, run them in worker processes to keep the event loop free
+            pdf_pages = await self._async_extract_pages_in_processes(
+                self._get_pdf_source(pdf),  # type: ignore[arg-type]
+                len(doc_reader.pages),
+                read_images=read_images,
+                password=password,
+            )
+            pdf_content_clean, shift = _clean_page_numbers(
+                page_content_list=[x[0] for x in pdf_pages],
+                extra_content=[x[1] for x in pdf_pages],
+                page_start_numbering_format=self.page_start_numbering_format,
+                page_end_numbering_format=self.page_end_numbering_format,
+            )
+            return self._create_documents(pdf_content_clean, doc_name, use_uuid_for_id, shift)
+
         async def _read_pdf_page(page, read_images) -> Tuple[str, str]:
             # We tried "asyncio.to_thread(page.extract_text)", but it maintains state internally, which leads to issues.
             page_text = page.extract_text()
@@ -356,7 +485,13 @@ class PDFReader(BasePDFReader):
             return []
 
         # Read and chunk
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        return self._pdf_reader_to_documents(
+            pdf_reader,
+            doc_name,
+            use_uuid_for_id=True,
+            pdf=pdf,
+            password=password,
+        )
 
     async def async_read(
         self,
@@ -381,7 +516,13 @@ class PDFReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader,
+            doc_name,
+            use_uuid_for_id=True,
+            pdf=pdf,
+            password=password,
+        )
 
 
 class PDFImageReader(BasePDFReader):
@@ -406,7 +547,14 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=False)
+        return self._pdf_reader_to_documents(
+            pdf_reader,
+            doc_name,
+            read_images=True,
+            use_uuid_for_id=False,
+            pdf=pdf,
+            password=password,
+        )
 
     async def async_read(
         self, pdf: Union[str, Path, IO[Any]], name: Optional[str] = None, password: Optional[str] = None
@@ -428,4 +576,11 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=False)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader,
+            doc_name,
+            read_images=True,
+            use_uuid_for_id=False,
+            pdf=pdf,
+            password=password,
+        )
@@ -1,9 +1,12 @@
 import asyncio
-import random
+import threading
 import time
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 
 import httpx
 
@@ -20,15 +23,30 @@ except ImportError:
     raise ImportError("The `bs4` package is not installed. Please install it via `pip install beautifulsoup4`.")
 
 
+@dataclass
+class CachedPage:
+    """A crawled page, kept to answer conditional requests when the website is crawled again"""
+
+    content: str
+    links: List[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
 @dataclass
 class WebsiteReader(Reader):
     """Reader for Websites"""
 
     max_depth: int = 3
     max_links: int = 10
-
-    _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
+    # Maximum number of requests in flight per host
+    max_concurrency: int = 4
+    # Maximum number of requests per second per host. A larger robots.txt Crawl-delay takes precedence.
+    requests_per_second: Optional[float] = 2.0
+    respect_robots_txt: bool = True
+    user_agent: Optional[str] = None
+    # Maximum number of crawled pages kept to answer conditional requests when a website is crawled again
+    max_cached_pages: int = 1000
 
     def __init__(
         self,
@@ -37,6 +55,11 @@ class WebsiteReader(Reader):
         max_links: int = 10,
         timeout: int = 10,
         proxy: Optional[str] = None,
+        max_concurrency: int = 4,
+        requests_per_second: Optional[float] = 2.0,
+        respect_robots_txt: bool = True,
+        user_agent: Optional[str] = None,
+        max_cached_pages: int = 1000,
         **kwargs,
     ):
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
@@ -44,9 +67,19 @@ class WebsiteReader(Reader):
         self.max_links = max_links
         self.proxy = proxy
         self.timeout = timeout
-
-        self._visited = set()
-        self._urls_to_crawl = []
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_second = requests_per_second
+        self.respect_robots_txt = respect_robots_txt
+        self.user_agent = user_agent
+        self.max_cached_pages = max_cached_pages
+
+        # Kept across crawls, so re-crawling a website only downloads what changed
+        self._robots_cache: Dict[str, Optional[RobotFileParser]] = {}
+        # Least recently crawled pages are evicted first
+        self._page_cache: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        self._next_request_at: Dict[str, float] = {}
+        self._rate_limit_lock = threading.Lock()
 
     @classmethod
     def get_supported_chunking_strategies(self) -> List[ChunkingStrategyType]:
@@ -63,26 +96,6 @@ class WebsiteReader(Reader):
     def get_supported_content_types(self) -> List[ContentType]:
         return [ContentType.URL]
 
-    def delay(self, min_seconds=1, max_seconds=3):
-        """
-        Introduce a random delay.
-
-        :param min_seconds: Minimum number of seconds to delay. Default is 1.
-        :param max_seconds: Maximum number of seconds to delay. Default is 3.
-        """
-        sleep_time = random.uniform(min_seconds, max_seconds)
-        time.sleep(sleep_time)
-
-    async def async_delay(self, min_seconds=1, max_seconds=3):
-        """
-        Introduce a random delay asynchronously.
-
-        :param min_seconds: Minimum number of seconds to delay. Default is 1.
-        :param max_seconds: Maximum number of seconds to delay. Default is 3.
-        """
-        sleep_time = random.uniform(min_seconds, max_seconds)
-        await asyncio.sleep(sleep_time)
-
     def _get_primary_domain(self, url: str) -> str:
         """
         Extract primary domain from the given URL.
@@ -138,10 +151,202 @@ class WebsiteReader(Reader):
             unwanted.decompose()
         return soup.get_text(strip=True, separator=" ")
 
+    def _get_client_kwargs(self) -> Dict[str, Any]:
+        """Arguments for the HTTP client shared by all requests of a crawl"""
+        client_kwargs: Dict[str, Any] = {
+            "timeout": self.timeout,
+            "follow_redirects": True,
+            "limits": httpx.Limits(
+                max_connections=self.max_concurrency * 4, max_keepalive_connections=self.max_concurrency
+            ),
+        }
+        if self.proxy:
+            client_kwargs["proxy"] = self.proxy
+        if self.user_agent:
+            client_kwargs["headers"] = {"User-Agent": self.user_agent}
+        return client_kwargs
+
+    def _get_origin(self, url: str) -> str:
+        parsed_url = urlparse(url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    def _parse_robots_txt(self, response: httpx.Response) -> Optional[RobotFileParser]:
+        """Parse a robots.txt response. Returns None, allowing everything, if the website has no robots.txt."""
+        if response.status_code >= 400:
+            return None
+        robots_parser = RobotFileParser()
+        robots_parser.parse(response.text.splitlines())
+        return robots_parser
+
+    def _is_allowed_by_robots(self, url: str) -> bool:
+        robots_parser = self._robots_cache.get(self._get_origin(url))
+        if robots_parser is None:
+            return True
+        return robots_parser.can_fetch(self.user_agent or "*", url)
+
+    def _load_robots_txt(self, client: httpx.Client, url: str) -> None:
+        origin = self._get_origin(url)
+        if origin in self._robots_cache:
+            return
+        try:
+            self._robots_cache[origin] = self._parse_robots_txt(client.get(f"{origin}/robots.txt"))
+        except httpx.HTTPError as e:
+            log_debug(f"Could not fetch robots.txt for {origin}: {e}")
+            self._robots_cache[origin] = None
+
+    async def _async_load_robots_txt(self, client: httpx.AsyncClient, url: str) -> None:
+        origin = self._get_origin(url)
+        if origin in self._robots_cache:
+            return
+        try:
+            self._robots_cache[origin] = self._parse_robots_txt(await client.get(f"{origin}/robots.txt"))
+        except httpx.HTTPError as e:
+            log_debug(f"Could not fetch robots.txt for {origin}: {e}")
+            self._robots_cache[origin] = None
+
+    def _reserve_request_slot(self, url: str) -> float:
+        """
+        Reserve the next request slot for the host of the given URL.
+
+        :param url: The URL that will be requested.
+        :return: The number of seconds to wait before sending the request.
+        """
+        min_interval = 1 / self.requests_per_second if self.requests_per_second else 0.0
+        if self.respect_robots_txt:
+            robots_parser = self._robots_cache.get(self._get_origin(url))
+            crawl_delay = robots_parser.crawl_delay(self.user_agent or "*") if robots_parser else None
+            if crawl_delay:
+                min_interval = max(min_interval, float(crawl_delay))
+
+        host = urlparse(url).netloc
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            request_at = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = request_at + min_interval
+        return request_at - now
+
+    def _get_conditional_headers(self, url: str) -> Dict[str, str]:
+        cached_page = self._page_cache.get(url)
+        if cached_page is None:
+            return {}
+        headers = {}
+        if cached_page.etag:
+            headers["If-None-Match"] = cached_page.etag
+        if cached_page.last_modified:
+            headers["If-Modified-Since"] = cached_page.last_modified
+        return headers
+
+    def _extract_links(self, soup: BeautifulSoup, current_url: str, primary_domain: str) -> List[str]:
+        """Extract the links to crawl next from a page"""
+        links = []
+        for link in soup.find_all("a", href=True):
+            if not isinstance(link, Tag):
+                continue
+
+            full_url = urljoin(current_url, str(link["href"]))
+            if not isinstance(full_url, str):
+                continue
+
+            parsed_url = urlparse(full_url)
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                links.append(full_url)
+        return links
+
+    def _parse_response(self, url: str, response: httpx.Response, primary_domain: str) -> Tuple[str, List[str]]:
+        """
+        Extract the main content and the links of a crawled page.
+
+        :param url: The crawled URL.
+        :param response: The response to the request for the URL.
+        :param primary_domain: Only links within this domain are returned.
+        :return: The main content of the page and the links found on it.
+        """
+        cached_page = self._page_cache.get(url)
+        if response.status_code == 304 and cached_page is not None:
+            log_debug(f"Not modified since the last crawl: {url}")
+            return cached_page.content, cached_page.links
+
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.content, "html.parser")
+        main_content = self._extract_main_content(soup)
+        links = self._extract_links(soup, url, primary_domain)
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            self._cache_page(url, CachedPage(content=main_content, links=links, etag=etag, last_modified=last_modified))
+        return main_content, links
+
+    def _cache_page(self, url: str, cached_page: CachedPage) -> None:
+        with self._page_cache_lock:
+            self._page_cache[url] = cached_page
+            self._page_cache.move_to_end(url)
+            while len(self._page_cache) > self.max_cached_pages:
+                self._page_cache.popitem(last=False)
+
+    def _fetch_page(self, client: httpx.Client, url: str, primary_domain: str) -> Tuple[str, List[str]]:
+        if self.respect_robots_txt:
+            self._load_robots_txt(client, url)
+            if not self._is_allowed_by_robots(url):
+                log_debug(f"Disallowed by robots.txt, skipping: {url}")
+                return "", []
+
+        wait_seconds = self._reserve_request_slot(url)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+        log_debug(f"Crawling: {url}")
+        response = client.get(url, headers=self._get_conditional_headers(url))
+        return self._parse_response(url, response, primary_domain)
+
+    async def _async_fetch_page(
+        self, client: httpx.AsyncClient, url: str, primary_domain: str
+    ) -> Tuple[str, List[str]]:
+        if self.respect_robots_txt:
+            await self._async_load_robots_txt(client, url)
+            if not self._is_allowed_by_robots(url):
+                log_debug(f"Disallowed by robots.txt, skipping: {url}")
+                return "", []
+
+        wait_seconds = self._reserve_request_slot(url)
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+        log_debug(f"Crawling asynchronously: {url}")
+        response = await client.get(url, headers=self._get_conditional_headers(url))
+        # Parsing is CPU bound, keep it off the event loop
+        return await asyncio.to_thread(self._parse_response, url, response, primary_domain)
+
+    def _add_links_to_crawl(
+        self, links: List[str], depth: int, visited: Set[str], urls_to_crawl: Deque[Tuple[str, int]]
+    ) -> None:
+        if depth > self.max_depth:
+            return
+        for link in links:
+            if link not in visited:
+                visited.add(link)
+                urls_to_crawl.append((link, depth))
+
+    def _pop_url_to_crawl(
+        self, urls_to_crawl: Deque[Tuple[str, int]], requests_per_host: Dict[str, int]
+    ) -> Optional[Tuple[str, int]]:
+        """Pop the first URL whose host has not reached `max_concurrency` requests in flight"""
+        for index, (current_url, current_depth) in enumerate(urls_to_crawl):
+            if requests_per_host[urlparse(current_url).netloc] < self.max_concurrency:
+                del urls_to_crawl[index]
+                return current_url, current_depth
+        return None
+
     def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
 
+        Pages are fetched concurrently over a shared connection pool, with at most `max_concurrency` requests in
+        flight and `requests_per_second` requests per second for each host.
+
         Parameters:
         - url (str): The starting URL to begin the crawl.
         - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
@@ -160,94 +365,69 @@ class WebsiteReader(Reader):
         The crawler will also respect the `max_depth` attribute of the WebCrawler class, ensuring it does not
         crawl deeper than the specified depth.
         """
-        num_links = 0
         crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
-        # Add starting URL with its depth to the global list
-        self._urls_to_crawl.append((url, starting_depth))
-        while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
-
-            # Skip if
-            # - URL is already visited
-            # - does not end with the primary domain,
-            # - exceeds max depth
-            # - exceeds max links
-            if (
-                current_url in self._visited
-                or not urlparse(current_url).netloc.endswith(primary_domain)
-                or (current_depth > self.max_depth and current_url != url)
-                or num_links >= self.max_links
-            ):
-                continue
-
-            self._visited.add(current_url)
-            self.delay()
+        # Crawl state is local, so the same reader can crawl several websites at once
+        visited: Set[str] = {url}
+        urls_to_crawl: Deque[Tuple[str, int]] = deque([(url, starting_depth)])
 
-            try:
-                log_debug(f"Crawling: {current_url}")
+        futures: Dict[Future, Tuple[str, int]] = {}
+        requests_per_host: Dict[str, int] = defaultdict(int)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            with httpx.Client(**self._get_client_kwargs()) as client:
+                while (urls_to_crawl or futures) and len(crawler_result) < self.max_links:
+                    # Never have more pages in flight than we still need
+                    while len(crawler_result) + len(futures) < self.max_links:
+                        next_url = self._pop_url_to_crawl(urls_to_crawl, requests_per_host)
+                        if next_url is None:
+                            break
+                        requests_per_host[urlparse(next_url[0]).netloc] += 1
+                        futures[executor.submit(self._fetch_page, client, next_url[0], primary_domain)] = next_url
+
+                    if not futures:
+                        break
+
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        current_url, current_depth = futures.pop(future)
+                        requests_per_host[urlparse(current_url).netloc] -= 1
+                        try:
+                            main_content, links = future.result()
+                        except httpx.HTTPStatusError as e:
+                            # Log HTTP status errors but continue crawling other pages
+                            # Skip redirect errors (3xx) as they should be handled by follow_redirects
+                            if e.response.status_code >= 300 and e.response.status_code < 400:
+                                logger.debug(f"Redirect encountered for {current_url}, skipping: {e}")
+                            else:
+                                logger.warning(f"HTTP status error while crawling {current_url}: {e}")
+                            # For the initial URL, we should raise the error only if it's not a redirect
+                            if current_url == url and not crawler_result and not (300 <= e.response.status_code < 400):
+                                raise
+                            continue
+                        except httpx.RequestError as e:
+                            # Log request errors but continue crawling other pages
+                            logger.warning(f"Request error while crawling {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and not crawler_result:
+                                raise
+                            continue
+                        except Exception as e:
+                            # Log other exceptions but continue crawling other pages
+                            logger.warning(f"Failed to crawl {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and not crawler_result:
+                                # Wrap non-HTTP exceptions in a RequestError
+                                raise httpx.RequestError(
+                                    f"Failed to crawl starting URL {url}: {str(e)}", request=None
+                                ) from e
+                            continue
 
-                response = (
-                    httpx.get(current_url, timeout=self.timeout, proxy=self.proxy, follow_redirects=True)
-                    if self.proxy
-                    else httpx.get(current_url, timeout=self.timeout, follow_redirects=True)
-                )
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Extract main content
-                main_content = self._extract_main_content(soup)
-                if main_content:
-                    crawler_result[current_url] = main_content
-                    num_links += 1
-
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
-                        continue
-
-                    href_str = str(link["href"])
-                    full_url = urljoin(current_url, href_str)
-
-                    if not isinstance(full_url, str):
-                        continue
-
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        full_url_str = str(full_url)
-                        if (
-                            full_url_str not in self._visited
-                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                        ):
-                            self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-            except httpx.HTTPStatusError as e:
-                # Log HTTP status errors but continue crawling other pages
-                # Skip redirect errors (3xx) as they should be handled by follow_redirects
-                if e.response.status_code >= 300 and e.response.status_code < 400:
-                    logger.debug(f"Redirect encountered for {current_url}, skipping: {e}")
-                else:
-                    logger.warning(f"HTTP status error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error only if it's not a redirect
-                if current_url == url and not crawler_result and not (300 <= e.response.status_code < 400):
-                    raise
-            except httpx.RequestError as e:
-                # Log request errors but continue crawling other pages
-                logger.warning(f"Request error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    raise
-            except Exception as e:
-                # Log other exceptions but continue crawling other pages
-                logger.warning(f"Failed to crawl {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    # Wrap non-HTTP exceptions in a RequestError
-                    raise httpx.RequestError(f"Failed to crawl starting URL {url}: {str(e)}", request=None) from e
+                        if main_content and len(crawler_result) < self.max_links:
+                            crawler_result[current_url] = main_content
+                        self._add_links_to_crawl(links, current_depth + 1, visited, urls_to_crawl)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
         # If we couldn't crawl any pages, raise an error
         if not crawler_result:
@@ -255,107 +435,110 @@ class WebsiteReader(Reader):
 
         return crawler_result
 
-    async def async_crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
+    async def async_crawl_stream(self, url: str, starting_depth: int = 1) -> AsyncIterator[Tuple[str, str]]:
         """
-        Asynchronously crawls a website and returns a dictionary of URLs and their corresponding content.
+        Asynchronously crawls a website, yielding each URL and its main content as soon as the page is crawled.
+
+        Pages are fetched concurrently over a shared connection pool, with at most `max_concurrency` requests in
+        flight and `requests_per_second` requests per second for each host.
 
         Parameters:
         - url (str): The starting URL to begin the crawl.
         - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
 
-        Returns:
-        - Dict[str, str]: A dictionary where each key is a URL and the corresponding value is the main
-                        content extracted from that URL.
+        Yields:
+        - Tuple[str, str]: The crawled URL and the main content extracted from it.
 
         Raises:
         - httpx.HTTPStatusError: If there's an HTTP status error.
         - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
         """
         num_links = 0
-        crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
+        # Crawl state is local, so the same reader can crawl several websites at once
+        visited: Set[str] = {url}
+        urls_to_crawl: Deque[Tuple[str, int]] = deque([(url, starting_depth)])
 
-        # Clear previously visited URLs and URLs to crawl
-        self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
-
-        client_args = {"proxy": self.proxy} if self.proxy else {}
-        async with httpx.AsyncClient(**client_args) as client:  # type: ignore
-            while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
-
-                if (
-                    current_url in self._visited
-                    or not urlparse(current_url).netloc.endswith(primary_domain)
-                    or current_depth > self.max_depth
-                    or num_links >= self.max_links
-                ):
-                    continue
-
-                self._visited.add(current_url)
-                await self.async_delay()
-
-                try:
-                    log_debug(f"Crawling asynchronously: {current_url}")
-                    response = await client.get(current_url, timeout=self.timeout, follow_redirects=True)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.content, "html.parser")
-
-                    # Extract main content
-                    main_content = self._extract_main_content(soup)
-                    if main_content:
-                        crawler_result[current_url] = main_content
-                        num_links += 1
-
-                    # Add found URLs to the list, with incremented depth
-                    for link in soup.find_all("a", href=True):
-                        if not isinstance(link, Tag):
+        tasks: Dict[asyncio.Task, Tuple[str, int]] = {}
+        requests_per_host: Dict[str, int] = defaultdict(int)
+        try:
+            async with httpx.AsyncClient(**self._get_client_kwargs()) as client:
+                while (urls_to_crawl or tasks) and num_links < self.max_links:
+                    # Never have more pages in flight than we still need
+                    while num_links + len(tasks) < self.max_links:
+                        next_url = self._pop_url_to_crawl(urls_to_crawl, requests_per_host)
+                        if next_url is None:
+                            break
+                        requests_per_host[urlparse(next_url[0]).netloc] += 1
+                        task = asyncio.create_task(self._async_fetch_page(client, next_url[0], primary_domain))
+                        tasks[task] = next_url
+
+                    if not tasks:
+                        break
+
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        current_url, current_depth = tasks.pop(task)
+                        requests_per_host[urlparse(current_url).netloc] -= 1
+                        try:
+                            main_content, links = task.result()
+                        except httpx.HTTPStatusError as e:
+                            # Log HTTP status errors but continue crawling other pages
+                            logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and num_links == 0:
+                                raise
                             continue
-
-                        href_str = str(link["href"])
-                        full_url = urljoin(current_url, href_str)
-
-                        if not isinstance(full_url, str):
+                        except httpx.RequestError as e:
+                            # Log request errors but continue crawling other pages
+                            logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and num_links == 0:
+                                raise
+                            continue
+                        except Exception as e:
+                            # Log other exceptions but continue crawling other pages
+                            logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and num_links == 0:
+                                # Wrap non-HTTP exceptions in a RequestError
+                                raise httpx.RequestError(
+                                    f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
+                                ) from e
                             continue
 
-                        parsed_url = urlparse(full_url)
-                        if parsed_url.netloc.endswith(primary_domain) and not any(
-                            parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                        ):
-                            full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
-                                self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-                except httpx.HTTPStatusError as e:
-                    # Log HTTP status errors but continue crawling other pages
-                    logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except httpx.RequestError as e:
-                    # Log request errors but continue crawling other pages
-                    logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except Exception as e:
-                    # Log other exceptions but continue crawling other pages
-                    logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        # Wrap non-HTTP exceptions in a RequestError
-                        raise httpx.RequestError(
-                            f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
-                        ) from e
+                        self._add_links_to_crawl(links, current_depth + 1, visited, urls_to_crawl)
+                        if main_content and num_links < self.max_links:
+                            num_links += 1
+                            yield current_url, main_content
+        finally:
+            # The consumer may stop early, don't leave requests running in the background
+            for task in tasks:
+                task.cancel()
 
         # If we couldn't crawl any pages, raise an error
-        if not crawler_result:
+        if num_links == 0:
             raise httpx.RequestError(f"Failed to extract any content from {url} asynchronously", request=None)
 
+    async def async_crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
+        """
+        Asynchronously crawls a website and returns a dictionary of URLs and their corresponding content.
+
+        Parameters:
+        - url (str): The starting URL to begin the crawl.
+        - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
+
+        Returns:
+        - Dict[str, str]: A dictionary where each key is a URL and the corresponding value is the main
+                        content extracted from that URL.
+
+        Raises:
+        - httpx.HTTPStatusError: If there's an HTTP status error.
+        - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
+        """
+        crawler_result: Dict[str, str] = {}
+        async for crawled_url, crawled_content in self.async_crawl_stream(url, starting_depth=starting_depth):
+            crawler_result[crawled_url] = crawled_content
         return crawler_result
 
     def read(self, url: str, name: Optional[str] = None) -> List[Document]:
@@ -453,3 +636,31 @@ class WebsiteReader(Reader):
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             logger.error(f"Error reading website asynchronously {url}: {e}")
             raise
+
+    async def async_read_stream(self, url: str, name: Optional[str] = None) -> AsyncIterator[List[Document]]:
+        """
+        Asynchronously reads a website, yielding the documents of each page as soon as the page is crawled.
+
+        This lets the caller chunk and embed pages while the rest of the website is still being crawled.
+
+        :param url: The URL of the website to read.
+        :return: An async iterator over the documents of each crawled page.
+        :raises httpx.HTTPStatusError: If there's an HTTP status error.
+        :raises httpx.RequestError: If there's a request-related error.
+        """
+        log_debug(f"Reading asynchronously: {url}")
+        try:
+            async for crawled_url, crawled_content in self.async_crawl_stream(url):
+                document = Document(
+                    name=name or url,
+                    id=str(crawled_url),
+                    meta_data={"url": str(crawled_url)},
+                    content=crawled_content,
+                )
+                if self.chunk:
+                    yield await asyncio.to_thread(self.chunk_document, document)
+                else:
+                    yield [document]
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            logger.error(f"Error reading website asynchronously {url}: {e}")
+            raise
@@ -1,6 +1,8 @@
-from typing import Any, Dict, List, Optional
+import json
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.knowledge.document import Document
+from agno.knowledge.model_manager import MicroBatcher, get_local_model_manager
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import logger
 
@@ -14,13 +16,36 @@ class SentenceTransformerReranker(Reranker):
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
+    # Concurrent reranks are scored together, in batches of up to max_batch_size pairs
+    max_batch_size: int = 32
+    # How long a rerank waits for other reranks to join its batch, in seconds
+    max_batch_wait: float = 0.005
+
+    def _get_model_key(self) -> Tuple[str, str, str]:
+        return ("cross_encoder", self.model, json.dumps(self.model_kwargs, sort_keys=True, default=str))
+
+    def _get_model(self) -> CrossEncoder:
+        # The model is loaded once per process and shared by all rerankers using it
+        return get_local_model_manager().get_model(
+            self._get_model_key(),
+            lambda: CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs),
+        )
+
+    def _predict_batch(self, sentence_pairs: List[List[str]]) -> List[float]:
+        return self._get_model().predict(sentence_pairs, batch_size=self.max_batch_size).tolist()
+
+    def _get_batcher(self) -> MicroBatcher:
+        return get_local_model_manager().get_batcher(
+            self._get_model_key(),
+            batch_fn=self._predict_batch,
+            max_batch_size=self.max_batch_size,
+            max_wait=self.max_batch_wait,
+        )
 
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
-
         top_n = self.top_n
         if top_n and not (0 < top_n):
             logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
@@ -30,7 +55,7 @@ class SentenceTransformerReranker(Reranker):
 
         sentence_pairs = [[query, doc.content] for doc in documents]
 
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
+        scores = self._get_batcher().submit(sentence_pairs)
         for index, score in enumerate(scores):
             doc = documents[index]
             doc.reranking_score = score
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from agno.knowledge.document import Document
+from agno.utils.log import log_debug, log_warning
+
+# Searches the documents matching each query, given the queries, max results, filters and search type
+SearchBatchFunction = Callable[
+    [List[str], Optional[int], Optional[Dict[str, Any]], Optional[str]], Awaitable[List[List[Document]]]
+]
+
+
+def embed_queries(embedder: Any, queries: List[str]) -> Dict[str, List[float]]:
+    """Embed the queries in one batch request, if the embedder supports it. Returns the embedding of each query."""
+    if embedder is None or len(queries) < 2 or not hasattr(embedder, "get_embeddings_batch_and_usage"):
+        return {}
+    try:
+        embeddings, _ = embedder.get_embeddings_batch_and_usage(queries)
+    except Exception as e:
+        log_warning(f"Error embedding queries in batch: {e}")
+        return {}
+    return dict(zip(queries, embeddings))
+
+
+async def aembed_queries(embedder: Any, queries: List[str]) -> Dict[str, List[float]]:
+    """Async version of embed_queries"""
+    if embedder is None or len(queries) < 2:
+        return {}
+    if not hasattr(embedder, "async_get_embeddings_batch_and_usage"):
+        return await asyncio.to_thread(embed_queries, embedder, queries)
+    try:
+        embeddings, _ = await embedder.async_get_embeddings_batch_and_usage(queries)
+    except Exception as e:
+        log_warning(f"Error embedding queries in batch: {e}")
+        return {}
+    return dict(zip(queries, embeddings))
+
+
+@dataclass
+class _PendingSearches:
+    max_results: Optional[int]
+    filters: Optional[Dict[str, Any]]
+    search_type: Optional[str]
+    queries: List[str] = field(default_factory=list)
+    futures: List["asyncio.Future[List[Document]]"] = field(default_factory=list)
+
+
+class SearchCoalescer:
+    """
+    Coalesces the searches started in the same event loop iteration, like the searches of parallel tool calls, into
+    one batch search. Searches with different max results, filters or search type are batched separately.
+    """
+
+    def __init__(self, search_batch: SearchBatchFunction):
+        self.search_batch = search_batch
+        self._pending: Dict[asyncio.AbstractEventLoop, Dict[str, _PendingSearches]] = {}
+        # Keep references to the running batches, so they are not garbage collected
+        self._tasks: set = set()
+
+    async def search(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        search_type: Optional[str] = None,
+    ) -> List[Document]:
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(loop)
+        if pending is None:
+            # Run the batch once the other searches started in this iteration have joined it
+            pending = self._pending[loop] = {}
+            loop.call_soon(self._flush, loop)
+
+        key = json.dumps([max_results, filters, search_type], sort_keys=True, default=str)
+        group = pending.get(key)
+        if group is None:
+            group = pending[key] = _PendingSearches(max_results=max_results, filters=filters, search_type=search_type)
+        future: asyncio.Future[List[Document]] = loop.create_future()
+        group.queries.append(query)
+        group.futures.append(future)
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        for group in self._pending.pop(loop, {}).values():
+            task = loop.create_task(self._run(group))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, group: _PendingSearches) -> None:
+        if len(group.queries) > 1:
+            log_debug(f"Coalesced {len(group.queries)} knowledge searches")
+        try:
+            results = await self.search_batch(group.queries, group.max_results, group.filters, group.search_type)
+        except Exception as e:
+            for future in group.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, documents in zip(group.futures, results):
+            # The search may have been cancelled while waiting for the batch
+            if not future.done():
+                future.set_result(documents)
@@ -12,6 +12,7 @@ class Image(BaseModel):
     url: Optional[str] = None  # Remote location
     filepath: Optional[Union[Path, str]] = None  # Local file path
     content: Optional[bytes] = None  # Raw image bytes (standardized to bytes)
+    content_ref: Optional[str] = None  # Reference to content held in a MediaStore
 
     # Metadata fields
     id: Optional[str] = None  # For tracking/referencing
@@ -34,12 +35,12 @@ class Image(BaseModel):
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            content = data.get("content") if data.get("content") is not None else data.get("content_ref")
 
             # Count non-None sources
             sources = [x for x in [url, filepath, content] if x is not None]
             if len(sources) == 0:
-                raise ValueError("One of 'url', 'filepath', or 'content' must be provided")
+                raise ValueError("One of 'url', 'filepath', 'content' or 'content_ref' must be provided")
             elif len(sources) > 1:
                 raise ValueError("Only one of 'url', 'filepath', or 'content' should be provided")
 
@@ -53,6 +54,12 @@ class Image(BaseModel):
         """Get image content as raw bytes, loading from URL/file if needed"""
         if self.content:
             return self.content
+        elif self.content_ref:
+            from agno.media_store import resolve_content_ref
+
+            # Cache the resolved content so the media store is only read once
+            self.content = resolve_content_ref(self.content_ref)
+            return self.content
         elif self.url:
             import httpx
 
@@ -104,7 +111,10 @@ class Image(BaseModel):
             "alt_text": self.alt_text,
         }
 
-        if include_base64_content and self.content:
+        if self.content_ref:
+            # Content held in a MediaStore is stored by reference only
+            result["content_ref"] = self.content_ref
+        elif include_base64_content and self.content:
             result["content"] = self.to_base64()
 
         return {k: v for k, v in result.items() if v is not None}
@@ -117,6 +127,7 @@ class Audio(BaseModel):
     url: Optional[str] = None
     filepath: Optional[Union[Path, str]] = None
     content: Optional[bytes] = None  # Raw audio bytes (standardized to bytes)
+    content_ref: Optional[str] = None  # Reference to content held in a MediaStore
 
     # Metadata fields
     id: Optional[str] = None
@@ -138,11 +149,11 @@ class Audio(BaseModel):
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            content = data.get("content") if data.get("content") is not None else data.get("content_ref")
 
             sources = [x for x in [url, filepath, content] if x is not None]
             if len(sources) == 0:
-                raise ValueError("One of 'url', 'filepath', or 'content' must be provided")
+                raise ValueError("One of 'url', 'filepath', 'content' or 'content_ref' must be provided")
             elif len(sources) > 1:
                 raise ValueError("Only one of 'url', 'filepath', or 'content' should be provided")
 
@@ -155,6 +166,12 @@ class Audio(BaseModel):
         """Get audio content as raw bytes"""
         if self.content:
             return self.content
+        elif self.content_ref:
+            from agno.media_store import resolve_content_ref
+
+            # Cache the resolved content so the media store is only read once
+            self.content = resolve_content_ref(self.content_ref)
+            return self.content
         elif self.url:
             import httpx
 
@@ -220,7 +237,10 @@ class Audio(BaseModel):
             "expires_at": self.expires_at,
         }
 
-        if include_base64_content and self.content:
+        if self.content_ref:
+            # Content held in a MediaStore is stored by reference only
+            result["content_ref"] = self.content_ref
+        elif include_base64_content and self.content:
             result["content"] = self.to_base64()
 
         return {k: v for k, v in result.items() if v is not None}
@@ -233,6 +253,7 @@ class Video(BaseModel):
     url: Optional[str] = None
     filepath: Optional[Union[Path, str]] = None
     content: Optional[bytes] = None  # Raw video bytes (standardized to bytes)
+    content_ref: Optional[str] = None  # Reference to content held in a MediaStore
 
     # Metadata fields
     id: Optional[str] = None
@@ -256,11 +277,11 @@ class Video(BaseModel):
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            content = data.get("content") if data.get("content") is not None else data.get("content_ref")
 
             sources = [x for x in [url, filepath, content] if x is not None]
             if len(sources) == 0:
-                raise ValueError("One of 'url', 'filepath', or 'content' must be provided")
+                raise ValueError("One of 'url', 'filepath', 'content' or 'content_ref' must be provided")
             elif len(sources) > 1:
                 raise ValueError("Only one of 'url', 'filepath', or 'content' should be provided")
 
@@ -273,6 +294,12 @@ class Video(BaseModel):
         """Get video content as raw bytes"""
         if self.content:
             return self.content
+        elif self.content_ref:
+            from agno.media_store import resolve_content_ref
+
+            # Cache the resolved content so the media store is only read once
+            self.content = resolve_content_ref(self.content_ref)
+            return self.content
         elif self.url:
             import httpx
 
@@ -327,7 +354,10 @@ class Video(BaseModel):
             "revised_prompt": self.revised_prompt,
         }
 
-        if include_base64_content and self.content:
+        if self.content_ref:
+            # Content held in a MediaStore is stored by reference only
+            result["content_ref"] = self.content_ref
+        elif include_base64_content and self.content:
             result["content"] = self.to_base64()
 
         return {k: v for k, v in result.items() if v is not None}
@@ -339,6 +369,8 @@ class File(BaseModel):
     filepath: Optional[Union[Path, str]] = None
     # Raw bytes content of a file
     content: Optional[Any] = None
+    # Reference to content held in a MediaStore
+    content_ref: Optional[str] = None
     mime_type: Optional[str] = None
 
     file_type: Optional[str] = None
@@ -352,9 +384,11 @@ class File(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def check_at_least_one_source(cls, data):
-        """Ensure at least one of url, filepath, or content is provided."""
-        if isinstance(data, dict) and not any(data.get(field) for field in ["url", "filepath", "content", "external"]):
-            raise ValueError("At least one of url, filepath, content or external must be provided")
+        """Ensure at least one of url, filepath, content, content_ref or external is provided."""
+        if isinstance(data, dict) and not any(
+            data.get(field) for field in ["url", "filepath", "content", "content_ref", "external"]
+        ):
+            raise ValueError("At least one of url, filepath, content, content_ref or external must be provided")
         return data
 
     @field_validator("mime_type")
@@ -443,14 +477,24 @@ class File(BaseModel):
                     pass
         return content_normalised
 
+    def get_content_bytes(self) -> Optional[Any]:
+        """Get file content, loading it from the MediaStore if it is stored by reference"""
+        if self.content is None and self.content_ref:
+            from agno.media_store import resolve_content_ref
+
+            self.content = resolve_content_ref(self.content_ref)
+        return self.content
+
     def to_dict(self) -> Dict[str, Any]:
-        content_normalised = self._normalise_content()
+        # Content held in a MediaStore is stored by reference only
+        content_normalised = self._normalise_content() if not self.content_ref else None
 
         response_dict = {
             "id": self.id,
             "url": self.url,
             "filepath": str(self.filepath) if self.filepath else None,
             "content": content_normalised,
+            "content_ref": self.content_ref,
             "mime_type": self.mime_type,
             "file_type": self.file_type,
             "filename": self.filename,
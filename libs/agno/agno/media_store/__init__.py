@@ -0,0 +1,4 @@
+from agno.media_store.base import MediaStore, get_media_store, parse_content_ref, resolve_content_ref
+from agno.media_store.local import LocalMediaStore
+
+__all__ = ["MediaStore", "LocalMediaStore", "get_media_store", "parse_content_ref", "resolve_content_ref"]
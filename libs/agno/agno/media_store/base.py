@@ -0,0 +1,97 @@
+import asyncio
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from typing import Dict, Optional, Tuple
+
+from agno.utils.log import log_warning
+from agno.utils.string import generate_id
+
+# Media stores created in this process, keyed by store id. Used to resolve content references.
+_media_stores: Dict[str, "MediaStore"] = {}
+
+
+class MediaStore(ABC):
+    """Base class for content-addressed media stores.
+
+    Media content is stored once per unique SHA-256 digest. Stored media objects only keep a content reference
+    of the form `<store_id>/<sha256>`, which is resolved back to bytes when the content is needed.
+    """
+
+    def __init__(self, *, id: Optional[str] = None, name: Optional[str] = None):
+        """Initialize base MediaStore.
+
+        Args:
+            id: Optional custom ID. Content references embed this ID, so it must be stable across restarts.
+            name: Optional name for the media store.
+        """
+        if name is None:
+            name = self.__class__.__name__
+
+        self.name = name
+        self.id = id if id else generate_id(name)
+        _media_stores[self.id] = self
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        return sha256(content).hexdigest()
+
+    def make_ref(self, content_hash: str) -> str:
+        return f"{self.id}/{content_hash}"
+
+    @abstractmethod
+    def exists(self, content_hash: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, content_hash: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, content_hash: str, content: bytes, mime_type: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, content_hash: str) -> bool:
+        raise NotImplementedError
+
+    def put(self, content: bytes, mime_type: Optional[str] = None) -> str:
+        """Store the content if it is not already stored and return its content reference."""
+        content_hash = self.hash_content(content)
+        if not self.exists(content_hash):
+            self.write(content_hash, content, mime_type=mime_type)
+        return self.make_ref(content_hash)
+
+    def get(self, content_ref: str) -> Optional[bytes]:
+        """Return the content for a content reference created by this store."""
+        _, content_hash = parse_content_ref(content_ref)
+        return self.read(content_hash)
+
+    async def aput(self, content: bytes, mime_type: Optional[str] = None) -> str:
+        return await asyncio.to_thread(self.put, content, mime_type)
+
+    async def aget(self, content_ref: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self.get, content_ref)
+
+
+def parse_content_ref(content_ref: str) -> Tuple[str, str]:
+    """Split a content reference into (store_id, content_hash)."""
+    store_id, _, content_hash = content_ref.rpartition("/")
+    return store_id, content_hash
+
+
+def get_media_store(store_id: str) -> Optional[MediaStore]:
+    return _media_stores.get(store_id)
+
+
+def resolve_content_ref(content_ref: str) -> Optional[bytes]:
+    """Load the content for a content reference from the media store that created it."""
+    store_id, content_hash = parse_content_ref(content_ref)
+    media_store = get_media_store(store_id)
+    if media_store is None:
+        log_warning(f"Media store {store_id} is not available, cannot resolve media content")
+        return None
+    try:
+        return media_store.read(content_hash)
+    except Exception as e:
+        log_warning(f"Error reading media content {content_ref}: {e}")
+        return None
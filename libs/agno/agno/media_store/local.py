@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from agno.media_store.base import MediaStore
+from agno.utils.string import generate_id
+
+
+class LocalMediaStore(MediaStore):
+    def __init__(
+        self,
+        base_dir: Union[str, Path] = "tmp/media",
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+    ):
+        """
+        Store media content as files on the local filesystem.
+
+        Files are written to `<base_dir>/<hash[:2]>/<hash>`, so identical content is only stored once.
+
+        Args:
+            base_dir (Union[str, Path]): Directory to store the media files in.
+            id (Optional[str]): ID of the media store. Generated from the resolved base_dir if not provided.
+            name (Optional[str]): Name of the media store.
+        """
+        self.base_dir = Path(base_dir).resolve()
+        if id is None:
+            id = generate_id(f"local://{self.base_dir}")
+        super().__init__(id=id, name=name)
+
+    def _path(self, content_hash: str) -> Path:
+        return self.base_dir / content_hash[:2] / content_hash
+
+    def exists(self, content_hash: str) -> bool:
+        return self._path(content_hash).exists()
+
+    def read(self, content_hash: str) -> Optional[bytes]:
+        path = self._path(content_hash)
+        if not path.exists():
+            return None
+        return path.read_bytes()
+
+    def write(self, content_hash: str, content: bytes, mime_type: Optional[str] = None) -> None:
+        path = self._path(content_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see partial content
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+
+    def delete(self, content_hash: str) -> bool:
+        path = self._path(content_hash)
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
@@ -0,0 +1,85 @@
+from typing import Any, Optional
+
+from agno.media_store.base import MediaStore
+from agno.utils.string import generate_id
+
+try:
+    import boto3  # type: ignore[import-untyped]
+    from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+except ImportError:
+    raise ImportError("`boto3` not installed. Please install it using `pip install boto3`")
+
+
+class S3MediaStore(MediaStore):
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "agno/media",
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        s3_client: Optional[Any] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+    ):
+        """
+        Store media content in an S3-compatible object store.
+
+        Objects are written to `<prefix>/<hash[:2]>/<hash>`, so identical content is only stored once.
+
+        Args:
+            bucket_name (str): The bucket to store the media in.
+            prefix (str): Key prefix for the stored objects.
+            region_name (Optional[str]): AWS region of the bucket.
+            endpoint_url (Optional[str]): Endpoint of an S3-compatible service (e.g. MinIO, R2).
+            aws_access_key_id (Optional[str]): AWS access key id. Uses the default credentials chain if not provided.
+            aws_secret_access_key (Optional[str]): AWS secret access key.
+            s3_client (Optional[Any]): A preconfigured boto3 S3 client.
+            id (Optional[str]): ID of the media store. Generated from the bucket and prefix if not provided.
+            name (Optional[str]): Name of the media store.
+        """
+        self.bucket_name = bucket_name
+        self.prefix = prefix.strip("/")
+        if id is None:
+            id = generate_id(f"s3://{endpoint_url or ''}/{bucket_name}/{self.prefix}")
+        super().__init__(id=id, name=name)
+
+        self.s3_client = s3_client or boto3.client(
+            "s3",
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+        )
+
+    def _key(self, content_hash: str) -> str:
+        return f"{self.prefix}/{content_hash[:2]}/{content_hash}" if self.prefix else content_hash
+
+    def exists(self, content_hash: str) -> bool:
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=self._key(content_hash))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def read(self, content_hash: str) -> Optional[bytes]:
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self._key(content_hash))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def write(self, content_hash: str, content: bytes, mime_type: Optional[str] = None) -> None:
+        extra_args = {"ContentType": mime_type} if mime_type else {}
+        self.s3_client.put_object(Bucket=self.bucket_name, Key=self._key(content_hash), Body=content, **extra_args)
+
+    def delete(self, content_hash: str) -> bool:
+        if not self.exists(content_hash):
+            return False
+        self.s3_client.delete_object(Bucket=self.bucket_name, Key=self._key(content_hash))
+        return True
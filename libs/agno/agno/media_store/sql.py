@@ -0,0 +1,107 @@
+import time
+from typing import Optional
+
+from agno.media_store.base import MediaStore
+from agno.utils.log import log_debug
+from agno.utils.string import generate_id
+
+try:
+    from sqlalchemy import BigInteger, Column, LargeBinary, MetaData, String, Table, delete, select
+    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.exc import IntegrityError
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+class SqlMediaStore(MediaStore):
+    def __init__(
+        self,
+        db_url: Optional[str] = None,
+        db_engine: Optional[Engine] = None,
+        table_name: str = "agno_media",
+        db_schema: Optional[str] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+    ):
+        """
+        Store media content in a database table, one row per unique content hash.
+
+        Works with any database supported by SQLAlchemy (e.g. SQLite, PostgreSQL, MySQL).
+
+        Args:
+            db_url (Optional[str]): The database URL to connect to.
+            db_engine (Optional[Engine]): The SQLAlchemy database engine to use.
+            table_name (str): Name of the table to store the media in.
+            db_schema (Optional[str]): The database schema to use.
+            id (Optional[str]): ID of the media store. Generated from the database URL and table if not provided.
+            name (Optional[str]): Name of the media store.
+
+        Raises:
+            ValueError: If neither db_url nor db_engine are provided.
+        """
+        _engine: Optional[Engine] = db_engine
+        if _engine is None and db_url is not None:
+            _engine = create_engine(db_url)
+        if _engine is None:
+            raise ValueError("One of db_url or db_engine must be provided")
+
+        if id is None:
+            seed = f"{db_url or _engine.url.render_as_string(hide_password=True)}#{db_schema or ''}.{table_name}"
+            id = generate_id(seed)
+        super().__init__(id=id, name=name)
+
+        self.db_engine: Engine = _engine
+        self.table_name = table_name
+        self.db_schema = db_schema
+        self.table = Table(
+            table_name,
+            MetaData(schema=db_schema),
+            Column("content_hash", String(64), primary_key=True),
+            Column("content", LargeBinary, nullable=False),
+            Column("mime_type", String(255), nullable=True),
+            Column("size", BigInteger, nullable=False),
+            Column("created_at", BigInteger, nullable=False),
+        )
+        self._table_created = False
+
+    def _ensure_table(self) -> None:
+        if not self._table_created:
+            log_debug(f"Creating media table {self.table_name} if it does not exist")
+            self.table.create(self.db_engine, checkfirst=True)
+            self._table_created = True
+
+    def exists(self, content_hash: str) -> bool:
+        self._ensure_table()
+        with self.db_engine.connect() as conn:
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash == content_hash)
+            return conn.execute(stmt).first() is not None
+
+    def read(self, content_hash: str) -> Optional[bytes]:
+        self._ensure_table()
+        with self.db_engine.connect() as conn:
+            stmt = select(self.table.c.content).where(self.table.c.content_hash == content_hash)
+            row = conn.execute(stmt).first()
+            return row[0] if row is not None else None
+
+    def write(self, content_hash: str, content: bytes, mime_type: Optional[str] = None) -> None:
+        self._ensure_table()
+        try:
+            with self.db_engine.begin() as conn:
+                conn.execute(
+                    self.table.insert().values(
+                        content_hash=content_hash,
+                        content=content,
+                        mime_type=mime_type,
+                        size=len(content),
+                        created_at=int(time.time()),
+                    )
+                )
+        except IntegrityError:
+            # Another writer stored the same content concurrently
+            log_debug(f"Media content {content_hash} already stored")
+
+    def delete(self, content_hash: str) -> bool:
+        self._ensure_table()
+        with self.db_engine.begin() as conn:
+            result = conn.execute(delete(self.table).where(self.table.c.content_hash == content_hash))
+            return result.rowcount > 0
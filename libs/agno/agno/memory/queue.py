@@ -0,0 +1,410 @@
+import asyncio
+import atexit
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.memory.manager import MemoryManager
+
+# Short messages that carry nothing worth remembering on their own
+TRIVIAL_MESSAGES = {
+    "ok",
+    "okay",
+    "k",
+    "yes",
+    "yep",
+    "yeah",
+    "no",
+    "nope",
+    "sure",
+    "thanks",
+    "thank you",
+    "thx",
+    "ty",
+    "cool",
+    "great",
+    "nice",
+    "got it",
+    "hi",
+    "hello",
+    "hey",
+    "bye",
+    "goodbye",
+    "lol",
+}
+
+
+def is_trivial_message(content: str, min_chars: int = 4) -> bool:
+    """Return True for acknowledgements, greetings and other messages without information about the user"""
+    normalized = re.sub(r"[^\w\s]", "", content.lower()).strip()
+    return len(normalized) < min_chars or normalized in TRIVIAL_MESSAGES
+
+
+@dataclass
+class _PendingBatch:
+    memory_manager: "MemoryManager"
+    user_id: Optional[str]
+    agent_id: Optional[str]
+    team_id: Optional[str]
+    # Messages of each queued turn
+    turns: List[List[Message]] = field(default_factory=list)
+    # Time at which the batch is extracted, unless it fills up first
+    deadline: float = 0.0
+
+
+class MemoryExtractionQueue:
+    """
+    Coalesces the memory extraction of several turns of a user into a single model call.
+
+    Turns are queued per user, agent and memory manager, and extracted together once no turn was added for
+    `debounce` seconds, or once `max_batch_turns` turns are queued. Trivial turns, like "thanks", are skipped.
+    Extractions queued from threads run on a bounded pool of workers shared by the agents using the queue, and
+    extractions queued from an event loop run as tasks on that loop.
+
+    Turns still queued when the interpreter exits are extracted before it exits. Turns queued from an event loop are
+    extracted when the loop shuts down through asyncio.run, or call `aflush()` before closing the loop yourself.
+    """
+
+    def __init__(
+        self,
+        debounce: float = 5.0,
+        max_batch_turns: int = 5,
+        max_pending_turns: int = 1000,
+        max_workers: int = 2,
+        skip_trivial_turns: bool = True,
+        min_message_chars: int = 4,
+    ):
+        # Seconds to wait for more turns before extracting a batch
+        self.debounce = debounce
+        # Maximum number of turns extracted in one model call
+        self.max_batch_turns = max_batch_turns
+        # Maximum number of queued turns across all users. New turns are dropped when full.
+        self.max_pending_turns = max_pending_turns
+        # Number of worker threads running extractions queued from threads
+        self.max_workers = max_workers
+        self.skip_trivial_turns = skip_trivial_turns
+        self.min_message_chars = min_message_chars
+
+        self._batches: Dict[Tuple[Any, ...], _PendingBatch] = {}
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._scheduler: Optional[threading.Thread] = None
+        self._futures: Set[Future] = set()
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        # Scheduler task of each event loop, with the event waking it up
+        self._loop_schedulers: Dict[int, Tuple["asyncio.Task[Any]", asyncio.Event]] = {}
+        # Batches whose extraction was cancelled by the shutdown of their event loop, by loop
+        self._interrupted: Dict[int, List[_PendingBatch]] = {}
+        self._exit_handler_registered = False
+
+        self._num_turns = 0
+        self._num_skipped_turns = 0
+        self._num_dropped_turns = 0
+        self._num_extractions = 0
+        self._num_extracted_turns = 0
+        self._num_failed_extractions = 0
+        self._num_running = 0
+
+    def __deepcopy__(self, memo):
+        # The queue is shared by all copies of an agent
+        return self
+
+    # --- Queueing ---
+
+    def _is_trivial(self, messages: List[Message]) -> bool:
+        if not self.skip_trivial_turns:
+            return False
+        return all(
+            is_trivial_message(message.get_content_string(), self.min_message_chars)
+            for message in messages
+            if message.role == "user"
+        )
+
+    @property
+    def num_pending_turns(self) -> int:
+        return sum(len(batch.turns) for batch in self._batches.values())
+
+    def _add_turn(
+        self,
+        key: Tuple[Any, ...],
+        memory_manager: "MemoryManager",
+        messages: List[Message],
+        user_id: Optional[str],
+        agent_id: Optional[str],
+        team_id: Optional[str],
+    ) -> Optional[_PendingBatch]:
+        """Add a turn to the pending batch of its key. Returns the batch if it is full. Must hold the lock."""
+        self._num_turns += 1
+        if self._is_trivial(messages):
+            self._num_skipped_turns += 1
+            log_debug("Skipping memory extraction for a trivial turn")
+            return None
+        if self.num_pending_turns >= self.max_pending_turns:
+            self._num_dropped_turns += 1
+            log_warning("Memory extraction queue is full, dropping turn")
+            return None
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _PendingBatch(
+                memory_manager=memory_manager, user_id=user_id, agent_id=agent_id, team_id=team_id
+            )
+        batch.turns.append(messages)
+        batch.deadline = time.monotonic() + self.debounce
+        if len(batch.turns) >= self.max_batch_turns:
+            return self._batches.pop(key)
+        return batch
+
+    def submit(
+        self,
+        memory_manager: "MemoryManager",
+        messages: List[Message],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> None:
+        """Queue the messages of a turn for memory extraction, from a thread"""
+        key = ("thread", id(memory_manager), user_id, agent_id, team_id)
+        with self._condition:
+            batch = self._add_turn(key, memory_manager, messages, user_id, agent_id, team_id)
+            if batch is None:
+                return
+            if key not in self._batches:
+                self._run_in_thread(batch)
+            else:
+                self._ensure_scheduler()
+                self._condition.notify()
+
+    async def asubmit(
+        self,
+        memory_manager: "MemoryManager",
+        messages: List[Message],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> None:
+        """Queue the messages of a turn for memory extraction, from an event loop"""
+        loop = asyncio.get_running_loop()
+        key = ("loop", id(loop), id(memory_manager), user_id, agent_id, team_id)
+        with self._lock:
+            batch = self._add_turn(key, memory_manager, messages, user_id, agent_id, team_id)
+            if batch is None:
+                return
+            if key not in self._batches:
+                self._run_in_loop(batch)
+        self._wake_loop_scheduler(loop)
+
+    # --- Extraction ---
+
+    @staticmethod
+    def _get_messages(batch: _PendingBatch) -> List[Message]:
+        return [message for turn in batch.turns for message in turn]
+
+    def _record_extraction(self, batch: _PendingBatch, error: Optional[Exception]) -> None:
+        with self._lock:
+            self._num_running -= 1
+            if error is not None:
+                self._num_failed_extractions += 1
+                return
+            self._num_extractions += 1
+            self._num_extracted_turns += len(batch.turns)
+
+    def _extract(self, batch: _PendingBatch) -> None:
+        error: Optional[Exception] = None
+        try:
+            log_debug(f"Extracting memories from {len(batch.turns)} turns of user {batch.user_id}")
+            batch.memory_manager.create_user_memories(
+                messages=self._get_messages(batch),
+                user_id=batch.user_id,
+                agent_id=batch.agent_id,
+                team_id=batch.team_id,
+            )
+        except Exception as e:
+            error = e
+            log_warning(f"Error in memory extraction: {e}")
+        self._record_extraction(batch, error)
+
+    async def _aextract(self, batch: _PendingBatch) -> None:
+        error: Optional[Exception] = None
+        try:
+            log_debug(f"Extracting memories from {len(batch.turns)} turns of user {batch.user_id}")
+            await batch.memory_manager.acreate_user_memories(
+                messages=self._get_messages(batch),
+                user_id=batch.user_id,
+                agent_id=batch.agent_id,
+                team_id=batch.team_id,
+            )
+        except asyncio.CancelledError:
+            # Cancelled by the shutdown of the loop, the scheduler of the loop extracts the batch again
+            with self._lock:
+                self._num_running -= 1
+                self._interrupted.setdefault(id(asyncio.get_running_loop()), []).append(batch)
+            raise
+        except Exception as e:
+            error = e
+            log_warning(f"Error in memory extraction: {e}")
+        self._record_extraction(batch, error)
+
+    def _run_in_thread(self, batch: _PendingBatch) -> None:
+        """Run the extraction of a batch on the worker pool. Must hold the lock."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-memory")
+        self._register_exit_handler()
+        self._num_running += 1
+        future = self._executor.submit(self._extract, batch)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+
+    def _run_in_loop(self, batch: _PendingBatch) -> None:
+        self._num_running += 1
+        loop = asyncio.get_running_loop()
+        task = loop.create_task(self._aextract(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        # The scheduler of the loop stops once no extraction is queued or running
+        task.add_done_callback(lambda _: self._wake_loop_scheduler(loop, start=False))
+
+    def _get_loop_keys(self, loop: asyncio.AbstractEventLoop) -> List[Tuple[Any, ...]]:
+        return [key for key in self._batches if key[0] == "loop" and key[1] == id(loop)]
+
+    def _wake_loop_scheduler(self, loop: asyncio.AbstractEventLoop, start: bool = True) -> None:
+        """Wake up the scheduler of the running loop, starting it if needed"""
+        with self._lock:
+            scheduler = self._loop_schedulers.get(id(loop))
+            if scheduler is None or scheduler[0].done() or scheduler[0].get_loop() is not loop:
+                if start:
+                    wake = asyncio.Event()
+                    self._loop_schedulers[id(loop)] = (loop.create_task(self._aschedule(loop, wake)), wake)
+                return
+        scheduler[1].set()
+
+    async def _aschedule(self, loop: asyncio.AbstractEventLoop, wake: asyncio.Event) -> None:
+        """
+        Extract the batches queued from an event loop once their debounce window elapsed.
+        Runs while extractions are queued or running, so it can extract them when the loop shuts down.
+        """
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    for key in self._get_loop_keys(loop):
+                        if self._batches[key].deadline <= now:
+                            self._run_in_loop(self._batches.pop(key))
+                    deadlines = [self._batches[key].deadline for key in self._get_loop_keys(loop)]
+                    if not deadlines and not any(task.get_loop() is loop for task in self._tasks):
+                        self._loop_schedulers.pop(id(loop), None)
+                        return
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=max(0.0, min(deadlines) - now) if deadlines else None)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            # The loop is shutting down, e.g. asyncio.run returned: extract the queued turns before it closes
+            await self._aflush_at_shutdown(loop)
+            raise
+
+    async def _aflush_at_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Running extractions were cancelled along with the scheduler, wait for them to record their batch
+        tasks = [task for task in list(self._tasks) if task.get_loop() is loop]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        with self._lock:
+            batches = self._interrupted.pop(id(loop), [])
+            batches.extend(self._batches.pop(key) for key in self._get_loop_keys(loop))
+            self._loop_schedulers.pop(id(loop), None)
+            self._num_running += len(batches)
+        if batches:
+            log_debug(f"Extracting memories from {len(batches)} queued batches before the event loop closes")
+        for batch in batches:
+            await self._aextract(batch)
+
+    def _register_exit_handler(self) -> None:
+        if not self._exit_handler_registered:
+            atexit.register(self._flush_at_exit)
+            self._exit_handler_registered = True
+
+    def _flush_at_exit(self) -> None:
+        """Extract the turns still queued from threads when the interpreter exits"""
+        # The worker pool is shut down by now, once its running extractions completed
+        with self._lock:
+            batches = [self._batches.pop(key) for key in [key for key in self._batches if key[0] == "thread"]]
+            self._num_running += len(batches)
+        for batch in batches:
+            self._extract(batch)
+
+    def _ensure_scheduler(self) -> None:
+        self._register_exit_handler()
+        if self._scheduler is None or not self._scheduler.is_alive():
+            self._scheduler = threading.Thread(target=self._schedule, name="agno-memory-scheduler", daemon=True)
+            self._scheduler.start()
+
+    def _schedule(self) -> None:
+        """Extract the batches queued from threads once their debounce window elapsed"""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                thread_batches = {key: batch for key, batch in self._batches.items() if key[0] == "thread"}
+                for key, batch in thread_batches.items():
+                    if batch.deadline <= now:
+                        self._run_in_thread(self._batches.pop(key))
+                deadlines = [batch.deadline for key, batch in self._batches.items() if key[0] == "thread"]
+                self._condition.wait(timeout=max(0.0, min(deadlines) - now) if deadlines else None)
+
+    def flush(self, wait: bool = True) -> None:
+        """Extract the batches queued from threads now, and wait for all thread extractions to complete"""
+        with self._condition:
+            for key in [key for key in self._batches if key[0] == "thread"]:
+                self._run_in_thread(self._batches.pop(key))
+            futures = list(self._futures)
+        if wait:
+            for future in futures:
+                future.result()
+
+    async def aflush(self) -> None:
+        """Extract the batches queued from this event loop now, and wait for their extractions to complete"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for key in self._get_loop_keys(loop):
+                self._run_in_loop(self._batches.pop(key))
+            tasks = [task for task in self._tasks if task.get_loop() is loop]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return backlog and coalescing metrics of the queue"""
+        with self._lock:
+            return {
+                "pending_turns": self.num_pending_turns,
+                "pending_batches": len(self._batches),
+                "running_extractions": self._num_running,
+                "num_turns": self._num_turns,
+                "num_skipped_turns": self._num_skipped_turns,
+                "num_dropped_turns": self._num_dropped_turns,
+                "num_extractions": self._num_extractions,
+                "num_failed_extractions": self._num_failed_extractions,
+                "avg_turns_per_extraction": (
+                    self._num_extracted_turns / self._num_extractions if self._num_extractions else 0.0
+                ),
+            }
+
+
+_memory_extraction_queue: Optional[MemoryExtractionQueue] = None
+
+
+def get_memory_extraction_queue() -> MemoryExtractionQueue:
+    """
+    Return the process-wide memory extraction queue.
+    Agents and teams only use a queue when given one, pass this one as `memory_extraction_queue` to share it.
+    """
+    global _memory_extraction_queue
+    if _memory_extraction_queue is None:
+        _memory_extraction_queue = MemoryExtractionQueue()
+    return _memory_extraction_queue
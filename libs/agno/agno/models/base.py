@@ -1,11 +1,8 @@
 import asyncio
 import collections.abc
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from hashlib import md5
-from pathlib import Path
-from time import time
+from time import perf_counter
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
     Any,
@@ -26,12 +23,14 @@ from pydantic import BaseModel
 
 from agno.exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
+from agno.models.cache import ModelResponseCache, get_default_model_response_cache, get_model_cache_key
 from agno.models.message import Citations, Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.run.agent import CustomEvent, RunContentEvent, RunOutput, RunOutputEvent
 from agno.run.team import RunContentEvent as TeamRunContentEvent
 from agno.run.team import TeamRunOutputEvent
+from agno.run.timing import RunPhase, StreamTimer, time_phase
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.timer import Timer
@@ -139,8 +138,11 @@ class Model(ABC):
 
     # Cache model responses to avoid redundant API calls during development
     cache_response: bool = False
+    # Time-to-live and directory of the default cache, storing responses as JSON files
     cache_ttl: Optional[int] = None
     cache_dir: Optional[str] = None
+    # Cache with a custom backend, like SqliteCache or RedisCache. Enables caching when set.
+    response_cache: Optional[ModelResponseCache] = None
 
     def __post_init__(self):
         if self.provider is None and self.name is not None:
@@ -154,99 +156,52 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
-    def _get_model_cache_key(self, messages: List[Message], stream: bool, **kwargs: Any) -> str:
-        """Generate a cache key based on model messages and core parameters."""
-        message_data = []
-        for msg in messages:
-            msg_dict = {
-                "role": msg.role,
-                "content": msg.content,
-            }
-            message_data.append(msg_dict)
-
-        # Include tools parameter in cache key
-        has_tools = bool(kwargs.get("tools"))
-
-        cache_data = {
-            "model_id": self.id,
-            "messages": message_data,
-            "has_tools": has_tools,
-            "response_format": kwargs.get("response_format"),
-            "stream": stream,
-        }
-
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return md5(cache_str.encode()).hexdigest()
-
-    def _get_model_cache_file_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key."""
-        if self.cache_dir:
-            cache_dir = Path(self.cache_dir)
-        else:
-            cache_dir = Path.home() / ".agno" / "cache" / "model_responses"
+    def _use_response_cache(self) -> bool:
+        return self.cache_response or self.response_cache is not None
+
+    def _get_response_cache(self) -> ModelResponseCache:
+        """Get the cache used for model responses."""
+        if self.response_cache is not None:
+            return self.response_cache
+        return get_default_model_response_cache(cache_dir=self.cache_dir, ttl=self.cache_ttl)
 
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f"{cache_key}.json"
+    def _get_model_cache_key(self, messages: List[Message], stream: bool, **kwargs: Any) -> str:
+        """Generate a cache key covering the model, its settings, the messages, tools and response format."""
+        return get_model_cache_key(
+            self,
+            messages,
+            stream=stream,
+            response_format=kwargs.get("response_format"),
+            tools=kwargs.get("tools"),
+            tool_choice=kwargs.get("tool_choice"),
+        )
 
     def _get_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a cached response if it exists and is not expired."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        if not cache_file.exists():
-            return None
-
-        try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
-
-            # Check TTL if set (None means no expiration)
-            if self.cache_ttl is not None:
-                if time() - cached_data["timestamp"] > self.cache_ttl:
-                    return None
-
-            return cached_data
-        except Exception:
-            return None
+        return self._get_response_cache().get(cache_key)
 
     def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
         """Save a model response to cache."""
-        try:
-            cache_file = self._get_model_cache_file_path(cache_key)
-
-            cache_data = {
-                "timestamp": int(time()),
-                "is_streaming": is_streaming,
-                "result": result.to_dict(),
-            }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
-
-    def _save_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
-        """Save streaming responses to cache."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        cache_data = {
-            "timestamp": int(time()),
-            "is_streaming": True,
-            "streaming_responses": [r.to_dict() for r in responses],
-        }
+        self._get_response_cache().save_response(cache_key, result)
 
-        try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
+    def _save_streaming_responses_to_cache(
+        self, cache_key: str, responses: List[Tuple[float, ModelResponse]], started_at: float
+    ) -> None:
+        """Save streaming responses to cache, with the delay before each response for paced replays."""
+        delays = []
+        previous_at = started_at
+        for received_at, response in responses:
+            delays.append((received_at - previous_at, response))
+            previous_at = received_at
+        self._get_response_cache().save_stream(cache_key, delays)
 
     def _model_response_from_cache(self, cached_data: Dict[str, Any]) -> ModelResponse:
         """Reconstruct a ModelResponse from cached data."""
         return ModelResponse.from_dict(cached_data["result"])
 
-    def _streaming_responses_from_cache(self, cached_data: list) -> Iterator[ModelResponse]:
-        """Reconstruct streaming responses from cached data."""
-        for cached_response in cached_data:
-            yield ModelResponse.from_dict(cached_response)
+    def _streaming_responses_from_cache(self, cached_data: Dict[str, Any]) -> Iterator[ModelResponse]:
+        """Replay streaming responses from cached data."""
+        yield from self._get_response_cache().replay_stream(cached_data)
 
     @abstractmethod
     def invoke(self, *args, **kwargs) -> ModelResponse:
@@ -306,8 +261,10 @@ class Model(ABC):
         """
 
         # Check cache if enabled
-        if self.cache_response:
-            cache_key = self._get_model_cache_key(messages, stream=False, response_format=response_format, tools=tools)
+        if self._use_response_cache():
+            cache_key = self._get_model_cache_key(
+                messages, stream=False, response_format=response_format, tools=tools, tool_choice=tool_choice
+            )
             cached_data = self._get_cached_model_response(cache_key)
 
             if cached_data:
@@ -358,6 +315,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    run_response=run_response,
                 ):
                     if isinstance(function_call_response, ModelResponse):
                         # The session state is updated by the function call
@@ -448,7 +406,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Response End", center=True, symbol="-")
 
         # Save to cache if enabled
-        if self.cache_response:
+        if self._use_response_cache():
             self._save_model_response_to_cache(cache_key, model_response, is_streaming=False)
 
         return model_response
@@ -461,6 +419,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        run_response: Optional[RunOutput] = None,
         send_media_to_model: bool = True,
     ) -> ModelResponse:
         """
@@ -468,8 +427,10 @@ class Model(ABC):
         """
 
         # Check cache if enabled
-        if self.cache_response:
-            cache_key = self._get_model_cache_key(messages, stream=False, response_format=response_format, tools=tools)
+        if self._use_response_cache():
+            cache_key = self._get_model_cache_key(
+                messages, stream=False, response_format=response_format, tools=tools, tool_choice=tool_choice
+            )
             cached_data = self._get_cached_model_response(cache_key)
 
             if cached_data:
@@ -493,6 +454,7 @@ class Model(ABC):
                 response_format=response_format,
                 tools=tools,
                 tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
             )
 
             # Add assistant message to messages
@@ -518,6 +480,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    run_response=run_response,
                 ):
                     if isinstance(function_call_response, ModelResponse):
                         # The session state is updated by the function call
@@ -607,7 +570,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response End", center=True, symbol="-")
 
         # Save to cache if enabled
-        if self.cache_response:
+        if self._use_response_cache():
             self._save_model_response_to_cache(cache_key, model_response, is_streaming=False)
 
         return model_response
@@ -629,14 +592,15 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response
-        provider_response = self.invoke(
-            assistant_message=assistant_message,
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        )
+        with time_phase(run_response, RunPhase.model_call, model=self.id):
+            provider_response = self.invoke(
+                assistant_message=assistant_message,
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            )
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
@@ -682,14 +646,15 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response
-        provider_response = await self.ainvoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            assistant_message=assistant_message,
-            run_response=run_response,
-        )
+        with time_phase(run_response, RunPhase.model_call, model=self.id):
+            provider_response = await self.ainvoke(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                assistant_message=assistant_message,
+                run_response=run_response,
+            )
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
@@ -802,20 +767,24 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-
-        for response_delta in self.invoke_stream(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
+        # Only the time spent waiting for the model is counted, not the time spent by the consumer of the stream
+        stream_timer = StreamTimer()
+        for response_delta in stream_timer.wrap(
+            self.invoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            )
         ):
             yield from self._populate_stream_data_and_assistant_message(
                 stream_data=stream_data,
                 assistant_message=assistant_message,
                 model_response_delta=response_delta,
             )
+        stream_timer.record(run_response, RunPhase.model_call, model=self.id)
 
         # Add final metrics to assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=response_delta)
@@ -838,21 +807,24 @@ class Model(ABC):
 
         # Check cache if enabled - capture key BEFORE streaming to avoid mismatch
         cache_key = None
-        if self.cache_response:
-            cache_key = self._get_model_cache_key(messages, stream=True, response_format=response_format, tools=tools)
+        if self._use_response_cache():
+            cache_key = self._get_model_cache_key(
+                messages, stream=True, response_format=response_format, tools=tools, tool_choice=tool_choice
+            )
             cached_data = self._get_cached_model_response(cache_key)
 
             if cached_data:
                 log_info("Cache hit for streaming model response")
                 # Yield cached responses
-                for response in self._streaming_responses_from_cache(cached_data["streaming_responses"]):
+                for response in self._streaming_responses_from_cache(cached_data):
                     yield response
                 return
 
             log_info("Cache miss for streaming model response")
 
         # Track streaming responses for caching
-        streaming_responses: List[ModelResponse] = []
+        streaming_responses: List[Tuple[float, ModelResponse]] = []
+        stream_started_at = perf_counter()
 
         log_debug(f"{self.get_provider()} Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
@@ -876,8 +848,8 @@ class Model(ABC):
                     tool_choice=tool_choice or self._tool_choice,
                     run_response=run_response,
                 ):
-                    if self.cache_response and isinstance(response, ModelResponse):
-                        streaming_responses.append(response)
+                    if self._use_response_cache() and isinstance(response, ModelResponse):
+                        streaming_responses.append((perf_counter(), response))
                     yield response
 
                 # Populate assistant message from stream data
@@ -905,8 +877,8 @@ class Model(ABC):
                     tools=tools,
                     tool_choice=tool_choice or self._tool_choice,
                 )
-                if self.cache_response:
-                    streaming_responses.append(model_response)
+                if self._use_response_cache():
+                    streaming_responses.append((perf_counter(), model_response))
                 yield model_response
 
             # Add assistant message to messages
@@ -927,9 +899,10 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    run_response=run_response,
                 ):
-                    if self.cache_response and isinstance(function_call_response, ModelResponse):
-                        streaming_responses.append(function_call_response)
+                    if self._use_response_cache() and isinstance(function_call_response, ModelResponse):
+                        streaming_responses.append((perf_counter(), function_call_response))
                     yield function_call_response
 
                 # Add a function call for each successful execution
@@ -983,8 +956,8 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Response Stream End", center=True, symbol="-")
 
         # Save streaming responses to cache if enabled
-        if self.cache_response and cache_key and streaming_responses:
-            self._save_streaming_responses_to_cache(cache_key, streaming_responses)
+        if self._use_response_cache() and cache_key and streaming_responses:
+            self._save_streaming_responses_to_cache(cache_key, streaming_responses, started_at=stream_started_at)
 
     async def aprocess_response_stream(
         self,
@@ -999,20 +972,25 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        async for response_delta in self.ainvoke_stream(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        ):  # type: ignore
+        # Only the time spent waiting for the model is counted, not the time spent by the consumer of the stream
+        stream_timer = StreamTimer()
+        async for response_delta in stream_timer.awrap(
+            self.ainvoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            )  # type: ignore
+        ):
             for model_response in self._populate_stream_data_and_assistant_message(
                 stream_data=stream_data,
                 assistant_message=assistant_message,
                 model_response_delta=response_delta,
             ):
                 yield model_response
+        stream_timer.record(run_response, RunPhase.model_call, model=self.id)
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=model_response)
@@ -1035,21 +1013,24 @@ class Model(ABC):
 
         # Check cache if enabled - capture key BEFORE streaming to avoid mismatch
         cache_key = None
-        if self.cache_response:
-            cache_key = self._get_model_cache_key(messages, stream=True, response_format=response_format, tools=tools)
+        if self._use_response_cache():
+            cache_key = self._get_model_cache_key(
+                messages, stream=True, response_format=response_format, tools=tools, tool_choice=tool_choice
+            )
             cached_data = self._get_cached_model_response(cache_key)
 
             if cached_data:
                 log_info("Cache hit for async streaming model response")
                 # Yield cached responses
-                for response in self._streaming_responses_from_cache(cached_data["streaming_responses"]):
+                async for response in self._get_response_cache().areplay_stream(cached_data):
                     yield response
                 return
 
             log_info("Cache miss for async streaming model response")
 
         # Track streaming responses for caching
-        streaming_responses: List[ModelResponse] = []
+        streaming_responses: List[Tuple[float, ModelResponse]] = []
+        stream_started_at = perf_counter()
 
         log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
@@ -1073,8 +1054,8 @@ class Model(ABC):
                     tool_choice=tool_choice or self._tool_choice,
                     run_response=run_response,
                 ):
-                    if self.cache_response and isinstance(model_response, ModelResponse):
-                        streaming_responses.append(model_response)
+                    if self._use_response_cache() and isinstance(model_response, ModelResponse):
+                        streaming_responses.append((perf_counter(), model_response))
                     yield model_response
 
                 # Populate assistant message from stream data
@@ -1101,8 +1082,8 @@ class Model(ABC):
                     tool_choice=tool_choice or self._tool_choice,
                     run_response=run_response,
                 )
-                if self.cache_response:
-                    streaming_responses.append(model_response)
+                if self._use_response_cache():
+                    streaming_responses.append((perf_counter(), model_response))
                 yield model_response
 
             # Add assistant message to messages
@@ -1123,9 +1104,10 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    run_response=run_response,
                 ):
-                    if self.cache_response and isinstance(function_call_response, ModelResponse):
-                        streaming_responses.append(function_call_response)
+                    if self._use_response_cache() and isinstance(function_call_response, ModelResponse):
+                        streaming_responses.append((perf_counter(), function_call_response))
                     yield function_call_response
 
                 # Add a function call for each successful execution
@@ -1179,8 +1161,8 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Stream End", center=True, symbol="-")
 
         # Save streaming responses to cache if enabled
-        if self.cache_response and cache_key and streaming_responses:
-            self._save_streaming_responses_to_cache(cache_key, streaming_responses)
+        if self._use_response_cache() and cache_key and streaming_responses:
+            self._save_streaming_responses_to_cache(cache_key, streaming_responses, started_at=stream_started_at)
 
     def _populate_stream_data_and_assistant_message(
         self, stream_data: MessageData, assistant_message: Message, model_response_delta: ModelResponse
@@ -1342,6 +1324,13 @@ class Model(ABC):
             videos = function_execution_result.videos
             audios = function_execution_result.audios
 
+        # Keep large outputs out of the context, sending a preview and a reference instead
+        function = function_call.function
+        if success and isinstance(output, str) and function._tool_output_manager is not None:
+            output = function._tool_output_manager.spill(
+                output, tool_name=function.name, namespace=function._tool_output_namespace
+            )
+
         return Message(
             role=self.tool_message_role,
             content=output if success else function_call.error,
@@ -1371,6 +1360,7 @@ class Model(ABC):
         function_call: FunctionCall,
         function_call_results: List[Message],
         additional_input: Optional[List[Message]] = None,
+        run_response: Optional[RunOutput] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         # Start function call
         function_call_timer = Timer()
@@ -1391,7 +1381,8 @@ class Model(ABC):
         # Run function calls sequentially
         function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
         try:
-            function_execution_result = function_call.execute()
+            with time_phase(run_response, RunPhase.tool_call, tool_name=function_call.function.name):
+                function_execution_result = function_call.execute()
         except AgentRunException as a_exc:
             # Update additional messages from function call
             _handle_agent_exception(a_exc, additional_input)
@@ -1477,6 +1468,7 @@ class Model(ABC):
                     result=str(function_call_result.content),
                     stop_after_tool_call=function_call_result.stop_after_tool_call,
                     metrics=function_call_result.metrics,
+                    cache_hit=function_call.cache_hit,
                 )
             ],
             event=ModelResponseEvent.tool_call_completed.value,
@@ -1498,6 +1490,7 @@ class Model(ABC):
         additional_input: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        run_response: Optional[RunOutput] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_input is None:
@@ -1587,7 +1580,10 @@ class Model(ABC):
                 continue
 
             yield from self.run_function_call(
-                function_call=fc, function_call_results=function_call_results, additional_input=additional_input
+                function_call=fc,
+                function_call_results=function_call_results,
+                additional_input=additional_input,
+                run_response=run_response,
             )
 
         # Add any additional messages at the end
@@ -1597,6 +1593,7 @@ class Model(ABC):
     async def arun_function_call(
         self,
         function_call: FunctionCall,
+        run_response: Optional[RunOutput] = None,
     ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall, FunctionExecutionResult]:
         """Run a single function call and return its success status, timer, and the FunctionCall object."""
         from inspect import isasyncgenfunction, iscoroutine, iscoroutinefunction
@@ -1605,30 +1602,31 @@ class Model(ABC):
         function_call_timer.start()
         success: Union[bool, AgentRunException] = False
 
-        try:
-            if (
-                iscoroutinefunction(function_call.function.entrypoint)
-                or isasyncgenfunction(function_call.function.entrypoint)
-                or iscoroutine(function_call.function.entrypoint)
-            ):
-                result = await function_call.aexecute()
-                success = result.status == "success"
+        with time_phase(run_response, RunPhase.tool_call, tool_name=function_call.function.name):
+            try:
+                if (
+                    iscoroutinefunction(function_call.function.entrypoint)
+                    or isasyncgenfunction(function_call.function.entrypoint)
+                    or iscoroutine(function_call.function.entrypoint)
+                ):
+                    result = await function_call.aexecute()
+                    success = result.status == "success"
 
-            # If any of the hooks are async, we need to run the function call asynchronously
-            elif function_call.function.tool_hooks is not None and any(
-                iscoroutinefunction(f) for f in function_call.function.tool_hooks
-            ):
-                result = await function_call.aexecute()
-                success = result.status == "success"
-            else:
-                result = await asyncio.to_thread(function_call.execute)
-                success = result.status == "success"
-        except AgentRunException as e:
-            success = e
-        except Exception as e:
-            log_error(f"Error executing function {function_call.function.name}: {e}")
-            success = False
-            raise e
+                # If any of the hooks are async, we need to run the function call asynchronously
+                elif function_call.function.tool_hooks is not None and any(
+                    iscoroutinefunction(f) for f in function_call.function.tool_hooks
+                ):
+                    result = await function_call.aexecute()
+                    success = result.status == "success"
+                else:
+                    result = await asyncio.to_thread(function_call.execute)
+                    success = result.status == "success"
+            except AgentRunException as e:
+                success = e
+            except Exception as e:
+                log_error(f"Error executing function {function_call.function.name}: {e}")
+                success = False
+                raise e
 
         function_call_timer.stop()
         return success, function_call_timer, function_call, result
@@ -1641,6 +1639,7 @@ class Model(ABC):
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
         skip_pause_check: bool = False,
+        run_response: Optional[RunOutput] = None,
     ) -> AsyncIterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_input is None:
@@ -1766,7 +1765,8 @@ class Model(ABC):
             ]
 
         results = await asyncio.gather(
-            *(self.arun_function_call(fc) for fc in function_calls_to_run), return_exceptions=True
+            *(self.arun_function_call(fc, run_response=run_response) for fc in function_calls_to_run),
+            return_exceptions=True,
         )
 
         # Separate async generators from other results for concurrent processing
@@ -1969,6 +1969,7 @@ class Model(ABC):
                         result=str(function_call_result.content),
                         stop_after_tool_call=function_call_result.stop_after_tool_call,
                         metrics=function_call_result.metrics,
+                        cache_hit=function_call.cache_hit,
                     )
                 ],
                 event=ModelResponseEvent.tool_call_completed.value,
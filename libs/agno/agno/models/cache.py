@@ -0,0 +1,201 @@
+import asyncio
+import json
+from dataclasses import dataclass, field, fields, is_dataclass
+from hashlib import sha256
+from pathlib import Path
+from time import sleep
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.utils.cache import CACHE_MISS, CacheBackend, FileCache, InMemoryCache
+from agno.utils.log import log_error
+
+# Model fields that don't change the response, or that hold credentials
+_EXCLUDED_MODEL_FIELDS = {
+    "cache_response",
+    "cache_ttl",
+    "cache_dir",
+    "response_cache",
+    "tool_message_role",
+    "assistant_message_role",
+    "timeout",
+    "max_retries",
+    "delay_between_retries",
+    "exponential_backoff",
+}
+_EXCLUDED_MODEL_FIELD_PARTS = ("api_key", "secret", "password", "token", "client", "headers", "credentials")
+# Kept even though they contain an excluded part
+_INCLUDED_MODEL_FIELDS = {"max_tokens", "max_completion_tokens", "max_output_tokens", "top_logprobs", "logprobs"}
+
+
+def _media_fingerprint(media: Any) -> Dict[str, Any]:
+    """Identify a media item by its source, hashing raw content instead of including it"""
+    fingerprint: Dict[str, Any] = {"type": type(media).__name__}
+    for attr in ("url", "filepath", "content_ref", "mime_type", "format", "detail", "filename", "name"):
+        value = getattr(media, attr, None)
+        if value is not None:
+            fingerprint[attr] = str(value)
+    content = getattr(media, "content", None)
+    if content is not None and "content_ref" not in fingerprint:
+        content_bytes = content if isinstance(content, bytes) else str(content).encode()
+        fingerprint["content_sha256"] = sha256(content_bytes).hexdigest()
+    return fingerprint
+
+
+def _canonical_message(message: Message) -> Dict[str, Any]:
+    """The parts of a message that are sent to the model. Ids and timestamps are left out."""
+    message_dict: Dict[str, Any] = {
+        "role": message.role,
+        "content": message.content,
+        "name": message.name,
+        "tool_call_id": message.tool_call_id,
+        "tool_calls": message.tool_calls,
+        "reasoning_content": message.reasoning_content,
+        "redacted_reasoning_content": message.redacted_reasoning_content,
+    }
+    for media_field in ("images", "audio", "videos", "files"):
+        media_items = getattr(message, media_field)
+        if media_items:
+            message_dict[media_field] = [_media_fingerprint(media) for media in media_items]
+    return {k: v for k, v in message_dict.items() if v is not None}
+
+
+def _canonical_response_format(response_format: Optional[Union[Dict, Type[BaseModel]]]) -> Any:
+    if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        return {"name": response_format.__name__, "schema": response_format.model_json_schema()}
+    return response_format
+
+
+def get_model_params(model: Any) -> Dict[str, Any]:
+    """The model settings that affect the response, like the sampling parameters"""
+    if not is_dataclass(model):
+        return {}
+
+    params: Dict[str, Any] = {}
+    for model_field in fields(model):
+        name = model_field.name
+        if name.startswith("_") or name in _EXCLUDED_MODEL_FIELDS:
+            continue
+        if name not in _INCLUDED_MODEL_FIELDS and any(part in name for part in _EXCLUDED_MODEL_FIELD_PARTS):
+            continue
+        value = getattr(model, name, None)
+        if value is None:
+            continue
+        if isinstance(value, (str, int, float, bool)):
+            params[name] = value
+        elif isinstance(value, (list, dict)):
+            try:
+                json.dumps(value, sort_keys=True)
+                params[name] = value
+            except (TypeError, ValueError):
+                continue
+    return params
+
+
+def get_model_cache_key(
+    model: Any,
+    messages: Sequence[Message],
+    stream: bool,
+    response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+) -> str:
+    """
+    Build a cache key covering the whole model request.
+
+    Two requests get the same key only if the model, its settings, the messages (including tool calls and media),
+    the tool definitions, the tool choice and the response format are all the same.
+    """
+    cache_data = {
+        "model_class": type(model).__name__,
+        "model_id": getattr(model, "id", None),
+        "model_params": get_model_params(model),
+        "messages": [_canonical_message(message) for message in messages],
+        "tools": tools or [],
+        "tool_choice": tool_choice,
+        "response_format": _canonical_response_format(response_format),
+        "stream": stream,
+    }
+    cache_str = json.dumps(cache_data, sort_keys=True, default=str)
+    return sha256(cache_str.encode()).hexdigest()
+
+
+@dataclass
+class ModelResponseCache:
+    """
+    Exact-match cache for model responses.
+
+    Use a shared backend, like SqliteCache or RedisCache from agno.utils.cache, to share responses between processes,
+    for example to replay recorded runs in CI.
+    """
+
+    # Where responses are stored
+    backend: CacheBackend = field(default_factory=InMemoryCache)
+    # Time-to-live for responses in seconds. None means responses don't expire.
+    ttl: Optional[int] = None
+    # Speed of replaying cached streams, relative to the recorded timing. None replays without delay.
+    replay_speed: Optional[float] = None
+    namespace: str = "model_responses"
+
+    def __deepcopy__(self, memo):
+        # The cache is shared by all copies of a model
+        return self
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached data for a request, or None"""
+        try:
+            cached_data = self.backend.get(self.namespace, cache_key)
+        except Exception as e:
+            log_error(f"Error reading model response cache: {e}")
+            return None
+        if cached_data is CACHE_MISS or not isinstance(cached_data, dict):
+            return None
+        return cached_data
+
+    def _set(self, cache_key: str, cache_data: Dict[str, Any]) -> None:
+        try:
+            self.backend.set(self.namespace, cache_key, cache_data, ttl=self.ttl)
+        except Exception as e:
+            log_error(f"Error writing model response cache: {e}")
+
+    def save_response(self, cache_key: str, response: ModelResponse) -> None:
+        self._set(cache_key, {"is_streaming": False, "result": response.to_dict()})
+
+    def save_stream(self, cache_key: str, responses: List[Tuple[float, ModelResponse]]) -> None:
+        """Save a stream of responses, each with the seconds elapsed since the previous one"""
+        self._set(
+            cache_key,
+            {
+                "is_streaming": True,
+                "streaming_responses": [response.to_dict() for _, response in responses],
+                "delays": [delay for delay, _ in responses],
+            },
+        )
+
+    def _get_replay_delays(self, cached_data: Dict[str, Any]) -> List[float]:
+        num_responses = len(cached_data.get("streaming_responses", []))
+        delays = cached_data.get("delays")
+        if not self.replay_speed or not delays or len(delays) != num_responses:
+            return [0.0] * num_responses
+        return [delay / self.replay_speed for delay in delays]
+
+    def replay_stream(self, cached_data: Dict[str, Any]) -> Iterator[ModelResponse]:
+        for delay, response_data in zip(self._get_replay_delays(cached_data), cached_data["streaming_responses"]):
+            if delay > 0:
+                sleep(delay)
+            yield ModelResponse.from_dict(response_data)
+
+    async def areplay_stream(self, cached_data: Dict[str, Any]) -> AsyncIterator[ModelResponse]:
+        for delay, response_data in zip(self._get_replay_delays(cached_data), cached_data["streaming_responses"]):
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield ModelResponse.from_dict(response_data)
+
+
+def get_default_model_response_cache(cache_dir: Optional[str] = None, ttl: Optional[int] = None) -> ModelResponseCache:
+    """The cache used with `cache_response=True`: JSON files in `cache_dir`, by default `~/.agno/cache`."""
+    base_cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".agno" / "cache"
+    return ModelResponseCache(backend=FileCache(base_cache_dir), ttl=ttl)
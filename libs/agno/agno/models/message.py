@@ -1,9 +1,10 @@
 import json
+import sys
 from time import time
 from typing import Any, Dict, List, Optional, Sequence, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, File, Image, Video
 from agno.models.metrics import Metrics
@@ -110,6 +111,9 @@ class Message(BaseModel):
     # The Unix timestamp the message was created.
     created_at: int = Field(default_factory=lambda: int(time()))
 
+    # Token counts of the message, keyed by tokenizer name. See agno.utils.tokens.count_message_tokens
+    _token_counts: Dict[str, int] = PrivateAttr(default_factory=dict)
+
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
     def get_content_string(self) -> str:
@@ -432,3 +436,175 @@ class Message(BaseModel):
     def content_is_valid(self) -> bool:
         """Check if the message content is valid."""
         return self.content is not None and len(self.content) > 0
+
+
+# Fields of CompactMessage, kept as attributes. The other fields of Message (media, citations, references and
+# provider data) are kept as serialized until they are read.
+COMPACT_MESSAGE_FIELDS = (
+    "id",
+    "role",
+    "content",
+    "name",
+    "tool_call_id",
+    "tool_calls",
+    "reasoning_content",
+    "tool_name",
+    "tool_args",
+    "tool_call_error",
+    "stop_after_tool_call",
+    "add_to_agent_memory",
+    "from_history",
+    "created_at",
+)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class CompactMessage:
+    """
+    Slim, read-mostly form of a Message, used for the messages of runs loaded from storage.
+
+    Common fields are kept in slots, with the role, name and tool name interned so they are shared across messages.
+    Metrics and the other fields are kept as serialized and only parsed when read, and `to_dict()` returns the
+    serialized form without parsing it. Convert to a Message with `to_message()` before sending it to a model.
+    """
+
+    __slots__ = COMPACT_MESSAGE_FIELDS + ("_metrics", "_extra", "_parsed", "_token_counts", "_message")
+
+    def __init__(self, data: Dict[str, Any]):
+        extra = dict(data)
+        for key in COMPACT_MESSAGE_FIELDS:
+            object.__setattr__(self, key, extra.pop(key, None))
+        object.__setattr__(self, "role", _intern(self.role))
+        object.__setattr__(self, "name", _intern(self.name))
+        object.__setattr__(self, "tool_name", _intern(self.tool_name))
+        if self.id is None:
+            object.__setattr__(self, "id", str(uuid4()))
+        if self.created_at is None:
+            object.__setattr__(self, "created_at", int(time()))
+        object.__setattr__(self, "stop_after_tool_call", bool(self.stop_after_tool_call))
+        object.__setattr__(self, "from_history", bool(self.from_history))
+        if self.add_to_agent_memory is None:
+            object.__setattr__(self, "add_to_agent_memory", True)
+
+        object.__setattr__(self, "_metrics", None)
+        # Serialized fields not kept in slots
+        object.__setattr__(self, "_extra", extra or None)
+        # Message holding the parsed extra fields, once one of them is read
+        object.__setattr__(self, "_parsed", None)
+        # Message returned by to_message(), reset when a field changes
+        object.__setattr__(self, "_message", None)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactMessage":
+        return cls(data)
+
+    @property
+    def metrics(self) -> Metrics:
+        if self._metrics is None:
+            serialized = self._extra.get("metrics") if self._extra else None
+            object.__setattr__(self, "_metrics", Metrics(**serialized) if serialized else Metrics())
+        return self._metrics  # type: ignore
+
+    @metrics.setter
+    def metrics(self, value: Metrics) -> None:
+        object.__setattr__(self, "_metrics", value)
+
+    def _get_parsed(self) -> Message:
+        if self._parsed is None:
+            extra = {key: value for key, value in (self._extra or {}).items() if key != "metrics"}
+            object.__setattr__(self, "_parsed", Message.from_dict({"role": self.role, **extra}))
+        return self._parsed  # type: ignore
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for unset slots and for attributes that are not slots
+        if name == "_token_counts":
+            token_counts: Dict[str, int] = {}
+            object.__setattr__(self, "_token_counts", token_counts)
+            return token_counts
+        if name.startswith("_") or name not in Message.model_fields:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        if self._parsed is None and (self._extra is None or name not in self._extra):
+            return Message.model_fields[name].get_default(call_default_factory=True)
+        return getattr(self._get_parsed(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in ("_message", "_token_counts", "_parsed"):
+            object.__setattr__(self, "_message", None)
+        if name in CompactMessage.__slots__ or name == "metrics":
+            object.__setattr__(self, name, value)
+        elif name in Message.model_fields:
+            setattr(self._get_parsed(), name, value)
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __repr__(self) -> str:
+        return f"CompactMessage(id={self.id!r}, role={self.role!r}, content={self.content!r})"
+
+    def get_content_string(self) -> str:
+        return Message.get_content_string(self)  # type: ignore
+
+    def content_is_valid(self) -> bool:
+        return self.content is not None and len(self.content) > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the message as a dictionary, as Message.to_dict() would."""
+        message_dict = {
+            "id": self.id,
+            "content": self.content,
+            "reasoning_content": self.reasoning_content,
+            "from_history": self.from_history,
+            "stop_after_tool_call": self.stop_after_tool_call,
+            "role": self.role,
+            "name": self.name,
+            "tool_call_id": self.tool_call_id,
+            "tool_name": self.tool_name,
+            "tool_args": self.tool_args,
+            "tool_call_error": self.tool_call_error,
+            "tool_calls": self.tool_calls,
+        }
+        message_dict = {
+            k: v for k, v in message_dict.items() if v is not None and not (isinstance(v, (list, dict)) and len(v) == 0)
+        }
+        if self._parsed is not None:
+            parsed_dict = self._parsed.to_dict()
+            extra = {
+                key: value for key, value in parsed_dict.items() if key not in message_dict and key != "created_at"
+            }
+            extra.pop("metrics", None)
+        else:
+            extra = {key: value for key, value in (self._extra or {}).items() if key != "metrics"}
+        message_dict.update(extra)
+
+        if self._metrics is not None:
+            metrics_dict = self._metrics.to_dict()
+            if metrics_dict:
+                message_dict["metrics"] = metrics_dict
+        elif self._extra and self._extra.get("metrics"):
+            message_dict["metrics"] = self._extra["metrics"]
+
+        message_dict["created_at"] = self.created_at
+        return message_dict
+
+    def to_message(self) -> Message:
+        """
+        Returns the message as a Message. The Message is built once and returned again until a field of this message
+        changes, and shares its token counts, so history messages are not parsed and counted on every run.
+        """
+        if self._message is None:
+            data = self.to_dict()
+            if self.add_to_agent_memory is not True:
+                data["add_to_agent_memory"] = self.add_to_agent_memory
+            message = Message.from_dict(data)
+            message._token_counts = self._token_counts
+            object.__setattr__(self, "_message", message)
+        return self._message  # type: ignore
+
+
+def to_message(message: Union[Message, CompactMessage]) -> Message:
+    """Returns the message as a Message, converting it if it is a CompactMessage"""
+    if isinstance(message, CompactMessage):
+        return message.to_message()
+    return message
@@ -28,6 +28,8 @@ class ToolExecution:
     tool_call_error: Optional[bool] = None
     result: Optional[str] = None
     metrics: Optional[Metrics] = None
+    # True if the result was served from the tool cache, False on a cache miss and None if caching is disabled
+    cache_hit: Optional[bool] = None
 
     # In the case where a tool call creates a run of an agent/team/workflow
     child_run_id: Optional[str] = None
@@ -70,6 +72,7 @@ class ToolExecution:
             tool_args=data.get("tool_args"),
             tool_call_error=data.get("tool_call_error"),
             result=data.get("result"),
+            cache_hit=data.get("cache_hit"),
             child_run_id=data.get("child_run_id"),
             stop_after_tool_call=data.get("stop_after_tool_call", False),
             requires_confirmation=data.get("requires_confirmation"),
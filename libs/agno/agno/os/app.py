@@ -1,19 +1,17 @@
+import asyncio
 from contextlib import asynccontextmanager
 from functools import partial
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 from uuid import uuid4
 
 from fastapi import APIRouter, FastAPI, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
-from rich import box
-from rich.panel import Panel
 from starlette.requests import Request
 
 from agno.agent.agent import Agent
 from agno.db.base import AsyncBaseDb, BaseDb
-from agno.knowledge.knowledge import Knowledge
 from agno.os.config import (
     AgentOSConfig,
     DatabaseConfig,
@@ -30,13 +28,9 @@ from agno.os.config import (
 )
 from agno.os.interfaces.base import BaseInterface
 from agno.os.router import get_base_router, get_websocket_router
-from agno.os.routers.evals import get_eval_router
 from agno.os.routers.health import get_health_router
 from agno.os.routers.home import get_home_router
-from agno.os.routers.knowledge import get_knowledge_router
-from agno.os.routers.memory import get_memory_router
-from agno.os.routers.metrics import get_metrics_router
-from agno.os.routers.session import get_session_router
+from agno.os.routers.prometheus import RunMetricsCollector, get_prometheus_router
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
     collect_mcp_tools_from_team,
@@ -45,24 +39,26 @@ from agno.os.utils import (
     load_yaml_config,
     update_cors_middleware,
 )
+from agno.run.timing import add_run_timings_listener
 from agno.team.team import Team
 from agno.utils.log import logger
 from agno.utils.string import generate_id, generate_id_from_name
 from agno.workflow.workflow import Workflow
 
+if TYPE_CHECKING:
+    from agno.knowledge.knowledge import Knowledge
+
 
 @asynccontextmanager
 async def mcp_lifespan(_, mcp_tools):
     """Manage MCP connection lifecycle inside a FastAPI app"""
-    # Startup logic: connect to all contextual MCP servers
-    for tool in mcp_tools:
-        await tool.connect()
+    # Startup logic: connect to all contextual MCP servers concurrently
+    await asyncio.gather(*(tool.connect() for tool in mcp_tools))
 
     yield
 
     # Shutdown logic: Close all contextual MCP connections
-    for tool in mcp_tools:
-        await tool.close()
+    await asyncio.gather(*(tool.close() for tool in mcp_tools), return_exceptions=True)
 
 
 def _combine_app_lifespans(lifespans: list) -> Any:
@@ -99,13 +95,14 @@ class AgentOS:
         agents: Optional[List[Agent]] = None,
         teams: Optional[List[Team]] = None,
         workflows: Optional[List[Workflow]] = None,
-        knowledge: Optional[List[Knowledge]] = None,
+        knowledge: Optional[List["Knowledge"]] = None,
         interfaces: Optional[List[BaseInterface]] = None,
         a2a_interface: bool = False,
         config: Optional[Union[str, AgentOSConfig]] = None,
         settings: Optional[AgnoAPISettings] = None,
         lifespan: Optional[Any] = None,
         enable_mcp_server: bool = False,
+        enable_prometheus_metrics: bool = False,
         base_app: Optional[FastAPI] = None,
         on_route_conflict: Literal["preserve_agentos", "preserve_base_app", "error"] = "preserve_agentos",
         telemetry: bool = True,
@@ -131,6 +128,8 @@ class AgentOS:
             settings: API settings for the OS
             lifespan: Optional lifespan context manager for the FastAPI app
             enable_mcp_server: Whether to enable MCP (Model Context Protocol)
+            enable_prometheus_metrics: Whether to record the phase timings of runs and expose them, with the runs in
+                flight and queue depths, on a Prometheus metrics endpoint
             base_app: Optional base FastAPI app to use for the AgentOS. All routes and middleware will be added to this app.
             on_route_conflict: What to do when a route conflict is detected in case a custom base_app is provided.
             telemetry: Whether to enable telemetry
@@ -183,6 +182,12 @@ class AgentOS:
         self.enable_mcp_server = enable_mcp or enable_mcp_server
         self.lifespan = lifespan
 
+        # Collects the run timings exposed on the Prometheus metrics endpoint
+        self.run_metrics_collector: Optional[RunMetricsCollector] = None
+        if enable_prometheus_metrics:
+            self.run_metrics_collector = RunMetricsCollector(components=[*(self.agents or []), *(self.teams or [])])
+            add_run_timings_listener(self.run_metrics_collector)
+
         # List of all MCP tools used inside the AgentOS
         self.mcp_tools: List[Any] = []
         self._mcp_app: Optional[Any] = None
@@ -203,6 +208,9 @@ class AgentOS:
                 # Required for the built-in routes to work
                 agent.store_events = True
 
+                if self.run_metrics_collector is not None:
+                    agent.record_timings = True
+
         if self.teams:
             for team in self.teams:
                 # Track all MCP tools recursively
@@ -216,10 +224,15 @@ class AgentOS:
                         member.initialize_agent()
                     elif isinstance(member, Team):
                         member.initialize_team()
+                    if self.run_metrics_collector is not None:
+                        member.record_timings = True
 
                 # Required for the built-in routes to work
                 team.store_events = True
 
+                if self.run_metrics_collector is not None:
+                    team.record_timings = True
+
         if self.workflows:
             for workflow in self.workflows:
                 # Track MCP tools recursively in workflow members
@@ -322,6 +335,8 @@ class AgentOS:
         self._add_router(fastapi_app, get_base_router(self, settings=self.settings))
         self._add_router(fastapi_app, get_websocket_router(self, settings=self.settings))
         self._add_router(fastapi_app, get_health_router())
+        if self.run_metrics_collector is not None:
+            self._add_router(fastapi_app, get_prometheus_router(self.run_metrics_collector, settings=self.settings))
         self._add_router(fastapi_app, get_home_router(self))
 
         has_a2a_interface = False
@@ -342,6 +357,13 @@ class AgentOS:
         self._auto_discover_databases()
         self._auto_discover_knowledge_instances()
 
+        # The domain routers are only loaded when the app is built
+        from agno.os.routers.evals import get_eval_router
+        from agno.os.routers.knowledge import get_knowledge_router
+        from agno.os.routers.memory import get_memory_router
+        from agno.os.routers.metrics import get_metrics_router
+        from agno.os.routers.session import get_session_router
+
         routers = [
             get_session_router(dbs=self.dbs),
             get_memory_router(dbs=self.dbs),
@@ -416,7 +438,7 @@ class AgentOS:
                     )
 
                 # Create a new router without the conflicting routes
-                filtered_router = APIRouter()
+                filtered_router = APIRouter(lifespan=router.lifespan_context)
                 for route in router.routes:
                     if route not in conflicting_routes:
                         filtered_router.routes.append(route)
@@ -682,8 +704,10 @@ class AgentOS:
             public_endpoint = "https://os.agno.com/"
 
         # Create a terminal panel to announce OS initialization and provide useful info
+        from rich import box
         from rich.align import Align
         from rich.console import Console, Group
+        from rich.panel import Panel
 
         panel_group = [
             Align.center(f"[bold cyan]{public_endpoint}[/bold cyan]"),
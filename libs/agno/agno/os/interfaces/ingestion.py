@@ -0,0 +1,108 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from agno.utils.cache import CACHE_MISS, CacheBackend, InMemoryCache
+from agno.utils.log import log_debug, log_error
+
+IDEMPOTENCY_NAMESPACE = "webhook_idempotency"
+
+
+@dataclass
+class _ConversationLock:
+    lock: asyncio.Lock
+    waiters: int = 0
+
+
+class WebhookIngestor:
+    """
+    Runs webhook handlers in the background with bounded concurrency.
+
+    Deliveries are deduplicated by an idempotency key, so platform retries don't trigger a second run, and handlers
+    for the same conversation run one at a time, in the order their deliveries arrived.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_pending: Optional[int] = 1000,
+        idempotency_ttl: int = 3600,
+        idempotency_cache: Optional[CacheBackend] = None,
+    ):
+        # Maximum number of handlers running at the same time, across all conversations
+        self.max_concurrency = max_concurrency
+        # Maximum number of accepted deliveries that haven't finished. None means unbounded.
+        self.max_pending = max_pending
+        # How long an idempotency key is remembered, in seconds
+        self.idempotency_ttl = idempotency_ttl
+        # Use a shared backend, like RedisCache, to deduplicate deliveries across workers
+        self.idempotency_cache: CacheBackend = idempotency_cache or InMemoryCache(
+            max_entries=10_000, max_size_bytes=None
+        )
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._conversation_locks: Dict[str, _ConversationLock] = {}
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+
+    @property
+    def num_pending(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def is_full(self) -> bool:
+        return self.max_pending is not None and self.num_pending >= self.max_pending
+
+    def is_duplicate(self, idempotency_key: str) -> bool:
+        """Return True if the key was seen before, and remember it otherwise"""
+        if self.idempotency_cache.get(IDEMPOTENCY_NAMESPACE, idempotency_key) is not CACHE_MISS:
+            return True
+        self.idempotency_cache.set(IDEMPOTENCY_NAMESPACE, idempotency_key, True, ttl=self.idempotency_ttl)
+        return False
+
+    def submit(
+        self,
+        handler: Callable[[], Awaitable[Any]],
+        conversation_id: str,
+        idempotency_key: Optional[str] = None,
+    ) -> bool:
+        """
+        Schedule a handler for a delivery.
+
+        Returns False if the delivery is a duplicate, or if too many deliveries are pending. Check `is_full` first to
+        tell the two apart, so the platform can be asked to retry later.
+        """
+        if self.is_full:
+            return False
+        if idempotency_key is not None and self.is_duplicate(idempotency_key):
+            log_debug(f"Skipping duplicate webhook delivery: {idempotency_key}")
+            return False
+
+        task = asyncio.create_task(self._run(handler, conversation_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run(self, handler: Callable[[], Awaitable[Any]], conversation_id: str) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        conversation_lock = self._conversation_locks.get(conversation_id)
+        if conversation_lock is None:
+            conversation_lock = self._conversation_locks[conversation_id] = _ConversationLock(lock=asyncio.Lock())
+        conversation_lock.waiters += 1
+        try:
+            # Take the conversation lock first, so queued messages of one conversation don't hold concurrency slots
+            async with conversation_lock.lock:
+                async with self._semaphore:
+                    await handler()
+        except Exception as e:
+            log_error(f"Error processing webhook delivery for conversation {conversation_id}: {e}")
+        finally:
+            conversation_lock.waiters -= 1
+            if conversation_lock.waiters == 0:
+                self._conversation_locks.pop(conversation_id, None)
+
+    async def wait(self) -> None:
+        """Wait for all pending deliveries to be processed"""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,54 @@
+from os import getenv
+from typing import Any, Dict, Optional
+
+import httpx
+
+from agno.utils.log import log_error
+
+SLACK_API_URL = "https://slack.com/api"
+
+
+class SlackClient:
+    """Async Slack Web API client sharing one connection pool between messages"""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.token: Optional[str] = token or getenv("SLACK_TOKEN")
+        if self.token is None or self.token == "":
+            raise ValueError("SLACK_TOKEN is not set")
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def _call(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.http_client.post(
+            f"{SLACK_API_URL}/{method}",
+            json=payload,
+            headers={"Authorization": f"Bearer {self.token}", "Content-Type": "application/json; charset=utf-8"},
+        )
+        response.raise_for_status()
+        data = response.json()
+        if not data.get("ok"):
+            log_error(f"Slack API error calling {method}: {data.get('error')}")
+            raise ValueError(f"Slack API error calling {method}: {data.get('error')}")
+        return data
+
+    async def post_message(self, channel: str, text: str, thread_ts: Optional[str] = None) -> str:
+        """Post a message and return its timestamp, which identifies it for updates"""
+        payload: Dict[str, Any] = {"channel": channel, "text": text}
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
+        data = await self._call("chat.postMessage", payload)
+        return data["ts"]
+
+    async def update_message(self, channel: str, ts: str, text: str) -> None:
+        await self._call("chat.update", {"channel": channel, "ts": ts, "text": text})
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
@@ -1,15 +1,28 @@
-from typing import Optional
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, List, Optional, Union
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from agno.agent.agent import Agent
+from agno.os.interfaces.ingestion import WebhookIngestor
+from agno.os.interfaces.slack.client import SlackClient
 from agno.os.interfaces.slack.security import verify_slack_signature
+from agno.run.agent import RunContentEvent, RunOutput
+from agno.run.team import RunContentEvent as TeamRunContentEvent
+from agno.run.team import TeamRunOutput
 from agno.team.team import Team
-from agno.tools.slack import SlackTools
-from agno.utils.log import log_info
+from agno.utils.log import log_info, log_warning
 from agno.workflow.workflow import Workflow
 
+# Slack truncates messages longer than this
+MAX_MESSAGE_LENGTH = 40000
+
+# Message subtypes that are edits, deletions or bot messages, not new user input
+IGNORED_MESSAGE_SUBTYPES = {"message_changed", "message_deleted", "bot_message", "message_replied"}
+
 
 class SlackEventResponse(BaseModel):
     """Response model for Slack event processing"""
@@ -24,11 +37,44 @@ class SlackChallengeResponse(BaseModel):
 
 
 def attach_routes(
-    router: APIRouter, agent: Optional[Agent] = None, team: Optional[Team] = None, workflow: Optional[Workflow] = None
+    router: APIRouter,
+    agent: Optional[Agent] = None,
+    team: Optional[Team] = None,
+    workflow: Optional[Workflow] = None,
+    ingestor: Optional[WebhookIngestor] = None,
+    token: Optional[str] = None,
+    streaming: bool = False,
+    stream_update_interval: float = 1.0,
 ) -> APIRouter:
     # Determine entity type for documentation
     entity_type = "agent" if agent else "team" if team else "workflow" if workflow else "unknown"
 
+    webhook_ingestor = ingestor or WebhookIngestor()
+    # Created on first use, so the router can be built without a token
+    slack_client: Optional[SlackClient] = None
+
+    def get_slack_client() -> SlackClient:
+        nonlocal slack_client
+        if slack_client is None:
+            slack_client = SlackClient(token=token)
+        return slack_client
+
+    router_lifespan = router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[Any]:
+        # Close the connections of the Slack client with the app
+        nonlocal slack_client
+        async with router_lifespan(app) as state:
+            try:
+                yield state
+            finally:
+                if slack_client is not None:
+                    await slack_client.aclose()
+                    slack_client = None
+
+    router.lifespan_context = lifespan
+
     @router.post(
         "/events",
         operation_id=f"slack_events_{entity_type}",
@@ -40,9 +86,10 @@ def attach_routes(
             200: {"description": "Event processed successfully"},
             400: {"description": "Missing Slack headers"},
             403: {"description": "Invalid Slack signature"},
+            503: {"description": "Too many events pending, Slack will retry the delivery"},
         },
     )
-    async def slack_events(request: Request, background_tasks: BackgroundTasks):
+    async def slack_events(request: Request):
         body = await request.body()
         timestamp = request.headers.get("X-Slack-Request-Timestamp")
         slack_signature = request.headers.get("X-Slack-Signature", "")
@@ -62,28 +109,59 @@ def attach_routes(
         # Process other event types (e.g., message events) asynchronously
         if "event" in data:
             event = data["event"]
-            if event.get("bot_id"):
+            if event.get("bot_id") or event.get("subtype") in IGNORED_MESSAGE_SUBTYPES:
                 log_info("bot event")
-                pass
             else:
-                background_tasks.add_task(_process_slack_event, event)
+                if webhook_ingestor.is_full:
+                    log_warning("Too many Slack events pending, asking Slack to retry")
+                    raise HTTPException(status_code=503, detail="Too many events pending")
+                # Slack retries a delivery with the same event id until it is acknowledged
+                idempotency_key = data.get("event_id") or event.get("client_msg_id") or event.get("ts")
+                webhook_ingestor.submit(
+                    partial(_process_slack_event, event),
+                    conversation_id=f"slack:{event.get('channel', '')}:{_get_thread_ts(event)}",
+                    idempotency_key=f"slack:{idempotency_key}" if idempotency_key else None,
+                )
 
         return SlackEventResponse(status="ok")
 
+    def _get_thread_ts(event: dict) -> str:
+        if event.get("thread_ts"):
+            return event.get("thread_ts", "")
+        return event.get("ts", "")
+
     async def _process_slack_event(event: dict):
         if event.get("type") == "message":
             user = None
             message_text = event.get("text", "")
             channel_id = event.get("channel", "")
             user = event.get("user")
-            if event.get("thread_ts"):
-                ts = event.get("thread_ts", "")
-            else:
-                ts = event.get("ts", "")
+            ts = _get_thread_ts(event)
 
             # Use the timestamp as the session id, so that each thread is a separate session
             session_id = ts
 
+            response: Optional[Union[RunOutput, TeamRunOutput]] = None
+            if streaming and (agent or team):
+                if agent:
+                    stream = agent.arun(
+                        message_text,
+                        user_id=user if user else None,
+                        session_id=session_id,
+                        stream=True,
+                        yield_run_response=True,
+                    )
+                else:
+                    stream = team.arun(  # type: ignore
+                        message_text,
+                        user_id=user if user else None,
+                        session_id=session_id,
+                        stream=True,
+                        yield_run_response=True,
+                    )
+                await _stream_slack_reply(channel=channel_id, thread_ts=ts, stream=stream)  # type: ignore
+                return
+
             if agent:
                 response = await agent.arun(message_text, user_id=user if user else None, session_id=session_id)
             elif team:
@@ -93,36 +171,66 @@ def attach_routes(
 
             if response:
                 if hasattr(response, "reasoning_content") and response.reasoning_content:
-                    _send_slack_message(
+                    await _send_slack_message(
                         channel=channel_id,
                         message=f"Reasoning: \n{response.reasoning_content}",
                         thread_ts=ts,
                         italics=True,
                     )
 
-                _send_slack_message(channel=channel_id, message=response.content or "", thread_ts=ts)
-
-    def _send_slack_message(channel: str, thread_ts: str, message: str, italics: bool = False):
-        if len(message) <= 40000:
-            if italics:
-                # Handle multi-line messages by making each line italic
-                formatted_message = "\n".join([f"_{line}_" for line in message.split("\n")])
-                SlackTools().send_message_thread(channel=channel, text=formatted_message or "", thread_ts=thread_ts)
-            else:
-                SlackTools().send_message_thread(channel=channel, text=message or "", thread_ts=thread_ts)
+                await _send_slack_message(channel=channel_id, message=response.content or "", thread_ts=ts)
+
+    async def _stream_slack_reply(channel: str, thread_ts: str, stream: AsyncIterator):
+        """Post the reply as soon as content arrives, and edit it as more content is streamed"""
+        content_event_type = RunContentEvent if agent else TeamRunContentEvent
+        slack = get_slack_client()
+        run_output: Optional[Union[RunOutput, TeamRunOutput]] = None
+        content = ""
+        message_ts: Optional[str] = None
+        last_update = 0.0
+
+        async for event in stream:
+            if isinstance(event, (RunOutput, TeamRunOutput)):
+                run_output = event
+            elif isinstance(event, content_event_type) and isinstance(event.content, str):
+                content += event.content
+                # Throttle edits to stay within Slack's rate limits
+                now = time.monotonic()
+                if content.strip() and now - last_update >= stream_update_interval:
+                    if message_ts is None:
+                        message_ts = await slack.post_message(channel, content[:MAX_MESSAGE_LENGTH], thread_ts)
+                    else:
+                        await slack.update_message(channel, message_ts, content[:MAX_MESSAGE_LENGTH])
+                    last_update = now
+
+        if run_output is not None and isinstance(run_output.content, str):
+            content = run_output.content
+        if message_ts is None:
+            await _send_slack_message(channel=channel, message=content, thread_ts=thread_ts)
             return
 
-        # Split message into batches of 4000 characters (WhatsApp message limit is 4096)
-        message_batches = [message[i : i + 40000] for i in range(0, len(message), 40000)]
-
-        # Add a prefix with the batch number
-        for i, batch in enumerate(message_batches, 1):
-            batch_message = f"[{i}/{len(message_batches)}] {batch}"
-            if italics:
-                # Handle multi-line messages by making each line italic
-                formatted_batch = "\n".join([f"_{line}_" for line in batch_message.split("\n")])
-                SlackTools().send_message_thread(channel=channel, text=formatted_batch or "", thread_ts=thread_ts)
-            else:
-                SlackTools().send_message_thread(channel=channel, text=batch_message or "", thread_ts=thread_ts)
+        # Replace the partial reply with the complete one, continuing in new messages if it is too long
+        message_batches = _get_message_batches(content)
+        await slack.update_message(channel, message_ts, message_batches[0])
+        for batch in message_batches[1:]:
+            await slack.post_message(channel, batch, thread_ts)
+
+    def _get_message_batches(message: str, italics: bool = False) -> List[str]:
+        if len(message) <= MAX_MESSAGE_LENGTH:
+            message_batches = [message]
+        else:
+            # Split message into batches, and add a prefix with the batch number
+            batches = [message[i : i + MAX_MESSAGE_LENGTH] for i in range(0, len(message), MAX_MESSAGE_LENGTH)]
+            message_batches = [f"[{i}/{len(batches)}] {batch}" for i, batch in enumerate(batches, 1)]
+
+        if italics:
+            # Handle multi-line messages by making each line italic
+            message_batches = ["\n".join([f"_{line}_" for line in batch.split("\n")]) for batch in message_batches]
+        return message_batches
+
+    async def _send_slack_message(channel: str, thread_ts: str, message: str, italics: bool = False):
+        slack = get_slack_client()
+        for batch in _get_message_batches(message, italics=italics):
+            await slack.post_message(channel, batch or "", thread_ts)
 
     return router
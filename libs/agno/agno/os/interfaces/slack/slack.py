@@ -4,8 +4,10 @@ from fastapi.routing import APIRouter
 
 from agno.agent.agent import Agent
 from agno.os.interfaces.base import BaseInterface
+from agno.os.interfaces.ingestion import WebhookIngestor
 from agno.os.interfaces.slack.router import attach_routes
 from agno.team.team import Team
+from agno.utils.cache import CacheBackend
 from agno.workflow.workflow import Workflow
 
 
@@ -21,12 +23,31 @@ class Slack(BaseInterface):
         workflow: Optional[Workflow] = None,
         prefix: str = "/slack",
         tags: Optional[List[str]] = None,
+        token: Optional[str] = None,
+        streaming: bool = False,
+        stream_update_interval: float = 1.0,
+        max_concurrency: int = 16,
+        max_pending: Optional[int] = 1000,
+        idempotency_ttl: int = 3600,
+        idempotency_cache: Optional[CacheBackend] = None,
     ):
         self.agent = agent
         self.team = team
         self.workflow = workflow
         self.prefix = prefix
         self.tags = tags or ["Slack"]
+        # Slack bot token. Defaults to the SLACK_TOKEN environment variable.
+        self.token = token
+        # Stream agent and team replies by editing the reply message as content arrives
+        self.streaming = streaming
+        # Minimum number of seconds between edits of a streamed reply
+        self.stream_update_interval = stream_update_interval
+        self.ingestor = WebhookIngestor(
+            max_concurrency=max_concurrency,
+            max_pending=max_pending,
+            idempotency_ttl=idempotency_ttl,
+            idempotency_cache=idempotency_cache,
+        )
 
         if not (self.agent or self.team or self.workflow):
             raise ValueError("Slack requires an agent, team or workflow")
@@ -34,6 +55,15 @@ class Slack(BaseInterface):
     def get_router(self) -> APIRouter:
         self.router = APIRouter(prefix=self.prefix, tags=self.tags)  # type: ignore
 
-        self.router = attach_routes(router=self.router, agent=self.agent, team=self.team, workflow=self.workflow)
+        self.router = attach_routes(
+            router=self.router,
+            agent=self.agent,
+            team=self.team,
+            workflow=self.workflow,
+            ingestor=self.ingestor,
+            token=self.token,
+            streaming=self.streaming,
+            stream_update_interval=self.stream_update_interval,
+        )
 
         return self.router
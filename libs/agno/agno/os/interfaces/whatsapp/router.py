@@ -1,12 +1,16 @@
 import base64
+from contextlib import asynccontextmanager
+from functools import partial
 from os import getenv
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+import httpx
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from agno.agent.agent import Agent
 from agno.media import Audio, File, Image, Video
+from agno.os.interfaces.ingestion import WebhookIngestor
 from agno.team.team import Team
 from agno.tools.whatsapp import WhatsAppTools
 from agno.utils.log import log_error, log_info, log_warning
@@ -15,13 +19,50 @@ from agno.utils.whatsapp import get_media_async, send_image_message_async, typin
 from .security import validate_webhook_signature
 
 
-def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def attach_routes(
+    router: APIRouter,
+    agent: Optional[Agent] = None,
+    team: Optional[Team] = None,
+    ingestor: Optional[WebhookIngestor] = None,
+    max_connections: int = 20,
+) -> APIRouter:
     if agent is None and team is None:
         raise ValueError("Either agent or team must be provided.")
 
+    webhook_ingestor = ingestor or WebhookIngestor()
+
     # Create WhatsApp tools instance once for reuse
     whatsapp_tools = WhatsAppTools(async_mode=True)
 
+    # One connection pool shared by all requests to the WhatsApp API, opened on first use and closed with the app
+    http_client: Optional[httpx.AsyncClient] = None
+
+    def get_http_client() -> httpx.AsyncClient:
+        nonlocal http_client
+        if http_client is None or http_client.is_closed:
+            http_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            )
+            whatsapp_tools.http_client = http_client
+        return http_client
+
+    router_lifespan = router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[Any]:
+        nonlocal http_client
+        async with router_lifespan(app) as state:
+            try:
+                yield state
+            finally:
+                if http_client is not None:
+                    await http_client.aclose()
+                    http_client = None
+                    whatsapp_tools.http_client = None
+
+    router.lifespan_context = lifespan
+
     @router.get("/status")
     async def status():
         return {"status": "available"}
@@ -45,7 +86,7 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
         raise HTTPException(status_code=403, detail="Invalid verify token or mode")
 
     @router.post("/webhook")
-    async def webhook(request: Request, background_tasks: BackgroundTasks):
+    async def webhook(request: Request):
         """Handle incoming WhatsApp messages"""
         try:
             # Get raw payload for signature validation
@@ -64,25 +105,35 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
                 log_warning(f"Received non-WhatsApp webhook object: {body.get('object')}")
                 return {"status": "ignored"}
 
-            # Process messages in background
-            for entry in body.get("entry", []):
-                for change in entry.get("changes", []):
-                    messages = change.get("value", {}).get("messages", [])
-
-                    if not messages:
-                        continue
-
-                    message = messages[0]
-                    background_tasks.add_task(process_message, message, agent, team)
+            messages = [
+                message
+                for entry in body.get("entry", [])
+                for change in entry.get("changes", [])
+                for message in change.get("value", {}).get("messages", [])
+            ]
+            if len(messages) > 0 and webhook_ingestor.is_full:
+                log_warning("Too many WhatsApp messages pending, asking WhatsApp to retry")
+                raise HTTPException(status_code=503, detail="Too many messages pending")
+
+            # Process messages in background, one at a time per sender. Redeliveries keep the message id.
+            for message in messages:
+                webhook_ingestor.submit(
+                    partial(process_message, message, agent, team),
+                    conversation_id=f"wa:{message.get('from')}",
+                    idempotency_key=f"wa:{message['id']}" if message.get("id") else None,
+                )
 
             return {"status": "processing"}
 
+        except HTTPException:
+            raise
         except Exception as e:
             log_error(f"Error processing webhook: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
     async def process_message(message: dict, agent: Optional[Agent], team: Optional[Team]):
         """Process a single WhatsApp message in the background"""
+        http_client = get_http_client()
         try:
             message_image = None
             message_video = None
@@ -90,7 +141,7 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
             message_doc = None
 
             message_id = message.get("id")
-            await typing_indicator_async(message_id)
+            await typing_indicator_async(message_id, http_client=http_client)
 
             if message.get("type") == "text":
                 message_text = message["text"]["body"]
@@ -124,20 +175,36 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
                     message_text,
                     user_id=phone_number,
                     session_id=f"wa:{phone_number}",
-                    images=[Image(content=await get_media_async(message_image))] if message_image else None,
-                    files=[File(content=await get_media_async(message_doc))] if message_doc else None,
-                    videos=[Video(content=await get_media_async(message_video))] if message_video else None,
-                    audio=[Audio(content=await get_media_async(message_audio))] if message_audio else None,
+                    images=[Image(content=await get_media_async(message_image, http_client=http_client))]
+                    if message_image
+                    else None,
+                    files=[File(content=await get_media_async(message_doc, http_client=http_client))]
+                    if message_doc
+                    else None,
+                    videos=[Video(content=await get_media_async(message_video, http_client=http_client))]
+                    if message_video
+                    else None,
+                    audio=[Audio(content=await get_media_async(message_audio, http_client=http_client))]
+                    if message_audio
+                    else None,
                 )
             elif team:
                 response = await team.arun(  # type: ignore
                     message_text,
                     user_id=phone_number,
                     session_id=f"wa:{phone_number}",
-                    files=[File(content=await get_media_async(message_doc))] if message_doc else None,
-                    images=[Image(content=await get_media_async(message_image))] if message_image else None,
-                    videos=[Video(content=await get_media_async(message_video))] if message_video else None,
-                    audio=[Audio(content=await get_media_async(message_audio))] if message_audio else None,
+                    files=[File(content=await get_media_async(message_doc, http_client=http_client))]
+                    if message_doc
+                    else None,
+                    images=[Image(content=await get_media_async(message_image, http_client=http_client))]
+                    if message_image
+                    else None,
+                    videos=[Video(content=await get_media_async(message_video, http_client=http_client))]
+                    if message_video
+                    else None,
+                    audio=[Audio(content=await get_media_async(message_audio, http_client=http_client))]
+                    if message_audio
+                    else None,
                 )
 
             if response.reasoning_content:
@@ -163,9 +230,11 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
 
                     if image_bytes:
                         media_id = await upload_media_async(
-                            media_data=image_bytes, mime_type="image/png", filename="image.png"
+                            media_data=image_bytes, mime_type="image/png", filename="image.png", http_client=http_client
+                        )
+                        await send_image_message_async(
+                            media_id=media_id, recipient=phone_number, text=response.content, http_client=http_client
                         )
-                        await send_image_message_async(media_id=media_id, recipient=phone_number, text=response.content)
                     else:
                         log_warning(
                             f"Could not process image content for user {phone_number}. Type: {type(image_content)}"
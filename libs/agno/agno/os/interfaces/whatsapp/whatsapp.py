@@ -4,8 +4,10 @@ from fastapi.routing import APIRouter
 
 from agno.agent import Agent
 from agno.os.interfaces.base import BaseInterface
+from agno.os.interfaces.ingestion import WebhookIngestor
 from agno.os.interfaces.whatsapp.router import attach_routes
 from agno.team import Team
+from agno.utils.cache import CacheBackend
 
 
 class Whatsapp(BaseInterface):
@@ -19,11 +21,21 @@ class Whatsapp(BaseInterface):
         team: Optional[Team] = None,
         prefix: str = "/whatsapp",
         tags: Optional[List[str]] = None,
+        max_concurrency: int = 16,
+        max_pending: Optional[int] = 1000,
+        idempotency_ttl: int = 3600,
+        idempotency_cache: Optional[CacheBackend] = None,
     ):
         self.agent = agent
         self.team = team
         self.prefix = prefix
         self.tags = tags or ["Whatsapp"]
+        self.ingestor = WebhookIngestor(
+            max_concurrency=max_concurrency,
+            max_pending=max_pending,
+            idempotency_ttl=idempotency_ttl,
+            idempotency_cache=idempotency_cache,
+        )
 
         if not (self.agent or self.team):
             raise ValueError("Whatsapp requires an agent or a team")
@@ -31,6 +43,6 @@ class Whatsapp(BaseInterface):
     def get_router(self) -> APIRouter:
         self.router = APIRouter(prefix=self.prefix, tags=self.tags)  # type: ignore
 
-        self.router = attach_routes(router=self.router, agent=self.agent, team=self.team)
+        self.router = attach_routes(router=self.router, agent=self.agent, team=self.team, ingestor=self.ingestor)
 
         return self.router
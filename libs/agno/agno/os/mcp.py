@@ -9,7 +9,7 @@ from fastmcp.server.http import (
     StarletteWithLifespan,
 )
 
-from agno.db.base import AsyncBaseDb, SessionType
+from agno.db.base import AsyncBaseDb, SessionProjection, SessionType
 from agno.db.schemas import UserMemory
 from agno.os.routers.memory.schemas import (
     UserMemorySchema,
@@ -113,6 +113,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
         else:
             sessions = db.get_sessions(
@@ -122,6 +123,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
 
         return {
@@ -146,6 +148,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
         else:
             sessions = db.get_sessions(
@@ -155,6 +158,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
 
         return {
@@ -179,6 +183,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
         else:
             sessions = db.get_sessions(
@@ -188,6 +193,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
 
         return {
@@ -0,0 +1,191 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from agno.os.auth import get_authentication_dependency
+from agno.os.settings import AgnoAPISettings
+from agno.run.cancel import get_active_runs
+from agno.run.team import TeamRunOutput
+from agno.run.timing import RunPhase, get_run_timings
+from agno.utils.log import log_warning
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Phases that measure the latency of the database
+DB_OPERATIONS = {RunPhase.session_read.value: "session_read", RunPhase.session_write.value: "session_write"}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra is not None else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Cumulative histogram per set of labels, rendered in the Prometheus text format"""
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = sorted(buckets)
+        # Per labels: count in each bucket (non cumulative, the last one is +Inf), sum and count
+        self._values: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key: Labels = tuple(sorted(labels.items()))
+        counts, totals = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0, 0.0]))
+        counts[bisect_left(self.buckets, value)] += 1
+        totals[0] += value
+        totals[1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, totals) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(list(self.buckets) + [float("inf")], counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(labels, ('le', le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(totals[0])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(totals[1])}")
+        return lines
+
+
+def _render_gauge(
+    name: str, description: str, values: Sequence[Tuple[Labels, float]], kind: str = "gauge"
+) -> List[str]:
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+    for labels, value in values:
+        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return lines
+
+
+class RunMetricsCollector:
+    """
+    Aggregates the timings of finished runs into latency histograms, and renders them with the number of runs in
+    flight and the depth of the background queues in the Prometheus text format.
+
+    Register it with `add_run_timings_listener()`. Agents and teams must be created with `record_timings=True`.
+    The memory extraction queue depth is read from the queues of the given agents and teams, and their members.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, components: Optional[Sequence[Any]] = None):
+        self.run_duration = Histogram("agno_run_duration_seconds", "Duration of agent and team runs.", buckets)
+        self.phase_duration = Histogram(
+            "agno_run_phase_duration_seconds", "Time spent in each phase of agent and team runs.", buckets
+        )
+        self.db_duration = Histogram(
+            "agno_db_operation_duration_seconds", "Latency of the database operations of runs.", buckets
+        )
+        self.components: List[Any] = list(components or [])
+        self._runs: Dict[Labels, int] = {}
+        self._lock = Lock()
+
+    def __call__(self, run_response: Any) -> None:
+        self.observe(run_response)
+
+    def observe(self, run_response: Any) -> None:
+        """Record the duration and phase timings of a finished run"""
+        timings = get_run_timings(run_response)
+        if timings is None:
+            return
+        if isinstance(run_response, TeamRunOutput):
+            component, component_id = "team", run_response.team_id
+        else:
+            component, component_id = "agent", getattr(run_response, "agent_id", None)
+        status = getattr(run_response, "status", None)
+        status = getattr(status, "value", status)
+        labels = {"component": component, "id": component_id or ""}
+        metrics = getattr(run_response, "metrics", None)
+
+        with self._lock:
+            run_key: Labels = tuple(sorted({**labels, "status": str(status)}.items()))
+            self._runs[run_key] = self._runs.get(run_key, 0) + 1
+            if metrics is not None and metrics.duration is not None:
+                self.run_duration.observe(metrics.duration, **labels)
+            for timing in timings.phases:
+                self.phase_duration.observe(timing.duration, phase=timing.phase, **labels)
+                if timing.phase in DB_OPERATIONS:
+                    self.db_duration.observe(timing.duration, operation=DB_OPERATIONS[timing.phase])
+
+    def _get_memory_extraction_queues(self) -> List[Any]:
+        """The distinct memory extraction queues of the agents and teams, including the members of the teams"""
+        queues: Dict[int, Any] = {}
+        components = list(self.components)
+        seen = set()
+        while components:
+            component = components.pop()
+            if id(component) in seen:
+                continue
+            seen.add(id(component))
+            queue = getattr(component, "memory_extraction_queue", None)
+            if queue is not None:
+                queues[id(queue)] = queue
+            components.extend(getattr(component, "members", None) or [])
+        return list(queues.values())
+
+    def _get_queue_depths(self) -> List[Tuple[Labels, float]]:
+        depths: List[Tuple[Labels, float]] = []
+        try:
+            pending_turns = sum(queue.get_metrics()["pending_turns"] for queue in self._get_memory_extraction_queues())
+            depths.append(((("queue", "memory_extraction"),), pending_turns))
+        except Exception as e:
+            log_warning(f"Error reading memory extraction queue metrics: {e}")
+        try:
+            from agno.knowledge.model_manager import get_local_model_manager
+
+            for model, batcher_metrics in get_local_model_manager().get_metrics().items():
+                depths.append(((("queue", "local_model"), ("model", model)), batcher_metrics["queue_size"]))
+        except Exception as e:
+            log_warning(f"Error reading local model metrics: {e}")
+        return depths
+
+    def render(self) -> str:
+        with self._lock:
+            lines = _render_gauge(
+                "agno_runs_total",
+                "Number of finished agent and team runs.",
+                sorted(self._runs.items()),
+                kind="counter",
+            )
+            lines += _render_gauge("agno_runs_in_flight", "Number of runs in progress.", [((), len(get_active_runs()))])
+            lines += self.run_duration.render()
+            lines += self.phase_duration.render()
+            lines += self.db_duration.render()
+        lines += _render_gauge(
+            "agno_queue_depth", "Number of items waiting in background queues.", self._get_queue_depths()
+        )
+        return "\n".join(lines) + "\n"
+
+
+def get_prometheus_router(collector: RunMetricsCollector, settings: AgnoAPISettings = AgnoAPISettings()) -> APIRouter:
+    router = APIRouter(dependencies=[Depends(get_authentication_dependency(settings))], tags=["Metrics"])
+
+    @router.get(
+        "/metrics/prometheus",
+        operation_id="get_prometheus_metrics",
+        summary="Get Prometheus Metrics",
+        description=(
+            "Run latency histograms by phase, database latency, runs in flight and background queue depths, "
+            "in the Prometheus text exposition format."
+        ),
+        response_class=PlainTextResponse,
+    )
+    async def get_prometheus_metrics() -> PlainTextResponse:
+        return PlainTextResponse(collector.render(), media_type="text/plain; version=0.0.4")
+
+    return router
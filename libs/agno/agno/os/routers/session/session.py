@@ -5,7 +5,7 @@ from uuid import uuid4
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request
 
-from agno.db.base import AsyncBaseDb, BaseDb, SessionType
+from agno.db.base import AsyncBaseDb, BaseDb, SessionProjection, SessionType
 from agno.os.auth import get_authentication_dependency
 from agno.os.schema import (
     AgentSessionDetailSchema,
@@ -127,6 +127,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, Union[BaseDb, AsyncBaseDb]])
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
         else:
             sessions, total_count = db.get_sessions(  # type: ignore
@@ -139,6 +140,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, Union[BaseDb, AsyncBaseDb]])
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                projection=SessionProjection.listing(),
             )
 
         return PaginatedResponse(
@@ -534,42 +536,31 @@ def attach_routes(router: APIRouter, dbs: dict[str, Union[BaseDb, AsyncBaseDb]])
         if hasattr(request.state, "user_id"):
             user_id = request.state.user_id
 
-        # Use timestamp filters directly (already in epoch format)
-        start_timestamp = created_after
-        end_timestamp = created_before
+        # Only read the runs in the requested window (timestamps are already in epoch format)
+        projection = SessionProjection.runs_window(created_after=created_after, created_before=created_before)
 
         if isinstance(db, AsyncBaseDb):
             db = cast(AsyncBaseDb, db)
             session = await db.get_session(
-                session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False
+                session_id=session_id,
+                session_type=session_type,
+                user_id=user_id,
+                deserialize=False,
+                projection=projection,
             )
         else:
             session = db.get_session(
-                session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False
+                session_id=session_id,
+                session_type=session_type,
+                user_id=user_id,
+                deserialize=False,
+                projection=projection,
             )
 
         if not session:
             raise HTTPException(status_code=404, detail=f"Session with ID {session_id} not found")
 
-        runs = session.get("runs")  # type: ignore
-        if not runs:
-            return []
-
-        # Filter runs by timestamp if specified
-        # TODO: Move this filtering into the DB layer
-        filtered_runs = []
-        for run in runs:
-            if start_timestamp or end_timestamp:
-                run_created_at = run.get("created_at")
-                if run_created_at:
-                    # created_at is stored as epoch int
-                    if start_timestamp and run_created_at < start_timestamp:
-                        continue
-                    if end_timestamp and run_created_at > end_timestamp:
-                        continue
-
-            filtered_runs.append(run)
-
+        filtered_runs = session.get("runs")  # type: ignore
         if not filtered_runs:
             return []
 
@@ -649,14 +640,25 @@ def attach_routes(router: APIRouter, dbs: dict[str, Union[BaseDb, AsyncBaseDb]])
         if hasattr(request.state, "user_id"):
             user_id = request.state.user_id
 
+        # Only read the requested run of the session
+        projection = SessionProjection.single_run(run_id)
+
         if isinstance(db, AsyncBaseDb):
             db = cast(AsyncBaseDb, db)
             session = await db.get_session(
-                session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False
+                session_id=session_id,
+                session_type=session_type,
+                user_id=user_id,
+                deserialize=False,
+                projection=projection,
             )
         else:
             session = db.get_session(
-                session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False
+                session_id=session_id,
+                session_type=session_type,
+                user_id=user_id,
+                deserialize=False,
+                projection=projection,
             )
 
         if not session:
@@ -664,18 +666,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, Union[BaseDb, AsyncBaseDb]])
 
         runs = session.get("runs")  # type: ignore
         if not runs:
-            raise HTTPException(status_code=404, detail=f"Session with ID {session_id} has no runs")
-
-        # Find the specific run
-        # TODO: Move this filtering into the DB layer
-        target_run = None
-        for run in runs:
-            if run.get("run_id") == run_id:
-                target_run = run
-                break
-
-        if not target_run:
             raise HTTPException(status_code=404, detail=f"Run with ID {run_id} not found in session {session_id}")
+        target_run = runs[0]
 
         # Return the appropriate schema based on run type
         if target_run.get("workflow_id") is not None:
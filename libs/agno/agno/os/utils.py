@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union
 
 from fastapi import FastAPI, HTTPException, UploadFile
 from fastapi.routing import APIRoute, APIRouter
@@ -7,7 +7,6 @@ from starlette.middleware.cors import CORSMiddleware
 
 from agno.agent.agent import Agent
 from agno.db.base import AsyncBaseDb, BaseDb
-from agno.knowledge.knowledge import Knowledge
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.models.message import Message
@@ -18,6 +17,9 @@ from agno.tools.function import Function
 from agno.utils.log import logger
 from agno.workflow.workflow import Workflow
 
+if TYPE_CHECKING:
+    from agno.knowledge.knowledge import Knowledge
+
 
 def get_db(dbs: dict[str, Union[BaseDb, AsyncBaseDb]], db_id: Optional[str] = None) -> Union[BaseDb, AsyncBaseDb]:
     """Return the database with the given ID, or the first database if no ID is provided."""
@@ -38,7 +40,7 @@ def get_db(dbs: dict[str, Union[BaseDb, AsyncBaseDb]], db_id: Optional[str] = No
     return db
 
 
-def get_knowledge_instance_by_db_id(knowledge_instances: List[Knowledge], db_id: Optional[str] = None) -> Knowledge:
+def get_knowledge_instance_by_db_id(knowledge_instances: List["Knowledge"], db_id: Optional[str] = None) -> "Knowledge":
     """Return the knowledge instance with the given ID, or the first knowledge instance if no ID is provided."""
     if not db_id and len(knowledge_instances) == 1:
         return next(iter(knowledge_instances))
@@ -6,11 +6,12 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 from pydantic import BaseModel
 
 from agno.media import Audio, File, Image, Video
-from agno.models.message import Citations, Message
+from agno.models.message import Citations, CompactMessage, Message
 from agno.models.metrics import Metrics
 from agno.models.response import ToolExecution
 from agno.reasoning.step import ReasoningStep
 from agno.run.base import BaseRunOutputEvent, MessageReferences, RunStatus
+from agno.run.timing import RunTimings
 from agno.utils.log import logger
 
 if TYPE_CHECKING:
@@ -146,6 +147,8 @@ class RunEvent(str, Enum):
     output_model_response_started = "OutputModelResponseStarted"
     output_model_response_completed = "OutputModelResponseCompleted"
 
+    semantic_cache_hit = "SemanticCacheHit"
+
     custom_event = "CustomEvent"
 
 
@@ -325,6 +328,15 @@ class SessionSummaryCompletedEvent(BaseAgentRunEvent):
     session_summary: Optional["SessionSummary"] = None
 
 
+@dataclass
+class SemanticCacheHitEvent(BaseAgentRunEvent):
+    event: str = RunEvent.semantic_cache_hit.value
+    # Similarity between the input and the cached input
+    similarity: Optional[float] = None
+    # Run the cached response was generated in
+    cached_run_id: Optional[str] = None
+
+
 @dataclass
 class ReasoningStartedEvent(BaseAgentRunEvent):
     event: str = RunEvent.reasoning_started.value
@@ -418,6 +430,7 @@ RunOutputEvent = Union[
     ParserModelResponseCompletedEvent,
     OutputModelResponseStartedEvent,
     OutputModelResponseCompletedEvent,
+    SemanticCacheHitEvent,
     CustomEvent,
 ]
 
@@ -450,6 +463,7 @@ RUN_EVENT_TYPE_REGISTRY = {
     RunEvent.parser_model_response_completed.value: ParserModelResponseCompletedEvent,
     RunEvent.output_model_response_started.value: OutputModelResponseStartedEvent,
     RunEvent.output_model_response_completed.value: OutputModelResponseCompletedEvent,
+    RunEvent.semantic_cache_hit.value: SemanticCacheHitEvent,
     RunEvent.custom_event.value: CustomEvent,
 }
 
@@ -488,8 +502,11 @@ class RunOutput:
 
     model: Optional[str] = None
     model_provider: Optional[str] = None
+    # Messages of runs loaded from a stored session are CompactMessage, see agno.models.message.to_message
     messages: Optional[List[Message]] = None
     metrics: Optional[Metrics] = None
+    # Time spent in each phase of the run
+    timings: Optional[RunTimings] = None
     additional_input: Optional[List[Message]] = None
 
     tools: Optional[List[ToolExecution]] = None
@@ -555,6 +572,7 @@ class RunOutput:
                 "citations",
                 "events",
                 "additional_input",
+                "timings",
                 "reasoning_steps",
                 "reasoning_messages",
                 "references",
@@ -564,6 +582,9 @@ class RunOutput:
         if self.metrics is not None:
             _dict["metrics"] = self.metrics.to_dict() if isinstance(self.metrics, Metrics) else self.metrics
 
+        if self.timings is not None:
+            _dict["timings"] = self.timings.to_dict() if isinstance(self.timings, RunTimings) else self.timings
+
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
 
@@ -663,7 +684,12 @@ class RunOutput:
             return json.dumps(_dict, indent=indent, separators=separators)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "RunOutput":
+    def from_dict(cls, data: Dict[str, Any], compact_messages: bool = False) -> "RunOutput":
+        """Creates a RunOutput from a dictionary.
+
+        Args:
+            compact_messages: Load the messages as CompactMessage, as done for the runs of stored sessions.
+        """
         if "run" in data:
             data = data.pop("run")
 
@@ -671,7 +697,8 @@ class RunOutput:
         events = [run_output_event_from_dict(event) for event in events] if events else None
 
         messages = data.pop("messages", None)
-        messages = [Message.from_dict(message) for message in messages] if messages else None
+        message_cls = CompactMessage if compact_messages else Message
+        messages = [message_cls.from_dict(message) for message in messages] if messages else None
 
         citations = data.pop("citations", None)
         citations = Citations.model_validate(citations) if citations else None
@@ -703,6 +730,10 @@ class RunOutput:
         if metrics:
             metrics = Metrics(**metrics)
 
+        timings = data.pop("timings", None)
+        if timings:
+            timings = RunTimings.from_dict(timings)
+
         additional_input = data.pop("additional_input", None)
 
         if additional_input is not None:
@@ -723,6 +754,7 @@ class RunOutput:
         return cls(
             messages=messages,
             metrics=metrics,
+            timings=timings,
             citations=citations,
             tools=tools,
             images=images,
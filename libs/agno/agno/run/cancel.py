@@ -79,3 +79,8 @@ def cleanup_run(run_id: str) -> None:
 def raise_if_cancelled(run_id: str) -> None:
     """Check if a run should be cancelled and raise exception if so."""
     _cancellation_manager.raise_if_cancelled(run_id)
+
+
+def get_active_runs() -> Dict[str, bool]:
+    """Get all currently tracked runs and their cancellation status."""
+    return _cancellation_manager.get_active_runs()
@@ -6,12 +6,13 @@ from typing import Any, Dict, List, Optional, Sequence, Union
 from pydantic import BaseModel
 
 from agno.media import Audio, File, Image, Video
-from agno.models.message import Citations, Message
+from agno.models.message import Citations, CompactMessage, Message
 from agno.models.metrics import Metrics
 from agno.models.response import ToolExecution
 from agno.reasoning.step import ReasoningStep
 from agno.run.agent import RunEvent, RunOutput, RunOutputEvent, run_output_event_from_dict
 from agno.run.base import BaseRunOutputEvent, MessageReferences, RunStatus
+from agno.run.timing import RunTimings
 from agno.utils.log import log_error
 
 
@@ -447,8 +448,11 @@ class TeamRunOutput:
 
     content: Optional[Any] = None
     content_type: str = "str"
+    # Messages of runs loaded from a stored session are CompactMessage, see agno.models.message.to_message
     messages: Optional[List[Message]] = None
     metrics: Optional[Metrics] = None
+    # Time spent in each phase of the run
+    timings: Optional[RunTimings] = None
     model: Optional[str] = None
     model_provider: Optional[str] = None
 
@@ -520,11 +524,15 @@ class TeamRunOutput:
                 "citations",
                 "events",
                 "additional_input",
+                "timings",
                 "reasoning_steps",
                 "reasoning_messages",
                 "references",
             ]
         }
+        if self.timings is not None:
+            _dict["timings"] = self.timings.to_dict() if isinstance(self.timings, RunTimings) else self.timings
+
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
 
@@ -604,7 +612,12 @@ class TeamRunOutput:
             return json.dumps(_dict, indent=indent, separators=separators)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "TeamRunOutput":
+    def from_dict(cls, data: Dict[str, Any], compact_messages: bool = False) -> "TeamRunOutput":
+        """Creates a TeamRunOutput from a dictionary.
+
+        Args:
+            compact_messages: Load the messages as CompactMessage, as done for the runs of stored sessions.
+        """
         events = data.pop("events", None)
         final_events = []
         for event in events or []:
@@ -619,16 +632,17 @@ class TeamRunOutput:
         events = final_events
 
         messages = data.pop("messages", None)
-        messages = [Message.from_dict(message) for message in messages] if messages else None
+        message_cls = CompactMessage if compact_messages else Message
+        messages = [message_cls.from_dict(message) for message in messages] if messages else None
 
         member_responses = data.pop("member_responses", [])
         parsed_member_responses: List[Union["TeamRunOutput", RunOutput]] = []
         if member_responses:
             for response in member_responses:
                 if "agent_id" in response:
-                    parsed_member_responses.append(RunOutput.from_dict(response))
+                    parsed_member_responses.append(RunOutput.from_dict(response, compact_messages=compact_messages))
                 else:
-                    parsed_member_responses.append(cls.from_dict(response))
+                    parsed_member_responses.append(cls.from_dict(response, compact_messages=compact_messages))
 
         additional_input = data.pop("additional_input", None)
         if additional_input is not None:
@@ -673,12 +687,17 @@ class TeamRunOutput:
         if metrics:
             metrics = Metrics(**metrics)
 
+        timings = data.pop("timings", None)
+        if timings:
+            timings = RunTimings.from_dict(timings)
+
         citations = data.pop("citations", None)
         citations = Citations.model_validate(citations) if citations else None
 
         return cls(
             messages=messages,
             metrics=metrics,
+            timings=timings,
             member_responses=parsed_member_responses,
             additional_input=additional_input,
             reasoning_steps=reasoning_steps,
@@ -0,0 +1,198 @@
+"""Per-run phase timings, and the listeners exporting them to tracing and metrics backends."""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from agno.utils.log import log_warning
+
+_lock = Lock()
+
+T = TypeVar("T")
+
+
+class RunPhase(str, Enum):
+    session_read = "session_read"
+    memory_retrieval = "memory_retrieval"
+    knowledge_retrieval = "knowledge_retrieval"
+    system_message = "system_message"
+    model_call = "model_call"
+    tool_call = "tool_call"
+    pre_hooks = "pre_hooks"
+    post_hooks = "post_hooks"
+    session_write = "session_write"
+    background_tasks = "background_tasks"
+
+
+@dataclass
+class PhaseTiming:
+    """Time spent in one phase of a run"""
+
+    phase: str
+    # Seconds since the start of the run
+    start: float
+    duration: float
+    # Details of the phase, like the tool name of a tool call
+    attributes: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        _dict: Dict[str, Any] = {"phase": self.phase, "start": self.start, "duration": self.duration}
+        if self.attributes:
+            _dict["attributes"] = self.attributes
+        return _dict
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PhaseTiming":
+        return cls(
+            phase=data["phase"],
+            start=data.get("start", 0.0),
+            duration=data.get("duration", 0.0),
+            attributes=data.get("attributes"),
+        )
+
+
+@dataclass
+class RunTimings:
+    """Breakdown of the wall-clock time of a run by phase"""
+
+    # Unix timestamp at which the run started
+    started_at: float = field(default_factory=time)
+    phases: List[PhaseTiming] = field(default_factory=list)
+    # perf_counter() at the start of the run, the origin of the phase start offsets
+    origin: float = field(default_factory=perf_counter, repr=False, compare=False)
+
+    def record(
+        self,
+        phase: str,
+        start_time: float,
+        end_time: Optional[float] = None,
+        duration: Optional[float] = None,
+        **attributes: Any,
+    ) -> PhaseTiming:
+        """
+        Record a phase from its perf_counter() start and end times.
+        The duration can be set when the phase was interrupted, like a model stream waiting for its consumer.
+        """
+        end_time = end_time if end_time is not None else perf_counter()
+        timing = PhaseTiming(
+            phase=phase.value if isinstance(phase, RunPhase) else phase,
+            start=start_time - self.origin,
+            duration=duration if duration is not None else end_time - start_time,
+            attributes={key: value for key, value in attributes.items() if value is not None} or None,
+        )
+        # Phases of parallel tool calls are recorded from several threads
+        with _lock:
+            self.phases.append(timing)
+        return timing
+
+    @contextmanager
+    def phase(self, phase: str, **attributes: Any) -> Iterator[None]:
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, start_time, **attributes)
+
+    def get_duration(self, phase: str) -> float:
+        """Total time spent in a phase, in seconds"""
+        phase = phase.value if isinstance(phase, RunPhase) else phase
+        return sum(timing.duration for timing in self.phases if timing.phase == phase)
+
+    def get_durations(self) -> Dict[str, float]:
+        """Total time spent in each phase, in seconds"""
+        durations: Dict[str, float] = {}
+        for timing in self.phases:
+            durations[timing.phase] = durations.get(timing.phase, 0.0) + timing.duration
+        return durations
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"started_at": self.started_at, "phases": [timing.to_dict() for timing in self.phases]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunTimings":
+        return cls(
+            started_at=data.get("started_at", 0.0),
+            phases=[PhaseTiming.from_dict(timing) for timing in data.get("phases", [])],
+        )
+
+
+def get_run_timings(target: Optional[Any]) -> Optional[RunTimings]:
+    """Return the timings of a run output, or the target itself if it is RunTimings"""
+    if isinstance(target, RunTimings):
+        return target
+    timings = getattr(target, "timings", None)
+    return timings if isinstance(timings, RunTimings) else None
+
+
+@contextmanager
+def time_phase(target: Optional[Any], phase: str, **attributes: Any) -> Iterator[None]:
+    """Time a phase of a run, if the run output (or RunTimings) is set and records timings"""
+    timings = get_run_timings(target)
+    if timings is None:
+        yield
+        return
+    with timings.phase(phase, **attributes):
+        yield
+
+
+class StreamTimer:
+    """Times the waits for the items of a stream, leaving out the time its consumer spends on each item"""
+
+    def __init__(self):
+        self.start_time: Optional[float] = None
+        self.duration = 0.0
+
+    def wrap(self, iterator: Iterator[T]) -> Iterator[T]:
+        self.start_time = wait_start = perf_counter()
+        for item in iterator:
+            self.duration += perf_counter() - wait_start
+            yield item
+            wait_start = perf_counter()
+        self.duration += perf_counter() - wait_start
+
+    async def awrap(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        self.start_time = wait_start = perf_counter()
+        async for item in iterator:
+            self.duration += perf_counter() - wait_start
+            yield item
+            wait_start = perf_counter()
+        self.duration += perf_counter() - wait_start
+
+    def record(self, target: Optional[Any], phase: str, **attributes: Any) -> None:
+        """Record the time spent waiting as a phase of the run, if the run output (or RunTimings) is set"""
+        timings = get_run_timings(target)
+        if timings is not None and self.start_time is not None:
+            timings.record(phase, self.start_time, duration=self.duration, **attributes)
+
+
+# --- Export ---
+
+# Listeners are called with the run output (RunOutput or TeamRunOutput) when a run finishes
+RunTimingsListener = Callable[[Any], None]
+
+_listeners: List[RunTimingsListener] = []
+
+
+def add_run_timings_listener(listener: RunTimingsListener) -> None:
+    """Call the listener with the output of every finished run, e.g. to export the timings as spans or metrics"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_run_timings_listener(listener: RunTimingsListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def publish_run_timings(run_response: Any) -> None:
+    """Pass the output of a finished run to the listeners. Errors of listeners are logged, not raised."""
+    if not _listeners or getattr(run_response, "timings", None) is None:
+        return
+    for listener in list(_listeners):
+        try:
+            listener(run_response)
+        except Exception as e:
+            log_warning(f"Error exporting run timings: {e}")
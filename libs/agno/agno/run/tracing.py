@@ -0,0 +1,87 @@
+"""Export the phase timings of runs as OpenTelemetry spans."""
+
+from typing import Any, Dict, Optional
+
+from agno.run.team import TeamRunOutput
+from agno.run.timing import RunTimings, add_run_timings_listener, get_run_timings, remove_run_timings_listener
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Tracer, TracerProvider
+except ImportError:
+    raise ImportError("`opentelemetry-api` not installed. Please install it using `pip install opentelemetry-api`")
+
+
+def _to_ns(seconds: float) -> int:
+    return int(seconds * 1e9)
+
+
+class OpenTelemetryRunExporter:
+    """
+    Creates a span for every finished run, with a child span for each phase of the run.
+
+    Spans are created after the run finished, from the timings recorded on the run output, so agents and teams
+    must be created with `record_timings=True`.
+    """
+
+    def __init__(self, tracer: Optional[Tracer] = None, tracer_provider: Optional[TracerProvider] = None):
+        self.tracer = tracer or trace.get_tracer("agno", tracer_provider=tracer_provider)
+
+    def get_run_attributes(self, run_response: Any) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = {}
+        for key in ["run_id", "session_id", "user_id", "agent_id", "agent_name", "team_id", "team_name", "model"]:
+            value = getattr(run_response, key, None)
+            if value is not None:
+                attributes[f"agno.{key}"] = value
+        status = getattr(run_response, "status", None)
+        if status is not None:
+            attributes["agno.status"] = status.value if hasattr(status, "value") else str(status)
+        metrics = getattr(run_response, "metrics", None)
+        if metrics is not None:
+            attributes["agno.input_tokens"] = metrics.input_tokens
+            attributes["agno.output_tokens"] = metrics.output_tokens
+        return attributes
+
+    def export(self, run_response: Any) -> None:
+        timings: Optional[RunTimings] = get_run_timings(run_response)
+        if timings is None:
+            return
+
+        # The run metrics timer starts after the session is read, so the last phase can end after it
+        metrics = getattr(run_response, "metrics", None)
+        duration = max(
+            [timing.start + timing.duration for timing in timings.phases]
+            + [metrics.duration if metrics is not None and metrics.duration is not None else 0.0]
+        )
+
+        name = "team.run" if isinstance(run_response, TeamRunOutput) else "agent.run"
+        run_span = self.tracer.start_span(
+            name, start_time=_to_ns(timings.started_at), attributes=self.get_run_attributes(run_response)
+        )
+        context = trace.set_span_in_context(run_span)
+        for timing in timings.phases:
+            phase_start = timings.started_at + timing.start
+            phase_span = self.tracer.start_span(
+                timing.phase,
+                context=context,
+                start_time=_to_ns(phase_start),
+                attributes={f"agno.{key}": value for key, value in (timing.attributes or {}).items()},
+            )
+            phase_span.end(end_time=_to_ns(phase_start + timing.duration))
+        run_span.end(end_time=_to_ns(timings.started_at + duration))
+
+    def __call__(self, run_response: Any) -> None:
+        self.export(run_response)
+
+
+def enable_opentelemetry_export(
+    tracer: Optional[Tracer] = None, tracer_provider: Optional[TracerProvider] = None
+) -> OpenTelemetryRunExporter:
+    """Export the timings of all finished runs as OpenTelemetry spans, and return the exporter"""
+    exporter = OpenTelemetryRunExporter(tracer=tracer, tracer_provider=tracer_provider)
+    add_run_timings_listener(exporter)
+    return exporter
+
+
+def disable_opentelemetry_export(exporter: OpenTelemetryRunExporter) -> None:
+    remove_run_timings_listener(exporter)
@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Mapping, Optional
 
-from agno.models.message import Message
+from agno.models.message import Message, to_message
 from agno.run.agent import RunOutput
 from agno.run.base import RunStatus
+from agno.session.run_index import RunIndex
 from agno.session.summary import SessionSummary
 from agno.utils.log import log_debug, log_warning
 
@@ -59,7 +60,7 @@ class AgentSession:
         runs = data.get("runs")
         serialized_runs: List[RunOutput] = []
         if runs is not None and isinstance(runs[0], dict):
-            serialized_runs = [RunOutput.from_dict(run) for run in runs]
+            serialized_runs = [RunOutput.from_dict(run, compact_messages=True) for run in runs]
 
         summary = data.get("summary")
         if summary is not None and isinstance(summary, dict):
@@ -89,23 +90,32 @@ class AgentSession:
             if m.metrics is not None:
                 m.metrics.duration = None
 
-        if not self.runs:
-            self.runs = []
-
-        for i, existing_run in enumerate(self.runs or []):
-            if existing_run.run_id == run.run_id:
-                self.runs[i] = run
-                break
+        run_index = self._get_run_index()
+        position = run_index.get_position(run.run_id)
+        if position is not None:
+            run_index.replace(position, run)
         else:
-            self.runs.append(run)
+            run_index.append(run)
 
         log_debug("Added RunOutput to Agent Session")
 
+    def _get_run_index(self) -> RunIndex:
+        """Returns the index of the runs, creating it on first use"""
+        if self.runs is None:
+            self.runs = []
+        run_index: Optional[RunIndex] = getattr(self, "_run_index", None)
+        if run_index is None or not run_index.is_valid_for(self.runs):
+            run_index = RunIndex(self.runs)
+            self._run_index = run_index
+        else:
+            run_index.update()
+        return run_index
+
     def get_run(self, run_id: str) -> Optional[RunOutput]:
-        for run in self.runs or []:
-            if run.run_id == run_id:
-                return run
-        return None
+        if not self.runs:
+            return None
+        position = self._get_run_index().get_position(run_id)
+        return self.runs[position] if position is not None else None
 
     def get_messages_from_last_n_runs(
         self,
@@ -133,18 +143,22 @@ class AgentSession:
         if skip_status is None:
             skip_status = [RunStatus.paused, RunStatus.cancelled, RunStatus.error]
 
-        session_runs = self.runs
-        # Filter by agent_id and team_id
-        if agent_id:
-            session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
-        if team_id:
-            session_runs = [run for run in session_runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
-
-        # Filter by status
-        session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_status]  # type: ignore
+        # Walk the runs of the agent or team from the last one, until last_n runs are found
+        runs_to_process: List[RunOutput] = []
+        for position in self._get_run_index().iter_positions_reversed(agent_id=agent_id, team_id=team_id):
+            run = self.runs[position]
+            # Filter by agent_id, team_id and status
+            if agent_id and getattr(run, "agent_id", None) != agent_id:
+                continue
+            if team_id and getattr(run, "team_id", None) != team_id:
+                continue
+            if not hasattr(run, "status") or run.status in skip_status:
+                continue
+            runs_to_process.append(run)
+            if last_n and len(runs_to_process) >= last_n:
+                break
+        runs_to_process.reverse()
 
-        # Filter by last_n
-        runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
         messages_from_history = []
         system_message = None
         for run_response in runs_to_process:
@@ -163,10 +177,10 @@ class AgentSession:
                 if message.role == "system":
                     # Only add the system message once
                     if system_message is None:
-                        system_message = message
+                        system_message = to_message(message)
                         messages_from_history.append(system_message)
                 else:
-                    messages_from_history.append(message)
+                    messages_from_history.append(to_message(message))
 
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
@@ -176,8 +190,9 @@ class AgentSession:
 
         tool_calls = []
         if self.runs:
-            session_runs = self.runs
-            for run_response in session_runs[::-1]:
+            # Only walk the runs with tool calls
+            for position in reversed(self._get_run_index().tool_call_positions):
+                run_response = self.runs[position]
                 if run_response and run_response.messages:
                     for message in run_response.messages or []:
                         if message.tool_calls:
@@ -192,15 +207,20 @@ class AgentSession:
         user_role: str = "user",
         assistant_role: Optional[List[str]] = None,
         skip_history_messages: bool = True,
+        runs: Optional[List[Any]] = None,
     ) -> List[Message]:
-        """Returns a list of messages for the session that iterate through user message and assistant response."""
+        """Returns a list of messages for the session that iterate through user message and assistant response.
+
+        Args:
+            runs: Runs to get the messages from. Defaults to all runs of the session.
+        """
 
         if assistant_role is None:
             # TODO: Check if we still need CHATBOT as a role
             assistant_role = ["assistant", "model", "CHATBOT"]
 
         final_messages: List[Message] = []
-        session_runs = self.runs
+        session_runs = self.runs if runs is None else runs
         if not session_runs:
             return []
 
@@ -226,8 +246,8 @@ class AgentSession:
                         break
 
                 if user_message_from_run and assistant_message_from_run:
-                    final_messages.append(user_message_from_run)
-                    final_messages.append(assistant_message_from_run)
+                    final_messages.append(to_message(user_message_from_run))
+                    final_messages.append(to_message(assistant_message_from_run))
         return final_messages
 
     def get_session_summary(self) -> Optional[SessionSummary]:
@@ -243,5 +263,5 @@ class AgentSession:
 
         messages = []
         for run in self.runs or []:
-            messages.extend([msg for msg in run.messages or [] if not msg.from_history])
+            messages.extend([to_message(msg) for msg in run.messages or [] if not msg.from_history])
         return messages
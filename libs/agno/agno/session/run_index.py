@@ -0,0 +1,90 @@
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class RunIndex:
+    """
+    Positions of the runs of a session by run id, agent, team and tool calls.
+
+    The index is updated as runs are upserted, so looking up a run or walking the last runs of an agent or team does
+    not scan all runs of the session. Runs appended to the list directly are indexed on the next lookup, and the
+    index is rebuilt if the list is replaced or shrinks.
+    """
+
+    def __init__(self, runs: List[Any]):
+        # The indexed list of runs
+        self.runs = runs
+        self.num_indexed = 0
+        # Position of each run by run id
+        self.positions: Dict[str, int] = {}
+        # Positions of the runs of each agent and team
+        self.agent_positions: Dict[str, List[int]] = {}
+        self.team_positions: Dict[str, List[int]] = {}
+        # Positions of the runs without a parent run, i.e. not runs of team members
+        self.main_positions: List[int] = []
+        # Positions of the runs with at least one tool call
+        self.tool_call_positions: List[int] = []
+        self.update()
+
+    def is_valid_for(self, runs: Optional[List[Any]]) -> bool:
+        return runs is self.runs and len(runs) >= self.num_indexed
+
+    def update(self) -> None:
+        """Index the runs added to the list since the last update"""
+        for position in range(self.num_indexed, len(self.runs)):
+            self._add(position, self.runs[position])
+        self.num_indexed = len(self.runs)
+
+    def _add(self, position: int, run: Any) -> None:
+        if run.run_id is not None:
+            self.positions[run.run_id] = position
+        agent_id = getattr(run, "agent_id", None)
+        if agent_id is not None:
+            self.agent_positions.setdefault(agent_id, []).append(position)
+        team_id = getattr(run, "team_id", None)
+        if team_id is not None:
+            self.team_positions.setdefault(team_id, []).append(position)
+        if getattr(run, "parent_run_id", None) is None:
+            self.main_positions.append(position)
+        if any(message.tool_calls for message in run.messages or []):
+            self.tool_call_positions.append(position)
+
+    def get_position(self, run_id: Optional[str]) -> Optional[int]:
+        position = self.positions.get(run_id) if run_id is not None else None
+        if position is None or position >= len(self.runs) or self.runs[position].run_id != run_id:
+            return None
+        return position
+
+    def append(self, run: Any) -> None:
+        """Append a run to the indexed list"""
+        self.update()
+        self.runs.append(run)
+        self.update()
+
+    def replace(self, position: int, run: Any) -> None:
+        """Replace the run at a position. Its agent, team and parent run must not change."""
+        self.runs[position] = run
+        has_tool_calls = any(message.tool_calls for message in run.messages or [])
+        i = bisect_left(self.tool_call_positions, position)
+        is_indexed = i < len(self.tool_call_positions) and self.tool_call_positions[i] == position
+        if has_tool_calls and not is_indexed:
+            insort(self.tool_call_positions, position)
+        elif not has_tool_calls and is_indexed:
+            del self.tool_call_positions[i]
+
+    def iter_positions_reversed(
+        self, agent_id: Optional[str] = None, team_id: Optional[str] = None, main_runs_only: bool = False
+    ) -> Iterator[int]:
+        """
+        Yields the positions of the runs from the last one, using the most selective index for the filters.
+        Runs are not guaranteed to match all filters, callers must check them.
+        """
+        if agent_id:
+            candidates: Any = self.agent_positions.get(agent_id, [])
+        elif team_id:
+            candidates = self.team_positions.get(team_id, [])
+        elif main_runs_only:
+            candidates = self.main_positions
+        else:
+            candidates = range(len(self.runs))
+        return reversed(candidates)
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union, cast
@@ -8,6 +10,7 @@ from pydantic import BaseModel, Field
 from agno.models.base import Model
 from agno.run.agent import Message
 from agno.utils.log import log_debug, log_warning
+from agno.utils.tokens import count_message_tokens
 
 # TODO: Look into moving all managers into a separate dir
 if TYPE_CHECKING:
@@ -23,12 +26,15 @@ class SessionSummary:
     summary: str
     topics: Optional[List[str]] = None
     updated_at: Optional[datetime] = None
+    # Id of the last run covered by the summary
+    last_run_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         _dict = {
             "summary": self.summary,
             "topics": self.topics,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "last_run_id": self.last_run_id,
         }
         return {k: v for k, v in _dict.items() if v is not None}
 
@@ -56,6 +62,17 @@ class SessionSummaryResponse(BaseModel):
         return self.model_dump_json(exclude_none=True, indent=2)
 
 
+# Runs background summary updates one at a time, shared by all managers
+_background_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_background_executor() -> ThreadPoolExecutor:
+    global _background_executor
+    if _background_executor is None:
+        _background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agno-summary")
+    return _background_executor
+
+
 @dataclass
 class SessionSummaryManager:
     """Session Summary Manager"""
@@ -72,6 +89,64 @@ class SessionSummaryManager:
     # Whether session summaries were created in the last run
     summaries_updated: bool = False
 
+    # Update the previous summary with the runs since it was created, instead of summarizing the whole session
+    incremental: bool = False
+    # Only update the summary once this many runs were added since the last update
+    update_every_n_runs: Optional[int] = None
+    # Only update the summary once the messages added since the last update reach this many tokens.
+    # Combined with update_every_n_runs, the summary is updated when either is reached.
+    update_every_n_tokens: Optional[int] = None
+    # Generate the summary from a snapshot of the session while the run is stored, instead of before.
+    # The summary is merged into the session when it is saved at the end of the run.
+    run_in_background: bool = False
+
+    # Summary updates running in the background, by session id
+    _background_updates: Dict[
+        str, Union["Future[Optional[SessionSummary]]", "asyncio.Task[Optional[SessionSummary]]"]
+    ] = field(default_factory=dict, init=False, repr=False)
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        cls = self.__class__
+        copied_obj = cls.__new__(cls)
+        memo[id(self)] = copied_obj
+        for k, v in self.__dict__.items():
+            setattr(copied_obj, k, {} if k == "_background_updates" else deepcopy(v, memo))
+        return copied_obj
+
+    def get_runs_since_summary(self, session: "Session") -> List[Any]:
+        """Return the runs of the session that are not covered by its summary"""
+        runs = session.runs or []  # type: ignore
+        summary = session.summary  # type: ignore
+        if summary is None or summary.last_run_id is None:
+            return list(runs)
+        for index, run in enumerate(runs):
+            if run.run_id == summary.last_run_id:
+                return list(runs[index + 1 :])
+        # The covered runs are no longer in the session, so summarize all of them
+        return list(runs)
+
+    def should_update_summary(self, session: "Session") -> bool:
+        """Return True if enough runs or tokens were added since the last summary update"""
+        if session.summary is None or (self.update_every_n_runs is None and self.update_every_n_tokens is None):  # type: ignore
+            return True
+        new_runs = self.get_runs_since_summary(session)
+        if len(new_runs) == 0:
+            return False
+        if self.update_every_n_runs is not None and len(new_runs) >= self.update_every_n_runs:
+            return True
+        if self.update_every_n_tokens is not None:
+            num_tokens = sum(
+                count_message_tokens(message)
+                for run in new_runs
+                for message in run.messages or []
+                if not message.from_history
+            )
+            if num_tokens >= self.update_every_n_tokens:
+                return True
+        return False
+
     def get_response_format(self, model: "Model") -> Union[Dict[str, Any], Type[BaseModel]]:  # type: ignore
         if model.supports_native_structured_outputs:
             return SessionSummaryResponse
@@ -91,6 +166,7 @@ class SessionSummaryManager:
         self,
         conversation: List[Message],
         response_format: Union[Dict[str, Any], Type[BaseModel]],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Message:
         if self.session_summary_prompt is not None:
             system_prompt = self.session_summary_prompt
@@ -127,6 +203,18 @@ class SessionSummaryManager:
         system_prompt += "\n".join(conversation_messages)
         system_prompt += "</conversation>"
 
+        if previous_summary is not None:
+            system_prompt += (
+                "\nThe conversation continues a session with the following summary:\n"
+                f"<previous_summary>\n{previous_summary.summary}\n</previous_summary>\n"
+            )
+            if previous_summary.topics:
+                system_prompt += f"Previous topics: {', '.join(previous_summary.topics)}\n"
+            system_prompt += (
+                "Update the summary with the new conversation, keeping the relevant information of the previous "
+                "summary, and return the topics of the whole session."
+            )
+
         if response_format == {"type": "json_object"}:
             from agno.utils.prompts import get_json_output_prompt
 
@@ -145,9 +233,17 @@ class SessionSummaryManager:
         self.model = cast(Model, self.model)
         response_format = self.get_response_format(self.model)
 
+        previous_summary = session.summary if self.incremental else None  # type: ignore
+        if previous_summary is not None:
+            # Only send the runs since the last update, along with the previous summary
+            conversation = session.get_messages_for_session(runs=self.get_runs_since_summary(session))  # type: ignore
+        else:
+            conversation = session.get_messages_for_session()  # type: ignore
+
         system_message = self.get_system_message(
-            conversation=session.get_messages_for_session(),  # type: ignore
+            conversation=conversation,
             response_format=response_format,
+            previous_summary=previous_summary,
         )
 
         if system_message is None:
@@ -204,15 +300,41 @@ class SessionSummaryManager:
 
         return None
 
-    def create_session_summary(
-        self,
-        session: Union["AgentSession", "TeamSession"],
+    def _get_last_run_id(self, session: "Session") -> Optional[str]:
+        runs = session.runs or []  # type: ignore
+        return runs[-1].run_id if runs else None
+
+    def _summarize(self, messages: List[Message], last_run_id: Optional[str]) -> Optional[SessionSummary]:
+        summary_response = self.model.response(messages=messages, response_format=self.get_response_format(self.model))  # type: ignore
+        session_summary = self._process_summary_response(summary_response, self.model)  # type: ignore
+        if session_summary is not None:
+            session_summary.last_run_id = last_run_id
+        return session_summary
+
+    async def _asummarize(self, messages: List[Message], last_run_id: Optional[str]) -> Optional[SessionSummary]:
+        summary_response = await self.model.aresponse(  # type: ignore
+            messages=messages,
+            response_format=self.get_response_format(self.model),  # type: ignore
+        )
+        session_summary = self._process_summary_response(summary_response, self.model)  # type: ignore
+        if session_summary is not None:
+            session_summary.last_run_id = last_run_id
+        return session_summary
+
+    def _apply_summary(
+        self, session: Union["AgentSession", "TeamSession"], session_summary: Optional[SessionSummary]
     ) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
-        log_debug("Creating session summary", center=True)
+        if session_summary is not None:
+            session.summary = session_summary
+            self.summaries_updated = True
+        return session_summary
+
+    def _generate_session_summary(self, session: Union["AgentSession", "TeamSession"]) -> Optional[SessionSummary]:
         if self.model is None:
             return None
 
+        # The summary covers the runs in the session when the prompt is built
+        last_run_id = self._get_last_run_id(session)
         messages = self._prepare_summary_messages(session)
 
         # Skip summary generation if there are no meaningful messages
@@ -220,26 +342,16 @@ class SessionSummaryManager:
             log_debug("No meaningful messages to summarize, skipping session summary")
             return None
 
-        response_format = self.get_response_format(self.model)
-
-        summary_response = self.model.response(messages=messages, response_format=response_format)
-        session_summary = self._process_summary_response(summary_response, self.model)
-
-        if session is not None and session_summary is not None:
-            session.summary = session_summary
-            self.summaries_updated = True
+        return self._apply_summary(session, self._summarize(messages, last_run_id))
 
-        return session_summary
-
-    async def acreate_session_summary(
-        self,
-        session: Union["AgentSession", "TeamSession"],
+    async def _agenerate_session_summary(
+        self, session: Union["AgentSession", "TeamSession"]
     ) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
-        log_debug("Creating session summary", center=True)
         if self.model is None:
             return None
 
+        # The summary covers the runs in the session when the prompt is built
+        last_run_id = self._get_last_run_id(session)
         messages = self._prepare_summary_messages(session)
 
         # Skip summary generation if there are no meaningful messages
@@ -247,13 +359,100 @@ class SessionSummaryManager:
             log_debug("No meaningful messages to summarize, skipping session summary")
             return None
 
-        response_format = self.get_response_format(self.model)
+        return self._apply_summary(session, await self._asummarize(messages, last_run_id))
 
-        summary_response = await self.model.aresponse(messages=messages, response_format=response_format)
-        session_summary = self._process_summary_response(summary_response, self.model)
+    def create_session_summary(self, session: Union["AgentSession", "TeamSession"]) -> Optional[SessionSummary]:
+        """
+        Creates a summary of the session, if enough runs or tokens were added since the last update.
 
-        if session is not None and session_summary is not None:
-            session.summary = session_summary
-            self.summaries_updated = True
+        With run_in_background, the summary is generated in a background thread from the messages of the session at
+        this point, and the current summary is returned. The new summary is set on the session by
+        merge_background_summary, when the session is saved after the update finished.
+        """
+        if self.model is None:
+            return None
+        if self.run_in_background:
+            # A finished update is the base of the next one
+            self.merge_background_summary(session)
+        if not self.should_update_summary(session):
+            log_debug("Skipping session summary update until more runs are added")
+            return session.summary
+
+        if not self.run_in_background:
+            log_debug("Creating session summary", center=True)
+            return self._generate_session_summary(session)
+
+        if session.session_id in self._background_updates:
+            # Still running, the next update covers the runs added in the meantime
+            return session.summary
+
+        # Build the prompt here, so the background thread never reads the session while the run updates it
+        last_run_id = self._get_last_run_id(session)
+        messages = self._prepare_summary_messages(session)
+        if messages is None:
+            log_debug("No meaningful messages to summarize, skipping session summary")
+            return session.summary
 
-        return session_summary
+        log_debug("Creating session summary in the background", center=True)
+        self._background_updates[session.session_id] = _get_background_executor().submit(
+            self._summarize, messages, last_run_id
+        )
+        return session.summary
+
+    async def acreate_session_summary(self, session: Union["AgentSession", "TeamSession"]) -> Optional[SessionSummary]:
+        """
+        Creates a summary of the session, if enough runs or tokens were added since the last update.
+
+        With run_in_background, the summary is generated in a background task from the messages of the session at
+        this point, and the current summary is returned. The new summary is set on the session by
+        merge_background_summary, when the session is saved after the update finished.
+        """
+        if self.model is None:
+            return None
+        if self.run_in_background:
+            # A finished update is the base of the next one
+            self.merge_background_summary(session)
+        if not self.should_update_summary(session):
+            log_debug("Skipping session summary update until more runs are added")
+            return session.summary
+
+        if not self.run_in_background:
+            log_debug("Creating session summary", center=True)
+            return await self._agenerate_session_summary(session)
+
+        if session.session_id in self._background_updates:
+            # Still running, the next update covers the runs added in the meantime
+            return session.summary
+
+        # Build the prompt here, so the background task never reads the session while the run updates it
+        last_run_id = self._get_last_run_id(session)
+        messages = self._prepare_summary_messages(session)
+        if messages is None:
+            log_debug("No meaningful messages to summarize, skipping session summary")
+            return session.summary
+
+        log_debug("Creating session summary in the background", center=True)
+        self._background_updates[session.session_id] = asyncio.create_task(self._asummarize(messages, last_run_id))
+        return session.summary
+
+    def merge_background_summary(self, session: Union["AgentSession", "TeamSession"]) -> Optional[SessionSummary]:
+        """
+        Set the summary of the finished background update of the session, if any, on the session.
+
+        Never waits for an update still running, so the summarizer stays off the path of the run. It is merged by a
+        later save of the session.
+        """
+        update = self._background_updates.get(session.session_id)
+        if update is None:
+            return None
+        if not update.done():
+            if isinstance(update, asyncio.Task) and update.get_loop().is_closed():
+                # The loop that started the update is gone, the next update covers its runs
+                self._background_updates.pop(session.session_id, None)
+            return None
+        self._background_updates.pop(session.session_id, None)
+        try:
+            return self._apply_summary(session, update.result())
+        except Exception as e:
+            log_warning(f"Error in session summary creation: {str(e)}")
+            return None
@@ -5,9 +5,10 @@ from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
-from agno.models.message import Message
+from agno.models.message import Message, to_message
 from agno.run.agent import RunOutput, RunStatus
 from agno.run.team import TeamRunOutput
+from agno.session.run_index import RunIndex
 from agno.session.summary import SessionSummary
 from agno.utils.log import log_debug, log_warning
 
@@ -65,9 +66,9 @@ class TeamSession:
         if runs is not None and isinstance(runs[0], dict):
             for run in runs:
                 if "agent_id" in run:
-                    serialized_runs.append(RunOutput.from_dict(run))
+                    serialized_runs.append(RunOutput.from_dict(run, compact_messages=True))
                 elif "team_id" in run:
-                    serialized_runs.append(TeamRunOutput.from_dict(run))
+                    serialized_runs.append(TeamRunOutput.from_dict(run, compact_messages=True))
 
         return cls(
             session_id=data.get("session_id"),  # type: ignore
@@ -84,10 +85,10 @@ class TeamSession:
         )
 
     def get_run(self, run_id: str) -> Optional[Union[TeamRunOutput, RunOutput]]:
-        for run in self.runs or []:
-            if run.run_id == run_id:
-                return run
-        return None
+        if not self.runs:
+            return None
+        position = self._get_run_index().get_position(run_id)
+        return self.runs[position] if position is not None else None
 
     def upsert_run(self, run_response: Union[TeamRunOutput, RunOutput]):
         """Adds a RunOutput, together with some calculated data, to the runs list."""
@@ -101,18 +102,27 @@ class TeamSession:
             if m.metrics is not None:
                 m.metrics.duration = None
 
-        if not self.runs:
-            self.runs = []
-
-        for i, existing_run in enumerate(self.runs or []):
-            if existing_run.run_id == run_response.run_id:
-                self.runs[i] = run_response
-                break
+        run_index = self._get_run_index()
+        position = run_index.get_position(run_response.run_id)
+        if position is not None:
+            run_index.replace(position, run_response)
         else:
-            self.runs.append(run_response)
+            run_index.append(run_response)
 
         log_debug("Added RunOutput to Team Session")
 
+    def _get_run_index(self) -> RunIndex:
+        """Returns the index of the runs, creating it on first use"""
+        if self.runs is None:
+            self.runs = []
+        run_index: Optional[RunIndex] = getattr(self, "_run_index", None)
+        if run_index is None or not run_index.is_valid_for(self.runs):
+            run_index = RunIndex(self.runs)
+            self._run_index = run_index
+        else:
+            run_index.update()
+        return run_index
+
     def get_messages_from_last_n_runs(
         self,
         agent_id: Optional[str] = None,
@@ -141,22 +151,29 @@ class TeamSession:
         if skip_status is None:
             skip_status = [RunStatus.paused, RunStatus.cancelled, RunStatus.error]
 
-        session_runs = self.runs
-
-        # Filter by agent_id and team_id
-        if agent_id:
-            session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
-        if team_id:
-            session_runs = [run for run in session_runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
-
-        if not member_runs:
+        # Walk the runs of the agent or team from the last one, until last_n runs are found
+        runs_to_process: List[Union[TeamRunOutput, RunOutput]] = []
+        run_index = self._get_run_index()
+        for position in run_index.iter_positions_reversed(
+            agent_id=agent_id, team_id=team_id, main_runs_only=not member_runs
+        ):
+            run = self.runs[position]
+            # Filter by agent_id and team_id
+            if agent_id and getattr(run, "agent_id", None) != agent_id:
+                continue
+            if team_id and getattr(run, "team_id", None) != team_id:
+                continue
             # Filter for the main team runs
-            session_runs = [run for run in session_runs if run.parent_run_id is None]  # type: ignore
-        # Filter by status
-        session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_status]  # type: ignore
+            if not member_runs and run.parent_run_id is not None:
+                continue
+            # Filter by status
+            if not hasattr(run, "status") or run.status in skip_status:
+                continue
+            runs_to_process.append(run)
+            if last_n and len(runs_to_process) >= last_n:
+                break
+        runs_to_process.reverse()
 
-        # Filter by last_n
-        runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
         messages_from_history = []
         system_message = None
 
@@ -176,10 +193,10 @@ class TeamSession:
                 if message.role == "system":
                     # Only add the system message once
                     if system_message is None:
-                        system_message = message
+                        system_message = to_message(message)
                         messages_from_history.append(system_message)
                 else:
-                    messages_from_history.append(message)
+                    messages_from_history.append(to_message(message))
 
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
@@ -192,7 +209,9 @@ class TeamSession:
         if session_runs is None:
             return []
 
-        for run_response in session_runs[::-1]:
+        # Only walk the runs with tool calls
+        for position in reversed(self._get_run_index().tool_call_positions):
+            run_response = session_runs[position]
             if run_response and run_response.messages:
                 for message in run_response.messages or []:
                     if message.tool_calls:
@@ -207,15 +226,20 @@ class TeamSession:
         user_role: str = "user",
         assistant_role: Optional[List[str]] = None,
         skip_history_messages: bool = True,
+        runs: Optional[List[Any]] = None,
     ) -> List[Message]:
-        """Returns a list of messages for the session that iterate through user message and assistant response."""
+        """Returns a list of messages for the session that iterate through user message and assistant response.
+
+        Args:
+            runs: Runs to get the messages from. Defaults to all runs of the session.
+        """
 
         if assistant_role is None:
             # TODO: Check if we still need CHATBOT as a role
             assistant_role = ["assistant", "model", "CHATBOT"]
 
         final_messages: List[Message] = []
-        session_runs = self.runs
+        session_runs = self.runs if runs is None else runs
         if session_runs is None:
             return []
 
@@ -241,8 +265,8 @@ class TeamSession:
                         break
 
                 if user_message_from_run and assistant_message_from_run:
-                    final_messages.append(user_message_from_run)
-                    final_messages.append(assistant_message_from_run)
+                    final_messages.append(to_message(user_message_from_run))
+                    final_messages.append(to_message(assistant_message_from_run))
         return final_messages
 
     def get_team_history(self, num_runs: Optional[int] = None) -> List[Tuple[str, str]]:
@@ -348,6 +372,6 @@ class TeamSession:
                         continue
                     if skip_roles and msg.role in skip_roles:
                         continue
-                    messages.append(msg)
+                    messages.append(to_message(msg))
 
         return messages
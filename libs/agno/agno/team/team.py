@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -36,13 +37,12 @@ from agno.exceptions import (
     OutputCheckError,
     RunCancelledException,
 )
-from agno.guardrails import BaseGuardrail
-from agno.knowledge.knowledge import Knowledge
+from agno.guardrails.base import BaseGuardrail
 from agno.knowledge.types import KnowledgeFilter
 from agno.media import Audio, File, Image, Video
-from agno.memory import MemoryManager
+from agno.media_store import MediaStore
 from agno.models.base import Model
-from agno.models.message import Message, MessageReferences
+from agno.models.message import Message, MessageReferences, to_message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
@@ -58,16 +58,20 @@ from agno.run.cancel import (
 )
 from agno.run.messages import RunMessages
 from agno.run.team import TeamRunEvent, TeamRunInput, TeamRunOutput, TeamRunOutputEvent
+from agno.run.timing import RunPhase, RunTimings, publish_run_timings, time_phase
 from agno.session import SessionSummaryManager, TeamSession, WorkflowSession
 from agno.tools import Toolkit
 from agno.tools.function import Function
 from agno.utils.agent import (
+    aoffload_media_from_run_output,
     await_for_background_tasks,
     await_for_background_tasks_stream,
     collect_joint_audios,
     collect_joint_files,
     collect_joint_images,
     collect_joint_videos,
+    offload_media_from_run_output,
+    resolve_media_from_messages,
     scrub_history_messages_from_run_output,
     scrub_media_from_run_output,
     scrub_tool_results_from_run_output,
@@ -112,12 +116,6 @@ from agno.utils.log import (
 )
 from agno.utils.merge_dict import merge_dictionaries
 from agno.utils.message import filter_tool_calls, get_text_from_message
-from agno.utils.print_response.team import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.utils.reasoning import (
     add_reasoning_metrics_to_metadata,
     add_reasoning_step_to_metadata,
@@ -134,6 +132,11 @@ from agno.utils.string import generate_id_from_name, parse_response_model_str
 from agno.utils.team import format_member_agent_task, get_member_id
 from agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    from agno.knowledge.knowledge import Knowledge
+    from agno.memory import MemoryManager
+    from agno.memory.queue import MemoryExtractionQueue
+
 
 @dataclass(init=False)
 class Team:
@@ -248,7 +251,7 @@ class Team:
     db: Optional[Union[BaseDb, AsyncBaseDb]] = None
 
     # Memory manager to use for this agent
-    memory_manager: Optional[MemoryManager] = None
+    memory_manager: Optional["MemoryManager"] = None
 
     # --- User provided dependencies ---
     # User provided dependencies
@@ -257,7 +260,7 @@ class Team:
     add_dependencies_to_context: bool = False
 
     # --- Agent Knowledge ---
-    knowledge: Optional[Knowledge] = None
+    knowledge: Optional["Knowledge"] = None
     # Add knowledge_filters to the Agent class attributes
     knowledge_filters: Optional[Dict[str, Any]] = None
     # Let the agent choose the knowledge filters
@@ -285,6 +288,8 @@ class Team:
     send_media_to_model: bool = True
     # If True, store media in run output
     store_media: bool = True
+    # Store media content in this MediaStore and keep only content references in the stored runs
+    media_store: Optional[MediaStore] = None
     # If True, store tool results in run output
     store_tool_messages: bool = True
     # If True, store history messages in run output
@@ -336,6 +341,9 @@ class Team:
     enable_agentic_memory: bool = False
     # If True, the agent creates/updates user memories at the end of runs
     enable_user_memories: bool = False
+    # Queue coalescing the memory extraction of several runs of a user into one model call.
+    # If None, memories are extracted from each run.
+    memory_extraction_queue: Optional["MemoryExtractionQueue"] = None
     # If True, the agent adds a reference to the user memories in the response
     add_memories_to_context: Optional[bool] = None
     # If True, the agent creates/updates session summaries at the end of runs
@@ -383,6 +391,8 @@ class Team:
     events_to_skip: Optional[List[Union[RunEvent, TeamRunEvent]]] = None
     # Store member agent runs inside the team's RunOutput
     store_member_responses: bool = False
+    # Record the time spent in each phase of the run (session read, model calls, tool calls...) on TeamRunOutput.timings
+    record_timings: bool = False
 
     # --- Debug ---
     # Enable debug logs
@@ -442,7 +452,7 @@ class Team:
         additional_input: Optional[List[Union[str, Dict, BaseModel, Message]]] = None,
         dependencies: Optional[Dict[str, Any]] = None,
         add_dependencies_to_context: bool = False,
-        knowledge: Optional[Knowledge] = None,
+        knowledge: Optional["Knowledge"] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         add_knowledge_to_context: bool = False,
         enable_agentic_knowledge_filters: Optional[bool] = False,
@@ -455,6 +465,7 @@ class Team:
         read_team_history: bool = False,
         read_chat_history: bool = False,
         store_media: bool = True,
+        media_store: Optional[MediaStore] = None,
         store_tool_messages: bool = True,
         store_history_messages: bool = True,
         send_media_to_model: bool = True,
@@ -478,7 +489,8 @@ class Team:
         enable_agentic_memory: bool = False,
         enable_user_memories: bool = False,
         add_memories_to_context: Optional[bool] = None,
-        memory_manager: Optional[MemoryManager] = None,
+        memory_extraction_queue: Optional["MemoryExtractionQueue"] = None,
+        memory_manager: Optional["MemoryManager"] = None,
         enable_session_summaries: bool = False,
         session_summary_manager: Optional[SessionSummaryManager] = None,
         add_session_summary_to_context: Optional[bool] = None,
@@ -495,6 +507,7 @@ class Team:
         store_events: bool = False,
         events_to_skip: Optional[List[Union[RunEvent, TeamRunEvent]]] = None,
         store_member_responses: bool = False,
+        record_timings: bool = False,
         stream_member_events: bool = True,
         debug_mode: bool = False,
         debug_level: Literal[1, 2] = 1,
@@ -563,6 +576,7 @@ class Team:
         self.read_chat_history = read_chat_history or read_team_history
 
         self.store_media = store_media
+        self.media_store = media_store
         self.store_tool_messages = store_tool_messages
         self.store_history_messages = store_history_messages
         self.send_media_to_model = send_media_to_model
@@ -589,6 +603,7 @@ class Team:
 
         self.enable_agentic_memory = enable_agentic_memory
         self.enable_user_memories = enable_user_memories
+        self.memory_extraction_queue = memory_extraction_queue
         self.add_memories_to_context = add_memories_to_context
         self.memory_manager = memory_manager
         self.enable_session_summaries = enable_session_summaries
@@ -609,6 +624,7 @@ class Team:
         self.stream_events = stream_events or stream_intermediate_steps
         self.store_events = store_events
         self.store_member_responses = store_member_responses
+        self.record_timings = record_timings
 
         self.events_to_skip = events_to_skip
         if self.events_to_skip is None:
@@ -783,6 +799,8 @@ class Team:
             log_warning("Database not provided. Memories will not be stored.")
 
         if self.memory_manager is None:
+            from agno.memory import MemoryManager
+
             self.memory_manager = MemoryManager(model=self.model, db=self.db)
         else:
             if self.memory_manager.model is None:
@@ -946,7 +964,8 @@ class Team:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                hook(**filtered_args)
+                with time_phase(run_response, RunPhase.pre_hooks, hook=hook.__name__):
+                    hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_response,
@@ -1012,11 +1031,12 @@ class Team:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                if asyncio.iscoroutinefunction(hook):
-                    await hook(**filtered_args)
-                else:
-                    # Synchronous function
-                    hook(**filtered_args)
+                with time_phase(run_response, RunPhase.pre_hooks, hook=hook.__name__):
+                    if asyncio.iscoroutinefunction(hook):
+                        await hook(**filtered_args)
+                    else:
+                        # Synchronous function
+                        hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_response,
@@ -1082,7 +1102,8 @@ class Team:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                hook(**filtered_args)
+                with time_phase(run_output, RunPhase.post_hooks, hook=hook.__name__):
+                    hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_output,
@@ -1143,10 +1164,11 @@ class Team:
                 # Filter arguments to only include those that the hook accepts
                 filtered_args = filter_hook_args(hook, all_args)
 
-                if asyncio.iscoroutinefunction(hook):
-                    await hook(**filtered_args)
-                else:
-                    hook(**filtered_args)
+                with time_phase(run_output, RunPhase.post_hooks, hook=hook.__name__):
+                    if asyncio.iscoroutinefunction(hook):
+                        await hook(**filtered_args)
+                    else:
+                        hook(**filtered_args)
 
                 yield handle_event(  # type: ignore
                     run_response=run_output,
@@ -1273,10 +1295,14 @@ class Team:
         # 4. Start memory creation in background thread
         memory_future = None
         if run_messages.user_message is not None and self.memory_manager is not None and not self.enable_agentic_memory:
-            log_debug("Starting memory creation in background thread.")
-            memory_future = self.background_executor.submit(
-                self._make_memories, run_messages=run_messages, user_id=user_id
-            )
+            if self.memory_extraction_queue is not None:
+                # Queueing the turn is cheap, the queue runs the extraction on its own workers
+                self._make_memories(run_messages=run_messages, user_id=user_id)
+            else:
+                log_debug("Starting memory creation in background thread.")
+                memory_future = self.background_executor.submit(
+                    self._make_memories, run_messages=run_messages, user_id=user_id
+                )
 
         try:
             raise_if_cancelled(run_response.run_id)  # type: ignore
@@ -1297,6 +1323,7 @@ class Team:
                 tool_choice=self.tool_choice,
                 tool_call_limit=self.tool_call_limit,
                 send_media_to_model=self.send_media_to_model,
+                run_response=run_response,  # type: ignore
             )
 
             # Check for cancellation after model call
@@ -1337,7 +1364,7 @@ class Team:
             raise_if_cancelled(run_response.run_id)  # type: ignore
 
             # 11. Wait for background memory creation
-            wait_for_background_tasks(memory_future=memory_future)
+            wait_for_background_tasks(memory_future=memory_future, run_response=run_response)
 
             raise_if_cancelled(run_response.run_id)  # type: ignore
 
@@ -1485,10 +1512,14 @@ class Team:
         # 4. Start memory creation in background thread
         memory_future = None
         if run_messages.user_message is not None and self.memory_manager is not None and not self.enable_agentic_memory:
-            log_debug("Starting memory creation in background thread.")
-            memory_future = self.background_executor.submit(
-                self._make_memories, run_messages=run_messages, user_id=user_id
-            )
+            if self.memory_extraction_queue is not None:
+                # Queueing the turn is cheap, the queue runs the extraction on its own workers
+                self._make_memories(run_messages=run_messages, user_id=user_id)
+            else:
+                log_debug("Starting memory creation in background thread.")
+                memory_future = self.background_executor.submit(
+                    self._make_memories, run_messages=run_messages, user_id=user_id
+                )
 
         try:
             # Start the Run by yielding a RunStarted event
@@ -1786,8 +1817,11 @@ class Team:
             files=file_artifacts,
         )
 
+        run_timings = RunTimings() if self.record_timings else None
+
         # Read existing session from database
-        team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
+        with time_phase(run_timings, RunPhase.session_read):
+            team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
         self._update_metadata(session=team_session)
 
         # Initialize session state
@@ -1859,6 +1893,7 @@ class Team:
             team_name=self.name,
             metadata=metadata,
             input=run_input,
+            timings=run_timings,
         )
 
         run_response.model = self.model.id if self.model is not None else None
@@ -2003,10 +2038,11 @@ class Team:
             await self._aresolve_run_dependencies(dependencies=dependencies)
 
         # 1. Read or create session. Reads from the database if provided.
-        if self._has_async_db():
-            team_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
-        else:
-            team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
+        with time_phase(run_response, RunPhase.session_read):
+            if self._has_async_db():
+                team_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
+            else:
+                team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
 
         # 2. Update metadata and session state
         self._update_metadata(session=team_session)
@@ -2113,6 +2149,7 @@ class Team:
                 tool_call_limit=self.tool_call_limit,
                 response_format=response_format,
                 send_media_to_model=self.send_media_to_model,
+                run_response=run_response,  # type: ignore
             )  # type: ignore
 
             # Check for cancellation after model call
@@ -2154,7 +2191,7 @@ class Team:
             raise_if_cancelled(run_response.run_id)  # type: ignore
 
             # 13. Wait for background memory creation
-            await await_for_background_tasks(memory_task=memory_task)
+            await await_for_background_tasks(memory_task=memory_task, run_response=run_response)
 
             raise_if_cancelled(run_response.run_id)  # type: ignore
             # 14. Create session summary
@@ -2241,10 +2278,11 @@ class Team:
             await self._aresolve_run_dependencies(dependencies=dependencies)
 
         # 2. Read or create session. Reads from the database if provided.
-        if self._has_async_db():
-            team_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
-        else:
-            team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
+        with time_phase(run_response, RunPhase.session_read):
+            if self._has_async_db():
+                team_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
+            else:
+                team_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
 
         # 3. Update metadata and session state
         self._update_metadata(session=team_session)
@@ -2694,6 +2732,7 @@ class Team:
             team_name=self.name,
             metadata=metadata,
             input=run_input,
+            timings=RunTimings() if self.record_timings else None,
         )
 
         run_response.model = self.model.id if self.model is not None else None
@@ -3361,10 +3400,22 @@ class Team:
         # Calculate session metrics
         self._update_session_metrics(session=session)
 
-        # Save session to memory
-        self.save_session(session=session)
+        # Add the session summary if its background update finished, so it is stored with the session
+        if self.session_summary_manager is not None:
+            self.session_summary_manager.merge_background_summary(session)
+
+        # Save session to memory. The stored run can't include the time spent writing it.
+        with time_phase(run_response, RunPhase.session_write):
+            self.save_session(session=session)
+
+        # Export the timings of the run
+        publish_run_timings(run_response)
 
     async def _acleanup_and_store(self, run_response: TeamRunOutput, session: TeamSession) -> None:
+        # Move the media to the media store off the event loop, the scrub below skips the media already stored
+        if self.store_media and self.media_store is not None:
+            await aoffload_media_from_run_output(run_response, self.media_store)
+
         #  Scrub the stored run based on storage flags
         self._scrub_run_output_for_storage(run_response)
 
@@ -3378,8 +3429,16 @@ class Team:
         # Calculate session metrics
         self._update_session_metrics(session=session)
 
-        # Save session to memory
-        await self.asave_session(session=session)
+        # Add the session summary if its background update finished, so it is stored with the session
+        if self.session_summary_manager is not None:
+            self.session_summary_manager.merge_background_summary(session)
+
+        # Save session to memory. The stored run can't include the time spent writing it.
+        with time_phase(run_response, RunPhase.session_write):
+            await self.asave_session(session=session)
+
+        # Export the timings of the run
+        publish_run_timings(run_response)
 
     def _make_memories(
         self,
@@ -3389,6 +3448,16 @@ class Team:
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
         )
+        if self.memory_extraction_queue is not None and self.memory_manager is not None:
+            if user_message_str is not None and user_message_str.strip() != "":
+                self.memory_extraction_queue.submit(
+                    self.memory_manager,
+                    [Message(role="user", content=user_message_str)],
+                    user_id=user_id,
+                    team_id=self.id,
+                )
+            return
+
         if user_message_str is not None and user_message_str.strip() != "" and self.memory_manager is not None:
             log_debug("Creating user memories.")
             self.memory_manager.create_user_memories(
@@ -3405,6 +3474,16 @@ class Team:
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
         )
+        if self.memory_extraction_queue is not None and self.memory_manager is not None:
+            if user_message_str is not None and user_message_str.strip() != "":
+                await self.memory_extraction_queue.asubmit(
+                    self.memory_manager,
+                    [Message(role="user", content=user_message_str)],
+                    user_id=user_id,
+                    team_id=self.id,
+                )
+            return
+
         if user_message_str is not None and user_message_str.strip() != "" and self.memory_manager is not None:
             log_debug("Creating user memories.")
             await self.memory_manager.acreate_user_memories(
@@ -3824,6 +3903,8 @@ class Team:
         if stream_events is None:
             stream_events = False if self.stream_events is None else self.stream_events
 
+        from agno.utils.print_response.team import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 team=self,
@@ -3929,6 +4010,8 @@ class Team:
         if stream_events is None:
             stream_events = False if self.stream_events is None else self.stream_events
 
+        from agno.utils.print_response.team import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 team=self,
@@ -4003,6 +4086,8 @@ class Team:
         if not self.store_media:
             scrub_media_from_run_output(run_response)
             scrubbed = True
+        elif self.media_store is not None:
+            offload_media_from_run_output(run_response, self.media_store)
 
         if not self.store_tool_messages:
             scrub_tool_results_from_run_output(run_response)
@@ -5768,18 +5853,19 @@ class Team:
         run_messages = RunMessages()
 
         # 1. Add system message to run_messages
-        system_message = self.get_system_message(
-            session=session,
-            session_state=session_state,
-            user_id=user_id,
-            images=images,
-            audio=audio,
-            videos=videos,
-            files=files,
-            dependencies=dependencies,
-            metadata=metadata,
-            add_session_state_to_context=add_session_state_to_context,
-        )
+        with time_phase(run_response, RunPhase.system_message):
+            system_message = self.get_system_message(
+                session=session,
+                session_state=session_state,
+                user_id=user_id,
+                images=images,
+                audio=audio,
+                videos=videos,
+                files=files,
+                dependencies=dependencies,
+                metadata=metadata,
+                add_session_state_to_context=add_session_state_to_context,
+            )
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -5829,6 +5915,9 @@ class Team:
             )
 
             if len(history) > 0:
+                # Load media stored by reference so it can be sent to the model
+                resolve_media_from_messages(history)
+
                 # Create a deep copy of the history messages to avoid modifying the original messages
                 history_copy = [deepcopy(msg) for msg in history]
 
@@ -5906,18 +5995,19 @@ class Team:
         run_messages = RunMessages()
 
         # 1. Add system message to run_messages
-        system_message = await self.aget_system_message(
-            session=session,
-            session_state=session_state,
-            user_id=user_id,
-            images=images,
-            audio=audio,
-            videos=videos,
-            files=files,
-            dependencies=dependencies,
-            metadata=metadata,
-            add_session_state_to_context=add_session_state_to_context,
-        )
+        with time_phase(run_response, RunPhase.system_message):
+            system_message = await self.aget_system_message(
+                session=session,
+                session_state=session_state,
+                user_id=user_id,
+                images=images,
+                audio=audio,
+                videos=videos,
+                files=files,
+                dependencies=dependencies,
+                metadata=metadata,
+                add_session_state_to_context=add_session_state_to_context,
+            )
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -5960,6 +6050,9 @@ class Team:
             )
 
             if len(history) > 0:
+                # Load media stored by reference so it can be sent to the model
+                resolve_media_from_messages(history)
+
                 # Create a deep copy of the history messages to avoid modifying the original messages
                 history_copy = [deepcopy(msg) for msg in history]
 
@@ -6389,7 +6482,7 @@ class Team:
             Returns:
                 str: A string indicating the status of the update.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = self.memory_manager.update_memory_task(task=task, user_id=user_id)
             return response
 
@@ -6405,7 +6498,7 @@ class Team:
             Returns:
                 str: A string indicating the status of the update.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = await self.memory_manager.aupdate_memory_task(task=task, user_id=user_id)
             return response
 
@@ -6569,8 +6662,8 @@ class Team:
                                         msg_pair_id = f"{user_content}:{assistant_content}"
                                         if msg_pair_id not in seen_message_pairs:
                                             seen_message_pairs.add(msg_pair_id)
-                                            all_messages.append(Message.model_validate(user_msg))
-                                            all_messages.append(Message.model_validate(assistant_msg))
+                                            all_messages.append(to_message(user_msg))
+                                            all_messages.append(to_message(assistant_msg))
                                             message_count += 1
                                     except Exception as e:
                                         log_warning(f"Error processing message pair: {e}")
@@ -6621,8 +6714,8 @@ class Team:
                                         msg_pair_id = f"{user_content}:{assistant_content}"
                                         if msg_pair_id not in seen_message_pairs:
                                             seen_message_pairs.add(msg_pair_id)
-                                            all_messages.append(Message.model_validate(user_msg))
-                                            all_messages.append(Message.model_validate(assistant_msg))
+                                            all_messages.append(to_message(user_msg))
+                                            all_messages.append(to_message(assistant_msg))
                                             message_count += 1
                                     except Exception as e:
                                         log_warning(f"Error processing message pair: {e}")
@@ -6657,6 +6750,9 @@ class Team:
         )
 
         if len(history) > 0:
+            # Load media stored by reference so it can be sent to the model
+            resolve_media_from_messages(history)
+
             # Create a deep copy of the history messages to avoid modifying the original messages
             history_copy = [deepcopy(msg) for msg in history]
 
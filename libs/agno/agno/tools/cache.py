@@ -0,0 +1,172 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from agno.utils.cache import CACHE_MISS, CacheBackend, FileCache, InMemoryCache
+from agno.utils.log import log_error
+
+
+@dataclass
+class ToolCacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Calls that waited for an identical in-flight call instead of running the tool
+    coalesced: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced}
+
+
+@dataclass
+class _InFlight:
+    lock: Any
+    waiters: int = 0
+
+
+@dataclass
+class ToolCache:
+    """
+    Tiered cache for tool results.
+
+    Lookups go to the in-process LRU first, then to the optional shared tier, whose hits are copied into memory.
+    Identical calls that are in flight at the same time are coalesced, so the tool runs once.
+    Share one ToolCache between toolkits to share entries, or give each toolkit its own to set separate policies.
+    """
+
+    # In-process tier
+    memory: Optional[InMemoryCache] = field(default_factory=InMemoryCache)
+    # Shared tier, like SqliteCache or RedisCache from agno.utils.cache
+    shared: Optional[CacheBackend] = None
+    # Time-to-live for entries in seconds. Functions can override this with `cache_ttl`.
+    ttl: Optional[int] = 3600
+    # Coalesce identical in-flight calls
+    single_flight: bool = True
+
+    stats: ToolCacheStats = field(default_factory=ToolCacheStats)
+
+    def __post_init__(self):
+        self._in_flight_lock = threading.Lock()
+        self._in_flight: Dict[Tuple[str, str], _InFlight] = {}
+        self._async_in_flight: Dict[Tuple[int, str, str], _InFlight] = {}
+
+    def __deepcopy__(self, memo):
+        # The cache is shared by all copies of an agent and its tools
+        return self
+
+    def get(self, namespace: str, key: str, ttl: Optional[int] = None) -> Any:
+        """Return the cached value, or `CACHE_MISS`"""
+        if self.memory is not None:
+            value = self.memory.get(namespace, key)
+            if value is not CACHE_MISS:
+                return value
+        if self.shared is not None:
+            try:
+                value = self.shared.get(namespace, key)
+            except Exception as e:
+                log_error(f"Error reading shared tool cache: {e}")
+                return CACHE_MISS
+            if value is not CACHE_MISS and self.memory is not None:
+                self.memory.set(namespace, key, value, ttl=ttl if ttl is not None else self.ttl)
+            return value
+        return CACHE_MISS
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        if self.memory is not None:
+            self.memory.set(namespace, key, value, ttl=ttl)
+        if self.shared is not None:
+            try:
+                self.shared.set(namespace, key, value, ttl=ttl)
+            except Exception as e:
+                log_error(f"Error writing shared tool cache: {e}")
+
+    def delete(self, namespace: str, key: str) -> None:
+        for tier in (self.memory, self.shared):
+            if tier is not None:
+                tier.delete(namespace, key)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        for tier in (self.memory, self.shared):
+            if tier is not None:
+                tier.clear(namespace)
+
+    @contextmanager
+    def lock(self, namespace: str, key: str) -> Iterator[bool]:
+        """
+        Hold the single-flight lock for a key while the tool runs.
+
+        Yields True if another call with the same key was in flight when this one started.
+        """
+        if not self.single_flight:
+            yield False
+            return
+
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get((namespace, key))
+            if in_flight is None:
+                in_flight = self._in_flight[(namespace, key)] = _InFlight(lock=threading.Lock())
+            in_flight.waiters += 1
+        waited = not in_flight.lock.acquire(blocking=False)
+        if waited:
+            in_flight.lock.acquire()
+        try:
+            yield waited
+        finally:
+            in_flight.lock.release()
+            with self._in_flight_lock:
+                in_flight.waiters -= 1
+                if in_flight.waiters == 0:
+                    self._in_flight.pop((namespace, key), None)
+
+    @asynccontextmanager
+    async def alock(self, namespace: str, key: str) -> AsyncIterator[bool]:
+        """Async version of `lock`, coalescing identical calls running in the same event loop"""
+        if not self.single_flight:
+            yield False
+            return
+
+        in_flight_key = (id(asyncio.get_running_loop()), namespace, key)
+        in_flight = self._async_in_flight.get(in_flight_key)
+        if in_flight is None:
+            in_flight = self._async_in_flight[in_flight_key] = _InFlight(lock=asyncio.Lock())
+        in_flight.waiters += 1
+        waited = in_flight.lock.locked()
+        await in_flight.lock.acquire()
+        try:
+            yield waited
+        finally:
+            in_flight.lock.release()
+            in_flight.waiters -= 1
+            if in_flight.waiters == 0:
+                self._async_in_flight.pop(in_flight_key, None)
+
+    def record(self, hit: bool, coalesced: bool = False) -> None:
+        with self._in_flight_lock:
+            if coalesced:
+                self.stats.coalesced += 1
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+
+# Default caches used by functions with `cache_results=True`, one per cache directory
+_default_tool_caches: Dict[Optional[str], ToolCache] = {}
+_default_tool_caches_lock = threading.Lock()
+
+
+def get_default_tool_cache(cache_dir: Optional[str] = None) -> ToolCache:
+    """
+    Return the default cache for a cache directory: an in-memory LRU backed by JSON files in `<cache_dir>/tool_results`.
+    Entries written to `<cache_dir>/functions` by previous versions have no expiry time and are not read.
+    """
+    with _default_tool_caches_lock:
+        tool_cache = _default_tool_caches.get(cache_dir)
+        if tool_cache is None:
+            base_cache_dir = Path(cache_dir) if cache_dir else Path(gettempdir()) / "agno_cache"
+            tool_cache = _default_tool_caches[cache_dir] = ToolCache(shared=FileCache(base_cache_dir / "tool_results"))
+        return tool_cache
@@ -76,6 +76,7 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    tool_cache: Optional[Any] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -104,6 +105,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        tool_cache: Optional[ToolCache] - Cache for the function results. Enables caching when set.
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -141,6 +143,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "tool_cache",
         }
     )
 
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.sql import fetch_rows, get_truncation_notice
 
 try:
     import duckdb
@@ -18,11 +19,18 @@ class DuckDbTools(Toolkit):
         init_commands: Optional[List] = None,
         read_only: bool = False,
         config: Optional[dict] = None,
+        max_result_rows: Optional[int] = None,
         **kwargs,
     ):
+        """
+        Args:
+            max_result_rows: Maximum number of rows returned by a query. Larger results are truncated, and only the
+                returned rows are fetched from DuckDB.
+        """
         self.db_path: Optional[str] = db_path
         self.read_only: bool = read_only
         self.config: Optional[dict] = config
+        self.max_result_rows: Optional[int] = max_result_rows
         self._connection: Optional[duckdb.DuckDBPyConnection] = connection
         self.init_commands: Optional[List] = init_commands
 
@@ -127,7 +135,11 @@ class DuckDbTools(Toolkit):
             result_output = "No output"
             if query_result is not None:
                 try:
-                    results_as_python_objects = query_result.fetchall()
+                    truncated = False
+                    if self.max_result_rows is None:
+                        results_as_python_objects = query_result.fetchall()
+                    else:
+                        results_as_python_objects, truncated = fetch_rows(query_result.fetchmany, self.max_result_rows)
                     result_rows = []
                     for row in results_as_python_objects:
                         if len(row) == 1:
@@ -137,6 +149,8 @@ class DuckDbTools(Toolkit):
 
                     result_data = "\n".join(result_rows)
                     result_output = ",".join(query_result.columns) + "\n" + result_data
+                    if truncated:
+                        result_output += "\n" + get_truncation_notice(self.max_result_rows)  # type: ignore
                 except AttributeError:
                     result_output = str(query_result)
 
@@ -1,3 +1,4 @@
+from contextlib import AsyncExitStack, ExitStack
 from dataclasses import dataclass
 from functools import partial
 from importlib.metadata import version
@@ -9,7 +10,9 @@ from pydantic import BaseModel, Field, validate_call
 
 from agno.exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
-from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.tools.cache import get_default_tool_cache
+from agno.utils.cache import CACHE_MISS
+from agno.utils.log import log_debug, log_exception, log_warning
 
 T = TypeVar("T")
 
@@ -115,7 +118,11 @@ class Function(BaseModel):
     # Caching configuration
     cache_results: bool = False
     cache_dir: Optional[str] = None
+    # Time-to-live for results in the default cache. A custom tool_cache uses its own ttl.
     cache_ttl: int = 3600
+    # Cache used for the function results (agno.tools.cache.ToolCache). Enables caching when set.
+    # Defaults to an in-memory LRU backed by JSON files in cache_dir.
+    tool_cache: Optional[Any] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
@@ -126,6 +133,9 @@ class Function(BaseModel):
     _session_state: Optional[Dict[str, Any]] = None
     # The dependencies that the function is associated with
     _dependencies: Optional[Dict[str, Any]] = None
+    # Manager spilling large outputs of the function (agno.tools.output.ToolOutputManager), and its namespace
+    _tool_output_manager: Optional[Any] = None
+    _tool_output_namespace: Optional[str] = None
 
     # Media context that the function is associated with
     _images: Optional[Sequence[Image]] = None
@@ -501,53 +511,18 @@ class Function(BaseModel):
         key_str = f"{self.name}:{args_str}:{kwargs_str}"
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
+    def _is_caching_enabled(self) -> bool:
+        return self.cache_results or self.tool_cache is not None
 
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
+    def _get_tool_cache(self) -> Any:
+        """Get the cache used for the function results."""
+        if self.tool_cache is not None:
+            return self.tool_cache
+        return get_default_tool_cache(self.cache_dir)
 
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
-        """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
-
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
-
-        return None
-
-    def _save_to_cache(self, cache_file: str, result: Any):
-        """Save result to cache."""
-        import json
-        from time import time
-
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+    def _get_cache_ttl(self) -> Optional[int]:
+        # A custom tool cache applies its own ttl
+        return self.cache_ttl if self.tool_cache is None else None
 
 
 class FunctionExecutionResult(BaseModel):
@@ -579,6 +554,9 @@ class FunctionCall(BaseModel):
     # Error while parsing arguments or running the function.
     error: Optional[str] = None
 
+    # True if the result was served from the tool cache, False on a cache miss and None if caching is disabled.
+    cache_hit: Optional[bool] = None
+
     def get_call_str(self) -> str:
         """Returns a string representation of the function call."""
         import shutil
@@ -790,12 +768,25 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
-        if self.function.cache_results and not isgeneratorfunction(self.function.entrypoint):
+        tool_cache = None
+        cache_key = None
+        cache_lock = ExitStack()
+        if self.function._is_caching_enabled() and not isgeneratorfunction(self.function.entrypoint):
+            tool_cache = self.function._get_tool_cache()
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
-
-            if cached_result is not None:
+            cache_ttl = self.function._get_cache_ttl()
+            cached_result = tool_cache.get(self.function.name, cache_key, ttl=cache_ttl)
+            coalesced = False
+            if cached_result is CACHE_MISS:
+                # Wait for an identical call in flight, and use its result
+                coalesced = cache_lock.enter_context(tool_cache.lock(self.function.name, cache_key))
+                if coalesced:
+                    cached_result = tool_cache.get(self.function.name, cache_key, ttl=cache_ttl)
+
+            self.cache_hit = cached_result is not CACHE_MISS
+            tool_cache.record(hit=self.cache_hit, coalesced=coalesced)
+            if self.cache_hit:
+                cache_lock.close()
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
                 return FunctionExecutionResult(status="success", result=cached_result)
@@ -822,10 +813,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if tool_cache is not None:
+                    tool_cache.set(self.function.name, cache_key, self.result, ttl=self.function._get_cache_ttl())
 
             execution_result = FunctionExecutionResult(
                 status="success", result=self.result, updated_session_state=updated_session_state
@@ -842,6 +831,7 @@ class FunctionCall(BaseModel):
             execution_result = FunctionExecutionResult(status="failure", error=str(e))
 
         finally:
+            cache_lock.close()
             self._handle_post_hook()
 
             if exception_to_raise is not None:
@@ -989,13 +979,27 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
-        if self.function.cache_results and not (
+        tool_cache = None
+        cache_key = None
+        cache_lock = AsyncExitStack()
+        if self.function._is_caching_enabled() and not (
             isasyncgenfunction(self.function.entrypoint) or isgeneratorfunction(self.function.entrypoint)
         ):
+            tool_cache = self.function._get_tool_cache()
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
-            if cached_result is not None:
+            cache_ttl = self.function._get_cache_ttl()
+            cached_result = tool_cache.get(self.function.name, cache_key, ttl=cache_ttl)
+            coalesced = False
+            if cached_result is CACHE_MISS:
+                # Wait for an identical call in flight, and use its result
+                coalesced = await cache_lock.enter_async_context(tool_cache.alock(self.function.name, cache_key))
+                if coalesced:
+                    cached_result = tool_cache.get(self.function.name, cache_key, ttl=cache_ttl)
+
+            self.cache_hit = cached_result is not CACHE_MISS
+            tool_cache.record(hit=self.cache_hit, coalesced=coalesced)
+            if self.cache_hit:
+                await cache_lock.aclose()
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
                 return FunctionExecutionResult(status="success", result=cached_result)
@@ -1021,10 +1025,8 @@ class FunctionCall(BaseModel):
                     self.result = await result
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if tool_cache is not None and not (isgenerator(self.result) or isasyncgen(self.result)):
+                tool_cache.set(self.function.name, cache_key, self.result, ttl=self.function._get_cache_ttl())
 
             updated_session_state = None
             if entrypoint_args.get("session_state") is not None:
@@ -1045,6 +1047,7 @@ class FunctionCall(BaseModel):
             execution_result = FunctionExecutionResult(status="failure", error=str(e))
 
         finally:
+            await cache_lock.aclose()
             if iscoroutinefunction(self.function.post_hook):
                 await self._handle_post_hook_async()
             else:
@@ -1,10 +1,13 @@
 import asyncio
+import json
 import weakref
+from collections import OrderedDict
 from contextlib import AsyncExitStack
 from dataclasses import asdict, dataclass
 from datetime import timedelta
+from time import time
 from types import TracebackType
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Literal, Optional, Set, Tuple, TypeVar, Union
 
 from agno.tools import Toolkit
 from agno.tools.function import Function
@@ -12,13 +15,20 @@ from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.mcp import get_entrypoint_for_tool
 
 try:
+    import anyio
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.sse import sse_client
     from mcp.client.stdio import get_default_environment, stdio_client
     from mcp.client.streamable_http import streamablehttp_client
+    from mcp.types import CallToolResult, ListToolsResult, ToolListChangedNotification
 except (ImportError, ModuleNotFoundError):
     raise ImportError("`mcp` not installed. Please install using `pip install mcp`")
 
+T = TypeVar("T")
+
+# Errors raised when the transport of a session was closed or broke, for example when a stdio server exits
+_CONNECTION_ERRORS = (ConnectionError, anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
 
 def _prepare_command(command: str) -> list[str]:
     """Sanitize a command and split it into parts before using it to run a MCP server."""
@@ -127,6 +137,301 @@ class StreamableHTTPClientParams:
     terminate_on_close: Optional[bool] = None
 
 
+MCPServerParams = Union[StdioServerParameters, SSEClientParams, StreamableHTTPClientParams]
+
+
+def _get_server_key(server_params: MCPServerParams) -> str:
+    """Identify a server by its connection parameters"""
+    if isinstance(server_params, StdioServerParameters):
+        params = server_params.model_dump(mode="json")
+    else:
+        params = asdict(server_params)
+    return f"{type(server_params).__name__}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+class _MCPConnection:
+    """
+    A session to an MCP server.
+
+    The transport and the session are opened and closed by a background task, because their contexts
+    must be exited by the task that entered them. This lets any task reconnect the session.
+    """
+
+    def __init__(self, pool: "MCPSessionPool"):
+        self.pool = pool
+        self.session: Optional[ClientSession] = None
+        # Number of requests currently using the session
+        self.in_flight = 0
+        self.last_used_at = 0.0
+        self.lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def open(self) -> None:
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error = None
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with AsyncExitStack() as stack:
+                client_connection = await stack.enter_async_context(self.pool._get_client_context())
+                read, write = client_connection[0:2]
+                session = await stack.enter_async_context(
+                    ClientSession(
+                        read,
+                        write,
+                        read_timeout_seconds=timedelta(seconds=self.pool._get_read_timeout_seconds()),
+                        message_handler=self.pool._handle_message,
+                    )
+                )
+                await session.initialize()
+                self.session = session
+                self.last_used_at = time()
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            if self._ready.is_set():
+                log_debug(f"MCP session closed with error: {e}")
+            self._error = e
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def ping(self) -> bool:
+        if self.session is None:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=self.pool.timeout_seconds)
+            self.last_used_at = time()
+            return True
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        self._closing.set()
+        try:
+            await asyncio.wait_for(task, timeout=self.pool.timeout_seconds)
+        except Exception:
+            task.cancel()
+
+    async def reconnect(self) -> None:
+        await self.close()
+        await self.open()
+
+
+class MCPSessionPool:
+    """
+    A pool of sessions connected to one MCP server.
+
+    Requests go to the least busy session. A session is health checked with a ping when it has been idle
+    for `health_check_interval` seconds, and reconnected when the check fails or its transport breaks
+    during a request. The tool list is cached until the server notifies that it changed.
+
+    Use `get_shared_mcp_session_pool` to share the sessions to a server between toolkits.
+    """
+
+    def __init__(
+        self,
+        server_params: MCPServerParams,
+        pool_size: int = 1,
+        timeout_seconds: float = 10,
+        call_timeout_seconds: Optional[float] = None,
+        health_check_interval: Optional[float] = 30,
+    ):
+        """
+        Args:
+            server_params: Parameters for connecting to the MCP server.
+            pool_size: Number of sessions to open to the server.
+            timeout_seconds: Read timeout in seconds for the sessions, also used for connecting and health checks.
+            call_timeout_seconds: Timeout in seconds for tool calls. None only limits calls by the read timeout.
+            health_check_interval: Idle seconds before a session is pinged on its next use. None disables health checks.
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.server_params = server_params
+        self.pool_size = pool_size
+        self.timeout_seconds = timeout_seconds
+        self.call_timeout_seconds = call_timeout_seconds
+        self.health_check_interval = health_check_interval
+
+        self._connections = [_MCPConnection(self) for _ in range(pool_size)]
+        self._connect_lock = asyncio.Lock()
+        self._tools: Optional[ListToolsResult] = None
+        self._tools_changed_callbacks: List[Callable[[], Coroutine[Any, Any, Any]]] = []
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Set for pools shared through get_shared_mcp_session_pool
+        self._shared_key: Optional[Tuple[int, str]] = None
+        self._users = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return any(connection.is_connected for connection in self._connections)
+
+    @property
+    def session(self) -> Optional[ClientSession]:
+        """A connected session of the pool"""
+        for connection in self._connections:
+            if connection.is_connected:
+                return connection.session
+        return None
+
+    def _get_client_context(self) -> Any:
+        if isinstance(self.server_params, StdioServerParameters):
+            return stdio_client(self.server_params)
+        if isinstance(self.server_params, SSEClientParams):
+            return sse_client(**asdict(self.server_params))
+        if isinstance(self.server_params, StreamableHTTPClientParams):
+            return streamablehttp_client(**asdict(self.server_params))  # type: ignore
+        raise ValueError(f"Unsupported MCP server parameters: {type(self.server_params).__name__}")
+
+    def _get_read_timeout_seconds(self) -> float:
+        """The read timeout of the sessions, capped by the timeout of the SSE and streamable-HTTP transports"""
+        if isinstance(self.server_params, (SSEClientParams, StreamableHTTPClientParams)):
+            params_timeout = self.server_params.timeout
+            if isinstance(params_timeout, timedelta):
+                params_timeout = params_timeout.total_seconds()
+            if params_timeout is not None:
+                return min(self.timeout_seconds, params_timeout)
+        return self.timeout_seconds
+
+    async def connect(self) -> None:
+        """Open all sessions of the pool concurrently. Sessions that fail to connect are retried on use."""
+        async with self._connect_lock:
+            pending = [connection for connection in self._connections if not connection.is_connected]
+            results = await asyncio.gather(*(connection.open() for connection in pending), return_exceptions=True)
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors and not self.is_connected:
+                raise errors[0]
+            for error in errors:
+                log_warning(f"Failed to open an MCP session, it will be retried on use: {error}")
+
+    async def _get_connection(self) -> _MCPConnection:
+        connection = min(self._connections, key=lambda c: c.in_flight)
+        async with connection.lock:
+            if not connection.is_connected:
+                await connection.open()
+            elif (
+                self.health_check_interval is not None
+                and connection.in_flight == 0
+                and time() - connection.last_used_at > self.health_check_interval
+                and not await connection.ping()
+            ):
+                log_warning("MCP session failed its health check, reconnecting")
+                await connection.reconnect()
+        return connection
+
+    async def _request(self, request: Callable[[ClientSession], Awaitable[T]], name: str) -> T:
+        """Send a request with a session of the pool, reconnecting and retrying once if the session was lost"""
+        for attempt in range(2):
+            connection = await self._get_connection()
+            session = connection.session
+            if session is None:
+                raise ConnectionError("MCP session is not connected")
+            connection.in_flight += 1
+            try:
+                return await request(session)
+            except _CONNECTION_ERRORS as e:
+                if attempt > 0:
+                    raise
+                log_warning(f"MCP session lost during {name}, reconnecting: {e}")
+                async with connection.lock:
+                    # Concurrent requests on the same session only reconnect it once
+                    if connection.session is session:
+                        await connection.reconnect()
+            finally:
+                connection.in_flight -= 1
+                connection.last_used_at = time()
+        raise ConnectionError(f"MCP session lost during {name}")
+
+    async def list_tools(self) -> ListToolsResult:
+        """Return the tools of the server, cached until the server notifies that they changed"""
+        if self._tools is None:
+            self._tools = await self._request(lambda session: session.list_tools(), "list_tools")
+        return self._tools
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> CallToolResult:
+        """Call a tool, failing with a TimeoutError after `call_timeout_seconds`"""
+
+        async def call(session: ClientSession) -> CallToolResult:
+            if self.call_timeout_seconds is None:
+                return await session.call_tool(name, arguments)
+            return await asyncio.wait_for(session.call_tool(name, arguments), timeout=self.call_timeout_seconds)
+
+        return await self._request(call, f"call to tool '{name}'")
+
+    def add_tools_changed_callback(self, callback: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+        """Register a coroutine function called when the tools of the server changed"""
+        if callback not in self._tools_changed_callbacks:
+            self._tools_changed_callbacks.append(callback)
+
+    def remove_tools_changed_callback(self, callback: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+        if callback in self._tools_changed_callbacks:
+            self._tools_changed_callbacks.remove(callback)
+
+    async def _handle_message(self, message: Any) -> None:
+        if not isinstance(getattr(message, "root", message), ToolListChangedNotification):
+            return
+        # Every session of the pool receives the notification, only handle it once
+        if self._tools is None:
+            return
+        log_debug("MCP server tools changed, refreshing the tool list")
+        self._tools = None
+        # Requests can't be sent from the message handler, as it blocks the session from reading responses
+        for callback in self._tools_changed_callbacks:
+            task = asyncio.create_task(callback())
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def close(self) -> None:
+        """Close all sessions of the pool"""
+        await asyncio.gather(*(connection.close() for connection in self._connections), return_exceptions=True)
+        self._tools = None
+
+    async def release(self) -> None:
+        """Stop using the pool. Shared pools are closed once no toolkit uses them."""
+        if self._shared_key is not None:
+            self._users -= 1
+            if self._users > 0:
+                return
+            _shared_pools.pop(self._shared_key, None)
+            self._shared_key = None
+        await self.close()
+
+
+# Pools shared between toolkits, by event loop and server
+_shared_pools: Dict[Tuple[int, str], MCPSessionPool] = {}
+
+
+def get_shared_mcp_session_pool(server_params: MCPServerParams, **kwargs: Any) -> MCPSessionPool:
+    """
+    Return the pool of sessions to a server shared by all toolkits in the current event loop, creating it if needed.
+    The pool settings in `kwargs` are only used when the pool is created. Call `release()` when done with the pool.
+    """
+    key = (id(asyncio.get_running_loop()), _get_server_key(server_params))
+    pool = _shared_pools.get(key)
+    if pool is None:
+        pool = MCPSessionPool(server_params, **kwargs)
+        pool._shared_key = key
+        _shared_pools[key] = pool
+    pool._users += 1
+    return pool
+
+
 class MCPTools(Toolkit):
     """
     A toolkit for integrating Model Context Protocol (MCP) servers with Agno agents.
@@ -151,6 +456,10 @@ class MCPTools(Toolkit):
         client=None,
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
+        pool_size: int = 1,
+        call_timeout_seconds: Optional[float] = None,
+        health_check_interval: Optional[float] = 30,
+        share_connections: bool = False,
         **kwargs,
     ):
         """
@@ -167,6 +476,10 @@ class MCPTools(Toolkit):
             include_tools: Optional list of tool names to include (if None, includes all)
             exclude_tools: Optional list of tool names to exclude (if None, excludes none)
             transport: The transport protocol to use, either "stdio" or "sse" or "streamable-http"
+            pool_size: Number of sessions to open to the server. Not used when a session is provided.
+            call_timeout_seconds: Timeout in seconds for tool calls. Not used when a session is provided.
+            health_check_interval: Idle seconds before a session is health checked on its next use. None disables them.
+            share_connections: Share the sessions with other toolkits connecting to the same server in this process.
         """
         super().__init__(name="MCPTools", **kwargs)
 
@@ -231,9 +544,13 @@ class MCPTools(Toolkit):
             arguments = parts[1:] if len(parts) > 1 else []
             self.server_params = StdioServerParameters(command=cmd, args=arguments, env=env)
 
+        self.pool_size = pool_size
+        self.call_timeout_seconds = call_timeout_seconds
+        self.health_check_interval = health_check_interval
+        self.share_connections = share_connections
+
         self._client = client
-        self._context = None
-        self._session_context = None
+        self._pool: Optional[MCPSessionPool] = None
         self._initialized = False
         self._connection_task = None
 
@@ -257,6 +574,15 @@ class MCPTools(Toolkit):
         if self._connection_task is None or self._connection_task.done():
             self._connection_task = asyncio.create_task(self._connect())  # type: ignore
 
+    def _get_server_params(self) -> MCPServerParams:
+        if self.server_params is not None:
+            return self.server_params
+        if self.transport == "sse":
+            return SSEClientParams(url=self.url)  # type: ignore
+        if self.transport == "streamable-http":
+            return StreamableHTTPClientParams(url=self.url)  # type: ignore
+        raise ValueError("server_params must be provided when using stdio transport.")
+
     async def _connect(self) -> None:
         """Connects to the MCP server and initializes the tools"""
         if self._initialized:
@@ -266,55 +592,36 @@ class MCPTools(Toolkit):
             await self.initialize()
             return
 
-        if not hasattr(self, "_active_contexts"):
-            self._active_contexts: list[Any] = []
-
-        # Create a new studio session
-        if self.transport == "sse":
-            sse_params = asdict(self.server_params) if self.server_params is not None else {}  # type: ignore
-            if "url" not in sse_params:
-                sse_params["url"] = self.url
-            self._context = sse_client(**sse_params)  # type: ignore
-            client_timeout = min(self.timeout_seconds, sse_params.get("timeout", self.timeout_seconds))
-
-        # Create a new streamable HTTP session
-        elif self.transport == "streamable-http":
-            streamable_http_params = asdict(self.server_params) if self.server_params is not None else {}  # type: ignore
-            if "url" not in streamable_http_params:
-                streamable_http_params["url"] = self.url
-            self._context = streamablehttp_client(**streamable_http_params)  # type: ignore
-            params_timeout = streamable_http_params.get("timeout", self.timeout_seconds)
-            if isinstance(params_timeout, timedelta):
-                params_timeout = int(params_timeout.total_seconds())
-            client_timeout = min(self.timeout_seconds, params_timeout)
-
+        pool_kwargs: Dict[str, Any] = dict(
+            pool_size=self.pool_size,
+            timeout_seconds=self.timeout_seconds,
+            call_timeout_seconds=self.call_timeout_seconds,
+            health_check_interval=self.health_check_interval,
+        )
+        server_params = self._get_server_params()
+        if self.share_connections:
+            self._pool = get_shared_mcp_session_pool(server_params, **pool_kwargs)
         else:
-            if self.server_params is None:
-                raise ValueError("server_params must be provided when using stdio transport.")
-            self._context = stdio_client(self.server_params)  # type: ignore
-            client_timeout = self.timeout_seconds
+            self._pool = MCPSessionPool(server_params, **pool_kwargs)
 
-        session_params = await self._context.__aenter__()  # type: ignore
-        self._active_contexts.append(self._context)
-        read, write = session_params[0:2]
-
-        self._session_context = ClientSession(read, write, read_timeout_seconds=timedelta(seconds=client_timeout))  # type: ignore
-        self.session = await self._session_context.__aenter__()  # type: ignore
-        self._active_contexts.append(self._session_context)
+        try:
+            await self._pool.connect()
+            self._pool.add_tools_changed_callback(self._refresh_tools)
+            self.session = self._pool.session
 
-        # Initialize with the new session
-        await self.initialize()
+            # Initialize with the new session
+            await self.initialize()
+        except Exception:
+            await self.close()
+            raise
 
     async def close(self) -> None:
         """Close the MCP connection and clean up resources"""
-        if self._session_context is not None:
-            await self._session_context.__aexit__(None, None, None)
+        if self._pool is not None:
+            self._pool.remove_tools_changed_callback(self._refresh_tools)
+            await self._pool.release()
+            self._pool = None
             self.session = None
-            self._session_context = None
-
-        if self._context is not None:
-            await self._context.__aexit__(None, None, None)
-            self._context = None
 
         self._initialized = False
 
@@ -324,16 +631,18 @@ class MCPTools(Toolkit):
 
     async def __aexit__(self, _exc_type, _exc_val, _exc_tb):
         """Exit the async context manager."""
-        if self._session_context is not None:
-            await self._session_context.__aexit__(_exc_type, _exc_val, _exc_tb)
-            self.session = None
-            self._session_context = None
-
-        if self._context is not None:
-            await self._context.__aexit__(_exc_type, _exc_val, _exc_tb)
-            self._context = None
+        await self.close()
 
+    async def _refresh_tools(self) -> None:
+        """Register the tools again after the MCP server notified that they changed"""
+        previous_functions = self.functions
+        self.functions = OrderedDict()
         self._initialized = False
+        try:
+            await self.initialize()
+        except Exception:
+            self.functions = previous_functions
+            self._initialized = True
 
     async def initialize(self) -> None:
         """Initialize the MCP toolkit by getting available tools from the MCP server"""
@@ -341,14 +650,21 @@ class MCPTools(Toolkit):
             return
 
         try:
-            if self.session is None:
-                raise ValueError("Failed to establish session connection")
+            tools_session: Union[ClientSession, MCPSessionPool]
+            if self._pool is not None:
+                # The sessions of the pool are initialized when they connect
+                available_tools = await self._pool.list_tools()
+                tools_session = self._pool
+            else:
+                if self.session is None:
+                    raise ValueError("Failed to establish session connection")
 
-            # Initialize the session if not already initialized
-            await self.session.initialize()
+                # Initialize the session if not already initialized
+                await self.session.initialize()
 
-            # Get the list of tools from the MCP server
-            available_tools = await self.session.list_tools()
+                # Get the list of tools from the MCP server
+                available_tools = await self.session.list_tools()
+                tools_session = self.session
 
             self._check_tools_filters(
                 available_tools=[tool.name for tool in available_tools.tools],
@@ -368,7 +684,7 @@ class MCPTools(Toolkit):
             for tool in filtered_tools:
                 try:
                     # Get an entrypoint for the tool
-                    entrypoint = get_entrypoint_for_tool(tool, self.session)
+                    entrypoint = get_entrypoint_for_tool(tool, tools_session)
                     # Create a Function for the tool
                     f = Function(
                         name=tool.name,
@@ -419,6 +735,10 @@ class MultiMCPTools(Toolkit):
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
         allow_partial_failure: bool = False,
+        pool_size: int = 1,
+        call_timeout_seconds: Optional[float] = None,
+        health_check_interval: Optional[float] = 30,
+        share_connections: bool = False,
         **kwargs,
     ):
         """
@@ -435,6 +755,10 @@ class MultiMCPTools(Toolkit):
             include_tools: Optional list of tool names to include (if None, includes all).
             exclude_tools: Optional list of tool names to exclude (if None, excludes none).
             allow_partial_failure: If True, allows toolkit to initialize even if some MCP servers fail to connect. If False, any failure will raise an exception.
+            pool_size: Number of sessions to open to each server.
+            call_timeout_seconds: Timeout in seconds for tool calls.
+            health_check_interval: Idle seconds before a session is health checked on its next use. None disables them.
+            share_connections: Share the sessions with other toolkits connecting to the same servers in this process.
         """
         super().__init__(name="MultiMCPTools", **kwargs)
 
@@ -492,12 +816,16 @@ class MultiMCPTools(Toolkit):
                 for url in urls:
                     self.server_params_list.append(StreamableHTTPClientParams(url=url))
 
-        self._async_exit_stack = AsyncExitStack()
+        self.pool_size = pool_size
+        self.call_timeout_seconds = call_timeout_seconds
+        self.health_check_interval = health_check_interval
+        self.share_connections = share_connections
+
+        self._pools: List[MCPSessionPool] = []
         self._successful_connections = 0
 
         self._initialized = False
         self._connection_task = None
-        self._active_contexts: list[Any] = []
         self._used_as_context_manager = False
 
         self._client = client
@@ -558,47 +886,47 @@ class MultiMCPTools(Toolkit):
         if self._connection_task is None or self._connection_task.done():
             self._connection_task = asyncio.create_task(self._connect())  # type: ignore
 
+    def _create_pool(self, server_params: MCPServerParams) -> MCPSessionPool:
+        pool_kwargs: Dict[str, Any] = dict(
+            pool_size=self.pool_size,
+            timeout_seconds=self.timeout_seconds,
+            call_timeout_seconds=self.call_timeout_seconds,
+            health_check_interval=self.health_check_interval,
+        )
+        if self.share_connections:
+            return get_shared_mcp_session_pool(server_params, **pool_kwargs)
+        return MCPSessionPool(server_params, **pool_kwargs)
+
     async def _connect(self) -> None:
-        """Connects to the MCP servers and initializes the tools"""
+        """Connects to the MCP servers concurrently and initializes the tools"""
         if self._initialized:
             return
 
         server_connection_errors = []
 
-        for server_params in self.server_params_list:
-            try:
-                # Handle stdio connections
-                if isinstance(server_params, StdioServerParameters):
-                    stdio_transport = await self._async_exit_stack.enter_async_context(stdio_client(server_params))
-                    read, write = stdio_transport
-                    session = await self._async_exit_stack.enter_async_context(
-                        ClientSession(read, write, read_timeout_seconds=timedelta(seconds=self.timeout_seconds))
-                    )
-                    await self.initialize(session)
-                    self._successful_connections += 1
+        pools = [self._create_pool(server_params) for server_params in self.server_params_list]
+        results = await asyncio.gather(*(pool.connect() for pool in pools), return_exceptions=True)
 
-                # Handle SSE connections
-                elif isinstance(server_params, SSEClientParams):
-                    client_connection = await self._async_exit_stack.enter_async_context(
-                        sse_client(**asdict(server_params))
-                    )
-                    read, write = client_connection
-                    session = await self._async_exit_stack.enter_async_context(ClientSession(read, write))
-                    await self.initialize(session)
-                    self._successful_connections += 1
-
-                # Handle Streamable HTTP connections
-                elif isinstance(server_params, StreamableHTTPClientParams):
-                    client_connection = await self._async_exit_stack.enter_async_context(
-                        streamablehttp_client(**asdict(server_params))
-                    )
-                    read, write = client_connection[0:2]
-                    session = await self._async_exit_stack.enter_async_context(ClientSession(read, write))
-                    await self.initialize(session)
-                    self._successful_connections += 1
+        if not self.allow_partial_failure:
+            for result in results:
+                if isinstance(result, BaseException):
+                    await asyncio.gather(*(pool.release() for pool in pools), return_exceptions=True)
+                    raise ValueError(f"MCP connection failed: {result}")
+
+        # Register the tools in the order the servers were given
+        for server_params, pool, result in zip(self.server_params_list, pools, results):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                await self.initialize(pool)
+                pool.add_tools_changed_callback(self._refresh_tools)
+                self._pools.append(pool)
+                self._successful_connections += 1
 
             except Exception as e:
+                await pool.release()
                 if not self.allow_partial_failure:
+                    await self.close()
                     raise ValueError(f"MCP connection failed: {e}")
 
                 log_error(f"Failed to initialize MCP server with params {server_params}: {e}")
@@ -613,8 +941,12 @@ class MultiMCPTools(Toolkit):
 
     async def close(self) -> None:
         """Close the MCP connections and clean up resources"""
-        await self._async_exit_stack.aclose()
+        pools, self._pools = self._pools, []
+        for pool in pools:
+            pool.remove_tools_changed_callback(self._refresh_tools)
+        await asyncio.gather(*(pool.release() for pool in pools), return_exceptions=True)
         self._initialized = False
+        self._successful_connections = 0
 
     async def __aenter__(self) -> "MultiMCPTools":
         """Enter the async context manager."""
@@ -628,16 +960,25 @@ class MultiMCPTools(Toolkit):
         exc_tb: Union[TracebackType, None],
     ):
         """Exit the async context manager."""
-        await self._async_exit_stack.aclose()
-        self._initialized = False
-        self._successful_connections = 0
+        await self.close()
+
+    async def _refresh_tools(self) -> None:
+        """Register the tools of all servers again after one of them notified that its tools changed"""
+        previous_functions = self.functions
+        self.functions = OrderedDict()
+        try:
+            for pool in self._pools:
+                await self.initialize(pool)
+        except Exception:
+            self.functions = previous_functions
 
-    async def initialize(self, session: ClientSession) -> None:
+    async def initialize(self, session: Union[ClientSession, MCPSessionPool]) -> None:
         """Initialize the MCP toolkit by getting available tools from the MCP server"""
 
         try:
-            # Initialize the session if not already initialized
-            await session.initialize()
+            # Initialize the session if not already initialized. Pooled sessions are initialized when they connect.
+            if isinstance(session, ClientSession):
+                await session.initialize()
 
             # Get the list of tools from the MCP server
             available_tools = await session.list_tools()
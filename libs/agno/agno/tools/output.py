@@ -0,0 +1,197 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Literal, Optional
+from uuid import uuid4
+
+from agno.tools.toolkit import Toolkit
+from agno.utils.cache import CACHE_MISS, CacheBackend, InMemoryCache
+from agno.utils.log import log_debug, log_warning
+
+# Names of the retrieval tools, whose outputs are never spilled
+TOOL_OUTPUT_TOOL_NAMES = {"read_tool_output", "search_tool_output", "slice_tool_output"}
+
+
+@dataclass
+class ToolOutputManager:
+    """
+    Keeps large tool outputs out of the context window.
+
+    Outputs over `max_chars` are stored in a scratch store, and the model gets a preview with a reference instead.
+    The agent registers tools to page through, search and slice the stored outputs, and stored sessions only
+    keep the preview and the reference.
+    """
+
+    # Outputs longer than this many characters are spilled
+    max_chars: int = 20_000
+    # Number of characters of a spilled output included in the tool message
+    preview_chars: int = 2_000
+    # Number of characters returned per page by the retrieval tools
+    page_chars: int = 8_000
+    # "run" keeps outputs until the run completes, "session" keeps them for later runs of the session until ttl
+    scope: Literal["run", "session"] = "session"
+    # Scratch store for the outputs. Use a persistent backend, like SqliteCache or RedisCache, to share them.
+    store: CacheBackend = field(
+        default_factory=lambda: InMemoryCache(max_entries=256, max_size_bytes=512 * 1024 * 1024)
+    )
+    # Time-to-live for stored outputs in seconds. None means outputs don't expire.
+    ttl: Optional[int] = 24 * 3600
+    # Names of tools whose outputs are never spilled
+    exclude_tools: Optional[List[str]] = None
+
+    def __post_init__(self):
+        if self.page_chars > self.max_chars:
+            raise ValueError("page_chars must not be larger than max_chars")
+
+    def __deepcopy__(self, memo):
+        # The scratch store is shared by all copies of an agent
+        return self
+
+    def get_namespace(self, run_id: Optional[str], session_id: Optional[str]) -> str:
+        scope_id = run_id if self.scope == "run" else session_id
+        return f"tool_outputs:{self.scope}:{scope_id}"
+
+    def spill(self, output: str, tool_name: Optional[str], namespace: str) -> str:
+        """Store the output if it is too large, and return the content to send to the model"""
+        if len(output) <= self.max_chars or tool_name in TOOL_OUTPUT_TOOL_NAMES:
+            return output
+        if self.exclude_tools is not None and tool_name in self.exclude_tools:
+            return output
+
+        output_id = f"output_{uuid4().hex[:12]}"
+        try:
+            self.store.set(namespace, output_id, output, ttl=self.ttl)
+        except Exception as e:
+            log_warning(f"Could not store the output of {tool_name}, sending it in full: {e}")
+            return output
+        log_debug(f"Stored {len(output)} characters of {tool_name} output as {output_id}")
+
+        num_lines = output.count("\n") + 1
+        num_pages = -(-len(output) // self.page_chars)
+        return (
+            f"{output[: self.preview_chars]}\n\n"
+            f"[Output truncated: showing the first {self.preview_chars} of {len(output)} characters "
+            f"({num_lines} lines). The full output is stored with output_id '{output_id}'. "
+            f"Use read_tool_output to read it in {num_pages} pages, search_tool_output to find lines matching a "
+            f"pattern, or slice_tool_output to read a range of lines.]"
+        )
+
+    def get(self, namespace: str, output_id: str) -> Optional[str]:
+        value = self.store.get(namespace, output_id)
+        return None if value is CACHE_MISS else value
+
+    def release_run(self, run_id: Optional[str]) -> None:
+        """Drop the outputs stored by a run, if outputs are scoped to runs"""
+        if self.scope == "run" and run_id is not None:
+            self.store.clear(self.get_namespace(run_id=run_id, session_id=None))
+
+    def get_toolkit(self, namespace: str) -> "ToolOutputTools":
+        return ToolOutputTools(manager=self, namespace=namespace)
+
+
+class ToolOutputTools(Toolkit):
+    """Tools to read the tool outputs stored by a ToolOutputManager"""
+
+    def __init__(self, manager: ToolOutputManager, namespace: str, **kwargs: Any):
+        self.manager = manager
+        self.namespace = namespace
+
+        super().__init__(
+            name="tool_output_tools",
+            tools=[self.read_tool_output, self.search_tool_output, self.slice_tool_output],
+            **kwargs,
+        )
+
+    def _get_output(self, output_id: str) -> Optional[str]:
+        return self.manager.get(self.namespace, output_id.strip().strip("'\""))
+
+    def _missing(self, output_id: str) -> str:
+        return f"No stored output found with output_id '{output_id}'. It may have expired."
+
+    def read_tool_output(self, output_id: str, page: int = 1) -> str:
+        """Use this function to read a page of a tool output that was truncated.
+
+        Args:
+            output_id (str): The output_id given in the truncated tool output.
+            page (int): The page to read, starting at 1.
+
+        Returns:
+            str: The requested page of the output.
+        """
+        output = self._get_output(output_id)
+        if output is None:
+            return self._missing(output_id)
+
+        page_chars = self.manager.page_chars
+        num_pages = max(1, -(-len(output) // page_chars))
+        if page < 1 or page > num_pages:
+            return f"Page {page} does not exist. The output has {num_pages} pages."
+        start = (page - 1) * page_chars
+        return f"[Page {page} of {num_pages}]\n{output[start : start + page_chars]}"
+
+    def search_tool_output(self, output_id: str, pattern: str, context_lines: int = 0, max_matches: int = 20) -> str:
+        """Use this function to find the lines of a truncated tool output that match a pattern, like grep.
+
+        Args:
+            output_id (str): The output_id given in the truncated tool output.
+            pattern (str): A regular expression, or plain text, to search for. The search is case-insensitive.
+            context_lines (int): Number of lines to include before and after each match.
+            max_matches (int): Maximum number of matches to return.
+
+        Returns:
+            str: The matching lines, each prefixed with its line number.
+        """
+        output = self._get_output(output_id)
+        if output is None:
+            return self._missing(output_id)
+
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            regex = re.compile(re.escape(pattern), re.IGNORECASE)
+
+        lines = output.splitlines()
+        matches = [i for i, line in enumerate(lines) if regex.search(line)]
+        if len(matches) == 0:
+            return f"No lines match '{pattern}'."
+
+        context_lines = max(0, context_lines)
+        selected: List[int] = []
+        for i in matches[:max_matches]:
+            for j in range(max(0, i - context_lines), min(len(lines), i + context_lines + 1)):
+                if not selected or j > selected[-1]:
+                    selected.append(j)
+
+        result = "\n".join(f"{j + 1}: {lines[j]}" for j in selected)
+        header = f"[{len(matches)} matching lines"
+        if len(matches) > max_matches:
+            header += f", showing the first {max_matches}"
+        result = f"{header}]\n{result}"
+        if len(result) > self.manager.page_chars:
+            result = result[: self.manager.page_chars] + "\n[Truncated, use a more specific pattern]"
+        return result
+
+    def slice_tool_output(self, output_id: str, start_line: int, end_line: int) -> str:
+        """Use this function to read a range of lines of a truncated tool output.
+
+        Args:
+            output_id (str): The output_id given in the truncated tool output.
+            start_line (int): The first line to read, starting at 1.
+            end_line (int): The last line to read, included.
+
+        Returns:
+            str: The requested lines, each prefixed with its line number.
+        """
+        output = self._get_output(output_id)
+        if output is None:
+            return self._missing(output_id)
+
+        lines = output.splitlines()
+        start_line = max(1, start_line)
+        end_line = min(len(lines), end_line)
+        if start_line > end_line:
+            return f"No lines in range. The output has {len(lines)} lines."
+
+        result = "\n".join(f"{i}: {lines[i - 1]}" for i in range(start_line, end_line + 1))
+        if len(result) > self.manager.page_chars:
+            result = result[: self.manager.page_chars] + "\n[Truncated, request fewer lines]"
+        return result
@@ -1,7 +1,8 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal, Optional
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, logger
+from agno.utils.sql import get_truncation_notice
 
 try:
     import pandas as pd
@@ -15,9 +16,20 @@ class PandasTools(Toolkit):
         enable_create_pandas_dataframe: bool = True,
         enable_run_dataframe_operation: bool = True,
         all: bool = False,
+        max_result_rows: Optional[int] = None,
+        result_format: Literal["text", "csv"] = "text",
         **kwargs,
     ):
+        """
+        Args:
+            max_result_rows: Maximum number of rows of the dataframes returned by operations. Larger results are
+                truncated.
+            result_format: Format of the dataframes returned by operations. One of text (aligned columns) or csv,
+                which is more compact.
+        """
         self.dataframes: Dict[str, pd.DataFrame] = {}
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.result_format: Literal["text", "csv"] = result_format
 
         tools: List[Any] = []
         if all or enable_create_pandas_dataframe:
@@ -91,12 +103,24 @@ class PandasTools(Toolkit):
 
             log_debug(f"Ran operation: {operation}")
             try:
-                try:
-                    return result.to_string()
-                except AttributeError:
-                    return str(result)
+                return self._format_result(result)
             except Exception:
                 return "Operation ran successfully"
         except Exception as e:
             logger.error(f"Error running operation: {e}")
             return f"Error running operation: {e}"
+
+    def _format_result(self, result: Any) -> str:
+        if not isinstance(result, (pd.DataFrame, pd.Series)):
+            try:
+                return result.to_string()
+            except AttributeError:
+                return str(result)
+
+        truncated = self.max_result_rows is not None and len(result) > self.max_result_rows
+        if truncated:
+            result = result.head(self.max_result_rows)
+        output = result.to_csv().rstrip("\n") if self.result_format == "csv" else result.to_string()
+        if truncated:
+            output += "\n" + get_truncation_notice(self.max_result_rows)  # type: ignore
+        return output
@@ -1,16 +1,51 @@
+import asyncio
 import csv
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     import psycopg
     from psycopg import sql
     from psycopg.connection import Connection as PgConnection
+    from psycopg.conninfo import make_conninfo
     from psycopg.rows import DictRow, dict_row
 except ImportError:
     raise ImportError("`psycopg` not installed. Please install using `pip install 'psycopg-binary'`.")
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_error
+from agno.utils.sql import afetch_rows, fetch_rows, get_truncation_notice
+
+_pools: Dict[str, Any] = {}
+_pools_lock = Lock()
+
+
+def get_shared_pool(conninfo: str, **pool_kwargs: Any) -> Any:
+    """
+    Return the read-only connection pool for a connection string and pool options, created once and shared by all
+    toolkits using them.
+    """
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError:
+        raise ImportError("`psycopg_pool` not installed. Please install using `pip install psycopg-pool`.")
+
+    def configure(connection: PgConnection) -> None:
+        connection.read_only = True
+
+    key = f"{conninfo}|{sorted(pool_kwargs.items())!r}"
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(
+                conninfo, kwargs={"row_factory": dict_row}, configure=configure, open=True, **pool_kwargs
+            )
+    return pool
+
+
+def _is_select(query: str) -> bool:
+    return query.lstrip().lower().startswith(("select", "with"))
 
 
 class PostgresTools(Toolkit):
@@ -23,27 +58,63 @@ class PostgresTools(Toolkit):
         host: Optional[str] = None,
         port: Optional[int] = None,
         table_schema: str = "public",
+        use_pool: bool = False,
+        pool_kwargs: Optional[Dict[str, Any]] = None,
+        async_tools: bool = False,
+        max_result_rows: Optional[int] = None,
         **kwargs,
     ):
+        """
+        Args:
+            use_pool: Take the connections from a pool shared by the toolkits connecting to the same database, instead
+                of opening a connection per toolkit. Requires `psycopg_pool`.
+            pool_kwargs: Options of the connection pool, like min_size and max_size.
+            async_tools: Register the async versions of show_tables, describe_table, inspect_query and run_query.
+            max_result_rows: Maximum number of rows returned by a query. The rows of SELECT queries are fetched with a
+                server-side cursor, and larger results are truncated.
+        """
         self._connection: Optional[PgConnection[DictRow]] = connection
+        self._async_connection: Optional[psycopg.AsyncConnection[DictRow]] = None
+        self._async_connection_loop: Optional[asyncio.AbstractEventLoop] = None
         self.db_name: Optional[str] = db_name
         self.user: Optional[str] = user
         self.password: Optional[str] = password
         self.host: Optional[str] = host
         self.port: Optional[int] = port
         self.table_schema: str = table_schema
+        self.max_result_rows: Optional[int] = max_result_rows
+
+        self.pool: Optional[Any] = None
+        if use_pool and connection is None:
+            self.pool = get_shared_pool(make_conninfo(**self._get_connection_kwargs()), **(pool_kwargs or {}))
 
         tools: List[Any] = [
-            self.show_tables,
-            self.describe_table,
+            self.ashow_tables if async_tools else self.show_tables,
+            self.adescribe_table if async_tools else self.describe_table,
             self.summarize_table,
-            self.inspect_query,
-            self.run_query,
+            self.ainspect_query if async_tools else self.inspect_query,
+            self.arun_query if async_tools else self.run_query,
             self.export_table_to_path,
         ]
 
         super().__init__(name="postgres_tools", tools=tools, **kwargs)
 
+    def _get_connection_kwargs(self) -> Dict[str, Any]:
+        connection_kwargs: Dict[str, Any] = {}
+        if self.db_name:
+            connection_kwargs["dbname"] = self.db_name
+        if self.user:
+            connection_kwargs["user"] = self.user
+        if self.password:
+            connection_kwargs["password"] = self.password
+        if self.host:
+            connection_kwargs["host"] = self.host
+        if self.port:
+            connection_kwargs["port"] = self.port
+
+        connection_kwargs["options"] = f"-c search_path={self.table_schema}"
+        return connection_kwargs
+
     @property
     def connection(self) -> PgConnection[DictRow]:
         """
@@ -52,25 +123,32 @@ class PostgresTools(Toolkit):
         """
         if self._connection is None or self._connection.closed:
             log_debug("Establishing new PostgreSQL connection.")
-            connection_kwargs: Dict[str, Any] = {"row_factory": dict_row}
-            if self.db_name:
-                connection_kwargs["dbname"] = self.db_name
-            if self.user:
-                connection_kwargs["user"] = self.user
-            if self.password:
-                connection_kwargs["password"] = self.password
-            if self.host:
-                connection_kwargs["host"] = self.host
-            if self.port:
-                connection_kwargs["port"] = self.port
-
-            connection_kwargs["options"] = f"-c search_path={self.table_schema}"
-
-            self._connection = psycopg.connect(**connection_kwargs)
+            self._connection = psycopg.connect(row_factory=dict_row, **self._get_connection_kwargs())
             self._connection.read_only = True
 
         return self._connection
 
+    @contextmanager
+    def _get_connection(self) -> Iterator[PgConnection[DictRow]]:
+        """Yields a connection from the pool, or the connection of the toolkit"""
+        if self.pool is not None:
+            with self.pool.connection() as connection:
+                yield connection
+        else:
+            yield self.connection
+
+    async def _get_async_connection(self) -> psycopg.AsyncConnection[DictRow]:
+        """Returns the async connection of the toolkit. Async connections can only be used in the loop that opened them."""
+        loop = asyncio.get_running_loop()
+        if self._async_connection is None or self._async_connection.closed or self._async_connection_loop is not loop:
+            log_debug("Establishing new async PostgreSQL connection.")
+            self._async_connection = await psycopg.AsyncConnection.connect(
+                row_factory=dict_row, **self._get_connection_kwargs()
+            )
+            await self._async_connection.set_read_only(True)
+            self._async_connection_loop = loop
+        return self._async_connection
+
     def __enter__(self):
         return self
 
@@ -84,29 +162,78 @@ class PostgresTools(Toolkit):
             self._connection.close()
             self._connection = None
 
+    async def aclose(self):
+        """Closes the database connections if they are open."""
+        self.close()
+        if self._async_connection and not self._async_connection.closed:
+            log_debug("Closing async PostgreSQL connection.")
+            await self._async_connection.close()
+            self._async_connection = None
+
+    def _use_server_side_cursor(self, connection: Any, query: str) -> bool:
+        # Named cursors only fetch the requested rows, but need a transaction and a SELECT statement
+        return self.max_result_rows is not None and not connection.autocommit and _is_select(query)
+
+    def _format_result(self, columns: List[str], rows: List[Any], truncated: bool = False) -> str:
+        if not rows:
+            return f"Query returned no results.\nColumns: {', '.join(columns)}"
+
+        header = ",".join(columns)
+        data_rows = [",".join(map(str, row.values())) for row in rows]
+        result = f"{header}\n" + "\n".join(data_rows)
+        if truncated:
+            result += "\n" + get_truncation_notice(self.max_result_rows)  # type: ignore
+        return result
+
     def _execute_query(self, query: str, params: Optional[tuple] = None) -> str:
         try:
-            with self.connection.cursor() as cursor:
+            with self._get_connection() as connection:
+                cursor_name = "agno_query" if self._use_server_side_cursor(connection, query) else None
+                with connection.cursor(name=cursor_name) if cursor_name else connection.cursor() as cursor:
+                    log_debug(f"Running PostgreSQL Query: {query} with Params: {params}")
+                    cursor.execute(query, params)
+
+                    if cursor.description is None:
+                        return cursor.statusmessage or "Query executed successfully with no output."
+
+                    columns = [desc[0] for desc in cursor.description]
+                    if self.max_result_rows is None:
+                        return self._format_result(columns, cursor.fetchall())
+                    rows, truncated = fetch_rows(cursor.fetchmany, self.max_result_rows)
+                    return self._format_result(columns, rows, truncated)
+
+        except psycopg.Error as e:
+            log_error(f"Database error: {e}")
+            # Connections of the pool are rolled back when returned to it
+            if self.pool is None and self.connection and not self.connection.closed:
+                self.connection.rollback()
+            return f"Error executing query: {e}"
+        except Exception as e:
+            log_error(f"An unexpected error occurred: {e}")
+            return f"An unexpected error occurred: {e}"
+
+    async def _aexecute_query(self, query: str, params: Optional[tuple] = None) -> str:
+        connection: Optional[psycopg.AsyncConnection[DictRow]] = None
+        try:
+            connection = await self._get_async_connection()
+            cursor_name = "agno_query" if self._use_server_side_cursor(connection, query) else None
+            async with connection.cursor(name=cursor_name) if cursor_name else connection.cursor() as cursor:
                 log_debug(f"Running PostgreSQL Query: {query} with Params: {params}")
-                cursor.execute(query, params)
+                await cursor.execute(query, params)
 
                 if cursor.description is None:
                     return cursor.statusmessage or "Query executed successfully with no output."
 
                 columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-
-                if not rows:
-                    return f"Query returned no results.\nColumns: {', '.join(columns)}"
-
-                header = ",".join(columns)
-                data_rows = [",".join(map(str, row.values())) for row in rows]
-                return f"{header}\n" + "\n".join(data_rows)
+                if self.max_result_rows is None:
+                    return self._format_result(columns, await cursor.fetchall())
+                rows, truncated = await afetch_rows(cursor.fetchmany, self.max_result_rows)
+                return self._format_result(columns, rows, truncated)
 
         except psycopg.Error as e:
             log_error(f"Database error: {e}")
-            if self.connection and not self.connection.closed:
-                self.connection.rollback()
+            if connection is not None and not connection.closed:
+                await connection.rollback()
             return f"Error executing query: {e}"
         except Exception as e:
             log_error(f"An unexpected error occurred: {e}")
@@ -118,6 +245,12 @@ class PostgresTools(Toolkit):
         stmt = "SELECT table_name FROM information_schema.tables WHERE table_schema = %s;"
         return self._execute_query(stmt, (self.table_schema,))
 
+    async def ashow_tables(self) -> str:
+        """Lists all tables in the configured schema."""
+
+        stmt = "SELECT table_name FROM information_schema.tables WHERE table_schema = %s;"
+        return await self._aexecute_query(stmt, (self.table_schema,))
+
     def describe_table(self, table: str) -> str:
         """
         Provides the schema (column name, data type, is nullable) for a given table.
@@ -135,6 +268,23 @@ class PostgresTools(Toolkit):
         """
         return self._execute_query(stmt, (self.table_schema, table))
 
+    async def adescribe_table(self, table: str) -> str:
+        """
+        Provides the schema (column name, data type, is nullable) for a given table.
+
+        Args:
+            table: The name of the table to describe.
+
+        Returns:
+            A string describing the table's columns and data types.
+        """
+        stmt = """
+            SELECT column_name, data_type, is_nullable
+            FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s;
+        """
+        return await self._aexecute_query(stmt, (self.table_schema, table))
+
     def summarize_table(self, table: str) -> str:
         """
         Computes and returns key summary statistics for a table's columns.
@@ -146,7 +296,7 @@ class PostgresTools(Toolkit):
             A string containing a summary of the table.
         """
         try:
-            with self.connection.cursor() as cursor:
+            with self._get_connection() as connection, connection.cursor() as cursor:
                 # First, get column information using a parameterized query
                 schema_query = """
                     SELECT column_name, data_type
@@ -216,6 +366,15 @@ class PostgresTools(Toolkit):
         """
         return self._execute_query(f"EXPLAIN {query}")
 
+    async def ainspect_query(self, query: str) -> str:
+        """
+        Shows the execution plan for a SQL query (using EXPLAIN).
+
+        :param query: The SQL query to inspect.
+        :return: The query's execution plan.
+        """
+        return await self._aexecute_query(f"EXPLAIN {query}")
+
     def export_table_to_path(self, table: str, path: str) -> str:
         """
         Exports a table's data to a local CSV file.
@@ -230,18 +389,21 @@ class PostgresTools(Toolkit):
         stmt = sql.SQL("SELECT * FROM {tbl};").format(tbl=table_identifier)
 
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(stmt)
+            with self._get_connection() as connection:
+                # Stream the rows with a server-side cursor, instead of loading the whole table in memory
+                cursor_name = None if connection.autocommit else "agno_export"
+                with connection.cursor(name=cursor_name) if cursor_name else connection.cursor() as cursor:
+                    cursor.execute(stmt)
 
-                if cursor.description is None:
-                    return f"Error: Query returned no description for table '{table}'."
+                    if cursor.description is None:
+                        return f"Error: Query returned no description for table '{table}'."
 
-                columns = [desc[0] for desc in cursor.description]
+                    columns = [desc[0] for desc in cursor.description]
 
-                with open(path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(columns)
-                    writer.writerows(row.values() for row in cursor)
+                    with open(path, "w", newline="", encoding="utf-8") as f:
+                        writer = csv.writer(f)
+                        writer.writerow(columns)
+                        writer.writerows(row.values() for row in cursor)
 
             return f"Successfully exported table '{table}' to '{path}'."
         except (psycopg.Error, IOError) as e:
@@ -255,3 +417,12 @@ class PostgresTools(Toolkit):
         :return: The query result as a formatted string.
         """
         return self._execute_query(query)
+
+    async def arun_query(self, query: str) -> str:
+        """
+        Runs a read-only SQL query and returns the result.
+
+        :param query: The SQL query to run.
+        :return: The query result as a formatted string.
+        """
+        return await self._aexecute_query(query)
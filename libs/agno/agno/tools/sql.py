@@ -1,11 +1,15 @@
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, logger
+from agno.utils.sql import ResultFormat, afetch_rows, fetch_rows, format_rows, get_truncation_notice
 
 try:
     from sqlalchemy import Engine, create_engine
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.sql.expression import text
@@ -13,6 +17,32 @@ except ImportError:
     raise ImportError("`sqlalchemy` not installed")
 
 
+_engines: Dict[str, Any] = {}
+_engines_lock = Lock()
+
+
+def _get_shared(db_url: str, engine_kwargs: Dict[str, Any], factory: Any) -> Any:
+    key = f"{factory.__name__}|{db_url}|{sorted(engine_kwargs.items())!r}"
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = factory(db_url, **engine_kwargs)
+    return engine
+
+
+def get_shared_engine(db_url: str, **engine_kwargs: Any) -> Engine:
+    """Return the engine for a database url and options, created once and shared by all toolkits using them"""
+    return _get_shared(db_url, engine_kwargs, create_engine)
+
+
+def get_shared_async_engine(db_url: str, **engine_kwargs: Any) -> AsyncEngine:
+    """
+    Return the async engine for a database url (e.g. postgresql+asyncpg://...) and options, created once and shared
+    by all toolkits using them. Connections of async engines belong to the event loop that opened them.
+    """
+    return _get_shared(db_url, engine_kwargs, create_async_engine)
+
+
 class SQLTools(Toolkit):
     def __init__(
         self,
@@ -29,17 +59,47 @@ class SQLTools(Toolkit):
         enable_describe_table: bool = True,
         enable_run_sql_query: bool = True,
         all: bool = False,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
+        async_tools: bool = False,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        share_engine: bool = True,
+        max_result_rows: Optional[int] = None,
+        stream_results: bool = True,
+        result_format: ResultFormat = "json",
         **kwargs,
     ):
-        # Get the database engine
-        _engine: Optional[Engine] = db_engine
-        if _engine is None and db_url is not None:
-            _engine = create_engine(db_url)
-        elif user and password and host and port and dialect:
+        """
+        Args:
+            async_db_url: Database url with an async driver (e.g. postgresql+asyncpg://...), used by the async tools.
+            async_db_engine: Async engine used by the async tools.
+            async_tools: Register the async versions of the tools. Without an async engine, the async tools run the
+                queries in a worker thread.
+            engine_kwargs: Options passed to create_engine, like pool_size.
+            share_engine: Share the engine, and its connection pool, with the other toolkits using the same url and
+                options.
+            max_result_rows: Maximum number of rows returned to the model. Larger results are truncated.
+            stream_results: Fetch the rows of SELECT queries with a server-side cursor when max_result_rows is set, if
+                the driver supports it.
+            result_format: Format of the query results. One of json, columnar (column names once, then the values of
+                each row) or csv.
+        """
+        engine_kwargs = engine_kwargs or {}
+
+        # Get the database url
+        _db_url: Optional[str] = db_url
+        if _db_url is None and user and password and host and port and dialect:
             if schema is not None:
-                _engine = create_engine(f"{dialect}://{user}:{password}@{host}:{port}/{schema}")
+                _db_url = f"{dialect}://{user}:{password}@{host}:{port}/{schema}"
             else:
-                _engine = create_engine(f"{dialect}://{user}:{password}@{host}:{port}")
+                _db_url = f"{dialect}://{user}:{password}@{host}:{port}"
+
+        # Get the database engine
+        _engine: Optional[Engine] = db_engine
+        if _engine is None and _db_url is not None:
+            _engine = (
+                get_shared_engine(_db_url, **engine_kwargs) if share_engine else create_engine(_db_url, **engine_kwargs)
+            )
 
         if _engine is None:
             raise ValueError("Could not build the database connection")
@@ -48,18 +108,30 @@ class SQLTools(Toolkit):
         self.db_engine: Engine = _engine
         self.Session: sessionmaker[Session] = sessionmaker(bind=self.db_engine)
 
+        # Async database connection
+        if async_db_engine is None and async_db_url is not None:
+            if share_engine:
+                async_db_engine = get_shared_async_engine(async_db_url, **engine_kwargs)
+            else:
+                async_db_engine = create_async_engine(async_db_url, **engine_kwargs)
+        self.async_db_engine: Optional[AsyncEngine] = async_db_engine
+
         self.schema = schema
 
         # Tables this toolkit can access
         self.tables: Optional[Dict[str, Any]] = tables
 
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.stream_results: bool = stream_results
+        self.result_format: ResultFormat = result_format
+
         tools: List[Any] = []
         if enable_list_tables or all:
-            tools.append(self.list_tables)
+            tools.append(self.alist_tables if async_tools else self.list_tables)
         if enable_describe_table or all:
-            tools.append(self.describe_table)
+            tools.append(self.adescribe_table if async_tools else self.describe_table)
         if enable_run_sql_query or all:
-            tools.append(self.run_sql_query)
+            tools.append(self.arun_sql_query if async_tools else self.run_sql_query)
 
         super().__init__(name="sql_tools", tools=tools, **kwargs)
 
@@ -74,17 +146,47 @@ class SQLTools(Toolkit):
 
         try:
             log_debug("listing tables in the database")
-            inspector = inspect(self.db_engine)
-            if self.schema:
-                table_names = inspector.get_table_names(schema=self.schema)
-            else:
-                table_names = inspector.get_table_names()
+            table_names = self._get_table_names(self.db_engine)
             log_debug(f"table_names: {table_names}")
             return json.dumps(table_names)
         except Exception as e:
             logger.error(f"Error getting tables: {e}")
             return f"Error getting tables: {e}"
 
+    async def alist_tables(self) -> str:
+        """Use this function to get a list of table names in the database.
+
+        Returns:
+            str: list of tables in the database.
+        """
+        if self.tables is not None:
+            return json.dumps(self.tables)
+        if self.async_db_engine is None:
+            return await asyncio.to_thread(self.list_tables)
+
+        try:
+            log_debug("listing tables in the database")
+            async with self.async_db_engine.connect() as conn:
+                table_names = await conn.run_sync(self._get_table_names)
+            log_debug(f"table_names: {table_names}")
+            return json.dumps(table_names)
+        except Exception as e:
+            logger.error(f"Error getting tables: {e}")
+            return f"Error getting tables: {e}"
+
+    def _get_table_names(self, connectable: Any) -> List[str]:
+        inspector = inspect(connectable)
+        if self.schema:
+            return inspector.get_table_names(schema=self.schema)
+        return inspector.get_table_names()
+
+    def _get_columns(self, connectable: Any, table_name: str) -> List[Dict[str, Any]]:
+        table_schema = inspect(connectable).get_columns(table_name, schema=self.schema)
+        return [
+            {"name": column["name"], "type": str(column["type"]), "nullable": column["nullable"]}
+            for column in table_schema
+        ]
+
     def describe_table(self, table_name: str) -> str:
         """Use this function to describe a table.
 
@@ -97,14 +199,28 @@ class SQLTools(Toolkit):
 
         try:
             log_debug(f"Describing table: {table_name}")
-            inspector = inspect(self.db_engine)
-            table_schema = inspector.get_columns(table_name, schema=self.schema)
-            return json.dumps(
-                [
-                    {"name": column["name"], "type": str(column["type"]), "nullable": column["nullable"]}
-                    for column in table_schema
-                ]
-            )
+            return json.dumps(self._get_columns(self.db_engine, table_name))
+        except Exception as e:
+            logger.error(f"Error getting table schema: {e}")
+            return f"Error getting table schema: {e}"
+
+    async def adescribe_table(self, table_name: str) -> str:
+        """Use this function to describe a table.
+
+        Args:
+            table_name (str): The name of the table to get the schema for.
+
+        Returns:
+            str: schema of a table
+        """
+        if self.async_db_engine is None:
+            return await asyncio.to_thread(self.describe_table, table_name)
+
+        try:
+            log_debug(f"Describing table: {table_name}")
+            async with self.async_db_engine.connect() as conn:
+                columns = await conn.run_sync(self._get_columns, table_name)
+            return json.dumps(columns)
         except Exception as e:
             logger.error(f"Error getting table schema: {e}")
             return f"Error getting table schema: {e}"
@@ -122,7 +238,25 @@ class SQLTools(Toolkit):
         """
 
         try:
-            return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+            return self._format_result(*self._execute_sql(sql=query, limit=limit))
+        except Exception as e:
+            logger.error(f"Error running query: {e}")
+            return f"Error running query: {e}"
+
+    async def arun_sql_query(self, query: str, limit: Optional[int] = 10) -> str:
+        """Use this function to run a SQL query and return the result.
+
+        Args:
+            query (str): The query to run.
+            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results.
+        Returns:
+            str: Result of the SQL query.
+        Notes:
+            - The result may be empty if the query does not return any data.
+        """
+
+        try:
+            return self._format_result(*await self._aexecute_sql(sql=query, limit=limit))
         except Exception as e:
             logger.error(f"Error running query: {e}")
             return f"Error running query: {e}"
@@ -137,18 +271,80 @@ class SQLTools(Toolkit):
         Returns:
             List[dict]: The result of the query.
         """
+        columns, rows, _ = self._execute_sql(sql=sql, limit=limit)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def _get_max_rows(self, limit: Optional[int]) -> Optional[int]:
+        limits = [value for value in (limit, self.max_result_rows) if value]
+        return min(limits) if limits else None
+
+    def _is_truncated(self, limit: Optional[int], has_more_rows: bool) -> bool:
+        # Rows left out by the limit requested in the tool call are not a truncation
+        return has_more_rows and self.max_result_rows is not None and (not limit or limit > self.max_result_rows)
+
+    def _use_server_side_cursor(self, sql: str) -> bool:
+        # Only results bounded by max_result_rows are streamed, and server-side cursors only accept SELECT statements
+        return (
+            self.stream_results
+            and self.max_result_rows is not None
+            and sql.lstrip().lower().startswith(("select", "values"))
+        )
+
+    def _format_result(self, columns: List[str], rows: List[Any], truncated: bool) -> str:
+        result = format_rows(columns, rows, self.result_format)
+        if truncated:
+            result += "\n" + get_truncation_notice(self.max_result_rows)  # type: ignore
+        return result
+
+    def _execute_sql(self, sql: str, limit: Optional[int] = None) -> Tuple[List[str], List[Any], bool]:
+        """Run a sql query. Returns the column names, the rows and whether the result was truncated."""
         log_debug(f"Running sql |\n{sql}")
 
+        max_rows = self._get_max_rows(limit)
+        statement = text(sql)
+        if max_rows is not None and self._use_server_side_cursor(sql):
+            # Use a server-side cursor so only the fetched rows are sent by the database
+            statement = statement.execution_options(stream_results=True)
+
         with self.Session() as sess, sess.begin():
-            result = sess.execute(text(sql))
+            result = sess.execute(statement)
 
             # Check if the operation has returned rows.
-            try:
-                if limit:
-                    rows = result.fetchmany(limit)
-                else:
-                    rows = result.fetchall()
-                return [row._asdict() for row in rows]
-            except Exception as e:
-                logger.error(f"Error while executing SQL: {e}")
-                return []
+            if not result.returns_rows:  # type: ignore[attr-defined]
+                return [], [], False
+            columns = list(result.keys())
+            if max_rows is None:
+                return columns, list(result.fetchall()), False
+            rows, has_more_rows = fetch_rows(result.fetchmany, max_rows)
+            return columns, rows, self._is_truncated(limit, has_more_rows)
+
+    async def _aexecute_sql(self, sql: str, limit: Optional[int] = None) -> Tuple[List[str], List[Any], bool]:
+        """Run a sql query with the async engine, or in a worker thread without one"""
+        if self.async_db_engine is None:
+            return await asyncio.to_thread(self._execute_sql, sql, limit)
+
+        log_debug(f"Running sql |\n{sql}")
+        max_rows = self._get_max_rows(limit)
+        async with self.async_db_engine.begin() as conn:
+            if max_rows is not None and self._use_server_side_cursor(sql):
+                return await self._astream_sql(conn, sql, limit, max_rows)
+
+            result = await conn.execute(text(sql))
+            if not result.returns_rows:
+                return [], [], False
+            columns = list(result.keys())
+            if max_rows is None:
+                return columns, list(result.fetchall()), False
+            rows, has_more_rows = fetch_rows(result.fetchmany, max_rows)
+            return columns, rows, self._is_truncated(limit, has_more_rows)
+
+    async def _astream_sql(
+        self, conn: AsyncConnection, sql: str, limit: Optional[int], max_rows: int
+    ) -> Tuple[List[str], List[Any], bool]:
+        stream = await conn.stream(text(sql))
+        try:
+            columns = list(stream.keys())
+            rows, has_more_rows = await afetch_rows(stream.fetchmany, max_rows)
+        finally:
+            await stream.close()
+        return columns, rows, self._is_truncated(limit, has_more_rows)
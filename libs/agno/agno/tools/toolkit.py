@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional
 
+from agno.tools.cache import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import log_debug, log_warning, logger
 
@@ -21,6 +22,7 @@ class Toolkit:
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        tool_cache: Optional[ToolCache] = None,
         auto_register: bool = True,
     ):
         """Initialize a new Toolkit.
@@ -37,6 +39,8 @@ class Toolkit:
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            tool_cache (Optional[ToolCache]): Cache for the toolkit's function results, with its own tiers and ttl.
+                Enables caching when set. Share one ToolCache between toolkits to share entries.
             auto_register (bool): Whether to automatically register all methods in the class.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
@@ -63,6 +67,7 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.tool_cache: Optional[ToolCache] = tool_cache
 
         # Automatically register all methods if auto_register is True
         if auto_register and self.tools:
@@ -128,6 +133,7 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                tool_cache=self.tool_cache,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
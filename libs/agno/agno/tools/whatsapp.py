@@ -19,6 +19,7 @@ class WhatsAppTools(Toolkit):
         version: Optional[str] = None,
         recipient_waid: Optional[str] = None,
         async_mode: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize WhatsApp toolkit.
 
@@ -28,6 +29,7 @@ class WhatsAppTools(Toolkit):
             version: API version to use
             recipient_waid: Default recipient WhatsApp ID (optional)
             async_mode: Whether to use async methods (default: False)
+            http_client: Async client to reuse between requests (optional)
         """
         # Core credentials
         self.access_token = access_token or getenv("WHATSAPP_ACCESS_TOKEN")
@@ -46,6 +48,7 @@ class WhatsAppTools(Toolkit):
         # API version and mode
         self.version = version or getenv("WHATSAPP_VERSION", "v22.0")
         self.async_mode = async_mode
+        self.http_client = http_client
 
         tools: List[Any] = []
         if self.async_mode:
@@ -79,11 +82,14 @@ class WhatsAppTools(Toolkit):
 
         logger.debug(f"Sending WhatsApp request to URL: {url}")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=data)
+        if self.http_client is not None:
+            response = await self.http_client.post(url, headers=headers, json=data)
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(url, headers=headers, json=data)
 
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return response.json()
 
     def _send_message_sync(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Send a message synchronously using the WhatsApp API.
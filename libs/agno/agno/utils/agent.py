@@ -1,11 +1,12 @@
 from asyncio import Future, Task
-from typing import AsyncIterator, Iterator, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Optional, Sequence, Union
 
 from agno.media import Audio, File, Image, Video
 from agno.models.message import Message
 from agno.run.agent import RunEvent, RunInput, RunOutput, RunOutputEvent
 from agno.run.team import RunOutputEvent as TeamRunOutputEvent
 from agno.run.team import TeamRunOutput
+from agno.run.timing import RunPhase, time_phase
 from agno.session import AgentSession, TeamSession
 from agno.utils.events import (
     create_memory_update_completed_event,
@@ -16,37 +17,47 @@ from agno.utils.events import (
 )
 from agno.utils.log import log_debug, log_warning
 
+if TYPE_CHECKING:
+    from agno.media_store import MediaStore
+
 
 async def await_for_background_tasks(
     memory_task: Optional[Task] = None,
     cultural_knowledge_task: Optional[Task] = None,
+    run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
 ) -> None:
     if memory_task is not None:
         try:
-            await memory_task
+            with time_phase(run_response, RunPhase.background_tasks, task="memory"):
+                await memory_task
         except Exception as e:
             log_warning(f"Error in memory creation: {str(e)}")
 
     if cultural_knowledge_task is not None:
         try:
-            await cultural_knowledge_task
+            with time_phase(run_response, RunPhase.background_tasks, task="cultural_knowledge"):
+                await cultural_knowledge_task
         except Exception as e:
             log_warning(f"Error in cultural knowledge creation: {str(e)}")
 
 
 def wait_for_background_tasks(
-    memory_future: Optional[Future] = None, cultural_knowledge_future: Optional[Future] = None
+    memory_future: Optional[Future] = None,
+    cultural_knowledge_future: Optional[Future] = None,
+    run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
 ) -> None:
     if memory_future is not None:
         try:
-            memory_future.result()
+            with time_phase(run_response, RunPhase.background_tasks, task="memory"):
+                memory_future.result()
         except Exception as e:
             log_warning(f"Error in memory creation: {str(e)}")
 
     # Wait for cultural knowledge creation
     if cultural_knowledge_future is not None:
         try:
-            cultural_knowledge_future.result()
+            with time_phase(run_response, RunPhase.background_tasks, task="cultural_knowledge"):
+                cultural_knowledge_future.result()
         except Exception as e:
             log_warning(f"Error in cultural knowledge creation: {str(e)}")
 
@@ -76,7 +87,8 @@ async def await_for_background_tasks_stream(
                     store_events=store_events,
                 )
         try:
-            await memory_task
+            with time_phase(run_response, RunPhase.background_tasks, task="memory"):
+                await memory_task
         except Exception as e:
             log_warning(f"Error in memory creation: {str(e)}")
         if stream_events:
@@ -97,7 +109,8 @@ async def await_for_background_tasks_stream(
 
     if cultural_knowledge_task is not None:
         try:
-            await cultural_knowledge_task
+            with time_phase(run_response, RunPhase.background_tasks, task="cultural_knowledge"):
+                await cultural_knowledge_task
         except Exception as e:
             log_warning(f"Error in cultural knowledge creation: {str(e)}")
 
@@ -127,7 +140,8 @@ def wait_for_background_tasks_stream(
                     store_events=store_events,
                 )
         try:
-            memory_future.result()
+            with time_phase(run_response, RunPhase.background_tasks, task="memory"):
+                memory_future.result()
         except Exception as e:
             log_warning(f"Error in memory creation: {str(e)}")
         if stream_events:
@@ -150,7 +164,8 @@ def wait_for_background_tasks_stream(
     if cultural_knowledge_future is not None:
         # TODO: Add events
         try:
-            cultural_knowledge_future.result()
+            with time_phase(run_response, RunPhase.background_tasks, task="cultural_knowledge"):
+                cultural_knowledge_future.result()
         except Exception as e:
             log_warning(f"Error in cultural knowledge creation: {str(e)}")
 
@@ -328,6 +343,80 @@ def scrub_media_from_message(message: Message) -> None:
     message.video_output = None
 
 
+def _get_media_from_message(message: Message) -> List[Union[Image, Video, Audio, File]]:
+    media: List[Union[Image, Video, Audio, File]] = []
+    for media_list in (message.images, message.videos, message.audio, message.files):
+        if media_list:
+            media.extend(media_list)
+    for media_output in (message.audio_output, message.image_output, message.video_output, message.file_output):
+        if media_output is not None:
+            media.append(media_output)
+    return media
+
+
+def _get_media_from_run_output(run_response: Union[RunOutput, TeamRunOutput]) -> List[Union[Image, Video, Audio, File]]:
+    media: List[Union[Image, Video, Audio, File]] = []
+    if run_response.input is not None:
+        for media_list in (
+            run_response.input.images,
+            run_response.input.videos,
+            run_response.input.audios,
+            run_response.input.files,
+        ):
+            if media_list:
+                media.extend(media_list)
+
+    for media_list in (run_response.images, run_response.videos, run_response.audio, run_response.files):
+        if media_list:
+            media.extend(media_list)
+    if run_response.response_audio is not None:
+        media.append(run_response.response_audio)
+
+    for messages in (run_response.messages, run_response.additional_input, run_response.reasoning_messages):
+        for message in messages or []:
+            media.extend(_get_media_from_message(message))
+
+    if isinstance(run_response, TeamRunOutput):
+        for member_response in run_response.member_responses:
+            media.extend(_get_media_from_run_output(member_response))
+    return media
+
+
+def offload_media_from_run_output(run_response: Union[RunOutput, TeamRunOutput], media_store: "MediaStore") -> None:
+    """
+    Move inline media content into the media store before the run is persisted.
+    Each media object keeps its content in memory, but is serialized with a content reference instead of base64.
+    """
+    for media in _get_media_from_run_output(run_response):
+        if media.content_ref is not None or not isinstance(media.content, bytes):
+            continue
+        try:
+            media.content_ref = media_store.put(media.content, mime_type=media.mime_type)
+        except Exception as e:
+            log_warning(f"Error storing media {media.id} in media store, it will be stored inline: {e}")
+
+
+async def aoffload_media_from_run_output(
+    run_response: Union[RunOutput, TeamRunOutput], media_store: "MediaStore"
+) -> None:
+    """Async version of offload_media_from_run_output, writing to the media store without blocking the event loop."""
+    for media in _get_media_from_run_output(run_response):
+        if media.content_ref is not None or not isinstance(media.content, bytes):
+            continue
+        try:
+            media.content_ref = await media_store.aput(media.content, mime_type=media.mime_type)
+        except Exception as e:
+            log_warning(f"Error storing media {media.id} in media store, it will be stored inline: {e}")
+
+
+def resolve_media_from_messages(messages: Sequence[Message]) -> None:
+    """Load the content of media stored by reference, so it can be sent to the model."""
+    for message in messages:
+        for media in _get_media_from_message(message):
+            if media.content is None and media.content_ref is not None:
+                media.get_content_bytes()
+
+
 def scrub_tool_results_from_run_output(run_response: Union[RunOutput, TeamRunOutput]) -> None:
     """
     Remove all tool-related data from RunOutput when store_tool_messages=False.
@@ -0,0 +1,288 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from tempfile import gettempdir
+from time import time
+from typing import Any, Optional, Tuple, Union
+
+from agno.utils.log import log_debug, log_error
+
+# Returned on a cache miss, as None is a valid cached value
+CACHE_MISS = object()
+
+
+class CacheBackend(ABC):
+    """Key-value store for cached results, with optional expiry. Entries are grouped in namespaces."""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Any:
+        """Return the cached value, or `CACHE_MISS` if there is no valid entry"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+
+def _serialize(value: Any) -> Optional[str]:
+    """Serialize a value for a persistent backend. Returns None if the value is not JSON serializable."""
+    try:
+        return json.dumps(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class InMemoryCache(CacheBackend):
+    """In-process LRU cache, bounded by number of entries and total size."""
+
+    def __init__(self, max_entries: int = 1024, max_size_bytes: Optional[int] = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        # (namespace, key) -> (value, expires_at, size)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        serialized = _serialize(value)
+        return len(serialized) if serialized is not None else len(str(value))
+
+    def get(self, namespace: str, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return CACHE_MISS
+            value, expires_at, size = entry
+            if expires_at is not None and expires_at < time():
+                del self._entries[(namespace, key)]
+                self._size_bytes -= size
+                return CACHE_MISS
+            self._entries.move_to_end((namespace, key))
+            return value
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        size = self._estimate_size(value)
+        if self.max_size_bytes is not None and size > self.max_size_bytes:
+            log_debug(f"Value of {size} bytes is too large for the in-memory cache")
+            return
+        expires_at = time() + ttl if ttl is not None else None
+        with self._lock:
+            old_entry = self._entries.pop((namespace, key), None)
+            if old_entry is not None:
+                self._size_bytes -= old_entry[2]
+            self._entries[(namespace, key)] = (value, expires_at, size)
+            self._size_bytes += size
+            # Evict least recently used entries
+            while len(self._entries) > self.max_entries or (
+                self.max_size_bytes is not None and self._size_bytes > self.max_size_bytes
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop((namespace, key), None)
+            if entry is not None:
+                self._size_bytes -= entry[2]
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._size_bytes = 0
+                return
+            for entry_key in [k for k in self._entries if k[0] == namespace]:
+                self._size_bytes -= self._entries.pop(entry_key)[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileCache(CacheBackend):
+    """One JSON file per entry, under `<cache_dir>/<namespace>/`. Shared by processes on the same host."""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir or Path(gettempdir()) / "agno_cache")
+        self._created_dirs: set = set()
+
+    def get_path(self, namespace: str, key: str, create_dir: bool = False) -> Path:
+        namespace_dir = self.cache_dir / namespace
+        if create_dir and namespace not in self._created_dirs:
+            namespace_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(namespace)
+        return namespace_dir / f"{key}.json"
+
+    def get(self, namespace: str, key: str) -> Any:
+        cache_path = self.get_path(namespace, key)
+        try:
+            with cache_path.open("r") as f:
+                cache_data = json.load(f)
+        except FileNotFoundError:
+            return CACHE_MISS
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            return CACHE_MISS
+
+        expires_at = cache_data.get("expires_at")
+        if expires_at is not None and expires_at < time():
+            cache_path.unlink(missing_ok=True)
+            return CACHE_MISS
+        return cache_data.get("result")
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        serialized = _serialize(value)
+        if serialized is None:
+            log_debug(f"Skipping file cache for non JSON serializable value in {namespace}")
+            return
+        cache_path = self.get_path(namespace, key, create_dir=True)
+        expires_at = time() + ttl if ttl is not None else None
+        try:
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            with tmp_path.open("w") as f:
+                f.write(f'{{"timestamp": {time()}, "expires_at": {json.dumps(expires_at)}, "result": {serialized}}}')
+            tmp_path.replace(cache_path)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+
+    def delete(self, namespace: str, key: str) -> None:
+        self.get_path(namespace, key).unlink(missing_ok=True)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        import shutil
+
+        target = self.cache_dir / namespace if namespace else self.cache_dir
+        shutil.rmtree(target, ignore_errors=True)
+        self._created_dirs.clear()
+
+
+class SqliteCache(CacheBackend):
+    """Cache stored in a SQLite database, shared by processes on the same host. Optionally bounded in entries."""
+
+    def __init__(
+        self,
+        db_file: Optional[Union[str, Path]] = None,
+        table_name: str = "agno_cache",
+        max_entries: Optional[int] = None,
+    ):
+        import sqlite3
+
+        self.db_file = str(db_file or Path(gettempdir()) / "agno_cache" / "cache.db")
+        if self.db_file != ":memory:":
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+        self.table_name = table_name
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_file, check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL, updated_at REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+
+    def get(self, namespace: str, key: str) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return CACHE_MISS
+        value, expires_at = row
+        if expires_at is not None and expires_at < time():
+            self.delete(namespace, key)
+            return CACHE_MISS
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        serialized = _serialize(value)
+        if serialized is None:
+            log_debug(f"Skipping SQLite cache for non JSON serializable value in {namespace}")
+            return
+        expires_at = time() + ttl if ttl is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (namespace, key, value, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, serialized, expires_at, time()),
+            )
+            if self.max_entries is not None:
+                # Evict the oldest entries
+                self._connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE rowid NOT IN "
+                    f"(SELECT rowid FROM {self.table_name} ORDER BY updated_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"DELETE FROM {self.table_name} WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock, self._connection:
+            if namespace is None:
+                self._connection.execute(f"DELETE FROM {self.table_name}")
+            else:
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE namespace = ?", (namespace,))
+
+
+class RedisCache(CacheBackend):
+    """Cache stored in Redis, shared across hosts. Expiry is handled by Redis."""
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        db_url: Optional[str] = None,
+        key_prefix: str = "agno:cache",
+    ):
+        try:
+            from redis import Redis
+        except ImportError:
+            raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+        if redis_client is None:
+            if db_url is None:
+                raise ValueError("One of redis_client or db_url must be provided")
+            redis_client = Redis.from_url(db_url)
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+
+    def _get_key(self, namespace: str, key: str) -> str:
+        return f"{self.key_prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str) -> Any:
+        value = self.redis_client.get(self._get_key(namespace, key))
+        if value is None:
+            return CACHE_MISS
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        serialized = _serialize(value)
+        if serialized is None:
+            log_debug(f"Skipping Redis cache for non JSON serializable value in {namespace}")
+            return
+        self.redis_client.set(self._get_key(namespace, key), serialized, ex=ttl)
+
+    def delete(self, namespace: str, key: str) -> None:
+        self.redis_client.delete(self._get_key(namespace, key))
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        pattern = f"{self.key_prefix}:{namespace}:*" if namespace else f"{self.key_prefix}:*"
+        keys = list(self.redis_client.scan_iter(match=pattern))
+        if keys:
+            self.redis_client.delete(*keys)
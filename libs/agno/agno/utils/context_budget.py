@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+from agno.utils.tokens import ApproximateTokenizer, Tokenizer, count_message_tokens
+
+
+@dataclass
+class ContextBudget:
+    """
+    Token budget for the messages sent to the model.
+
+    The budget is filled by priority: the system message and the current input are always included,
+    then the most recent history turns, then the additional input, then older history turns.
+    History is only ever dropped a whole turn at a time, starting with the oldest.
+    """
+
+    # Maximum number of input tokens sent to the model
+    max_tokens: int
+    # Budget per model id, overriding max_tokens for these models
+    model_max_tokens: Optional[Dict[str, int]] = None
+    # Tokens kept free for the model response
+    reserved_output_tokens: int = 0
+    # Tokenizer used to count tokens. Counts are cached on each message.
+    tokenizer: Tokenizer = field(default_factory=ApproximateTokenizer)
+    # Number of most recent history turns that take priority over the additional input
+    num_recent_turns: int = 2
+
+    def get_max_tokens(self, model_id: Optional[str] = None) -> int:
+        if model_id is not None and self.model_max_tokens and model_id in self.model_max_tokens:
+            return self.model_max_tokens[model_id]
+        return self.max_tokens
+
+
+def split_into_turns(messages: List[Message], user_role: str = "user") -> List[List[Message]]:
+    """Split messages into turns, each starting with a user message"""
+    turns: List[List[Message]] = []
+    for message in messages:
+        if message.role == user_role or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def apply_context_budget(
+    budget: ContextBudget,
+    required_messages: List[Message],
+    history: List[Message],
+    additional_messages: Optional[List[Message]] = None,
+    model_id: Optional[str] = None,
+) -> Tuple[List[Message], bool, Dict[str, Any]]:
+    """
+    Select the history messages, and whether to keep the additional messages, that fit in the token budget.
+
+    Args:
+        budget: The token budget.
+        required_messages: Messages always sent to the model, like the system message and the current input.
+        history: Messages from previous runs, oldest first.
+        additional_messages: Messages added on every run, like few-shot examples.
+        model_id: The id of the model the messages are sent to.
+
+    Returns:
+        The history messages to send, in order, whether to keep the additional messages, and the token breakdown.
+    """
+    tokenizer = budget.tokenizer
+    max_tokens = budget.get_max_tokens(model_id)
+
+    required_tokens = sum(count_message_tokens(m, tokenizer) for m in required_messages)
+    additional_tokens = sum(count_message_tokens(m, tokenizer) for m in additional_messages or [])
+    remaining_tokens = max_tokens - budget.reserved_output_tokens - required_tokens
+    if remaining_tokens < 0:
+        log_warning(f"The system message and input use {required_tokens} tokens, over the budget of {max_tokens}")
+
+    # Newest turns first
+    turns = split_into_turns(history)
+    turns.reverse()
+    turn_tokens = [sum(count_message_tokens(m, tokenizer) for m in turn) for turn in turns]
+
+    num_turns = 0
+    history_tokens = 0
+
+    def add_turns(max_turns: int) -> None:
+        nonlocal num_turns, history_tokens, remaining_tokens
+        while num_turns < min(max_turns, len(turns)) and turn_tokens[num_turns] <= remaining_tokens:
+            remaining_tokens -= turn_tokens[num_turns]
+            history_tokens += turn_tokens[num_turns]
+            num_turns += 1
+
+    # 1. Recent turns
+    add_turns(budget.num_recent_turns)
+    # 2. Additional messages, only if the recent turns were all included
+    include_additional = False
+    if additional_messages and additional_tokens <= remaining_tokens:
+        include_additional = True
+        remaining_tokens -= additional_tokens
+    # 3. Older turns, only continuing from the recent turns so no turn is skipped
+    if num_turns == min(budget.num_recent_turns, len(turns)):
+        add_turns(len(turns))
+
+    selected_history = [m for turn in reversed(turns[:num_turns]) for m in turn]
+    num_dropped_messages = len(history) - len(selected_history)
+    if num_dropped_messages > 0:
+        log_debug(f"Context budget: dropped {num_dropped_messages} history messages")
+    if additional_messages and not include_additional:
+        log_warning(f"Context budget: dropped {len(additional_messages)} additional input messages")
+
+    breakdown: Dict[str, Any] = {
+        "max_tokens": max_tokens,
+        "reserved_output_tokens": budget.reserved_output_tokens,
+        "required_tokens": required_tokens,
+        "additional_input_tokens": additional_tokens if include_additional else 0,
+        "history_tokens": history_tokens,
+        "total_tokens": required_tokens + history_tokens + (additional_tokens if include_additional else 0),
+        "history_messages": len(selected_history),
+        "dropped_history_messages": num_dropped_messages,
+        "dropped_additional_input_messages": 0
+        if include_additional or not additional_messages
+        else len(additional_messages),
+    }
+    return selected_history, include_additional, breakdown
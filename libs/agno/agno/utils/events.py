@@ -30,6 +30,7 @@ from agno.run.agent import (
     RunOutputEvent,
     RunPausedEvent,
     RunStartedEvent,
+    SemanticCacheHitEvent,
     SessionSummaryCompletedEvent,
     SessionSummaryStartedEvent,
     ToolCallCompletedEvent,
@@ -330,6 +331,19 @@ def create_memory_update_completed_event(from_run_response: RunOutput) -> Memory
     )
 
 
+def create_semantic_cache_hit_event(
+    from_run_response: RunOutput, similarity: Optional[float] = None, cached_run_id: Optional[str] = None
+) -> SemanticCacheHitEvent:
+    return SemanticCacheHitEvent(
+        session_id=from_run_response.session_id,
+        agent_id=from_run_response.agent_id,  # type: ignore
+        agent_name=from_run_response.agent_name,  # type: ignore
+        run_id=from_run_response.run_id,
+        similarity=similarity,
+        cached_run_id=cached_run_id,
+    )
+
+
 def create_team_memory_update_completed_event(from_run_response: TeamRunOutput) -> TeamMemoryUpdateCompletedEvent:
     return TeamMemoryUpdateCompletedEvent(
         session_id=from_run_response.session_id,
@@ -55,3 +55,25 @@ def filter_hook_args(hook: Callable[..., Any], all_args: Dict[str, Any]) -> Dict
         log_warning(f"Could not inspect hook signature, passing all arguments: {e}")
         # If signature inspection fails, pass all arguments as fallback
         return all_args
+
+
+# Arguments of the hooks that are available before the session is loaded
+SESSION_INDEPENDENT_HOOK_ARGS = {"run_input", "agent", "team", "metadata", "user_id", "debug_mode"}
+
+
+def is_session_independent_hook(hook: Callable[..., Any]) -> bool:
+    """Whether the hook only accepts arguments that are available before the session is loaded."""
+    import inspect
+
+    try:
+        sig = inspect.signature(hook)
+    except Exception:
+        return False
+
+    for name, param in sig.parameters.items():
+        # Hooks with **kwargs receive all arguments
+        if param.kind == inspect.Parameter.VAR_KEYWORD:
+            return False
+        if param.kind != inspect.Parameter.VAR_POSITIONAL and name not in SESSION_INDEPENDENT_HOOK_ARGS:
+            return False
+    return True
@@ -1,5 +1,6 @@
 import json
 from functools import partial
+from typing import TYPE_CHECKING, Union
 from uuid import uuid4
 
 from agno.utils.log import log_debug, log_exception
@@ -15,14 +16,17 @@ except (ImportError, ModuleNotFoundError):
 from agno.media import Image
 from agno.tools.function import ToolResult
 
+if TYPE_CHECKING:
+    from agno.tools.mcp import MCPSessionPool
 
-def get_entrypoint_for_tool(tool: MCPTool, session: ClientSession):
+
+def get_entrypoint_for_tool(tool: MCPTool, session: Union[ClientSession, "MCPSessionPool"]):
     """
     Return an entrypoint for an MCP tool.
 
     Args:
         tool: The MCP tool to create an entrypoint for
-        session: The session to use
+        session: The session, or pool of sessions, to call the tool with
 
     Returns:
         Callable: The entrypoint function for the tool
@@ -0,0 +1,54 @@
+"""Helpers shared by the SQL toolkits to bound and format query results"""
+
+import csv
+import io
+import json
+from typing import Any, Callable, List, Literal, Sequence, Tuple
+
+# json: a list of objects, columnar: the column names once and a list of values per row, csv: a header and rows
+ResultFormat = Literal["json", "columnar", "csv"]
+
+
+def fetch_rows(
+    fetchmany: Callable[[int], Sequence[Any]], max_rows: int, batch_size: int = 1000
+) -> Tuple[List[Any], bool]:
+    """Fetch at most `max_rows` rows in batches. Returns the rows, and whether the result had more rows."""
+    rows: List[Any] = []
+    # Fetch one extra row to know if the result was truncated
+    while len(rows) <= max_rows:
+        batch = fetchmany(min(batch_size, max_rows + 1 - len(rows)))
+        if not batch:
+            break
+        rows.extend(batch)
+    return rows[:max_rows], len(rows) > max_rows
+
+
+async def afetch_rows(fetchmany: Callable[[int], Any], max_rows: int, batch_size: int = 1000) -> Tuple[List[Any], bool]:
+    """Async version of fetch_rows, for awaitable fetchmany functions"""
+    rows: List[Any] = []
+    while len(rows) <= max_rows:
+        batch = await fetchmany(min(batch_size, max_rows + 1 - len(rows)))
+        if not batch:
+            break
+        rows.extend(batch)
+    return rows[:max_rows], len(rows) > max_rows
+
+
+def format_rows(columns: Sequence[str], rows: Sequence[Sequence[Any]], result_format: ResultFormat = "json") -> str:
+    """Format rows of values as a string for the model"""
+    if result_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return buffer.getvalue().rstrip("\n")
+    if result_format == "columnar":
+        return json.dumps({"columns": list(columns), "rows": [list(row) for row in rows]}, default=str)
+    return json.dumps([dict(zip(columns, row)) for row in rows], default=str)
+
+
+def get_truncation_notice(max_rows: int) -> str:
+    return (
+        f"The result was truncated to the first {max_rows} rows. "
+        "Use filters, aggregations or a LIMIT clause to get a smaller result."
+    )
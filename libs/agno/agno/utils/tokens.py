@@ -0,0 +1,78 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from agno.models.message import Message
+
+# Rough number of tokens used by a media item (image, audio, video or file) in a message
+MEDIA_TOKEN_ESTIMATE = 1000
+# Tokens used by the message structure itself (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class Tokenizer(ABC):
+    """Counts tokens in text. Subclass this to use the tokenizer of a specific model."""
+
+    # Identifies the tokenizer in cached message token counts
+    name: str = "tokenizer"
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        raise NotImplementedError
+
+    def count_message_tokens(self, message: Message) -> int:
+        """Count the tokens a message uses in the context window"""
+        num_tokens = MESSAGE_OVERHEAD_TOKENS
+        if message.content is not None:
+            num_tokens += self.count_tokens(message.get_content_string())
+        if message.tool_calls:
+            num_tokens += self.count_tokens(json.dumps(message.tool_calls, default=str))
+        for media in (message.images, message.audio, message.videos, message.files):
+            if media:
+                num_tokens += MEDIA_TOKEN_ESTIMATE * len(media)
+        return num_tokens
+
+
+class ApproximateTokenizer(Tokenizer):
+    """Estimates tokens from the number of characters. Fast and without dependencies."""
+
+    name = "approximate"
+
+    def __init__(self, chars_per_token: float = 4.0):
+        self.chars_per_token = chars_per_token
+        self.name = f"approximate-{chars_per_token}"
+
+    def count_tokens(self, text: str) -> int:
+        return int(len(text) / self.chars_per_token) + 1 if text else 0
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Counts tokens with a tiktoken encoding, as used by OpenAI models."""
+
+    def __init__(self, encoding_name: str = "o200k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install it using `pip install tiktoken`")
+
+        self.encoding: Any = tiktoken.get_encoding(encoding_name)
+        self.name = f"tiktoken-{encoding_name}"
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(message: Message, tokenizer: Optional[Tokenizer] = None) -> int:
+    """
+    Count the tokens of a message, caching the count on the message.
+
+    The cache is kept per tokenizer and is copied along with the message, so history messages are only counted once.
+    """
+    tokenizer = tokenizer or ApproximateTokenizer()
+    cached_count = message._token_counts.get(tokenizer.name)
+    if cached_count is not None:
+        return cached_count
+
+    num_tokens = tokenizer.count_message_tokens(message)
+    message._token_counts[tokenizer.name] = num_tokens
+    return num_tokens
@@ -1,5 +1,6 @@
 import os
-from typing import Optional, Union
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Union
 
 import httpx
 import requests
@@ -21,6 +22,16 @@ def get_phone_number_id() -> str:
     return phone_number_id
 
 
+@asynccontextmanager
+async def _get_async_client(http_client: Optional[httpx.AsyncClient] = None) -> AsyncIterator[httpx.AsyncClient]:
+    """Use the given client to reuse its connection pool, or a new client closed on exit"""
+    if http_client is not None:
+        yield http_client
+    else:
+        async with httpx.AsyncClient() as client:
+            yield client
+
+
 def get_media(media_id: str) -> Union[dict, bytes]:
     """
     Sends a GET request to the Facebook Graph API to retrieve media information.
@@ -51,12 +62,13 @@ def get_media(media_id: str) -> Union[dict, bytes]:
         return {"error": str(e)}
 
 
-async def get_media_async(media_id: str) -> Union[dict, bytes]:
+async def get_media_async(media_id: str, http_client: Optional[httpx.AsyncClient] = None) -> Union[dict, bytes]:
     """
     Sends a GET request to the Facebook Graph API to retrieve media information.
 
     Args:
         media_id (str): The ID of the media to retrieve.
+        http_client: Optional client to reuse, instead of opening a new connection
     """
     url = f"https://graph.facebook.com/v22.0/{media_id}"
 
@@ -64,7 +76,7 @@ async def get_media_async(media_id: str) -> Union[dict, bytes]:
 
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        async with httpx.AsyncClient() as client:
+        async with _get_async_client(http_client) as client:
             response = await client.get(url, headers=headers)
             response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
             data = response.json()
@@ -74,7 +86,7 @@ async def get_media_async(media_id: str) -> Union[dict, bytes]:
         return {"error": str(e)}
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with _get_async_client(http_client) as client:
             response = await client.get(media_url, headers=headers)
             response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
             data = response.content
@@ -120,7 +132,9 @@ def upload_media(media_data: bytes, mime_type: str, filename: str = "file"):
         return {"error": str(e)}
 
 
-async def upload_media_async(media_data: bytes, mime_type: str, filename: str = "file"):
+async def upload_media_async(
+    media_data: bytes, mime_type: str, filename: str = "file", http_client: Optional[httpx.AsyncClient] = None
+):
     """
     Sends a POST request to the Facebook Graph API to upload media for WhatsApp.
 
@@ -128,6 +142,7 @@ async def upload_media_async(media_data: bytes, mime_type: str, filename: str =
         media_data: Bytes buffer containing the file data
         mime_type (str): The MIME type of the file
         filename (str): The name to use for the file in the upload. Defaults to "file"
+        http_client: Optional client to reuse, instead of opening a new connection
     """
     phone_number_id = get_phone_number_id()
 
@@ -144,7 +159,7 @@ async def upload_media_async(media_data: bytes, mime_type: str, filename: str =
         file_data = BytesIO(media_data)
         files = {"file": (filename, file_data, mime_type)}
 
-        async with httpx.AsyncClient() as client:
+        async with _get_async_client(http_client) as client:
             response = await client.post(url, headers=headers, data=data, files=files)
             response.raise_for_status()  # Raise an error for bad responses
             json_resp = response.json()
@@ -162,6 +177,7 @@ async def send_image_message_async(
     media_id: str,
     recipient: str,
     text: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ):
     """Send an image message to a WhatsApp user (asynchronous version).
 
@@ -169,6 +185,7 @@ async def send_image_message_async(
         media_id: The media id for the image to send
         recipient: Recipient's WhatsApp ID or phone number (e.g., "+1234567890").
         text: Caption for the image
+        http_client: Optional client to reuse, instead of opening a new connection
 
     Returns:
         Success message with message ID
@@ -191,7 +208,7 @@ async def send_image_message_async(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with _get_async_client(http_client) as client:
             import json
 
             log_debug(f"Request data: {json.dumps(data, indent=2)}")
@@ -280,7 +297,7 @@ def typing_indicator(message_id: Optional[str] = None):
         return {"error": str(e)}
 
 
-async def typing_indicator_async(message_id: Optional[str] = None):
+async def typing_indicator_async(message_id: Optional[str] = None, http_client: Optional[httpx.AsyncClient] = None):
     if not message_id:
         return
 
@@ -298,7 +315,7 @@ async def typing_indicator_async(message_id: Optional[str] = None):
         "typing_indicator": {"type": "text"},
     }
     try:
-        async with httpx.AsyncClient() as client:
+        async with _get_async_client(http_client) as client:
             response = await client.post(url, headers=headers, data=data)
             response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
     except httpx.HTTPStatusError as e:
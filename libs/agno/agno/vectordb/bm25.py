@@ -0,0 +1,134 @@
+import math
+import re
+from collections import Counter
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agno.knowledge.document import Document
+from agno.vectordb.fusion import get_document_key
+
+
+def tokenize(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def matches_filters(document: Document, filters: Optional[Dict[str, Any]]) -> bool:
+    """Return True if the document metadata contains all the filter values"""
+    if not filters:
+        return True
+    meta_data = document.meta_data or {}
+    return all(meta_data.get(key) == value for key, value in filters.items())
+
+
+class BM25Index:
+    """
+    In-memory BM25 keyword index, used for keyword search with vector databases that don't support it.
+
+    Documents are identified by their content, so adding the same content twice keeps one entry.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, tokenizer: Callable[[str], List[str]] = tokenize):
+        # Term frequency saturation
+        self.k1 = k1
+        # Document length normalization
+        self.b = b
+        self.tokenizer = tokenizer
+
+        self._documents: Dict[str, Document] = {}
+        self._content_hashes: Dict[str, Optional[str]] = {}
+        self._term_frequencies: Dict[str, Counter] = {}
+        self._document_lengths: Dict[str, int] = {}
+        # Number of documents containing each term
+        self._document_frequencies: Counter = Counter()
+        self._total_length = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, documents: List[Document], content_hash: Optional[str] = None) -> None:
+        with self._lock:
+            for document in documents:
+                key = get_document_key(document)
+                if key in self._documents:
+                    self._remove(key)
+                term_frequencies = Counter(self.tokenizer(document.content))
+                self._documents[key] = document
+                self._content_hashes[key] = content_hash
+                self._term_frequencies[key] = term_frequencies
+                self._document_lengths[key] = sum(term_frequencies.values())
+                self._document_frequencies.update(term_frequencies.keys())
+                self._total_length += self._document_lengths[key]
+
+    def _remove(self, key: str) -> None:
+        self._documents.pop(key)
+        self._content_hashes.pop(key)
+        self._document_frequencies.subtract(self._term_frequencies.pop(key).keys())
+        self._total_length -= self._document_lengths.pop(key)
+
+    def remove(self, predicate: Callable[[Document], bool]) -> int:
+        """Remove the documents matching the predicate, and return how many were removed"""
+        with self._lock:
+            keys = [key for key, document in self._documents.items() if predicate(document)]
+            for key in keys:
+                self._remove(key)
+            self._document_frequencies = +self._document_frequencies
+            return len(keys)
+
+    def update_metadata(self, predicate: Callable[[Document], bool], metadata: Dict[str, Any]) -> None:
+        with self._lock:
+            for document in self._documents.values():
+                if predicate(document):
+                    document.meta_data = {**(document.meta_data or {}), **metadata}
+
+    def remove_content_hash(self, content_hash: str) -> int:
+        with self._lock:
+            keys = [key for key, value in self._content_hashes.items() if value == content_hash]
+            for key in keys:
+                self._remove(key)
+            self._document_frequencies = +self._document_frequencies
+            return len(keys)
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return content_hash in self._content_hashes.values()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._content_hashes.clear()
+            self._term_frequencies.clear()
+            self._document_lengths.clear()
+            self._document_frequencies.clear()
+            self._total_length = 0
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        """Return the documents matching the query with their BM25 scores, best first"""
+        query_terms = set(self.tokenizer(query))
+        with self._lock:
+            num_documents = len(self._documents)
+            if num_documents == 0 or not query_terms:
+                return []
+            average_length = self._total_length / num_documents
+
+            results: List[Tuple[Document, float]] = []
+            for key, term_frequencies in self._term_frequencies.items():
+                if not any(term in term_frequencies for term in query_terms):
+                    continue
+                document = self._documents[key]
+                if not matches_filters(document, filters):
+                    continue
+                length_norm = self.k1 * (1 - self.b + self.b * self._document_lengths[key] / (average_length or 1))
+                score = 0.0
+                for term in query_terms:
+                    frequency = term_frequencies.get(term, 0)
+                    if frequency == 0:
+                        continue
+                    document_frequency = self._document_frequencies[term]
+                    idf = math.log(1 + (num_documents - document_frequency + 0.5) / (document_frequency + 0.5))
+                    score += idf * frequency * (self.k1 + 1) / (frequency + length_norm)
+                results.append((document, score))
+
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results[:limit]
@@ -0,0 +1,117 @@
+from dataclasses import replace
+from enum import Enum
+from hashlib import md5
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from agno.knowledge.document import Document
+
+# Metadata key holding the per-signal ranks and scores of a fused search result
+SEARCH_SCORES_KEY = "search_scores"
+
+
+class FusionMethod(str, Enum):
+    # Reciprocal rank fusion: sum of weight / (rrf_k + rank), insensitive to the scale of the scores
+    rrf = "rrf"
+    # Weighted sum of the scores of each signal, min-max normalized per signal
+    weighted = "weighted"
+
+
+# A custom fusion function gets the signals a document was found by, each with its "rank" (starting at 1),
+# "score" (None if the signal has no scores) and "normalized_score", and returns the fused score
+FusionFunction = Callable[[Dict[str, Dict[str, Any]]], float]
+
+
+def get_document_key(document: Document) -> str:
+    """Key identifying the same document across the results of different signals"""
+    return md5(document.content.encode()).hexdigest()
+
+
+def _normalize_scores(num_results: int, scores: Optional[Sequence[Optional[float]]]) -> List[float]:
+    """Min-max normalize the scores of one signal, using the ranks if the signal has no scores"""
+    if num_results == 0:
+        return []
+    if scores is None or len(scores) != num_results or any(score is None for score in scores):
+        return [1.0 - rank / num_results for rank in range(num_results)]
+    low, high = min(scores), max(scores)  # type: ignore
+    if high == low:
+        return [1.0] * num_results
+    return [(score - low) / (high - low) for score in scores]  # type: ignore
+
+
+def fuse_results(
+    results: Dict[str, List[Document]],
+    scores: Optional[Dict[str, Sequence[Optional[float]]]] = None,
+    method: Union[FusionMethod, FusionFunction] = FusionMethod.rrf,
+    weights: Optional[Dict[str, float]] = None,
+    rrf_k: int = 60,
+    limit: Optional[int] = None,
+) -> List[Document]:
+    """
+    Fuse the ranked results of several retrieval signals into one ranking.
+
+    Args:
+        results (Dict[str, List[Document]]): Results of each signal, like "vector" and "keyword", best first.
+        scores (Optional[Dict[str, Sequence[Optional[float]]]]): Scores of the results of each signal, higher is better.
+        method (Union[FusionMethod, FusionFunction]): Fusion method, or a function computing the fused score.
+        weights (Optional[Dict[str, float]]): Weight of each signal. Signals default to a weight of 1.
+        rrf_k (int): Rank offset of reciprocal rank fusion. Higher values flatten the contribution of top ranks.
+        limit (Optional[int]): Maximum number of results to return.
+
+    Returns:
+        List[Document]: Copies of the documents, best first, with their ranks and scores under
+            meta_data["search_scores"].
+    """
+    scores = scores or {}
+    weights = weights or {}
+
+    documents: Dict[str, Document] = {}
+    signals: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for signal, signal_results in results.items():
+        signal_scores = scores.get(signal)
+        normalized_scores = _normalize_scores(len(signal_results), signal_scores)
+        for rank, document in enumerate(signal_results):
+            key = get_document_key(document)
+            # Keep the first copy of a document, so the results of the first signal take precedence
+            documents.setdefault(key, document)
+            document_signals = signals.setdefault(key, {})
+            if signal in document_signals:
+                continue
+            document_signals[signal] = {
+                "rank": rank + 1,
+                "score": signal_scores[rank] if signal_scores is not None and rank < len(signal_scores) else None,
+                "normalized_score": normalized_scores[rank],
+            }
+
+    fused_scores: Dict[str, float] = {}
+    for key, document_signals in signals.items():
+        if method == FusionMethod.rrf:
+            fused_scores[key] = sum(
+                weights.get(signal, 1.0) / (rrf_k + signal_score["rank"])
+                for signal, signal_score in document_signals.items()
+            )
+        elif method == FusionMethod.weighted:
+            fused_scores[key] = sum(
+                weights.get(signal, 1.0) * signal_score["normalized_score"]
+                for signal, signal_score in document_signals.items()
+            )
+        elif callable(method):
+            fused_scores[key] = method(document_signals)
+        else:
+            raise ValueError(f"Invalid fusion method: {method}")
+
+    ranked_keys = sorted(fused_scores, key=lambda key: fused_scores[key], reverse=True)
+    if limit is not None:
+        ranked_keys = ranked_keys[:limit]
+
+    fused_results = []
+    for key in ranked_keys:
+        search_scores: Dict[str, Any] = {
+            signal: {"rank": signal_score["rank"], "score": signal_score["score"]}
+            for signal, signal_score in signals[key].items()
+        }
+        search_scores["fused"] = fused_scores[key]
+        document = documents[key]
+        fused_results.append(
+            replace(document, meta_data={**(document.meta_data or {}), SEARCH_SCORES_KEY: search_scores})
+        )
+    return fused_results
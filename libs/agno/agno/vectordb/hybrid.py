@@ -0,0 +1,348 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from agno.knowledge.document import Document
+from agno.utils.log import log_debug, log_info, log_warning, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.bm25 import BM25Index, matches_filters
+from agno.vectordb.fusion import FusionFunction, FusionMethod, fuse_results
+from agno.vectordb.search import SearchType
+
+# Scores of the results of a signal, or None if the signal doesn't return scores
+SignalResults = Tuple[List[Document], Optional[List[Optional[float]]]]
+
+
+def _accepts_filters(method: Optional[Callable]) -> bool:
+    if method is None:
+        return False
+    try:
+        return "filters" in inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class HybridSearch(VectorDb):
+    """
+    Hybrid search over any vector database.
+
+    Runs vector and keyword retrieval concurrently and fuses their rankings, with reciprocal rank fusion by default.
+    Keyword retrieval uses the native keyword search of the vector database where available, and a local BM25
+    index of the documents inserted through this wrapper otherwise. The local index is kept in memory: pass
+    load_documents to rebuild it from the stored documents when it is first used after a restart. Results carry
+    their per-signal ranks and scores under meta_data["search_scores"].
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDb,
+        fusion: Union[FusionMethod, FusionFunction] = FusionMethod.rrf,
+        weights: Optional[Dict[str, float]] = None,
+        rrf_k: int = 60,
+        num_candidates: Optional[int] = None,
+        candidate_multiplier: int = 4,
+        native_keyword_search: bool = True,
+        keyword_index: Optional[BM25Index] = None,
+        load_documents: Optional[Callable[[], List[Document]]] = None,
+        search_type: SearchType = SearchType.hybrid,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ):
+        """
+        Args:
+            vector_db (VectorDb): Vector database to search, configured for vector search.
+            fusion (Union[FusionMethod, FusionFunction]): Fusion method, or a function computing the fused score.
+            weights (Optional[Dict[str, float]]): Weights of the "vector" and "keyword" signals. Default to 1.
+            rrf_k (int): Rank offset of reciprocal rank fusion.
+            num_candidates (Optional[int]): Number of results fetched per signal. Defaults to the limit times
+                candidate_multiplier.
+            candidate_multiplier (int): Multiplier of the limit used when num_candidates is not set.
+            native_keyword_search (bool): Use the keyword search of the vector database if it has one.
+            keyword_index (Optional[BM25Index]): Local keyword index used if the vector database has no keyword search.
+            load_documents (Optional[Callable[[], List[Document]]]): Returns the documents stored in the vector
+                database, to rebuild the local keyword index if it is empty when first used.
+            search_type (SearchType): Search to perform. Vector and keyword search return a single signal.
+        """
+        super().__init__(id=id or vector_db.id, name=name or vector_db.name, description=description)
+        self.vector_db = vector_db
+        self.fusion = fusion
+        self.weights = weights
+        self.rrf_k = rrf_k
+        self.num_candidates = num_candidates
+        self.candidate_multiplier = candidate_multiplier
+        self.search_type: SearchType = search_type
+        self.keyword_index: BM25Index = keyword_index or BM25Index()
+        self.load_documents = load_documents
+        # Whether the local keyword index was checked, and rebuilt if needed, on its first use
+        self._keyword_index_checked = False
+        self._keyword_index_lock = threading.Lock()
+
+        self.native_keyword_search = native_keyword_search
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper, like the embedder of the vector database
+        if name.startswith("_") or name == "vector_db":
+            raise AttributeError(name)
+        return getattr(self.vector_db, name)
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        # Copies share the local keyword index, like they share the stored documents
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for key, value in self.__dict__.items():
+            if key in ("keyword_index", "load_documents", "_keyword_index_lock"):
+                setattr(copied, key, value)
+            elif key == "_executor":
+                setattr(copied, key, None)
+            else:
+                setattr(copied, key, deepcopy(value, memo))
+        return copied
+
+    @property
+    def _vector_search(self) -> Optional[Callable]:
+        return getattr(self.vector_db, "vector_search", None)
+
+    @property
+    def _async_vector_search(self) -> Optional[Callable]:
+        return getattr(self.vector_db, "async_vector_search", None)
+
+    @property
+    def _keyword_search(self) -> Optional[Callable]:
+        return getattr(self.vector_db, "keyword_search", None) if self.native_keyword_search else None
+
+    @property
+    def _async_keyword_search(self) -> Optional[Callable]:
+        return getattr(self.vector_db, "async_keyword_search", None) if self.native_keyword_search else None
+
+    def _get_num_candidates(self, limit: int) -> int:
+        return max(limit, self.num_candidates or limit * self.candidate_multiplier)
+
+    # --- Signals ---
+
+    def _uses_native_keyword_search(self, filters: Optional[Dict[str, Any]]) -> bool:
+        return self._keyword_search is not None and (filters is None or _accepts_filters(self._keyword_search))
+
+    def _vector_signal(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> SignalResults:
+        if self._vector_search is not None and _accepts_filters(self._vector_search):
+            return self._vector_search(query=query, limit=limit, filters=filters), None
+        if self._vector_search is not None and filters is None:
+            return self._vector_search(query=query, limit=limit), None
+        return self.vector_db.search(query=query, limit=limit, filters=filters), None
+
+    async def _async_vector_signal(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> SignalResults:
+        if self._async_vector_search is not None and _accepts_filters(self._async_vector_search):
+            return await self._async_vector_search(query=query, limit=limit, filters=filters), None
+        if self._vector_search is not None:
+            return await asyncio.to_thread(self._vector_signal, query, limit, filters)
+        return await self.vector_db.async_search(query=query, limit=limit, filters=filters), None
+
+    def _check_keyword_index(self) -> None:
+        """Rebuild the local keyword index on its first use if it is empty, or warn that keyword results are missing"""
+        if self._keyword_index_checked:
+            return
+        # Searches running meanwhile wait for the rebuild, instead of searching an empty index
+        with self._keyword_index_lock:
+            if self._keyword_index_checked:
+                return
+            try:
+                if len(self.keyword_index) > 0:
+                    return
+                if self.load_documents is None:
+                    log_warning(
+                        "The local keyword index of HybridSearch is empty, so searches only use vector results. "
+                        "Documents are indexed when inserted through HybridSearch: pass load_documents to rebuild the "
+                        "index after a restart."
+                    )
+                    return
+                documents = self.load_documents()
+                self.keyword_index.add(documents)
+                log_info(f"Rebuilt the local keyword index with {len(documents)} documents")
+            except Exception as e:
+                log_warning(f"Error rebuilding the local keyword index, searches only use vector results: {e}")
+            finally:
+                self._keyword_index_checked = True
+
+    def _local_keyword_signal(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> SignalResults:
+        self._check_keyword_index()
+        results = self.keyword_index.search(query=query, limit=limit, filters=filters)
+        return [document for document, _ in results], [score for _, score in results]
+
+    def _keyword_signal(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> SignalResults:
+        if not self._uses_native_keyword_search(filters):
+            return self._local_keyword_signal(query, limit, filters)
+        if filters is None:
+            return self._keyword_search(query=query, limit=limit), None  # type: ignore
+        return self._keyword_search(query=query, limit=limit, filters=filters), None  # type: ignore
+
+    async def _async_keyword_signal(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> SignalResults:
+        if not self._uses_native_keyword_search(filters):
+            if not self._keyword_index_checked:
+                # Rebuilding the index loads every stored document, so it runs off the event loop
+                await asyncio.to_thread(self._check_keyword_index)
+            return self._local_keyword_signal(query, limit, filters)
+        if self._async_keyword_search is not None and _accepts_filters(self._async_keyword_search):
+            return await self._async_keyword_search(query=query, limit=limit, filters=filters), None
+        return await asyncio.to_thread(self._keyword_signal, query, limit, filters)
+
+    def _fuse(self, signals: Dict[str, SignalResults], limit: int) -> List[Document]:
+        return fuse_results(
+            results={signal: documents for signal, (documents, _) in signals.items()},
+            scores={signal: scores for signal, (_, scores) in signals.items() if scores is not None},
+            method=self.fusion,
+            weights=self.weights,
+            rrf_k=self.rrf_k,
+            limit=limit,
+        )
+
+    # --- Search ---
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        if self.search_type == SearchType.vector:
+            return self._fuse({"vector": self._vector_signal(query, limit, filters)}, limit)
+        if self.search_type == SearchType.keyword:
+            return self._fuse({"keyword": self._keyword_signal(query, limit, filters)}, limit)
+
+        num_candidates = self._get_num_candidates(limit)
+        signals: Dict[str, SignalResults] = {}
+        try:
+            if self._uses_native_keyword_search(filters):
+                # Both signals query the database, so run them at the same time
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hybrid_search")
+                keyword_future = self._executor.submit(self._keyword_signal, query, num_candidates, filters)
+                signals["vector"] = self._vector_signal(query, num_candidates, filters)
+                signals["keyword"] = keyword_future.result()
+            else:
+                signals["vector"] = self._vector_signal(query, num_candidates, filters)
+                signals["keyword"] = self._local_keyword_signal(query, num_candidates, filters)
+        except Exception as e:
+            logger.error(f"Error during hybrid search: {e}")
+            return []
+
+        log_debug(f"Hybrid search: {len(signals['vector'][0])} vector and {len(signals['keyword'][0])} keyword results")
+        return self._fuse(signals, limit)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        if self.search_type == SearchType.vector:
+            return self._fuse({"vector": await self._async_vector_signal(query, limit, filters)}, limit)
+        if self.search_type == SearchType.keyword:
+            return self._fuse({"keyword": await self._async_keyword_signal(query, limit, filters)}, limit)
+
+        num_candidates = self._get_num_candidates(limit)
+        try:
+            vector_signal, keyword_signal = await asyncio.gather(
+                self._async_vector_signal(query, num_candidates, filters),
+                self._async_keyword_signal(query, num_candidates, filters),
+            )
+        except Exception as e:
+            logger.error(f"Error during hybrid search: {e}")
+            return []
+        return self._fuse({"vector": vector_signal, "keyword": keyword_signal}, limit)
+
+    def get_supported_search_types(self) -> List[str]:
+        return [SearchType.vector, SearchType.keyword, SearchType.hybrid]
+
+    # --- Writes, mirrored in the local keyword index ---
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.vector_db.insert(content_hash, documents, filters)
+        self.keyword_index.add(documents, content_hash=content_hash)
+
+    async def async_insert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        await self.vector_db.async_insert(content_hash, documents, filters)
+        self.keyword_index.add(documents, content_hash=content_hash)
+
+    def upsert_available(self) -> bool:
+        return self.vector_db.upsert_available()
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.vector_db.upsert(content_hash, documents, filters)
+        self.keyword_index.remove_content_hash(content_hash)
+        self.keyword_index.add(documents, content_hash=content_hash)
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        await self.vector_db.async_upsert(content_hash, documents, filters)
+        self.keyword_index.remove_content_hash(content_hash)
+        self.keyword_index.add(documents, content_hash=content_hash)
+
+    def index_documents(self, documents: List[Document], content_hash: Optional[str] = None) -> None:
+        """Add documents already stored in the vector database to the local keyword index"""
+        self.keyword_index.add(documents, content_hash=content_hash)
+
+    def delete(self) -> bool:
+        self.keyword_index.clear()
+        return self.vector_db.delete()
+
+    def delete_by_id(self, id: str) -> bool:
+        self.keyword_index.remove(lambda document: document.id == id)
+        return self.vector_db.delete_by_id(id)
+
+    def delete_by_name(self, name: str) -> bool:
+        self.keyword_index.remove(lambda document: document.name == name)
+        return self.vector_db.delete_by_name(name)
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        self.keyword_index.remove(lambda document: matches_filters(document, metadata))
+        return self.vector_db.delete_by_metadata(metadata)
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        self.keyword_index.remove(lambda document: document.content_id == content_id)
+        return self.vector_db.delete_by_content_id(content_id)
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        self.vector_db.update_metadata(content_id, metadata)
+        self.keyword_index.update_metadata(lambda document: document.content_id == content_id, metadata)
+
+    def drop(self) -> None:
+        self.keyword_index.clear()
+        self.vector_db.drop()
+
+    async def async_drop(self) -> None:
+        self.keyword_index.clear()
+        await self.vector_db.async_drop()
+
+    # --- Delegated ---
+
+    def create(self) -> None:
+        self.vector_db.create()
+
+    async def async_create(self) -> None:
+        await self.vector_db.async_create()
+
+    def name_exists(self, name: str) -> bool:
+        return self.vector_db.name_exists(name)
+
+    def async_name_exists(self, name: str) -> bool:
+        return self.vector_db.async_name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        return self.vector_db.id_exists(id)
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return self.vector_db.content_hash_exists(content_hash)
+
+    def exists(self) -> bool:
+        return self.vector_db.exists()
+
+    async def async_exists(self) -> bool:
+        return await self.vector_db.async_exists()
+
+    def optimize(self) -> None:
+        self.vector_db.optimize()
+
+    def __del__(self):
+        executor = self.__dict__.get("_executor")
+        if executor is not None:
+            executor.shutdown(wait=False)
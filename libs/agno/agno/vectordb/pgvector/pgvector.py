@@ -1,18 +1,20 @@
 import asyncio
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
+from weakref import ReferenceType, ref
 
 from agno.utils.string import generate_id
 
 try:
     from sqlalchemy import update
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import Engine, create_engine, make_url
+    from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
+    from sqlalchemy.sql.expression import Executable, Select, TextClause, bindparam, desc, func, select, text
     from sqlalchemy.types import DateTime, String
 
 except ImportError:
@@ -29,10 +31,19 @@ from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.fusion import FusionFunction, FusionMethod, fuse_results
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
 from agno.vectordb.search import SearchType
 
 
+def get_async_db_url(db_url: str) -> str:
+    """Return the URL of the same database with an async driver: asyncpg if the URL uses it, psycopg otherwise"""
+    url = make_url(db_url)
+    if url.drivername not in ("postgresql+asyncpg", "postgresql+psycopg", "postgresql+psycopg_async"):
+        url = url.set(drivername="postgresql+psycopg")
+    return url.render_as_string(hide_password=False)
+
+
 class PgVector(VectorDb):
     """
     PgVector class for managing vector operations with PostgreSQL and pgvector.
@@ -60,6 +71,12 @@ class PgVector(VectorDb):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
+        async_pool_size: int = 10,
+        fusion: Optional[Union[FusionMethod, FusionFunction]] = None,
+        rrf_k: int = 60,
+        hybrid_candidate_multiplier: int = 4,
     ):
         """
         Initialize the PgVector instance.
@@ -80,6 +97,15 @@ class PgVector(VectorDb):
             content_language (str): Language for full-text search.
             schema_version (int): Version of the database schema.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
+            reranker (Optional[Reranker]): Reranker for the search results.
+            async_db_url (Optional[str]): Database URL for the async methods. Defaults to db_url with an async driver.
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async engine for the async methods.
+            async_pool_size (int): Connection pool size of the async engine created from the database URL.
+            fusion (Optional[Union[FusionMethod, FusionFunction]]): Fuse the rankings of separate vector and keyword
+                searches in hybrid search, instead of mixing their scores in a single query.
+            rrf_k (int): Rank offset of reciprocal rank fusion.
+            hybrid_candidate_multiplier (int): Multiplier of the limit giving the number of candidates per search
+                when fusing rankings.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -136,6 +162,10 @@ class PgVector(VectorDb):
         self.vector_score_weight: float = vector_score_weight
         # Content language for full-text search
         self.content_language: str = content_language
+        # Fusion of the vector and keyword rankings in hybrid search. None mixes the scores in a single query.
+        self.fusion: Optional[Union[FusionMethod, FusionFunction]] = fusion
+        self.rrf_k: int = rrf_k
+        self.hybrid_candidate_multiplier: int = hybrid_candidate_multiplier
 
         # Table schema version
         self.schema_version: int = schema_version
@@ -147,10 +177,61 @@ class PgVector(VectorDb):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+
+        # Async engine for the async methods. Created from the database URL on first use if not provided.
+        self.async_db_url: Optional[str] = async_db_url
+        self.async_db_engine: Optional[AsyncEngine] = async_db_engine
+        self.async_pool_size: int = async_pool_size
+        self._async_engine_unavailable: bool = False
+        # Async engine created from the database URL, and the event loop its pooled connections belong to
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_engine_loop: Optional["ReferenceType[asyncio.AbstractEventLoop]"] = None
         # Database table
         self.table: Table = self.get_table()
         log_debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
 
+    def _get_async_engine(self) -> Optional[AsyncEngine]:
+        """
+        Return the async engine for the running event loop. Engines created from the database URL belong to this
+        instance and are disposed by async_close().
+
+        Returns None if no async driver is installed, in which case async methods run in threads.
+        """
+        if self.async_db_engine is not None:
+            return self.async_db_engine
+        if self._async_engine_unavailable:
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            if self._async_engine is not None and (
+                self._async_engine_loop is None or self._async_engine_loop() is not loop
+            ):
+                # Pooled connections can only be used from the loop that opened them. Drop the pool of the
+                # previous loop without closing its connections, which can't be closed from this loop.
+                self._async_engine.sync_engine.dispose(close=False)
+                self._async_engine = None
+            if self._async_engine is None:
+                async_db_url = self.async_db_url or get_async_db_url(
+                    self.db_url or self.db_engine.url.render_as_string(hide_password=False)
+                )
+                self._async_engine = create_async_engine(
+                    async_db_url, pool_size=self.async_pool_size, pool_pre_ping=True
+                )
+                self._async_engine_loop = ref(loop)
+            return self._async_engine
+        except Exception as e:
+            logger.warning(f"Async engine not available, running async PgVector operations in threads: {e}")
+            self._async_engine_unavailable = True
+            return None
+
+    async def async_close(self) -> None:
+        """Dispose the async engine created from the database URL, closing its pooled connections."""
+        async_engine, self._async_engine = self._async_engine, None
+        self._async_engine_loop = None
+        if async_engine is not None:
+            await async_engine.dispose()
+
     def get_table_v1(self) -> Table:
         """
         Get the SQLAlchemy Table object for schema version 1.
@@ -344,52 +425,49 @@ class PgVector(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
         batch_size: int = 100,
     ) -> None:
-        """Insert documents asynchronously with parallel embedding."""
+        """Insert documents asynchronously with parallel embedding, writing each batch on the async engine."""
         try:
-            with self.Session() as sess:
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i : i + batch_size]
-                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
-                    try:
-                        # Embed all documents in the batch
-                        await self._async_embed_documents(batch_docs)
-
-                        # Prepare documents for insertion
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                cleaned_content = self._clean_content(doc.content)
-                                record_id = doc.id or content_hash
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": record_id,
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                    "content_id": doc.content_id,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
-
-                        # Insert the batch of records
-                        if batch_records:
-                            insert_stmt = postgresql.insert(self.table)
-                            sess.execute(insert_stmt, batch_records)
-                            sess.commit()  # Commit batch independently
-                            log_info(f"Inserted batch of {len(batch_records)} documents.")
-                    except Exception as e:
-                        logger.error(f"Error with batch starting at index {i}: {e}")
-                        sess.rollback()  # Rollback the current batch if there's an error
-                        raise
+            for i in range(0, len(documents), batch_size):
+                batch_docs = documents[i : i + batch_size]
+                log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                try:
+                    # Embed all documents in the batch
+                    await self._async_embed_documents(batch_docs)
+
+                    # Prepare documents for insertion
+                    batch_records = []
+                    for doc in batch_docs:
+                        try:
+                            cleaned_content = self._clean_content(doc.content)
+                            record_id = doc.id or content_hash
+
+                            meta_data = doc.meta_data or {}
+                            if filters:
+                                meta_data.update(filters)
+
+                            record = {
+                                "id": record_id,
+                                "name": doc.name,
+                                "meta_data": doc.meta_data,
+                                "filters": filters,
+                                "content": cleaned_content,
+                                "embedding": doc.embedding,
+                                "usage": doc.usage,
+                                "content_hash": content_hash,
+                                "content_id": doc.content_id,
+                            }
+                            batch_records.append(record)
+                        except Exception as e:
+                            logger.error(f"Error processing document '{doc.name}': {e}")
+
+                    # Insert the batch of records, committing each batch independently
+                    if batch_records:
+                        insert_stmt = postgresql.insert(self.table)
+                        await self._async_execute_write(insert_stmt, batch_records)
+                        log_info(f"Inserted batch of {len(batch_records)} documents.")
+                except Exception as e:
+                    logger.error(f"Error with batch starting at index {i}: {e}")
+                    raise
         except Exception as e:
             logger.error(f"Error inserting documents: {e}")
             raise
@@ -560,10 +638,10 @@ class PgVector(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
         batch_size: int = 100,
     ) -> None:
-        """Upsert documents asynchronously by running in a thread."""
+        """Upsert documents asynchronously, writing each batch on the async engine."""
         try:
-            if self.content_hash_exists(content_hash):
-                self._delete_by_content_hash(content_hash)
+            if await self._async_content_hash_exists(content_hash):
+                await self._async_delete_by_content_hash(content_hash)
             await self._async_upsert(content_hash, documents, filters, batch_size)
         except Exception as e:
             logger.error(f"Error upserting documents by content hash: {e}")
@@ -585,71 +663,119 @@ class PgVector(VectorDb):
             batch_size (int): Number of documents to upsert in each batch.
         """
         try:
-            with self.Session() as sess:
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i : i + batch_size]
-                    log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
-                    try:
-                        # Embed all documents in the batch
-                        await self._async_embed_documents(batch_docs)
+            for i in range(0, len(documents), batch_size):
+                batch_docs = documents[i : i + batch_size]
+                log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                try:
+                    # Embed all documents in the batch
+                    await self._async_embed_documents(batch_docs)
+
+                    # Prepare documents for upserting
+                    batch_records_dict = {}  # Use dict to deduplicate by ID
+                    for doc in batch_docs:
+                        try:
+                            cleaned_content = self._clean_content(doc.content)
+                            record_id = md5(cleaned_content.encode()).hexdigest()
+
+                            meta_data = doc.meta_data or {}
+                            if filters:
+                                meta_data.update(filters)
+
+                            record = {
+                                "id": record_id,  # use record_id as a reproducible id to avoid duplicates while upsert
+                                "name": doc.name,
+                                "meta_data": doc.meta_data,
+                                "filters": filters,
+                                "content": cleaned_content,
+                                "embedding": doc.embedding,
+                                "usage": doc.usage,
+                                "content_hash": content_hash,
+                                "content_id": doc.content_id,
+                            }
+                            batch_records_dict[record_id] = record  # This deduplicates by ID
+                        except Exception as e:
+                            logger.error(f"Error processing document '{doc.name}': {e}")
+
+                    # Convert dict to list for upsert
+                    batch_records = list(batch_records_dict.values())
+                    if not batch_records:
+                        log_info("No valid records to upsert in this batch.")
+                        continue
+
+                    # Upsert the batch of records, committing each batch independently
+                    insert_stmt = postgresql.insert(self.table).values(batch_records)
+                    upsert_stmt = insert_stmt.on_conflict_do_update(
+                        index_elements=["id"],
+                        set_={
+                            "name": insert_stmt.excluded.name,
+                            "meta_data": insert_stmt.excluded.meta_data,
+                            "filters": insert_stmt.excluded.filters,
+                            "content": insert_stmt.excluded.content,
+                            "embedding": insert_stmt.excluded.embedding,
+                            "usage": insert_stmt.excluded.usage,
+                            "content_hash": insert_stmt.excluded.content_hash,
+                            "content_id": insert_stmt.excluded.content_id,
+                        },
+                    )
+                    await self._async_execute_write(upsert_stmt)
+                    log_info(f"Upserted batch of {len(batch_records)} documents.")
+                except Exception as e:
+                    logger.error(f"Error with batch starting at index {i}: {e}")
+                    raise
+        except Exception as e:
+            logger.error(f"Error upserting documents: {e}")
+            raise
 
-                        # Prepare documents for upserting
-                        batch_records_dict = {}  # Use dict to deduplicate by ID
-                        for doc in batch_docs:
-                            try:
-                                cleaned_content = self._clean_content(doc.content)
-                                record_id = md5(cleaned_content.encode()).hexdigest()
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": record_id,  # use record_id as a reproducible id to avoid duplicates while upsert
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                    "content_id": doc.content_id,
-                                }
-                                batch_records_dict[record_id] = record  # This deduplicates by ID
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+    def _execute_write(self, stmt: Executable, records: Optional[List[Dict[str, Any]]] = None) -> None:
+        with self.Session() as sess:
+            try:
+                if records is None:
+                    sess.execute(stmt)
+                else:
+                    sess.execute(stmt, records)
+                sess.commit()
+            except Exception:
+                sess.rollback()
+                raise
 
-                        # Convert dict to list for upsert
-                        batch_records = list(batch_records_dict.values())
-                        if not batch_records:
-                            log_info("No valid records to upsert in this batch.")
-                            continue
+    async def _async_execute_write(self, stmt: Executable, records: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Execute a write in its own transaction on the async engine, or in a thread if there is no async driver"""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            await asyncio.to_thread(self._execute_write, stmt, records)
+            return
 
-                        # Upsert the batch of records
-                        insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={
-                                "name": insert_stmt.excluded.name,
-                                "meta_data": insert_stmt.excluded.meta_data,
-                                "filters": insert_stmt.excluded.filters,
-                                "content": insert_stmt.excluded.content,
-                                "embedding": insert_stmt.excluded.embedding,
-                                "usage": insert_stmt.excluded.usage,
-                                "content_hash": insert_stmt.excluded.content_hash,
-                                "content_id": insert_stmt.excluded.content_id,
-                            },
-                        )
-                        sess.execute(upsert_stmt)
-                        sess.commit()  # Commit batch independently
-                        log_info(f"Upserted batch of {len(batch_records)} documents.")
-                    except Exception as e:
-                        logger.error(f"Error with batch starting at index {i}: {e}")
-                        sess.rollback()  # Rollback the current batch if there's an error
-                        raise
+        async with async_engine.begin() as conn:
+            if records is None:
+                await conn.execute(stmt)
+            else:
+                await conn.execute(stmt, records)
+
+    async def _async_content_hash_exists(self, content_hash: str) -> bool:
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await asyncio.to_thread(self.content_hash_exists, content_hash)
+
+        try:
+            async with async_engine.connect() as conn:
+                stmt = select(1).where(self.table.c.content_hash == content_hash).limit(1)
+                result = await conn.execute(stmt)
+                return result.first() is not None
         except Exception as e:
-            logger.error(f"Error upserting documents: {e}")
-            raise
+            logger.error(f"Error checking if record exists: {e}")
+            return False
+
+    async def _async_delete_by_content_hash(self, content_hash: str) -> bool:
+        if self._get_async_engine() is None:
+            return await asyncio.to_thread(self._delete_by_content_hash, content_hash)
+
+        try:
+            await self._async_execute_write(self.table.delete().where(self.table.c.content_hash == content_hash))
+            log_info(f"Deleted records with content hash '{content_hash}' from table '{self.table.fullname}'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting rows from table '{self.table.fullname}': {e}")
+            return False
 
     def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
         """
@@ -705,8 +831,180 @@ class PgVector(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """
+        Perform a search based on the configured search type, using the async engine.
+
+        Runs the sync search in a thread if no async driver is available.
+        """
+        if self._get_async_engine() is None:
+            return await asyncio.to_thread(self.search, query, limit, filters)
+
+        if self.search_type == SearchType.vector:
+            return await self.async_vector_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.keyword:
+            return await self.async_keyword_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.hybrid:
+            return await self.async_hybrid_search(query=query, limit=limit, filters=filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+
+    def _get_search_columns(self) -> List[Column]:
+        return [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.embedding,
+            self.table.c.usage,
+        ]
+
+    def _get_index_settings_stmt(self) -> Optional[TextClause]:
+        """Return the statement setting the vector index search parameters for the current transaction"""
+        if isinstance(self.vector_index, Ivfflat):
+            return text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}")
+        elif isinstance(self.vector_index, HNSW):
+            return text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}")
+        return None
+
+    def _get_ts_query(self, query: str):
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        return func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+
+    def _get_vector_search_stmt(
+        self, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        """
+        Build the vector search statement.
+
+        All values are bound parameters, so the SQL is the same for every query and drivers can reuse the
+        prepared statement.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results based on the distance metric
+        if self.distance == Distance.l2:
+            stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
+        elif self.distance == Distance.cosine:
+            stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+        elif self.distance == Distance.max_inner_product:
+            stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def _get_keyword_search_stmt(
+        self, query: str, limit: int, filters: Optional[Dict[str, Any]] = None, matches_only: bool = False
+    ) -> Select:
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        # Build the text search vector
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        ts_query = self._get_ts_query(query)
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+
+        # Only return rows matching the query, so rows without keyword matches don't get a keyword rank
+        if matches_only:
+            stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order by the relevance rank
+        stmt = stmt.order_by(text_rank.desc())
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def _get_hybrid_search_stmt(
+        self, query: str, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        # Build the text search vector
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(ts_vector, self._get_ts_query(query))
+
+        # Compute the vector similarity score
+        if self.distance == Distance.l2:
+            # For L2 distance, smaller distances are better
+            vector_distance = self.table.c.embedding.l2_distance(query_embedding)
+            # Invert and normalize the distance to get a similarity score between 0 and 1
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.cosine:
+            # For cosine distance, smaller distances are better
+            vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.max_inner_product:
+            # For inner product, higher values are better
+            # Assume embeddings are normalized, so inner product ranges from -1 to 1
+            raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
+            # Normalize to range [0, 1]
+            vector_score = (raw_vector_score + 1) / 2
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Apply weights to control the influence of each score
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        # Combine the scores into a hybrid score
+        hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+
+        # Build the base statement, including the hybrid score
+        stmt = select(*self._get_search_columns(), hybrid_score.label("hybrid_score"))
+
+        # Add the full-text search condition
+        # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results by the hybrid score in descending order
+        stmt = stmt.order_by(desc("hybrid_score"))
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def _get_search_results(self, results: Sequence[Any]) -> List[Document]:
+        """Convert the result rows to Document objects"""
+        return [
+            Document(
+                id=result.id,
+                name=result.name,
+                meta_data=result.meta_data,
+                content=result.content,
+                embedder=self.embedder,
+                embedding=result.embedding,
+                usage=result.usage,
+            )
+            for result in results
+        ]
+
+    async def _async_fetch_search_results(self, stmt: Select, use_index_settings: bool = True) -> Sequence[Any]:
+        """Run a search statement on the async engine, in a transaction with the index search settings"""
+        async with self._get_async_engine().begin() as conn:  # type: ignore
+            index_settings_stmt = self._get_index_settings_stmt() if use_index_settings else None
+            if index_settings_stmt is not None:
+                await conn.execute(index_settings_stmt)
+            result = await conn.execute(stmt)
+            return result.fetchall()
 
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -727,48 +1025,19 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_vector_search_stmt(query_embedding, limit, filters)
+            if stmt is None:
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
             # Log the query for debugging
             log_debug(f"Vector search query: {stmt}")
 
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    index_settings_stmt = self._get_index_settings_stmt()
+                    if index_settings_stmt is not None:
+                        sess.execute(index_settings_stmt)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing semantic search: {e}")
@@ -777,19 +1046,40 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._get_search_results(results)
+
+            if self.reranker:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return []
+
+    async def async_vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Perform a vector similarity search on the async engine."""
+        try:
+            query_embedding = await self.embedder.async_get_embedding(query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
+
+            stmt = self._get_vector_search_stmt(query_embedding, limit, filters)
+            if stmt is None:
+                return []
+
+            try:
+                results = await self._async_fetch_search_results(stmt)
+            except Exception as e:
+                logger.error(f"Error performing semantic search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            search_results = self._get_search_results(results)
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -828,37 +1118,7 @@ class PgVector(VectorDb):
             List[Document]: List of matching documents.
         """
         try:
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order by the relevance rank
-            stmt = stmt.order_by(text_rank.desc())
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            stmt = self._get_keyword_search_stmt(query, limit, filters)
 
             # Log the query for debugging
             log_debug(f"Keyword search query: {stmt}")
@@ -874,19 +1134,30 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._get_search_results(results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during keyword search: {e}")
+            return []
+
+    async def async_keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Perform a keyword search on the 'content' column, on the async engine."""
+        try:
+            stmt = self._get_keyword_search_stmt(query, limit, filters)
+
+            try:
+                results = await self._async_fetch_search_results(stmt, use_index_settings=False)
+            except Exception as e:
+                logger.error(f"Error performing keyword search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            search_results = self._get_search_results(results)
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -918,99 +1189,63 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            if self.fusion is not None:
+                return self._fused_hybrid_search(query, query_embedding, limit, filters)
+
+            stmt = self._get_hybrid_search_stmt(query, query_embedding, limit, filters)
+            if stmt is None:
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+            # Log the query for debugging
+            log_debug(f"Hybrid search query: {stmt}")
 
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+            # Execute the query
+            try:
+                with self.Session() as sess, sess.begin():
+                    index_settings_stmt = self._get_index_settings_stmt()
+                    if index_settings_stmt is not None:
+                        sess.execute(index_settings_stmt)
+                    results = sess.execute(stmt).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing hybrid search: {e}")
+                return []
 
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
+            # Process the results and convert to Document objects
+            search_results = self._get_search_results(results)
 
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+            if self.reranker:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
 
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during hybrid search: {e}")
+            return []
 
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
+    async def async_hybrid_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Perform a hybrid search combining vector similarity and full-text search, on the async engine."""
+        try:
+            query_embedding = await self.embedder.async_get_embedding(query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            if self.fusion is not None:
+                return await self._async_fused_hybrid_search(query, query_embedding, limit, filters)
 
-            # Log the query for debugging
-            log_debug(f"Hybrid search query: {stmt}")
+            stmt = self._get_hybrid_search_stmt(query, query_embedding, limit, filters)
+            if stmt is None:
+                return []
 
-            # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
-                    results = sess.execute(stmt).fetchall()
+                results = await self._async_fetch_search_results(stmt)
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
                 return []
 
-            # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._get_search_results(results)
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -1021,6 +1256,72 @@ class PgVector(VectorDb):
             logger.error(f"Error during hybrid search: {e}")
             return []
 
+    def _fuse_hybrid_results(
+        self, query: str, vector_results: Sequence[Any], keyword_results: Sequence[Any], limit: int
+    ) -> List[Document]:
+        """Fuse the rankings of the vector and keyword searches, then rerank"""
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        search_results = fuse_results(
+            results={
+                "vector": self._get_search_results(vector_results),
+                "keyword": self._get_search_results(keyword_results),
+            },
+            method=self.fusion,  # type: ignore
+            weights={"vector": self.vector_score_weight, "keyword": 1 - self.vector_score_weight},
+            rrf_k=self.rrf_k,
+            limit=limit,
+        )
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def _fused_hybrid_search(
+        self, query: str, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        num_candidates = limit * self.hybrid_candidate_multiplier
+        vector_stmt = self._get_vector_search_stmt(query_embedding, num_candidates, filters)
+        if vector_stmt is None:
+            return []
+        keyword_stmt = self._get_keyword_search_stmt(query, num_candidates, filters, matches_only=True)
+
+        try:
+            with self.Session() as sess, sess.begin():
+                index_settings_stmt = self._get_index_settings_stmt()
+                if index_settings_stmt is not None:
+                    sess.execute(index_settings_stmt)
+                vector_results = sess.execute(vector_stmt).fetchall()
+                keyword_results = sess.execute(keyword_stmt).fetchall()
+        except Exception as e:
+            logger.error(f"Error performing hybrid search: {e}")
+            return []
+
+        return self._fuse_hybrid_results(query, vector_results, keyword_results, limit)
+
+    async def _async_fused_hybrid_search(
+        self, query: str, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        num_candidates = limit * self.hybrid_candidate_multiplier
+        vector_stmt = self._get_vector_search_stmt(query_embedding, num_candidates, filters)
+        if vector_stmt is None:
+            return []
+        keyword_stmt = self._get_keyword_search_stmt(query, num_candidates, filters, matches_only=True)
+
+        try:
+            # Run both searches at the same time, on separate connections
+            vector_results, keyword_results = await asyncio.gather(
+                self._async_fetch_search_results(vector_stmt),
+                self._async_fetch_search_results(keyword_stmt, use_index_settings=False),
+            )
+        except Exception as e:
+            logger.error(f"Error performing hybrid search: {e}")
+            return []
+
+        return self._fuse_hybrid_results(query, vector_results, keyword_results, limit)
+
     def drop(self) -> None:
         """
         Drop the table from the database.
@@ -1389,7 +1690,7 @@ class PgVector(VectorDb):
             if k in {"metadata", "table"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session", "embedder"}:
+            elif k in {"db_engine", "Session", "embedder", "async_db_engine", "_async_engine", "_async_engine_loop"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -62,12 +62,6 @@ from agno.utils.log import (
     set_log_level_to_info,
     use_workflow_logger,
 )
-from agno.utils.print_response.workflow import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.workflow.condition import Condition
 from agno.workflow.loop import Loop
 from agno.workflow.parallel import Parallel
@@ -2850,6 +2844,8 @@ class Workflow:
                 else (self.stream_intermediate_steps or self.stream_events)
             )
 
+        from agno.utils.print_response.workflow import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 workflow=self,
@@ -2940,6 +2936,8 @@ class Workflow:
                 else (self.stream_intermediate_steps or self.stream_events)
             )
 
+        from agno.utils.print_response.workflow import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 workflow=self,
@@ -0,0 +1,480 @@
+"""Benchmark cases covering the agent, team and workflow hot paths.
+
+Every case is registered with `@benchmark` and receives a `BenchmarkContext`. It returns the callable to time,
+which can be sync or async. Anything done before returning the callable is setup and is not measured.
+"""
+
+import importlib.util
+from dataclasses import dataclass, field
+from time import time
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from agno.models.message import Message
+from agno.run.agent import RunInput, RunOutput
+from agno.run.base import RunStatus
+from agno.session import AgentSession
+from tests.benchmarks.stubs import StubEmbedder, StubModel
+
+
+@dataclass
+class BenchmarkContext:
+    # Directory for files created by the benchmark (sqlite, json, vector stores)
+    tmp_dir: str
+    # Number of content chunks streamed by the stub model
+    stream_tokens: int = 256
+    # Number of runs stored in sessions used as history
+    history_runs: int = 50
+    # Number of team members / parallel workflow steps
+    fan_out: int = 4
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[BenchmarkContext], Callable[[], Any]]
+    description: Optional[str] = None
+    is_async: bool = False
+    # Optional modules needed by the benchmark, the benchmark is skipped if any is missing
+    requires: List[str] = field(default_factory=list)
+    # Also measure the memory held by the object returned by the benchmark callable
+    measure_memory: bool = False
+
+    def is_available(self) -> bool:
+        return all(importlib.util.find_spec(module) is not None for module in self.requires)
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, is_async: bool = False, requires: Optional[List[str]] = None, measure_memory: bool = False):
+    """Register a benchmark case."""
+
+    def decorator(setup: Callable[[BenchmarkContext], Callable[[], Any]]):
+        BENCHMARKS[name] = Benchmark(
+            name=name,
+            setup=setup,
+            description=(setup.__doc__ or "").strip() or None,
+            is_async=is_async,
+            requires=requires or [],
+            measure_memory=measure_memory,
+        )
+        return setup
+
+    return decorator
+
+
+# -*- Helpers -*-
+
+
+def get_weather(city: str, unit: str = "celsius") -> str:
+    """Get the current weather for a city.
+
+    Args:
+        city (str): Name of the city.
+        unit (str): Temperature unit, either celsius or fahrenheit.
+    """
+    return f"It is 21 degrees {unit} in {city}."
+
+
+def add_numbers(a: int, b: int) -> int:
+    """Add two numbers.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+    """
+    return a + b
+
+
+def search_catalog(query: str, limit: int = 10, in_stock_only: bool = False) -> List[str]:
+    """Search the product catalog.
+
+    Args:
+        query (str): Search terms.
+        limit (int): Maximum number of results.
+        in_stock_only (bool): Only return products that are in stock.
+    """
+    return [f"{query}-{i}" for i in range(limit)]
+
+
+TOOLS = [get_weather, add_numbers, search_catalog]
+
+
+def build_session(
+    agent_id: str, num_runs: int, session_id: Optional[str] = None, with_tool_calls: bool = False
+) -> AgentSession:
+    """
+    Build an agent session holding `num_runs` completed user/assistant runs.
+    With `with_tool_calls`, every run also has a system message, a tool call and message metrics.
+    """
+    session_id = session_id or str(uuid4())
+    runs = []
+    for i in range(num_runs):
+        messages = [
+            Message(role="user", content=f"Question number {i}?"),
+            Message(role="assistant", content=f"Answer number {i}. " * 10),
+        ]
+        if with_tool_calls:
+            tool_call = {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": "get_weather", "arguments": '{"city": "Paris"}'},
+            }
+            messages[1:1] = [
+                Message(role="assistant", tool_calls=[tool_call]),
+                Message(
+                    role="tool",
+                    tool_call_id=f"call_{i}",
+                    tool_name="get_weather",
+                    tool_args={"city": "Paris"},
+                    content=get_weather("Paris"),
+                ),
+            ]
+            messages.insert(0, Message(role="system", content="You are a helpful assistant. Be concise."))
+            for message in messages:
+                message.metrics.input_tokens = 120
+                message.metrics.output_tokens = 40
+        runs.append(
+            RunOutput(
+                run_id=str(uuid4()),
+                agent_id=agent_id,
+                session_id=session_id,
+                content=f"Answer number {i}. " * 10,
+                input=RunInput(input_content=f"Question number {i}?"),
+                messages=messages,
+                status=RunStatus.completed,
+            )
+        )
+    return AgentSession(session_id=session_id, agent_id=agent_id, runs=runs, created_at=int(time()))
+
+
+def build_agent(**kwargs: Any):
+    from agno.agent import Agent
+
+    kwargs.setdefault("model", StubModel())
+    kwargs.setdefault("telemetry", False)
+    return Agent(**kwargs)
+
+
+# -*- Agent -*-
+
+
+@benchmark("agent_instantiation")
+def agent_instantiation(ctx: BenchmarkContext):
+    """Create an Agent with a model and tools."""
+    from agno.agent import Agent
+
+    model = StubModel()
+
+    def run():
+        return Agent(model=model, instructions=["Be concise."], tools=TOOLS, telemetry=False)
+
+    return run
+
+
+@benchmark("agent_system_message")
+def agent_system_message(ctx: BenchmarkContext):
+    """Build the default system message for an agent with instructions, tools and datetime."""
+    agent = build_agent(
+        id="bench-agent",
+        description="A benchmark agent.",
+        instructions=["Be concise.", "Cite your sources.", "Use tools when needed."],
+        expected_output="A short answer.",
+        add_datetime_to_context=True,
+        markdown=True,
+        tools=TOOLS,
+    )
+    agent.initialize_agent()
+    session = AgentSession(session_id=str(uuid4()), agent_id=agent.id)
+
+    def run():
+        return agent.get_system_message(session=session, session_state={})
+
+    return run
+
+
+@benchmark("agent_run_messages")
+def agent_run_messages(ctx: BenchmarkContext):
+    """Assemble run messages (system message, history and user message) from a session with history."""
+    agent = build_agent(
+        id="bench-agent",
+        instructions=["Be concise."],
+        add_history_to_context=True,
+        num_history_runs=3,
+        tools=TOOLS,
+    )
+    agent.initialize_agent()
+    session = build_session(agent_id="bench-agent", num_runs=ctx.history_runs)
+
+    def run():
+        run_response = RunOutput(run_id=str(uuid4()), agent_id=agent.id, session_id=session.session_id)
+        return agent._get_run_messages(
+            run_response=run_response,
+            input="What is the weather in Paris?",
+            session=session,
+            session_state={},
+        )
+
+    return run
+
+
+@benchmark("agent_tool_preparation")
+def agent_tool_preparation(ctx: BenchmarkContext):
+    """Rebuild the tool definitions and function map sent to the model."""
+    agent = build_agent(id="bench-agent", tools=TOOLS)
+    agent.initialize_agent()
+    session = AgentSession(session_id=str(uuid4()), agent_id=agent.id)
+
+    def run():
+        agent._rebuild_tools = True
+        run_response = RunOutput(run_id=str(uuid4()), agent_id=agent.id, session_id=session.session_id)
+        agent._determine_tools_for_model(
+            model=agent.model,  # type: ignore
+            run_response=run_response,
+            session=session,
+            session_state={},
+        )
+        return agent._tools_for_model
+
+    return run
+
+
+@benchmark("agent_run")
+def agent_run(ctx: BenchmarkContext):
+    """Complete a non-streaming agent run without a database."""
+    agent = build_agent(instructions=["Be concise."])
+
+    def run():
+        return agent.run("What is the capital of France?")
+
+    return run
+
+
+@benchmark("agent_run_with_tool_call")
+def agent_run_with_tool_call(ctx: BenchmarkContext):
+    """Complete an agent run where the model calls a tool once before answering."""
+    agent = build_agent(
+        model=StubModel(tool_calls=[("get_weather", {"city": "Paris"})]),
+        tools=TOOLS,
+    )
+
+    def run():
+        return agent.run("What is the weather in Paris?")
+
+    return run
+
+
+@benchmark("agent_run_stream")
+def agent_run_stream(ctx: BenchmarkContext):
+    """Consume a streaming agent run emitting `stream_tokens` content chunks, with events enabled."""
+    agent = build_agent(model=StubModel(stream_chunks=ctx.stream_tokens, reply="token " * ctx.stream_tokens))
+
+    def run():
+        for _ in agent.run("Tell me a story.", stream=True, stream_events=True):
+            pass
+
+    return run
+
+
+@benchmark("agent_arun_stream", is_async=True)
+def agent_arun_stream(ctx: BenchmarkContext):
+    """Consume an async streaming agent run emitting `stream_tokens` content chunks."""
+    agent = build_agent(model=StubModel(stream_chunks=ctx.stream_tokens, reply="token " * ctx.stream_tokens))
+
+    async def run():
+        async for _ in agent.arun("Tell me a story.", stream=True):
+            pass
+
+    return run
+
+
+# -*- Sessions -*-
+
+
+def _session_read_upsert(db: Any, ctx: BenchmarkContext):
+    from agno.db.base import SessionType
+
+    session = build_session(agent_id="bench-agent", num_runs=ctx.history_runs)
+    db.upsert_session(session)
+
+    def run():
+        loaded = db.get_session(session_id=session.session_id, session_type=SessionType.AGENT)
+        return db.upsert_session(loaded)
+
+    return run
+
+
+@benchmark("session_read_upsert_in_memory")
+def session_read_upsert_in_memory(ctx: BenchmarkContext):
+    """Read and upsert a session with `history_runs` runs using InMemoryDb."""
+    from agno.db.in_memory import InMemoryDb
+
+    return _session_read_upsert(InMemoryDb(), ctx)
+
+
+@benchmark("session_read_upsert_json")
+def session_read_upsert_json(ctx: BenchmarkContext):
+    """Read and upsert a session with `history_runs` runs using JsonDb."""
+    from agno.db.json import JsonDb
+
+    return _session_read_upsert(JsonDb(db_path=f"{ctx.tmp_dir}/json_db"), ctx)
+
+
+@benchmark("session_read_upsert_sqlite", requires=["sqlalchemy"])
+def session_read_upsert_sqlite(ctx: BenchmarkContext):
+    """Read and upsert a session with `history_runs` runs using SqliteDb."""
+    from agno.db.sqlite import SqliteDb
+
+    return _session_read_upsert(SqliteDb(db_file=f"{ctx.tmp_dir}/bench.db"), ctx)
+
+
+@benchmark("session_load_500_runs", measure_memory=True)
+def session_load_500_runs(ctx: BenchmarkContext):
+    """Deserialize a stored session with 500 runs with tool calls, as done on every session read."""
+    import json
+
+    serialized = json.dumps(build_session(agent_id="bench-agent", num_runs=500, with_tool_calls=True).to_dict())
+
+    def run():
+        return AgentSession.from_dict(json.loads(serialized))
+
+    return run
+
+
+@benchmark("session_history_500_runs")
+def session_history_500_runs(ctx: BenchmarkContext):
+    """Get the messages of the last 3 runs and the last 3 tool calls of a session with 500 runs."""
+    session = build_session(agent_id="bench-agent", num_runs=500, with_tool_calls=True)
+
+    def run():
+        session.get_messages_from_last_n_runs(agent_id="bench-agent", last_n=3)
+        return session.get_tool_calls(num_calls=3)
+
+    return run
+
+
+@benchmark("agent_run_with_sqlite_history", requires=["sqlalchemy"])
+def agent_run_with_sqlite_history(ctx: BenchmarkContext):
+    """Complete an agent run that reads history from and writes the session to SqliteDb."""
+    from agno.db.sqlite import SqliteDb
+
+    db = SqliteDb(db_file=f"{ctx.tmp_dir}/bench_history.db")
+    agent = build_agent(id="bench-agent", db=db, add_history_to_context=True, num_history_runs=3)
+    session = build_session(agent_id="bench-agent", num_runs=ctx.history_runs)
+    db.upsert_session(session)
+
+    def run():
+        return agent.run("And what about tomorrow?", session_id=session.session_id)
+
+    return run
+
+
+# -*- Teams -*-
+
+
+@benchmark("team_delegation_fan_out", is_async=True)
+def team_delegation_fan_out(ctx: BenchmarkContext):
+    """Delegate a task to all `fan_out` team members and collect their responses."""
+    from agno.team import Team
+
+    members = [build_agent(name=f"Member {i}", role=f"Member number {i}") for i in range(ctx.fan_out)]
+    team = Team(
+        members=members,
+        model=StubModel(tool_calls=[("delegate_task_to_members", {"task": "Summarize the report."})]),
+        delegate_task_to_all_members=True,
+        telemetry=False,
+    )
+
+    async def run():
+        return await team.arun("Summarize the report.")
+
+    return run
+
+
+# -*- Workflows -*-
+
+
+@benchmark("workflow_parallel", is_async=True)
+def workflow_parallel(ctx: BenchmarkContext):
+    """Run a workflow with `fan_out` agent steps in a Parallel block followed by a summary step."""
+    from agno.workflow import Parallel, Step, Workflow
+
+    steps = [Step(name=f"step_{i}", agent=build_agent(name=f"Agent {i}")) for i in range(ctx.fan_out)]
+    workflow = Workflow(
+        name="Parallel Benchmark",
+        steps=[Parallel(*steps, name="parallel"), Step(name="summary", agent=build_agent(name="Summary"))],
+        telemetry=False,
+    )
+
+    async def run():
+        return await workflow.arun("Research the topic.")
+
+    return run
+
+
+@benchmark("workflow_loop", is_async=True)
+def workflow_loop(ctx: BenchmarkContext):
+    """Run a workflow with a Loop of two agent steps over three iterations."""
+    from agno.workflow import Loop, Step, Workflow
+
+    workflow = Workflow(
+        name="Loop Benchmark",
+        steps=[
+            Loop(
+                steps=[
+                    Step(name="draft", agent=build_agent(name="Drafter")),
+                    Step(name="review", agent=build_agent(name="Reviewer")),
+                ],
+                name="loop",
+                max_iterations=3,
+            )
+        ],
+        telemetry=False,
+    )
+
+    async def run():
+        return await workflow.arun("Write an essay.")
+
+    return run
+
+
+# -*- Guardrails -*-
+
+
+@benchmark("guardrails_long_input")
+def guardrails_long_input(ctx: BenchmarkContext):
+    """Check a 100 KB input without PII or prompt injection with the PII and prompt injection guardrails."""
+    from agno.guardrails import PIIDetectionGuardrail, PromptInjectionGuardrail
+
+    guardrails = [PIIDetectionGuardrail(), PromptInjectionGuardrail()]
+    run_input = RunInput(input_content=" ".join(f"The weather in city {i} is sunny today." for i in range(2500)))
+
+    def run():
+        for guardrail in guardrails:
+            guardrail.check(run_input)
+
+    return run
+
+
+# -*- Knowledge -*-
+
+
+@benchmark("knowledge_search_lancedb", requires=["lancedb"])
+def knowledge_search_lancedb(ctx: BenchmarkContext):
+    """Search a local LanceDb table of 500 documents through Knowledge."""
+    from agno.knowledge.document import Document
+    from agno.knowledge.knowledge import Knowledge
+    from agno.vectordb.lancedb import LanceDb
+
+    vector_db = LanceDb(uri=f"{ctx.tmp_dir}/lancedb", table_name="bench", embedder=StubEmbedder())
+    knowledge = Knowledge(vector_db=vector_db)
+    documents = [
+        Document(name=f"doc_{i}", content=f"Document {i} talks about topic {i % 25} in detail.") for i in range(500)
+    ]
+    vector_db.insert(content_hash="bench", documents=documents)
+
+    def run():
+        return knowledge.search("What is topic 7 about?", max_results=5)
+
+    return run
@@ -0,0 +1,284 @@
+"""Run the framework overhead benchmarks and compare results between commits.
+
+Usage (from libs/agno):
+    python -m tests.benchmarks.run --output results.json
+    python -m tests.benchmarks.run --only agent_run,agent_run_stream --iterations 200
+    python -m tests.benchmarks.run --output head.json --compare base.json --threshold 0.15
+
+Results are written as JSON. With `--compare`, the median of every benchmark is compared against the baseline file
+and the process exits with status 1 when any benchmark is slower than `threshold` (a fraction, 0.15 = 15%).
+Benchmarks registered with `measure_memory` also report the memory retained by their result and the RSS growth.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from agno.eval.performance import PerformanceResult
+from agno.utils.log import set_log_level_to_info
+from tests.benchmarks.cases import BENCHMARKS, Benchmark, BenchmarkContext
+
+RESULTS_SCHEMA_VERSION = 1
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def _agno_version() -> Optional[str]:
+    try:
+        from importlib.metadata import version
+
+        return version("agno")
+    except Exception:
+        return None
+
+
+def _get_rss() -> Optional[int]:
+    """Resident set size of the process in bytes, where available"""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def measure_memory(func: Any) -> Dict[str, Any]:
+    """Measure the memory held by the result of one call of a sync benchmark callable"""
+    gc.collect()
+    rss_before = _get_rss()
+    result = func()
+    gc.collect()
+    rss_after = _get_rss()
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    memory: Dict[str, Any] = {"retained_mb": retained / 1024 / 1024, "peak_mb": peak / 1024 / 1024}
+    if rss_before is not None and rss_after is not None:
+        memory["rss_delta_mb"] = (rss_after - rss_before) / 1024 / 1024
+    return memory
+
+
+def run_benchmark(bench: Benchmark, ctx: BenchmarkContext, iterations: int, warmup: int) -> Dict[str, Any]:
+    """Time `iterations` calls of the benchmark callable after `warmup` untimed calls."""
+    func = bench.setup(ctx)
+    run_times: List[float] = []
+
+    if bench.is_async:
+        loop = asyncio.new_event_loop()
+        try:
+            for _ in range(warmup):
+                loop.run_until_complete(func())
+            gc.collect()
+            for _ in range(iterations):
+                start = perf_counter()
+                loop.run_until_complete(func())
+                run_times.append(perf_counter() - start)
+        finally:
+            loop.close()
+    else:
+        for _ in range(warmup):
+            func()
+        gc.collect()
+        for _ in range(iterations):
+            start = perf_counter()
+            func()
+            run_times.append(perf_counter() - start)
+
+    result = PerformanceResult(run_times=run_times)
+    bench_result: Dict[str, Any] = {
+        "iterations": iterations,
+        "mean": result.avg_run_time,
+        "median": result.median_run_time,
+        "min": result.min_run_time,
+        "max": result.max_run_time,
+        "std_dev": result.std_dev_run_time,
+        "p95": result.p95_run_time,
+    }
+    if bench.measure_memory and not bench.is_async:
+        bench_result["memory"] = measure_memory(func)
+    return bench_result
+
+
+def run_benchmarks(
+    names: Optional[List[str]] = None,
+    iterations: int = 50,
+    warmup: int = 5,
+    stream_tokens: int = 256,
+    history_runs: int = 50,
+    fan_out: int = 4,
+) -> Dict[str, Any]:
+    """Run the selected benchmarks (all by default) and return the results document."""
+    selected = names or list(BENCHMARKS.keys())
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    results: Dict[str, Any] = {}
+    skipped: Dict[str, str] = {}
+    with tempfile.TemporaryDirectory(prefix="agno_bench_") as tmp_dir:
+        ctx = BenchmarkContext(tmp_dir=tmp_dir, stream_tokens=stream_tokens, history_runs=history_runs, fan_out=fan_out)
+        for name in selected:
+            bench = BENCHMARKS[name]
+            if not bench.is_available():
+                skipped[name] = f"missing dependencies: {', '.join(bench.requires)}"
+                continue
+            results[name] = run_benchmark(bench, ctx, iterations=iterations, warmup=warmup)
+            # Benchmarks may change the log level through agent debug settings
+            set_log_level_to_info()
+
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "metadata": {
+            "commit": _git_commit(),
+            "agno_version": _agno_version(),
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "parameters": {
+                "iterations": iterations,
+                "warmup": warmup,
+                "stream_tokens": stream_tokens,
+                "history_runs": history_runs,
+                "fan_out": fan_out,
+            },
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Compare the median of each benchmark present in both result documents."""
+    comparisons = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or not base.get("median"):
+            continue
+        change = (result["median"] - base["median"]) / base["median"]
+        comparisons.append(
+            {
+                "name": name,
+                "baseline_median": base["median"],
+                "current_median": result["median"],
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return comparisons
+
+
+def print_results(document: Dict[str, Any], comparisons: Optional[List[Dict[str, Any]]] = None) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    by_name = {c["name"]: c for c in comparisons or []}
+    table = Table(title="Framework Overhead Benchmarks", show_header=True, header_style="bold magenta")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Median (ms)", style="green", justify="right")
+    table.add_column("p95 (ms)", style="green", justify="right")
+    table.add_column("Std Dev (ms)", style="yellow", justify="right")
+    show_memory = any("memory" in result for result in document["results"].values())
+    if show_memory:
+        table.add_column("Retained (MB)", style="blue", justify="right")
+        table.add_column("RSS delta (MB)", style="blue", justify="right")
+    if comparisons is not None:
+        table.add_column("vs. baseline", justify="right")
+
+    for name, result in document["results"].items():
+        row = [name, f"{result['median'] * 1000:.3f}", f"{result['p95'] * 1000:.3f}", f"{result['std_dev'] * 1000:.3f}"]
+        if show_memory:
+            memory = result.get("memory", {})
+            row.append(f"{memory['retained_mb']:.2f}" if "retained_mb" in memory else "-")
+            row.append(f"{memory['rss_delta_mb']:.2f}" if "rss_delta_mb" in memory else "-")
+        if comparisons is not None:
+            comparison = by_name.get(name)
+            if comparison is None:
+                row.append("-")
+            else:
+                style = "red" if comparison["regression"] else "green"
+                row.append(f"[{style}]{comparison['change'] * 100:+.1f}%[/{style}]")
+        table.add_row(*row)
+
+    console = Console()
+    console.print(table)
+    for name, reason in document["skipped"].items():
+        console.print(f"[dim]Skipped {name}: {reason}[/dim]")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark agno framework overhead with a stub model.")
+    parser.add_argument("--only", help="Comma separated list of benchmarks to run.")
+    parser.add_argument("--list", action="store_true", help="List the available benchmarks and exit.")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--stream-tokens", type=int, default=256)
+    parser.add_argument("--history-runs", type=int, default=50)
+    parser.add_argument("--fan-out", type=int, default=4)
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", help="Baseline results JSON file to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed median slowdown before failing.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, bench in BENCHMARKS.items():
+            print(f"{name}: {bench.description or ''}")
+        return 0
+
+    document = run_benchmarks(
+        names=args.only.split(",") if args.only else None,
+        iterations=args.iterations,
+        warmup=args.warmup,
+        stream_tokens=args.stream_tokens,
+        history_runs=args.history_runs,
+        fan_out=args.fan_out,
+    )
+
+    comparisons = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        comparisons = compare_results(document, baseline, threshold=args.threshold)
+        document["comparison"] = {"baseline_commit": baseline.get("metadata", {}).get("commit"), "results": comparisons}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+
+    print_results(document, comparisons)
+
+    if comparisons and any(c["regression"] for c in comparisons):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
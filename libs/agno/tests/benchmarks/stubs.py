@@ -0,0 +1,130 @@
+"""Deterministic stand-ins for model providers and embedders.
+
+These stubs never touch the network, so benchmark timings only reflect the framework code paths.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from agno.knowledge.embedder.base import Embedder
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class StubModel(Model):
+    """A model that answers instantly with a fixed reply.
+
+    If `tool_calls` is set and tools are available for the request, the first turn of every run calls those
+    tools. Once the tool results are in the message list, the model answers with `reply`.
+    """
+
+    id: str = "stub-model"
+    name: str = "StubModel"
+    provider: str = "Stub"
+
+    # Content returned by the model
+    reply: str = "This is a stubbed response."
+    # Number of content chunks emitted when streaming
+    stream_chunks: int = 32
+    # Tool calls issued on the first turn, as (tool_name, arguments) pairs
+    tool_calls: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+
+    def _should_call_tools(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]) -> bool:
+        if not self.tool_calls or not tools:
+            return False
+        return len(messages) == 0 or messages[-1].role != self.tool_message_role
+
+    def _tool_calls_payload(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(arguments)},
+            }
+            for i, (name, arguments) in enumerate(self.tool_calls)
+        ]
+
+    def _usage(self, messages: List[Message]) -> Metrics:
+        input_tokens = sum(len(str(m.content or "")) // 4 for m in messages)
+        output_tokens = len(self.reply) // 4
+        return Metrics(
+            input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens
+        )
+
+    def _response(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]) -> ModelResponse:
+        if self._should_call_tools(messages, tools):
+            return ModelResponse(
+                role=self.assistant_message_role,
+                tool_calls=self._tool_calls_payload(),
+                response_usage=self._usage(messages),
+            )
+        return ModelResponse(role=self.assistant_message_role, content=self.reply, response_usage=self._usage(messages))
+
+    def _response_stream(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]
+    ) -> Iterator[ModelResponse]:
+        if self._should_call_tools(messages, tools):
+            yield ModelResponse(role=self.assistant_message_role, tool_calls=self._tool_calls_payload())
+            yield ModelResponse(response_usage=self._usage(messages))
+            return
+
+        chunk_size = max(1, len(self.reply) // max(1, self.stream_chunks))
+        chunks = [self.reply[i : i + chunk_size] for i in range(0, len(self.reply), chunk_size)]
+        # Pad the stream so exactly `stream_chunks` content deltas are emitted
+        chunks.extend([""] * max(0, self.stream_chunks - len(chunks)))
+        for chunk in chunks[: self.stream_chunks]:
+            yield ModelResponse(role=self.assistant_message_role, content=chunk or " ")
+        yield ModelResponse(response_usage=self._usage(messages))
+
+    def invoke(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs) -> ModelResponse:
+        return self._response(messages, tools)
+
+    async def ainvoke(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs
+    ) -> ModelResponse:
+        return self._response(messages, tools)
+
+    def invoke_stream(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs
+    ) -> Iterator[ModelResponse]:
+        yield from self._response_stream(messages, tools)
+
+    async def ainvoke_stream(  # type: ignore[override]
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs
+    ) -> AsyncIterator[ModelResponse]:
+        for response in self._response_stream(messages, tools):
+            yield response
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+@dataclass
+class StubEmbedder(Embedder):
+    """Hash-based embedder producing stable vectors without loading a model."""
+
+    dimensions: Optional[int] = 64
+
+    def get_embedding(self, text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        dimensions = self.dimensions or 64
+        values = [digest[i % len(digest)] / 255.0 for i in range(dimensions)]
+        norm = sum(v * v for v in values) ** 0.5 or 1.0
+        return [v / norm for v in values]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
@@ -0,0 +1,244 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+from agno.agent.agent import Agent
+from agno.agent.cache import SCOPE_KEY, SemanticCache, normalize_query
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.knowledge import Knowledge
+from agno.run.agent import RunEvent, RunOutput
+from agno.vectordb.base import VectorDb
+from tests.unit.stubs import FakeModel
+
+
+@dataclass
+class WordEmbedder(Embedder):
+    """Deterministic bag-of-words embedder"""
+
+    dimensions: Optional[int] = 64
+    num_calls: int = 0
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.num_calls += 1
+        embedding = [0.0] * (self.dimensions or 64)
+        for word in text.split():
+            embedding[sum(ord(c) for c in word) % len(embedding)] += 1.0
+        return embedding
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+
+class InMemoryVectorDb(VectorDb):
+    def __init__(self, embedder: Embedder):
+        super().__init__()
+        self.embedder = embedder
+        self.documents: Dict[str, Document] = {}
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return content_hash in self.documents
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.documents[content_hash] = documents[0]
+
+    async def async_insert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    async def async_upsert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        # Embed the query like a vector db would, the matches only depend on the filters
+        self.embedder.get_embedding(query)
+        matches = [
+            document
+            for document in self.documents.values()
+            if all((document.meta_data or {}).get(key) == value for key, value in (filters or {}).items())
+        ]
+        return matches[:limit]
+
+    async def async_search(self, query: str, limit: int = 5, filters=None) -> List[Document]:
+        return self.search(query, limit, filters)
+
+    def drop(self) -> None:
+        self.documents.clear()
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        self.drop()
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return False
+
+    def delete_by_name(self, name: str) -> bool:
+        return False
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        return False
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        pass
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return False
+
+    def get_supported_search_types(self) -> List[str]:
+        return ["vector"]
+
+
+def get_semantic_cache(**kwargs) -> SemanticCache:
+    return SemanticCache(vector_db=InMemoryVectorDb(embedder=WordEmbedder()), **kwargs)
+
+
+def test_normalize_query():
+    assert normalize_query("  What is the   capital of France?! ") == "what is the capital of france"
+
+
+def test_similar_query_hits_within_scope():
+    semantic_cache = get_semantic_cache()
+    semantic_cache.store("What is the capital of France?", RunOutput(run_id="run-1", content="Paris"), "scope-a")
+
+    hit = semantic_cache.lookup("what is the capital of france", "scope-a")
+    assert hit is not None
+    assert hit.run_output["content"] == "Paris"
+    assert hit.run_output["run_id"] == "run-1"
+
+    assert semantic_cache.lookup("How tall is Mount Everest?", "scope-a") is None
+    # Entries are not shared between scopes
+    assert semantic_cache.lookup("What is the capital of France?", "scope-b") is None
+    assert all(doc.meta_data[SCOPE_KEY] == "scope-a" for doc in semantic_cache.vector_db.documents.values())  # type: ignore
+
+
+def test_lookup_embeds_the_query_once():
+    semantic_cache = get_semantic_cache()
+    semantic_cache.store("What is the capital of France?", RunOutput(run_id="run-1", content="Paris"), "scope")
+    embedder = semantic_cache.embedder
+    embedder.num_calls = 0  # type: ignore
+
+    assert semantic_cache.lookup("What is the capital of France?", "scope") is not None
+    assert asyncio.run(semantic_cache.alookup("What is the capital of France?", "scope")) is not None
+    assert embedder.num_calls == 2  # type: ignore
+    # The vector db of the cache is left unchanged
+    assert semantic_cache.vector_db.embedder is embedder
+
+
+def test_expired_entries_are_ignored():
+    semantic_cache = get_semantic_cache(ttl=60)
+    semantic_cache.store("What is the capital of France?", RunOutput(run_id="run-1", content="Paris"), "scope")
+    assert semantic_cache.lookup("What is the capital of France?", "scope") is not None
+
+    semantic_cache.ttl = 0
+    time.sleep(1.1)
+    assert semantic_cache.lookup("What is the capital of France?", "scope") is None
+
+
+def test_agent_serves_similar_inputs_from_cache():
+    model = FakeModel(chunks=["Paris"])
+    agent = Agent(model=model, semantic_cache=get_semantic_cache())
+
+    first = agent.run("What is the capital of France?")
+    assert first.content == "Paris"
+    assert first.metrics.additional_metrics["semantic_cache"] == {"hit": False}  # type: ignore
+
+    second = agent.run("what is the capital of france")
+    assert second.content == "Paris"
+    assert model.num_calls == 1
+    semantic_cache_metrics = second.metrics.additional_metrics["semantic_cache"]  # type: ignore
+    assert semantic_cache_metrics["hit"] is True
+    assert semantic_cache_metrics["cached_run_id"] == first.run_id
+
+    # Different users don't share cached responses
+    agent.run("What is the capital of France?", user_id="other-user")
+    assert model.num_calls == 2
+
+
+def test_agent_streams_cache_hit_events():
+    model = FakeModel(chunks=["Paris"])
+    agent = Agent(model=model, semantic_cache=get_semantic_cache())
+    agent.run("What is the capital of France?")
+
+    events = list(agent.run("What is the capital of France?", stream=True, stream_events=True))
+    assert [event.event for event in events] == [
+        RunEvent.run_started.value,
+        RunEvent.semantic_cache_hit.value,
+        RunEvent.run_content.value,
+        RunEvent.run_completed.value,
+    ]
+    assert events[2].content == "Paris"
+    assert model.num_calls == 1
+
+
+def test_async_agent_serves_similar_inputs_from_cache():
+    model = FakeModel(chunks=["Paris"])
+    agent = Agent(model=model, semantic_cache=get_semantic_cache())
+
+    async def run_twice():
+        await agent.arun("What is the capital of France?")
+        return await agent.arun("What is the capital of France")
+
+    assert asyncio.run(run_twice()).content == "Paris"
+    assert model.num_calls == 1
+
+
+def test_agent_does_not_cache_runs_depending_on_the_conversation():
+    model = FakeModel(chunks=["Paris"])
+    agent = Agent(model=model, semantic_cache=get_semantic_cache(), add_history_to_context=True)
+
+    agent.run("What is the capital of France?", session_id="session-1")
+    second = agent.run("What is the capital of France?", session_id="session-2")
+    assert model.num_calls == 2
+    assert "semantic_cache" not in (second.metrics.additional_metrics or {})  # type: ignore
+
+    # The context of the run can also be set per run
+    agent = Agent(model=model, semantic_cache=get_semantic_cache())
+    agent.run("What is the capital of France?", add_session_state_to_context=True)
+    agent.run("What is the capital of France?", add_session_state_to_context=True)
+    assert model.num_calls == 4
+
+
+def test_knowledge_version_is_cached():
+    contents_db = MagicMock()
+    contents_db.get_knowledge_contents.return_value = ([], 0)
+    knowledge = Knowledge(contents_db=contents_db)
+
+    assert knowledge.get_version() == knowledge.get_version() == "0:None"
+    assert contents_db.get_knowledge_contents.call_count == 1
+
+    # Local changes invalidate the cached version
+    knowledge._version += 1
+    knowledge.get_version()
+    assert contents_db.get_knowledge_contents.call_count == 2
+
+    knowledge.version_cache_ttl = 0
+    knowledge.get_version()
+    assert contents_db.get_knowledge_contents.call_count == 3
@@ -0,0 +1,151 @@
+import asyncio
+import json
+from typing import List, Tuple
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from agno.agent.agent import Agent
+from agno.os.interfaces.ingestion import WebhookIngestor
+from agno.os.interfaces.slack import Slack
+from agno.os.interfaces.slack import router as slack_router
+from agno.os.interfaces.whatsapp import Whatsapp
+from agno.os.interfaces.whatsapp import router as whatsapp_router
+from agno.tools.whatsapp import WhatsAppTools
+from tests.unit.stubs import FakeModel
+
+
+class FakeSlackClient:
+    def __init__(self, token=None):
+        self.calls: List[Tuple[str, str, str]] = []
+
+    async def post_message(self, channel: str, text: str, thread_ts=None) -> str:
+        self.calls.append(("post", channel, text))
+        return f"ts-{len(self.calls)}"
+
+    async def update_message(self, channel: str, ts: str, text: str) -> None:
+        self.calls.append(("update", ts, text))
+
+
+def test_ingestor_deduplicates_and_serializes_conversations():
+    ingestor = WebhookIngestor(max_concurrency=2)
+    running: List[str] = []
+    max_running = 0
+    order: List[str] = []
+
+    async def handle(conversation_id: str, message: str):
+        nonlocal max_running
+        running.append(conversation_id)
+        max_running = max(max_running, len(running))
+        # Messages of one conversation never run concurrently
+        assert running.count(conversation_id) == 1
+        await asyncio.sleep(0.01)
+        order.append(f"{conversation_id}:{message}")
+        running.remove(conversation_id)
+
+    async def main():
+        for message in ["1", "2", "3"]:
+            for conversation_id in ["a", "b", "c"]:
+                assert ingestor.submit(
+                    lambda c=conversation_id, m=message: handle(c, m),
+                    conversation_id=conversation_id,
+                    idempotency_key=f"{conversation_id}:{message}",
+                )
+        # Redelivered messages are skipped
+        assert not ingestor.submit(lambda: handle("a", "1"), conversation_id="a", idempotency_key="a:1")
+        await ingestor.wait()
+
+    asyncio.run(main())
+    assert len(order) == 9
+    assert max_running == 2
+    for conversation_id in ["a", "b", "c"]:
+        assert [m for m in order if m.startswith(conversation_id)] == [f"{conversation_id}:{m}" for m in "123"]
+    assert ingestor.num_pending == 0
+
+
+def test_ingestor_rejects_deliveries_when_full():
+    ingestor = WebhookIngestor(max_pending=1)
+
+    async def main():
+        assert ingestor.submit(lambda: asyncio.sleep(0.01), conversation_id="a", idempotency_key="1")
+        assert ingestor.is_full
+        assert not ingestor.submit(lambda: asyncio.sleep(0.01), conversation_id="b", idempotency_key="2")
+        await ingestor.wait()
+        # The rejected delivery was not remembered, so its retry is accepted
+        assert ingestor.submit(lambda: asyncio.sleep(0.01), conversation_id="b", idempotency_key="2")
+        await ingestor.wait()
+
+    asyncio.run(main())
+
+
+def test_slack_streams_reply_once_per_event(monkeypatch):
+    fake_client = FakeSlackClient()
+    monkeypatch.setattr(slack_router, "SlackClient", lambda token=None: fake_client)
+    monkeypatch.setattr(slack_router, "verify_slack_signature", lambda *args: True)
+
+    slack = Slack(
+        agent=Agent(model=FakeModel(chunks=["Hello", " world", "!"])), streaming=True, stream_update_interval=0
+    )
+    app = FastAPI()
+    app.include_router(slack.get_router())
+
+    payload = {
+        "event_id": "Ev1",
+        "event": {"type": "message", "text": "Hi", "channel": "C1", "user": "U1", "ts": "1.0"},
+    }
+    headers = {"X-Slack-Request-Timestamp": "1", "X-Slack-Signature": "v0=signature"}
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # Slack retries deliveries it considers unacknowledged, with the same event id
+            for _ in range(2):
+                response = await client.post("/slack/events", content=json.dumps(payload), headers=headers)
+                assert response.status_code == 200
+        await slack.ingestor.wait()
+
+    asyncio.run(main())
+    assert fake_client.calls == [
+        ("post", "C1", "Hello"),
+        ("update", "ts-1", "Hello world"),
+        ("update", "ts-1", "Hello world!"),
+        ("update", "ts-1", "Hello world!"),
+    ]
+
+
+def test_whatsapp_http_client_is_closed_with_the_app(monkeypatch):
+    clients: List[httpx.AsyncClient] = []
+
+    async def send_text_message_async(self, recipient: str, text: str) -> None:
+        clients.append(self.http_client)
+
+    async def typing_indicator_async(message_id, http_client=None) -> None:
+        pass
+
+    monkeypatch.setenv("WHATSAPP_ACCESS_TOKEN", "token")
+    monkeypatch.setenv("WHATSAPP_PHONE_NUMBER_ID", "phone-number-id")
+    monkeypatch.setattr(whatsapp_router, "validate_webhook_signature", lambda *args: True)
+    monkeypatch.setattr(whatsapp_router, "typing_indicator_async", typing_indicator_async)
+    monkeypatch.setattr(WhatsAppTools, "send_text_message_async", send_text_message_async)
+
+    whatsapp = Whatsapp(agent=Agent(model=FakeModel()))
+    app = FastAPI()
+    app.include_router(whatsapp.get_router())
+    body = {
+        "object": "whatsapp_business_account",
+        "entry": [
+            {
+                "changes": [
+                    {"value": {"messages": [{"id": "m1", "from": "123", "type": "text", "text": {"body": "Hi"}}]}}
+                ]
+            }
+        ],
+    }
+
+    with TestClient(app) as client:
+        assert client.post("/whatsapp/webhook", json=body).json() == {"status": "processing"}
+        client.portal.call(whatsapp.ingestor.wait)  # type: ignore
+        assert len(clients) == 1 and not clients[0].is_closed
+
+    assert clients[0].is_closed
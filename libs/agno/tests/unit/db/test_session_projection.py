@@ -0,0 +1,103 @@
+from sqlalchemy import JSON, BigInteger, Column, MetaData, String, Table, select
+from sqlalchemy.dialects import postgresql
+
+from agno.db.base import SessionProjection, SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.mongo.utils import get_session_projection_stages
+from agno.db.postgres.utils import get_projected_session_columns
+from agno.db.sqlite import SqliteDb
+from agno.run.agent import RunOutput
+from agno.session import AgentSession, Session
+
+
+def build_session() -> AgentSession:
+    runs = [
+        RunOutput(
+            run_id=f"run_{i}", agent_id="agent_1", session_id="session_1", content=f"content {i}", created_at=100 + i
+        )
+        for i in range(5)
+    ]
+    # The second run belongs to a member of the first one
+    runs[1].parent_run_id = "run_0"
+    return AgentSession(
+        session_id="session_1",
+        agent_id="agent_1",
+        runs=runs,  # type: ignore
+        summary=None,
+        session_data={"session_name": "Projection test"},
+        created_at=1,
+    )
+
+
+def check_projections(db, session: Session) -> None:
+    db.upsert_session(session)
+
+    metadata = db.get_session(
+        "session_1", SessionType.AGENT, deserialize=False, projection=SessionProjection.metadata_only()
+    )
+    assert "runs" not in metadata
+    assert "summary" not in metadata
+    assert metadata["session_data"]["session_name"] == "Projection test"
+
+    single_run = db.get_session(
+        "session_1", SessionType.AGENT, deserialize=False, projection=SessionProjection.single_run("run_3")
+    )
+    assert [run["run_id"] for run in single_run["runs"]] == ["run_3"]
+
+    window = db.get_session(
+        "session_1", SessionType.AGENT, deserialize=False, projection=SessionProjection.runs_window(102, 103)
+    )
+    assert [run["run_id"] for run in window["runs"]] == ["run_2", "run_3"]
+
+    top_level = db.get_session(
+        "session_1", SessionType.AGENT, projection=SessionProjection(top_level_runs_only=True, runs_limit=3)
+    )
+    assert [run.run_id for run in top_level.runs] == ["run_0", "run_2", "run_3"]
+
+    sessions, total_count = db.get_sessions(
+        session_type=SessionType.AGENT, deserialize=False, projection=SessionProjection.listing()
+    )
+    assert total_count == 1
+    assert [run["run_id"] for run in sessions[0]["runs"]] == ["run_0"]
+
+    # Reading without a projection still returns the full session
+    full_session = db.get_session("session_1", SessionType.AGENT)
+    assert len(full_session.runs) == 5
+
+
+def test_in_memory_db_projections():
+    check_projections(InMemoryDb(), build_session())
+
+
+def test_sqlite_db_projections(tmp_path):
+    check_projections(SqliteDb(db_file=str(tmp_path / "agno.db")), build_session())
+
+
+def test_postgres_projection_filters_runs_in_query():
+    table = Table(
+        "agno_sessions",
+        MetaData(),
+        Column("session_id", String),
+        Column("runs", JSON),
+        Column("summary", JSON),
+        Column("created_at", BigInteger),
+    )
+
+    metadata_stmt = select(*get_projected_session_columns(table, SessionProjection.metadata_only()))
+    assert [column.name for column in metadata_stmt.selected_columns] == ["session_id", "created_at"]
+
+    run_stmt = select(*get_projected_session_columns(table, SessionProjection.single_run("run_1")))
+    sql = str(run_stmt.compile(dialect=postgresql.dialect()))
+    assert "json_array_elements" in sql
+    assert "json_agg" in sql
+    assert "summary" not in sql
+
+
+def test_mongo_projection_stages():
+    assert get_session_projection_stages(None) == []
+    assert get_session_projection_stages(SessionProjection.metadata_only()) == [{"$project": {"runs": 0, "summary": 0}}]
+
+    stages = get_session_projection_stages(SessionProjection.listing())
+    runs = stages[0]["$addFields"]["runs"]
+    assert runs["$slice"][1] == 1
+    assert stages[1] == {"$project": {"summary": 0}}
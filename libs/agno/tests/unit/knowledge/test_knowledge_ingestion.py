@@ -0,0 +1,222 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.base import Reader
+from agno.vectordb.base import VectorDb
+
+
+class RecordingVectorDb(VectorDb):
+    """In-memory VectorDb that records inserted documents."""
+
+    def __init__(self) -> None:
+        self.inserted: Dict[str, List[Document]] = {}
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def drop(self) -> None:
+        self.inserted.clear()
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return False
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.inserted[content_hash] = documents
+
+    async def async_insert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.inserted[content_hash] = documents
+
+    def upsert_available(self) -> bool:
+        return False
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.inserted[content_hash] = documents
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.inserted[content_hash] = documents
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return []
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return []
+
+    def get_supported_search_types(self) -> List[str]:
+        return []
+
+    def delete(self) -> bool:
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return True
+
+    def delete_by_name(self, name: str) -> bool:
+        return True
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        return True
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        pass
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return True
+
+
+class SlowReader(Reader):
+    """Reader that blocks like a parser would, and tracks how many reads run at the same time."""
+
+    def __init__(self, fail_on: Optional[str] = None):
+        super().__init__(chunk=False)
+        self.fail_on = fail_on
+        self.active_reads = 0
+        self.max_active_reads = 0
+        self._lock = threading.Lock()
+
+    def read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
+        with self._lock:
+            self.active_reads += 1
+            self.max_active_reads = max(self.max_active_reads, self.active_reads)
+        try:
+            time.sleep(0.05)
+            path = Path(obj)
+            if self.fail_on and path.name == self.fail_on:
+                raise ValueError(f"Could not parse {path.name}")
+            return [Document(name=path.name, content=path.read_text())]
+        finally:
+            with self._lock:
+                self.active_reads -= 1
+
+
+def _write_files(directory: Path, count: int) -> None:
+    for i in range(count):
+        (directory / f"file_{i}.txt").write_text(f"Content of file {i}")
+
+
+@pytest.mark.asyncio
+async def test_directory_files_are_read_concurrently(tmp_path):
+    _write_files(tmp_path, 8)
+    vector_db = RecordingVectorDb()
+    reader = SlowReader()
+    knowledge = Knowledge(vector_db=vector_db, max_concurrent_reads=3)
+
+    await knowledge.add_content_async(path=str(tmp_path), reader=reader)
+
+    assert len(vector_db.inserted) == 8
+    assert reader.max_active_reads == 3
+
+
+@pytest.mark.asyncio
+async def test_failing_file_does_not_stop_directory(tmp_path):
+    _write_files(tmp_path, 4)
+    vector_db = RecordingVectorDb()
+    knowledge = Knowledge(vector_db=vector_db)
+
+    await knowledge.add_content_async(path=str(tmp_path), reader=SlowReader(fail_on="file_2.txt"))
+
+    inserted_names = {documents[0].name for documents in vector_db.inserted.values()}
+    assert inserted_names == {"file_0.txt", "file_1.txt", "file_3.txt"}
+
+
+def test_add_contents_loads_paths_concurrently(tmp_path):
+    _write_files(tmp_path, 4)
+    vector_db = RecordingVectorDb()
+    reader = SlowReader()
+    knowledge = Knowledge(vector_db=vector_db, max_concurrent_reads=4)
+
+    knowledge.add_contents(paths=[str(path) for path in sorted(tmp_path.iterdir())], reader=reader)
+    # The limits are created per event loop, so a second run works as well
+    knowledge.add_contents(paths=[str(path) for path in sorted(tmp_path.iterdir())], reader=reader)
+
+    assert len(vector_db.inserted) == 4
+    assert reader.max_active_reads > 1
+
+
+class UpsertingVectorDb(RecordingVectorDb):
+    """RecordingVectorDb that supports upsert and records the upserted content hashes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.upserted: List[str] = []
+
+    def upsert_available(self) -> bool:
+        return True
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.upserted.append(content_hash)
+        self.inserted[content_hash] = documents
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        self.inserted = {
+            content_hash: documents
+            for content_hash, documents in self.inserted.items()
+            if documents[0].content_id != content_id
+        }
+        return True
+
+
+class StreamingReader(Reader):
+    """Reader that yields one batch of documents per crawled page."""
+
+    def __init__(self, pages: List[str]):
+        super().__init__(chunk=False)
+        self.pages = pages
+
+    def read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
+        return [Document(name=page, content=f"Content of {page}") for page in self.pages]
+
+    async def async_read_stream(self, url: str, name: Optional[str] = None):
+        for page in self.pages:
+            yield [Document(name=page, content=f"Content of {page}")]
+
+
+@pytest.mark.asyncio
+async def test_streamed_batches_are_all_upserted():
+    vector_db = UpsertingVectorDb()
+    knowledge = Knowledge(vector_db=vector_db)
+
+    await knowledge.add_content_async(url="https://example.com/docs", reader=StreamingReader(["a", "b", "c"]))
+
+    # Each batch is upserted under its own hash, so later batches do not replace the earlier ones
+    assert len(vector_db.upserted) == 3
+    assert len(set(vector_db.upserted)) == 3
+    assert sorted(documents[0].name for documents in vector_db.inserted.values()) == ["a", "b", "c"]
+
+    # Batches of a previous crawl are removed when the website is crawled again
+    await knowledge.add_content_async(url="https://example.com/docs", reader=StreamingReader(["a"]))
+    assert [documents[0].name for documents in vector_db.inserted.values()] == ["a"]
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agno.knowledge.model_manager import LocalModelManager, MicroBatcher, get_local_model_manager
+
+
+def test_model_is_loaded_once_across_threads():
+    manager = LocalModelManager()
+    loads = []
+
+    def loader():
+        time.sleep(0.05)
+        loads.append(1)
+        return object()
+
+    models = []
+    threads = [threading.Thread(target=lambda: models.append(manager.get_model("model", loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(model is models[0] for model in models)
+
+    manager.unload("model")
+    assert manager.get_model("model", loader) is not models[0]
+    assert get_local_model_manager() is get_local_model_manager()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched():
+    batch_sizes = []
+
+    def batch_fn(texts):
+        batch_sizes.append(len(texts))
+        return [text.upper() for text in texts]
+
+    batcher = MicroBatcher(batch_fn=batch_fn, max_batch_size=8, max_wait=0.05)
+    results = await asyncio.gather(*[batcher.asubmit([f"text {i}", f"more {i}"]) for i in range(4)])
+
+    # Each request gets the results of its own items, in order
+    assert results == [[f"TEXT {i}", f"MORE {i}"] for i in range(4)]
+    assert batch_sizes == [8]
+    metrics = batcher.metrics.to_dict()
+    assert metrics["num_requests"] == 4
+    assert metrics["num_batches"] == 1
+    assert metrics["avg_batch_size"] == 8
+    assert metrics["queue_size"] == 0
+
+
+def test_batch_errors_are_raised_to_every_request():
+    def batch_fn(texts):
+        raise RuntimeError("model failed")
+
+    batcher = MicroBatcher(batch_fn=batch_fn, max_wait=0.01)
+    with pytest.raises(RuntimeError, match="model failed"):
+        batcher.submit(["text"])
+    # The worker keeps serving requests after an error
+    batcher.batch_fn = lambda texts: texts
+    assert batcher.submit(["text"]) == ["text"]
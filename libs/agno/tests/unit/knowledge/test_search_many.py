@@ -0,0 +1,216 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.precomputed import PrecomputedEmbedder, with_precomputed_embeddings
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.base import VectorDb
+
+DOCUMENTS = ["red apples grow on trees", "green pears are sweet", "blue whales swim in the ocean"]
+VOCABULARY = sorted({word for document in DOCUMENTS for word in document.split()})
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Bag-of-words embedder over the words of the documents, counting its single and batch calls"""
+
+    calls: List[str] = field(default_factory=list)
+    batch_calls: List[List[str]] = field(default_factory=list)
+
+    def _embed(self, text: str) -> List[float]:
+        embedding = [0.0] * len(VOCABULARY)
+        for word in text.lower().split():
+            if word in VOCABULARY:
+                embedding[VOCABULARY.index(word)] += 1.0
+        return embedding
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return self._embed(text)
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return self._embed(text)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batch_calls.append(list(texts))
+        return [self._embed(text) for text in texts], [None] * len(texts)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self.get_embeddings_batch_and_usage(texts)
+
+
+class EmbeddingVectorDb(VectorDb):
+    """In-memory VectorDb embedding the query and ranking the documents by dot product"""
+
+    def __init__(self, embedder: Embedder, documents: List[str]):
+        super().__init__()
+        self.embedder = embedder
+        self.documents = [(Document(content=content), embedder._embed(content)) for content in documents]  # type: ignore
+
+    def _rank(self, query_embedding: List[float], limit: int) -> List[Document]:
+        scores = [(sum(a * b for a, b in zip(query_embedding, embedding)), doc) for doc, embedding in self.documents]
+        ranked = sorted((item for item in scores if item[0] > 0), key=lambda item: -item[0])
+        return [doc for _, doc in ranked[:limit]]
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return self._rank(self.embedder.get_embedding(query), limit)
+
+    async def async_search(self, query: str, limit: int = 5, filters=None) -> List[Document]:
+        return self._rank(await self.embedder.async_get_embedding(query), limit)
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return False
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def async_insert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        pass
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def async_upsert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        pass
+
+    def drop(self) -> None:
+        pass
+
+    async def async_drop(self) -> None:
+        pass
+
+    def delete(self) -> bool:
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return False
+
+    def delete_by_name(self, name: str) -> bool:
+        return False
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        return False
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        pass
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return False
+
+    def get_supported_search_types(self) -> List[str]:
+        return ["vector"]
+
+
+def make_knowledge(**kwargs) -> Tuple[Knowledge, CountingEmbedder]:
+    embedder = CountingEmbedder()
+    return Knowledge(vector_db=EmbeddingVectorDb(embedder, DOCUMENTS), **kwargs), embedder
+
+
+def test_search_batch_embeds_queries_in_one_batch():
+    knowledge, embedder = make_knowledge()
+
+    results = knowledge.search_batch(["apples", "whales", "apples"], max_results=1)
+
+    assert [[doc.content for doc in docs] for docs in results] == [
+        ["red apples grow on trees"],
+        ["blue whales swim in the ocean"],
+        ["red apples grow on trees"],
+    ]
+    assert embedder.batch_calls == [["apples", "whales"]]
+    assert embedder.calls == []
+
+
+def test_search_many_merges_and_deduplicates_results():
+    knowledge, _ = make_knowledge()
+
+    documents = knowledge.search_many(["red apples", "apples trees", "ocean whales"], max_results=5)
+
+    contents = [doc.content for doc in documents]
+    assert contents[0] == "red apples grow on trees"
+    assert sorted(contents) == sorted(["red apples grow on trees", "blue whales swim in the ocean"])
+    assert "search_scores" in documents[0].meta_data
+
+
+def test_async_search_batch_matches_sync_results():
+    knowledge, embedder = make_knowledge()
+    queries = ["apples", "sweet pears", "ocean"]
+
+    async_results = asyncio.run(knowledge.async_search_batch(queries, max_results=2))
+
+    assert async_results == [knowledge.search(query, max_results=2) for query in queries]
+    assert embedder.batch_calls == [queries]
+
+
+def test_concurrent_async_searches_are_coalesced():
+    knowledge, embedder = make_knowledge()
+
+    async def search_all():
+        return await asyncio.gather(
+            knowledge.async_search("apples", max_results=1),
+            knowledge.async_search("whales", max_results=1),
+            knowledge.async_search("pears", max_results=2),
+        )
+
+    apples, whales, pears = asyncio.run(search_all())
+
+    assert [doc.content for doc in apples] == ["red apples grow on trees"]
+    assert [doc.content for doc in whales] == ["blue whales swim in the ocean"]
+    assert [doc.content for doc in pears] == ["green pears are sweet"]
+    # Searches with the same max results are batched together
+    assert embedder.batch_calls == [["apples", "whales"]]
+    assert embedder.calls == ["pears"]
+
+
+def test_async_searches_are_not_coalesced_when_disabled():
+    knowledge, embedder = make_knowledge(coalesce_searches=False)
+
+    async def search_all():
+        return await asyncio.gather(knowledge.async_search("apples"), knowledge.async_search("whales"))
+
+    asyncio.run(search_all())
+
+    assert embedder.batch_calls == []
+    assert sorted(embedder.calls) == ["apples", "whales"]
+
+
+def test_precomputed_embeddings_are_scoped_to_a_copy_of_the_vector_db():
+    embedder = CountingEmbedder()
+    vector_db = EmbeddingVectorDb(embedder, DOCUMENTS)
+
+    vector_db_copy = with_precomputed_embeddings(vector_db, {"query": [1.0, 2.0]})
+
+    assert isinstance(vector_db_copy.embedder, PrecomputedEmbedder)
+    assert vector_db_copy.embedder.get_embedding("query") == [1.0, 2.0]
+    assert asyncio.run(vector_db_copy.embedder.async_get_embedding("query")) == [1.0, 2.0]
+    assert vector_db_copy.embedder.get_embedding("other") == embedder._embed("other")
+    # The vector db and its embedder are left unchanged
+    assert vector_db.embedder is embedder
+    assert embedder.get_embedding("query") != [1.0, 2.0]
+    assert embedder.calls == ["other", "query"]
+    assert with_precomputed_embeddings(vector_db, {}) is vector_db
@@ -0,0 +1,153 @@
+import base64
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.media import File, Image
+from agno.media_store import LocalMediaStore, parse_content_ref
+from agno.models.message import Message
+from agno.run.agent import RunInput, RunOutput
+from agno.session.agent import AgentSession
+from agno.utils.agent import offload_media_from_run_output, resolve_media_from_messages
+from tests.unit.stubs import FakeModel
+
+IMAGE_BYTES = b"\x89PNG\r\n\x1a\n" + b"0" * 4096
+
+
+def get_leaf_values(value: Any) -> Iterator[Any]:
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from get_leaf_values(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from get_leaf_values(item)
+    else:
+        yield value
+
+
+def assert_stored_by_reference(session_dict: Dict[str, Any], content: bytes) -> None:
+    """The serialized session holds neither the raw bytes nor the base64 encoding of the content"""
+    encoded_content = base64.b64encode(content).decode("utf-8")
+    for value in get_leaf_values(session_dict):
+        assert not (isinstance(value, bytes) and content in value)
+        assert not (isinstance(value, str) and encoded_content in value)
+
+
+@pytest.fixture
+def media_store(tmp_path):
+    return LocalMediaStore(base_dir=tmp_path / "media")
+
+
+def test_put_deduplicates_content(media_store):
+    ref_1 = media_store.put(IMAGE_BYTES, mime_type="image/png")
+    ref_2 = media_store.put(IMAGE_BYTES, mime_type="image/png")
+
+    assert ref_1 == ref_2
+    store_id, content_hash = parse_content_ref(ref_1)
+    assert store_id == media_store.id
+    assert content_hash == media_store.hash_content(IMAGE_BYTES)
+    assert len(list(media_store.base_dir.rglob("*"))) == 2  # One prefix directory and one file
+    assert media_store.get(ref_1) == IMAGE_BYTES
+
+
+def test_local_media_store_id_is_stable(tmp_path):
+    assert LocalMediaStore(base_dir=tmp_path).id == LocalMediaStore(base_dir=tmp_path).id
+
+
+def test_image_to_dict_uses_content_ref(media_store):
+    image = Image(content=IMAGE_BYTES, mime_type="image/png")
+    image.content_ref = media_store.put(IMAGE_BYTES)
+
+    image_dict = image.to_dict()
+    assert "content" not in image_dict
+    assert image_dict["content_ref"] == image.content_ref
+
+    restored = Image.model_validate(image_dict)
+    assert restored.content is None
+    assert restored.get_content_bytes() == IMAGE_BYTES
+    assert restored.content == IMAGE_BYTES
+
+
+def test_media_requires_a_source():
+    with pytest.raises(ValueError):
+        Image(mime_type="image/png")
+    with pytest.raises(ValueError):
+        File(mime_type="application/pdf")
+
+
+def test_offload_media_from_run_output(media_store):
+    image = Image(content=IMAGE_BYTES, mime_type="image/png")
+    file = File(content=b"%PDF-1.4 test", mime_type="application/pdf")
+    run = RunOutput(
+        run_id="run_1",
+        input=RunInput(input_content="Describe this image", images=[image]),
+        messages=[
+            Message(role="user", content="Describe this image", images=[image], files=[file]),
+            Message(role="assistant", content="A test image"),
+        ],
+        images=[image],
+    )
+
+    offload_media_from_run_output(run, media_store)
+
+    assert image.content_ref is not None
+    assert file.content_ref is not None
+    # Content stays available in memory for the current run
+    assert image.content == IMAGE_BYTES
+
+    session = AgentSession(session_id="session_1", runs=[run])
+    session_dict = session.to_dict()
+    assert_stored_by_reference(session_dict, IMAGE_BYTES)
+    assert session_dict["runs"][0]["images"][0]["content_ref"] == image.content_ref
+    assert session_dict["runs"][0]["messages"][0]["images"][0]["content_ref"] == image.content_ref
+
+    restored_session = AgentSession.from_dict(session_dict)
+    restored_messages = restored_session.runs[0].messages  # type: ignore
+    restored_image = restored_messages[0].images[0]  # type: ignore
+    assert restored_image.content is None
+
+    resolve_media_from_messages(restored_messages)  # type: ignore
+    assert restored_image.content == IMAGE_BYTES
+    assert restored_messages[0].files[0].content == b"%PDF-1.4 test"  # type: ignore
+
+
+def test_sql_media_store(tmp_path):
+    from agno.media_store.sql import SqlMediaStore
+
+    media_store = SqlMediaStore(db_url=f"sqlite:///{tmp_path / 'media.db'}")
+    ref = media_store.put(IMAGE_BYTES, mime_type="image/png")
+    assert media_store.put(IMAGE_BYTES, mime_type="image/png") == ref
+    assert media_store.get(ref) == IMAGE_BYTES
+
+    _, content_hash = parse_content_ref(ref)
+    assert media_store.delete(content_hash) is True
+    assert media_store.exists(content_hash) is False
+
+
+class ThreadRecordingMediaStore(LocalMediaStore):
+    """LocalMediaStore recording the threads writing to it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.write_threads: List[threading.Thread] = []
+
+    def write(self, content_hash: str, content: bytes, mime_type: Optional[str] = None) -> None:
+        self.write_threads.append(threading.current_thread())
+        super().write(content_hash, content, mime_type=mime_type)
+
+
+@pytest.mark.asyncio
+async def test_async_run_stores_media_off_the_event_loop(tmp_path):
+    media_store = ThreadRecordingMediaStore(base_dir=tmp_path / "media")
+    agent = Agent(model=FakeModel(), db=InMemoryDb(), media_store=media_store)
+
+    await agent.arun("Describe this image", images=[Image(content=IMAGE_BYTES, mime_type="image/png")], session_id="s1")
+
+    assert media_store.write_threads
+    assert all(thread is not threading.main_thread() for thread in media_store.write_threads)
+    session = agent.get_session("s1")
+    assert session is not None
+    assert_stored_by_reference(session.to_dict(), IMAGE_BYTES)
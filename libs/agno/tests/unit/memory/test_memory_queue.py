@@ -0,0 +1,138 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.queue import MemoryExtractionQueue, is_trivial_message
+from agno.models.message import Message
+from agno.run.messages import RunMessages
+
+
+class FakeMemoryManager:
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+
+    def create_user_memories(self, messages=None, user_id=None, agent_id=None, team_id=None, message=None):
+        self.calls.append({"messages": [m.content for m in messages], "user_id": user_id, "agent_id": agent_id})
+        return "ok"
+
+    async def acreate_user_memories(self, messages=None, user_id=None, agent_id=None, team_id=None, message=None):
+        return self.create_user_memories(messages=messages, user_id=user_id, agent_id=agent_id, team_id=team_id)
+
+
+def user_message(content: str) -> List[Message]:
+    return [Message(role="user", content=content)]
+
+
+def test_trivial_messages():
+    assert is_trivial_message("Thanks!")
+    assert is_trivial_message("ok")
+    assert not is_trivial_message("I moved to Lisbon last month")
+
+
+def test_turns_are_coalesced_per_user():
+    manager = FakeMemoryManager()
+    queue = MemoryExtractionQueue(debounce=60, max_batch_turns=3)
+
+    queue.submit(manager, user_message("I live in Lisbon"), user_id="alice")  # type: ignore
+    queue.submit(manager, user_message("thanks"), user_id="alice")  # type: ignore
+    queue.submit(manager, user_message("I work as a nurse"), user_id="bob")  # type: ignore
+    queue.submit(manager, user_message("I have two cats"), user_id="alice")  # type: ignore
+    assert queue.get_metrics()["pending_turns"] == 3
+
+    # The third turn of alice fills her batch, bob's batch waits for the debounce window or a flush
+    queue.submit(manager, user_message("I am vegetarian"), user_id="alice")  # type: ignore
+    queue.flush()
+
+    assert sorted(call["user_id"] for call in manager.calls) == ["alice", "bob"]
+    alice_call = next(call for call in manager.calls if call["user_id"] == "alice")
+    assert alice_call["messages"] == ["I live in Lisbon", "I have two cats", "I am vegetarian"]
+    metrics = queue.get_metrics()
+    assert metrics["num_turns"] == 5
+    assert metrics["num_skipped_turns"] == 1
+    assert metrics["num_extractions"] == 2
+    assert metrics["avg_turns_per_extraction"] == 2.0
+    assert metrics["pending_turns"] == 0
+
+
+def test_batches_are_extracted_after_the_debounce_window():
+    manager = FakeMemoryManager()
+    queue = MemoryExtractionQueue(debounce=0.05)
+
+    queue.submit(manager, user_message("I live in Lisbon"), user_id="alice")  # type: ignore
+    queue.submit(manager, user_message("I have two cats"), user_id="alice")  # type: ignore
+    for _ in range(100):
+        if queue.get_metrics()["num_extractions"] == 1:
+            break
+        time.sleep(0.01)
+    queue.flush()
+    assert len(manager.calls) == 1
+    assert manager.calls[0]["messages"] == ["I live in Lisbon", "I have two cats"]
+
+
+@pytest.mark.asyncio
+async def test_agent_queues_memory_extraction():
+    manager = FakeMemoryManager()
+    queue = MemoryExtractionQueue(debounce=0.01)
+    agent = Agent(model=MagicMock(), memory_manager=manager, memory_extraction_queue=queue)  # type: ignore
+
+    for content in ["I live in Lisbon", "ok", "I have two cats"]:
+        await agent._amake_memories(RunMessages(user_message=Message(role="user", content=content)), user_id="alice")
+    await asyncio.sleep(0.05)
+    await queue.aflush()
+
+    assert len(manager.calls) == 1
+    assert manager.calls[0]["messages"] == ["I live in Lisbon", "I have two cats"]
+    assert manager.calls[0]["agent_id"] == agent.id
+
+
+def test_turns_queued_from_a_loop_are_extracted_when_it_shuts_down():
+    manager = FakeMemoryManager()
+    queue = MemoryExtractionQueue(debounce=60)
+
+    async def run():
+        await queue.asubmit(manager, user_message("I live in Lisbon"), user_id="alice")  # type: ignore
+        await queue.asubmit(manager, user_message("I have two cats"), user_id="alice")  # type: ignore
+
+    asyncio.run(run())
+
+    assert len(manager.calls) == 1
+    assert manager.calls[0]["messages"] == ["I live in Lisbon", "I have two cats"]
+    assert queue.get_metrics()["running_extractions"] == 0
+
+
+def test_extractions_interrupted_by_the_loop_shutdown_run_again():
+    class SlowMemoryManager(FakeMemoryManager):
+        async def acreate_user_memories(self, **kwargs):
+            if not hasattr(self, "started"):
+                self.started = True
+                await asyncio.sleep(60)
+            return await super().acreate_user_memories(**kwargs)
+
+    manager = SlowMemoryManager()
+    queue = MemoryExtractionQueue(max_batch_turns=1)
+
+    async def run():
+        await queue.asubmit(manager, user_message("I live in Lisbon"), user_id="alice")  # type: ignore
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    assert [call["messages"] for call in manager.calls] == [["I live in Lisbon"]]
+    assert queue.get_metrics()["num_extractions"] == 1
+
+
+def test_turns_queued_from_threads_are_extracted_at_exit():
+    manager = FakeMemoryManager()
+    queue = MemoryExtractionQueue(debounce=60)
+
+    queue.submit(manager, user_message("I live in Lisbon"), user_id="alice")  # type: ignore
+    assert manager.calls == []
+
+    # Registered with atexit when the first turn is queued
+    queue._flush_at_exit()
+    assert len(manager.calls) == 1
+    assert queue.get_metrics()["pending_turns"] == 0
@@ -0,0 +1,149 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+from agno.session.agent import AgentSession
+from agno.session.summary import SessionSummary, SessionSummaryManager
+from tests.unit.stubs import FakeModel
+
+
+def get_model(summary: str = "The user likes soup.") -> MagicMock:
+    model = MagicMock()
+    model.supports_native_structured_outputs = False
+    model.supports_json_schema_outputs = False
+    response = SimpleNamespace(content=json.dumps({"summary": summary, "topics": ["food"]}), parsed=None)
+    model.response = MagicMock(return_value=response)
+    model.aresponse = AsyncMock(return_value=response)
+    return model
+
+
+def add_run(session: AgentSession, run_id: str, user: str, assistant: str) -> None:
+    session.upsert_run(
+        RunOutput(
+            run_id=run_id,
+            session_id=session.session_id,
+            messages=[Message(role="user", content=user), Message(role="assistant", content=assistant)],
+        )
+    )
+
+
+def get_prompt(model: MagicMock) -> str:
+    messages: List[Message] = model.response.call_args.kwargs["messages"]
+    return messages[0].content  # type: ignore
+
+
+def test_incremental_summary_only_sends_new_runs():
+    session = AgentSession(session_id="session")
+    add_run(session, "run-1", "I like tom yum", "Noted")
+    add_run(session, "run-2", "And pad thai", "Noted too")
+    session.summary = SessionSummary(summary="The user likes tom yum.", last_run_id="run-1")
+
+    model = get_model()
+    manager = SessionSummaryManager(model=model, incremental=True)
+    summary = manager.create_session_summary(session)
+
+    prompt = get_prompt(model)
+    assert "And pad thai" in prompt
+    assert "I like tom yum" not in prompt
+    assert "<previous_summary>\nThe user likes tom yum.\n</previous_summary>" in prompt
+    assert summary is not None and summary.last_run_id == "run-2"
+    assert SessionSummary.from_dict(summary.to_dict()).last_run_id == "run-2"
+
+
+def test_summary_cadence():
+    session = AgentSession(session_id="session")
+    add_run(session, "run-1", "Hi", "Hello")
+    model = get_model()
+    manager = SessionSummaryManager(model=model, incremental=True, update_every_n_runs=2, update_every_n_tokens=1000)
+
+    # The first summary is always created
+    manager.create_session_summary(session)
+    assert model.response.call_count == 1
+
+    add_run(session, "run-2", "Hi again", "Hello again")
+    manager.create_session_summary(session)
+    assert model.response.call_count == 1
+
+    # A long run reaches the token threshold before the run threshold
+    add_run(session, "run-3", "soup " * 1000, "Hello")
+    assert manager.get_runs_since_summary(session)[0].run_id == "run-2"
+    manager.create_session_summary(session)
+    assert model.response.call_count == 2
+    assert session.summary.last_run_id == "run-3"  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_background_summary_is_merged_when_the_session_is_saved():
+    session = AgentSession(session_id="session")
+    add_run(session, "run-1", "Hi", "Hello")
+    model = get_model()
+    manager = SessionSummaryManager(model=model, run_in_background=True)
+
+    # The current summary is returned without waiting for the update, which summarizes the session as it is now
+    assert await manager.acreate_session_summary(session) is None
+    add_run(session, "run-2", "Bye", "Goodbye")
+    assert session.summary is None
+
+    # A running update is not waited for, it is merged by a later save
+    update = manager._background_updates[session.session_id]
+    assert not update.done()
+    assert manager.merge_background_summary(session) is None
+
+    await update
+    summary = manager.merge_background_summary(session)
+    assert summary is not None and session.summary is summary
+    assert session.summary.last_run_id == "run-1"
+    assert manager.summaries_updated
+    assert manager.merge_background_summary(session) is None
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_wait_for_the_background_summary():
+    summarized = asyncio.Event()
+    response = SimpleNamespace(content=json.dumps({"summary": "The user said hi.", "topics": []}), parsed=None)
+
+    async def slow_summary(*args, **kwargs):
+        await summarized.wait()
+        return response
+
+    model = get_model()
+    model.aresponse = AsyncMock(side_effect=slow_summary)
+    manager = SessionSummaryManager(model=model, run_in_background=True)
+    agent = Agent(model=FakeModel(), db=InMemoryDb(), session_summary_manager=manager)
+
+    run_output = await agent.arun("Hi", session_id="session")
+    assert run_output.content == "Hello"
+    update = manager._background_updates["session"]
+    assert not update.done()
+
+    # The next run stores the summary that finished in the meantime
+    summarized.set()
+    await update
+    await agent.arun("Bye", session_id="session")
+    session = agent.get_session("session")
+    assert session is not None and session.summary is not None
+    assert session.summary.summary == "The user said hi."
+
+
+def test_background_summary_is_merged_by_the_agent_save():
+    model = get_model()
+    manager = SessionSummaryManager(model=model, run_in_background=True)
+    agent = Agent(model=MagicMock(), session_summary_manager=manager)
+    session = AgentSession(session_id="session")
+    add_run(session, "run-1", "Hi", "Hello")
+
+    assert manager.create_session_summary(session) is None
+    manager._background_updates[session.session_id].result()
+    agent._cleanup_and_store(run_response=session.runs[0], session=session)  # type: ignore
+
+    assert session.summary is not None
+    assert session.summary.last_run_id == "run-1"
+    assert manager._background_updates == {}
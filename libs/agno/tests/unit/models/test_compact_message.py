@@ -0,0 +1,137 @@
+from copy import deepcopy
+
+from agno.media import Image
+from agno.models.message import CompactMessage, Message, to_message
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession, TeamSession
+from agno.utils.tokens import ApproximateTokenizer, count_message_tokens
+
+
+def make_message(**kwargs) -> Message:
+    message = Message(role="assistant", content="The weather is sunny", **kwargs)
+    message.metrics.input_tokens = 10
+    message.metrics.output_tokens = 5
+    return message
+
+
+def test_compact_message_serializes_like_message():
+    message = make_message(
+        tool_calls=[{"id": "call_1", "type": "function", "function": {"name": "get_weather", "arguments": "{}"}}],
+        images=[Image(url="https://example.com/image.png")],
+    )
+    data = message.to_dict()
+
+    compact = CompactMessage.from_dict(message.to_dict())
+    assert compact.to_dict() == data
+    assert compact.role == "assistant"
+    assert compact.get_content_string() == "The weather is sunny"
+
+    # Media and metrics are parsed when read
+    assert compact._parsed is None and compact._metrics is None
+    assert compact.metrics.output_tokens == 5
+    assert compact.images is not None and compact.images[0].url == "https://example.com/image.png"
+    assert compact.to_dict() == data
+
+
+def test_compact_message_unset_fields_are_not_parsed():
+    compact = CompactMessage.from_dict(make_message().to_dict())
+
+    assert compact.images is None
+    assert compact.citations is None
+    assert compact.references is None
+    assert compact._parsed is None
+
+
+def test_compact_message_interns_strings():
+    first = CompactMessage.from_dict({"role": "".join(["assis", "tant"]), "tool_name": "".join(["get_", "weather"])})
+    second = CompactMessage.from_dict({"role": "".join(["assist", "ant"]), "tool_name": "".join(["get_w", "eather"])})
+
+    assert first.role is second.role
+    assert first.tool_name is second.tool_name
+
+
+def test_compact_message_updates_and_copies():
+    compact = CompactMessage.from_dict(make_message().to_dict())
+    compact.metrics.duration = None
+    compact.images = [Image(url="https://example.com/image.png")]
+
+    copied = deepcopy(compact)
+    copied.from_history = True
+    assert compact.from_history is False
+    assert copied.to_dict()["images"] == compact.to_dict()["images"]
+
+    message = to_message(compact)
+    assert isinstance(message, Message)
+    assert message.id == compact.id
+    assert message.metrics.input_tokens == 10
+    assert message.images is not None and message.images[0].url == "https://example.com/image.png"
+    assert to_message(message) is message
+
+
+def test_compact_message_converts_once_and_keeps_token_counts():
+    compact = CompactMessage.from_dict(make_message().to_dict())
+
+    message = to_message(compact)
+    assert to_message(compact) is message
+    count = count_message_tokens(message)
+    assert compact._token_counts == message._token_counts == {ApproximateTokenizer().name: count}
+
+    # Changing a field of the compact message converts it again, keeping the token counts
+    compact.content = "The weather is rainy"
+    updated = to_message(compact)
+    assert updated is not message
+    assert updated.content == "The weather is rainy"
+    assert updated._token_counts is compact._token_counts
+
+
+def build_run(i: int) -> RunOutput:
+    return RunOutput(
+        run_id=f"run_{i}",
+        agent_id="agent_1",
+        status=RunStatus.completed,
+        messages=[
+            Message(role="system", content="You are a helpful assistant"),
+            Message(role="user", content=f"Question {i}"),
+            make_message(),
+        ],
+    )
+
+
+def test_agent_session_loads_compact_messages():
+    session = AgentSession(session_id="session_1", agent_id="agent_1", runs=[build_run(i) for i in range(3)])
+    data = session.to_dict()
+
+    loaded = AgentSession.from_dict(session.to_dict())
+    assert loaded is not None and loaded.runs is not None
+    assert all(isinstance(message, CompactMessage) for run in loaded.runs for message in run.messages or [])
+    assert loaded.to_dict() == data
+
+    # History is returned as Messages
+    history = loaded.get_messages_from_last_n_runs(last_n=2)
+    assert [message.role for message in history] == ["system", "user", "assistant", "user", "assistant"]
+    assert all(type(message) is Message for message in history)
+    # The converted messages are reused, so their token counts are computed once
+    assert all(a is b for a, b in zip(history, loaded.get_messages_from_last_n_runs(last_n=2)))
+    assert all(type(message) is Message for message in loaded.get_messages_for_session())
+    assert all(type(message) is Message for message in loaded.get_chat_history())
+
+
+def test_team_session_loads_compact_messages():
+    team_run = TeamRunOutput(
+        run_id="team_run_1",
+        team_id="team_1",
+        status=RunStatus.completed,
+        messages=[Message(role="user", content="Question"), make_message()],
+        member_responses=[build_run(0)],
+    )
+    session = TeamSession(session_id="session_1", team_id="team_1", runs=[team_run])
+
+    loaded = TeamSession.from_dict(session.to_dict())
+    assert loaded is not None and loaded.runs is not None
+    loaded_run = loaded.runs[0]
+    assert isinstance(loaded_run, TeamRunOutput)
+    assert isinstance(loaded_run.messages[0], CompactMessage)  # type: ignore
+    assert isinstance(loaded_run.member_responses[0].messages[0], CompactMessage)  # type: ignore
+    assert all(type(message) is Message for message in loaded.get_messages_from_last_n_runs())
@@ -0,0 +1,95 @@
+import asyncio
+from typing import Any, List
+
+from agno.media import Image
+from agno.models.cache import ModelResponseCache, get_model_cache_key
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.utils.cache import SqliteCache
+from tests.unit.stubs import FakeModel
+
+WEATHER_TOOL = {
+    "type": "function",
+    "function": {"name": "get_weather", "parameters": {"type": "object", "properties": {"city": {"type": "string"}}}},
+}
+
+
+def test_cache_key_ignores_ids_and_timestamps():
+    model = FakeModel()
+    key_1 = get_model_cache_key(model, [Message(role="user", content="Hi")], stream=False)
+    key_2 = get_model_cache_key(model, [Message(role="user", content="Hi", created_at=1)], stream=False)
+    assert key_1 == key_2
+
+
+def test_cache_key_covers_the_whole_request():
+    model = FakeModel()
+    messages = [Message(role="user", content="What is the weather?")]
+    base_key = get_model_cache_key(model, messages, stream=False, tools=[WEATHER_TOOL])
+
+    other_tool = {"type": "function", "function": {"name": "get_time", "parameters": {"type": "object"}}}
+    assert get_model_cache_key(model, messages, stream=False, tools=[other_tool]) != base_key
+    assert get_model_cache_key(model, messages, stream=False, tools=[WEATHER_TOOL], tool_choice="none") != base_key
+    assert get_model_cache_key(FakeModel(temperature=0.7), messages, stream=False, tools=[WEATHER_TOOL]) != base_key
+
+    tool_call = {"id": "call_1", "type": "function", "function": {"name": "get_weather", "arguments": "{}"}}
+    with_tool_call = messages + [Message(role="assistant", tool_calls=[tool_call])]
+    assert get_model_cache_key(model, with_tool_call, stream=False, tools=[WEATHER_TOOL]) != base_key
+
+    image_1 = [Message(role="user", content="Describe", images=[Image(content=b"image-1")])]
+    image_2 = [Message(role="user", content="Describe", images=[Image(content=b"image-2")])]
+    assert get_model_cache_key(model, image_1, stream=False) != get_model_cache_key(model, image_2, stream=False)
+
+    # Credentials don't change the key
+    assert get_model_cache_key(FakeModel(api_key="secret"), messages, stream=False, tools=[WEATHER_TOOL]) == base_key
+
+
+def test_response_is_served_from_shared_cache(tmp_path):
+    backend = SqliteCache(db_file=tmp_path / "cache.db")
+    messages = [Message(role="user", content="Hi")]
+
+    model = FakeModel(response_cache=ModelResponseCache(backend=backend))
+    assert model.response(messages=list(messages)).content == "Hello"
+    assert model.num_calls == 1
+
+    # Another process sharing the backend
+    other_model = FakeModel(response_cache=ModelResponseCache(backend=backend))
+    assert other_model.response(messages=list(messages)).content == "Hello"
+    assert other_model.num_calls == 0
+
+
+def test_stream_is_replayed_from_cache():
+    model = FakeModel(chunks=["Hel", "lo", "!"], response_cache=ModelResponseCache())
+    messages = [Message(role="user", content="Hi")]
+
+    first = [r.content for r in model.response_stream(messages=list(messages)) if isinstance(r, ModelResponse)]
+    second = [r.content for r in model.response_stream(messages=list(messages)) if isinstance(r, ModelResponse)]
+
+    assert first == second == ["Hel", "lo", "!"]
+    assert model.num_calls == 1
+
+
+def test_async_stream_is_replayed_from_cache():
+    model = FakeModel(chunks=["a", "b"], response_cache=ModelResponseCache())
+
+    async def collect() -> List[Any]:
+        return [
+            r.content
+            async for r in model.aresponse_stream(messages=[Message(role="user", content="Hi")])
+            if isinstance(r, ModelResponse)
+        ]
+
+    assert asyncio.run(collect()) == ["a", "b"]
+    assert asyncio.run(collect()) == ["a", "b"]
+    assert model.num_calls == 1
+
+
+def test_stream_replay_pacing():
+    cache = ModelResponseCache(replay_speed=2.0)
+    cache.save_stream("key", [(0.2, ModelResponse(content="a")), (0.4, ModelResponse(content="b"))])
+    cached_data = cache.get("key")
+    assert cached_data is not None
+    assert cache._get_replay_delays(cached_data) == [0.1, 0.2]
+
+    cache.replay_speed = None
+    assert cache._get_replay_delays(cached_data) == [0.0, 0.0]
+    assert [r.content for r in cache.replay_stream(cached_data)] == ["a", "b"]
@@ -9,6 +9,7 @@ from agno.knowledge.reader.pdf_reader import (
     PDFImageReader,
     PDFReader,
     _clean_page_numbers,
+    _split_page_ranges,
 )
 
 
@@ -298,3 +299,75 @@ def test_clean_page_numbers_untrustable(p_nr_format):
     assert not clean_content[0].endswith(p_nr_format["end"].format(page_nr=1))
     assert not clean_content[0].startswith(p_nr_format["start"].format(page_nr=2))
     assert not clean_content[0].endswith(p_nr_format["end"].format(page_nr=2))
+
+
+def _build_text_pdf(page_texts) -> bytes:
+    """Build a minimal PDF with one line of text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", ""]
+    page_ids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {len(objects)} 0 R "
+            "/Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >> >>"
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>"
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{i} 0 obj\n{obj}\nendobj\n".encode()
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return pdf
+
+
+@pytest.fixture
+def multi_page_pdf_path(tmp_path) -> Path:
+    pdf_path = tmp_path / "multi_page.pdf"
+    pdf_path.write_bytes(_build_text_pdf([f"Page {i} content" for i in range(1, 8)]))
+    return pdf_path
+
+
+def test_split_page_ranges():
+    assert _split_page_ranges(7, 3) == [(0, 3), (3, 5), (5, 7)]
+    assert _split_page_ranges(2, 4) == [(0, 1), (1, 2)]
+
+
+def test_pdf_reader_process_pool_keeps_page_order(multi_page_pdf_path):
+    expected = PDFReader(chunk=False).read(multi_page_pdf_path)
+    reader = PDFReader(chunk=False, max_workers=3)
+
+    documents = reader.read(multi_page_pdf_path)
+    with open(multi_page_pdf_path, "rb") as pdf_file:
+        documents_from_stream = reader.read(BytesIO(pdf_file.read()), name="multi_page")
+
+    assert [doc.content for doc in documents] == [doc.content for doc in expected]
+    assert [doc.content for doc in documents_from_stream] == [doc.content for doc in expected]
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 8))
+    assert "Page 5 content" in documents[4].content
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_process_pool_async(multi_page_pdf_path):
+    expected = await PDFReader(chunk=False).async_read(multi_page_pdf_path)
+    documents = await PDFReader(chunk=False, max_workers=2).async_read(multi_page_pdf_path)
+
+    assert [doc.content for doc in documents] == [doc.content for doc in expected]
+
+
+def test_pdf_is_only_copied_for_worker_processes(multi_page_pdf_path, monkeypatch):
+    reader = PDFReader(chunk=False, max_workers=1)
+    monkeypatch.setattr(reader, "_get_pdf_source", lambda pdf: pytest.fail("PDF copied without worker processes"))
+    with open(multi_page_pdf_path, "rb") as pdf_file:
+        assert len(reader.read(BytesIO(pdf_file.read()), name="multi_page")) == 7
+
+    process_pool = PDFReader(max_workers=2)._get_process_pool()
+    assert process_pool._mp_context.get_start_method() == "spawn"
+    process_pool.shutdown()
@@ -35,14 +35,6 @@ def mock_html_content_with_article():
     """
 
 
-def test_delay():
-    reader = WebsiteReader()
-
-    with patch("time.sleep", return_value=None) as mock_sleep:
-        reader.delay(1, 2)
-        mock_sleep.assert_called_once()
-
-
 def test_crawl_basic(mock_html_content):
     reader = WebsiteReader(max_depth=1, max_links=1)
 
@@ -171,16 +163,6 @@ def test_crawl_max_depth(mock_html_content, mock_html_content_with_article):
         assert "https://example.com/page1" in result
 
 
-@pytest.mark.asyncio
-async def test_async_delay():
-    reader = WebsiteReader()
-
-    # Simple patch for asyncio.sleep
-    with patch("asyncio.sleep", return_value=None) as mock_sleep:
-        await reader.async_delay(1, 2)
-        mock_sleep.assert_called_once()
-
-
 @pytest.mark.asyncio
 async def test_async_crawl_basic(mock_html_content):
     reader = WebsiteReader(max_depth=1, max_links=1)
@@ -273,3 +255,108 @@ async def test_async_crawl_max_depth(mock_html_content, mock_html_content_with_a
         assert len(result) == 2
         assert "https://example.com" in result
         assert "https://example.com/page1" in result
+
+
+def _mock_website(requests_log=None):
+    import httpx
+
+    pages = {
+        "/": '<main>Home page</main><a href="/docs">Docs</a><a href="/private">Private</a>',
+        "/docs": '<main>Docs page</main><a href="/docs/intro">Intro</a><a href="/">Home</a>',
+        "/docs/intro": "<main>Intro page</main>",
+        "/private": "<main>Private page</main>",
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests_log is not None:
+            requests_log.append(request)
+        if request.url.path == "/robots.txt":
+            return httpx.Response(200, text="User-agent: *\nDisallow: /private\n")
+        if request.url.path not in pages:
+            return httpx.Response(404)
+        etag = f'"{request.url.path}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, text=pages[request.url.path], headers={"ETag": etag})
+
+    return httpx.MockTransport(handler)
+
+
+def _patch_transport(reader, transport):
+    client_kwargs = reader._get_client_kwargs()
+    client_kwargs["transport"] = transport
+    return patch.object(reader, "_get_client_kwargs", return_value=client_kwargs)
+
+
+def test_crawl_concurrently_respects_robots_txt():
+    reader = WebsiteReader(max_depth=3, max_links=10, requests_per_second=None)
+
+    with _patch_transport(reader, _mock_website()):
+        result = reader.crawl("https://example.com/")
+
+    assert result == {
+        "https://example.com/": "Home page",
+        "https://example.com/docs": "Docs page",
+        "https://example.com/docs/intro": "Intro page",
+    }
+
+
+def test_crawl_sends_conditional_requests_on_recrawl():
+    requests_log: list = []
+    reader = WebsiteReader(max_depth=3, max_links=10, requests_per_second=None)
+
+    with _patch_transport(reader, _mock_website(requests_log)):
+        first_result = reader.crawl("https://example.com/")
+        requests_log.clear()
+        second_result = reader.crawl("https://example.com/")
+
+    assert first_result == second_result
+    page_requests = [request for request in requests_log if request.url.path != "/robots.txt"]
+    assert len(page_requests) == 3
+    assert all("if-none-match" in request.headers for request in page_requests)
+    # robots.txt is cached across crawls
+    assert not any(request.url.path == "/robots.txt" for request in requests_log)
+
+
+def test_page_cache_keeps_the_most_recently_crawled_pages():
+    reader = WebsiteReader(max_depth=3, max_links=10, requests_per_second=None, max_cached_pages=2)
+
+    with _patch_transport(reader, _mock_website()):
+        reader.crawl("https://example.com/")
+
+    assert len(reader._page_cache) == 2
+    assert "https://example.com/docs/intro" in reader._page_cache
+
+
+def test_reserve_request_slot_spaces_requests_per_host():
+    reader = WebsiteReader(requests_per_second=10)
+
+    assert reader._reserve_request_slot("https://example.com/a") == 0
+    assert reader._reserve_request_slot("https://example.com/b") == pytest.approx(0.1, abs=0.01)
+    assert reader._reserve_request_slot("https://docs.example.com/a") == 0
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_stream_yields_pages_up_to_max_links():
+    reader = WebsiteReader(max_depth=3, max_links=2, requests_per_second=None)
+
+    with _patch_transport(reader, _mock_website()):
+        crawled = [crawled_url async for crawled_url, _ in reader.async_crawl_stream("https://example.com/")]
+
+    assert crawled == ["https://example.com/", "https://example.com/docs"]
+
+
+@pytest.mark.asyncio
+async def test_async_read_stream():
+    reader = WebsiteReader(max_depth=3, max_links=10, requests_per_second=None)
+    reader.chunk = False
+
+    with _patch_transport(reader, _mock_website()):
+        batches = [documents async for documents in reader.async_read_stream("https://example.com/")]
+
+    assert len(batches) == 3
+    assert {documents[0].meta_data["url"] for documents in batches} == {
+        "https://example.com/",
+        "https://example.com/docs",
+        "https://example.com/docs/intro",
+    }
@@ -0,0 +1,198 @@
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.agent.agent import Agent
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+from agno.run.timing import (
+    RunPhase,
+    RunTimings,
+    add_run_timings_listener,
+    remove_run_timings_listener,
+)
+from tests.unit.stubs import FakeModel
+
+GET_WEATHER_CALL = ("get_weather", {"city": "Paris"})
+
+
+def get_weather(city: str) -> str:
+    """Return the weather in a city"""
+    return f"Sunny in {city}"
+
+
+def pre_hook(run_input):
+    pass
+
+
+def get_phases(run_output: RunOutput) -> List[str]:
+    assert run_output.timings is not None
+    return [timing.phase for timing in run_output.timings.phases]
+
+
+def test_run_timings_round_trip():
+    timings = RunTimings()
+    with timings.phase(RunPhase.tool_call, tool_name="get_weather", ignored=None):
+        pass
+
+    run_output = RunOutput(run_id="run_1", timings=timings)
+    data = run_output.to_dict()
+    assert data["timings"]["phases"][0]["phase"] == "tool_call"
+    assert data["timings"]["phases"][0]["attributes"] == {"tool_name": "get_weather"}
+
+    restored = RunOutput.from_dict(data)
+    assert isinstance(restored.timings, RunTimings)
+    assert restored.timings.started_at == timings.started_at
+    assert restored.timings.get_duration(RunPhase.tool_call) == timings.phases[0].duration
+
+
+def test_agent_records_run_phases():
+    agent = Agent(
+        model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]),
+        tools=[get_weather],
+        pre_hooks=[pre_hook],
+        record_timings=True,
+    )
+
+    run_output = agent.run("What is the weather in Paris?")
+
+    phases = get_phases(run_output)
+    for phase in ["session_read", "pre_hooks", "system_message", "model_call", "tool_call", "session_write"]:
+        assert phase in phases
+    assert phases.count("model_call") == 2
+    assert phases[0] == "session_read"
+    assert phases[-1] == "session_write"
+    tool_call = next(timing for timing in run_output.timings.phases if timing.phase == "tool_call")  # type: ignore
+    assert tool_call.attributes == {"tool_name": "get_weather"}
+
+
+def test_agent_stream_records_run_phases():
+    agent = Agent(
+        model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), tools=[get_weather], record_timings=True
+    )
+
+    run_output = None
+    for event in agent.run("What is the weather in Paris?", stream=True, yield_run_response=True):
+        if isinstance(event, RunOutput):
+            run_output = event
+    assert run_output is not None
+    phases = get_phases(run_output)
+    assert phases.count("model_call") == 2
+    assert "tool_call" in phases
+
+
+@pytest.mark.asyncio
+async def test_agent_arun_records_run_phases():
+    agent = Agent(
+        model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), tools=[get_weather], record_timings=True
+    )
+
+    run_output = await agent.arun("What is the weather in Paris?")
+
+    phases = get_phases(run_output)
+    assert phases.count("model_call") == 2
+    assert "tool_call" in phases
+    assert "session_read" in phases
+
+
+def test_timings_are_off_by_default_and_published_when_recorded():
+    published: List[Any] = []
+    add_run_timings_listener(published.append)
+    try:
+        run_output = Agent(
+            model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), tools=[get_weather]
+        ).run("What is the weather in Paris?")
+        assert run_output.timings is None
+        assert "timings" not in run_output.to_dict()
+        assert published == []
+
+        run_output = Agent(
+            model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]),
+            tools=[get_weather],
+            record_timings=True,
+        ).run("Weather in Paris?")
+        assert published == [run_output]
+    finally:
+        remove_run_timings_listener(published.append)
+
+
+def test_opentelemetry_export():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from agno.run.tracing import OpenTelemetryRunExporter
+
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    exporter = OpenTelemetryRunExporter(tracer_provider=tracer_provider)
+
+    run_output = Agent(
+        model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), tools=[get_weather], record_timings=True
+    ).run("Weather in Paris?")
+    exporter.export(run_output)
+
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    run_span = spans["agent.run"]
+    assert run_span.attributes["agno.run_id"] == run_output.run_id
+    tool_span = spans["tool_call"]
+    assert tool_span.parent.span_id == run_span.context.span_id
+    assert tool_span.attributes["agno.tool_name"] == "get_weather"
+    assert run_span.start_time <= tool_span.start_time <= tool_span.end_time <= run_span.end_time
+
+
+def test_prometheus_metrics_endpoint():
+    from fastapi.testclient import TestClient
+
+    from agno.os import AgentOS
+
+    agent = Agent(
+        id="weather-agent", model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), tools=[get_weather]
+    )
+    agent_os = AgentOS(agents=[agent], enable_prometheus_metrics=True, telemetry=False)
+    assert agent.record_timings
+    try:
+        agent.run("What is the weather in Paris?")
+        client = TestClient(agent_os.get_app())
+        response = client.get("/metrics/prometheus")
+    finally:
+        remove_run_timings_listener(agent_os.run_metrics_collector)  # type: ignore
+
+    assert response.status_code == 200
+    body = response.text
+    assert 'agno_runs_total{component="agent",id="weather-agent",status="COMPLETED"} 1' in body
+    assert "# TYPE agno_run_duration_seconds histogram" in body
+    assert 'agno_run_phase_duration_seconds_count{component="agent",id="weather-agent",phase="model_call"} 2' in body
+    assert 'agno_db_operation_duration_seconds_count{operation="session_read"} 1' in body
+    assert (
+        'agno_run_phase_duration_seconds_bucket{component="agent",id="weather-agent",phase="tool_call",le="+Inf"} 1'
+        in body
+    )
+    assert "agno_runs_in_flight 0" in body
+    assert 'agno_queue_depth{queue="memory_extraction"} 0' in body
+
+
+def test_prometheus_queue_depth_reads_the_queues_of_agents_and_team_members():
+    from agno.memory.queue import MemoryExtractionQueue
+    from agno.os.routers.prometheus import RunMetricsCollector
+    from agno.team import Team
+
+    queue, member_queue = MemoryExtractionQueue(debounce=60), MemoryExtractionQueue(debounce=60)
+    agent = Agent(model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), memory_extraction_queue=queue)
+    member = Agent(
+        model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), memory_extraction_queue=member_queue
+    )
+    team = Team(model=FakeModel(tool_calls=[GET_WEATHER_CALL], chunks=["It is sunny"]), members=[member, agent])
+    collector = RunMetricsCollector(components=[agent, team])
+
+    manager = MagicMock()
+    queue.submit(manager, [Message(role="user", content="I live in Lisbon")], user_id="alice")
+    member_queue.submit(manager, [Message(role="user", content="I have two cats")], user_id="bob")
+    member_queue.submit(manager, [Message(role="user", content="I am vegetarian")], user_id="bob")
+
+    assert collector._get_queue_depths()[0] == ((("queue", "memory_extraction"),), 3)
+    queue.flush()
+    member_queue.flush()
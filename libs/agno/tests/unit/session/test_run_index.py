@@ -0,0 +1,101 @@
+from typing import List, Optional
+
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession, TeamSession
+
+
+def build_run(
+    i: int, agent_id: str = "agent_1", status: RunStatus = RunStatus.completed, tool_call: bool = False
+) -> RunOutput:
+    messages = [Message(role="user", content=f"Question {i}")]
+    if tool_call:
+        messages.append(Message(role="assistant", tool_calls=[{"id": f"call_{i}", "type": "function"}]))
+    messages.append(Message(role="assistant", content=f"Answer {i}"))
+    return RunOutput(run_id=f"run_{i}", agent_id=agent_id, status=status, messages=messages)
+
+
+def get_contents(messages: List[Message]) -> List[Optional[str]]:
+    return [message.content for message in messages]  # type: ignore
+
+
+def test_history_from_last_runs_of_agent():
+    session = AgentSession(session_id="session_1")
+    for i in range(20):
+        status = RunStatus.error if i == 18 else RunStatus.completed
+        session.upsert_run(build_run(i, agent_id="agent_1" if i % 2 == 0 else "agent_2", status=status))
+
+    history = session.get_messages_from_last_n_runs(agent_id="agent_1", last_n=2)
+    assert get_contents(history) == ["Question 14", "Answer 14", "Question 16", "Answer 16"]
+
+    history = session.get_messages_from_last_n_runs(last_n=3)
+    assert get_contents(history) == ["Question 16", "Answer 16", "Question 17", "Answer 17", "Question 19", "Answer 19"]
+
+    assert len(session.get_messages_from_last_n_runs(agent_id="agent_2")) == 20
+
+
+def test_upsert_replaces_run_and_keeps_index():
+    session = AgentSession(session_id="session_1")
+    for i in range(5):
+        session.upsert_run(build_run(i))
+
+    paused = build_run(5, status=RunStatus.paused)
+    session.upsert_run(paused)
+    assert get_contents(session.get_messages_from_last_n_runs(last_n=1)) == ["Question 4", "Answer 4"]
+
+    completed = build_run(5, tool_call=True)
+    session.upsert_run(completed)
+    assert len(session.runs) == 6  # type: ignore
+    assert session.get_run("run_5") is completed
+    assert session.get_run("missing") is None
+    assert get_contents(session.get_messages_from_last_n_runs(last_n=1))[0] == "Question 5"
+    assert session.get_tool_calls() == [{"id": "call_5", "type": "function"}]
+    assert "_run_index" not in session.to_dict()
+
+
+def test_index_follows_changes_to_the_runs_list():
+    session = AgentSession(session_id="session_1", runs=[build_run(0)])
+    assert session.get_run("run_0") is not None
+
+    # Runs appended directly are indexed on the next lookup
+    session.runs.append(build_run(1, tool_call=True))  # type: ignore
+    assert session.get_run("run_1") is not None
+    assert session.get_tool_calls() == [{"id": "call_1", "type": "function"}]
+
+    # A new list of runs is indexed again
+    session.runs = [build_run(2)]
+    assert session.get_run("run_1") is None
+    assert get_contents(session.get_messages_from_last_n_runs()) == ["Question 2", "Answer 2"]
+    assert session.get_tool_calls() == []
+
+
+def test_tool_calls_from_last_runs():
+    session = AgentSession(session_id="session_1")
+    for i in range(10):
+        session.upsert_run(build_run(i, tool_call=i in (2, 5, 7)))
+
+    assert [tool_call["id"] for tool_call in session.get_tool_calls()] == ["call_7", "call_5", "call_2"]
+    assert [tool_call["id"] for tool_call in session.get_tool_calls(num_calls=2)] == ["call_7", "call_5"]
+
+
+def test_team_history_skips_member_runs():
+    session = TeamSession(session_id="session_1")
+    for i in range(3):
+        team_run = TeamRunOutput(
+            run_id=f"team_run_{i}",
+            team_id="team_1",
+            status=RunStatus.completed,
+            messages=[Message(role="user", content=f"Team question {i}")],
+        )
+        member_run = build_run(i)
+        member_run.parent_run_id = team_run.run_id
+        session.upsert_run(member_run)
+        session.upsert_run(team_run)
+
+    assert get_contents(session.get_messages_from_last_n_runs(last_n=2)) == ["Team question 1", "Team question 2"]
+    assert get_contents(session.get_messages_from_last_n_runs(last_n=1, member_runs=True)) == ["Team question 2"]
+    member_history = session.get_messages_from_last_n_runs(agent_id="agent_1", last_n=1, member_runs=True)
+    assert get_contents(member_history) == ["Question 2", "Answer 2"]
+    assert session.get_run("run_1").parent_run_id == "team_run_1"  # type: ignore
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from tests.benchmarks.stubs import StubModel
+
+
+@dataclass
+class FakeModel(StubModel):
+    """
+    StubModel for tests running agents and teams, recording the number of calls and the messages of each request.
+
+    Streams exactly `chunks` when they are set, instead of splitting the reply in `stream_chunks` parts.
+    """
+
+    id: str = "fake-model"
+    name: str = "FakeModel"
+    provider: str = "Fake"
+
+    reply: str = "Hello"
+    chunks: Optional[List[str]] = None
+    # Request parameters, to test what the response cache keys cover
+    temperature: Optional[float] = None
+    api_key: Optional[str] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.chunks is not None:
+            self.reply = "".join(self.chunks)
+        self.num_calls = 0
+        self.requests: List[List[Message]] = []
+
+    def _record(self, messages: List[Message]) -> None:
+        self.num_calls += 1
+        self.requests.append(list(messages))
+
+    def _response(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]) -> ModelResponse:
+        self._record(messages)
+        return super()._response(messages, tools)
+
+    def _response_stream(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]
+    ) -> Iterator[ModelResponse]:
+        self._record(messages)
+        if self.chunks is None or self._should_call_tools(messages, tools):
+            yield from super()._response_stream(messages, tools)
+            return
+        for chunk in self.chunks:
+            yield ModelResponse(role=self.assistant_message_role, content=chunk)
@@ -344,3 +344,14 @@ def test_custom_table_name_with_special_chars(duckdb_tools_instance, mock_duckdb
     assert result == custom_table
     call_args = mock_duckdb_connection.sql.call_args[0][0]
     assert f"CREATE TABLE IF NOT EXISTS {custom_table} AS" in call_args
+
+
+def test_run_query_truncates_to_max_result_rows():
+    """Test that large results are truncated to max_result_rows."""
+    tools = DuckDbTools(max_result_rows=3)
+
+    lines = tools.run_query("SELECT * FROM range(10)").split("\n")
+
+    assert lines[:4] == ["range", "0", "1", "2"]
+    assert "truncated to the first 3 rows" in lines[4]
+    assert tools.run_query("SELECT * FROM range(3)") == "range\n0\n1\n2"
@@ -255,69 +255,81 @@ def test_function_cache_key_dict_order_independence():
     assert cache_key1 == cache_key2 == cache_key3
 
 
-def test_function_cache_file_path():
-    """Test generation of cache file paths."""
-    func = Function(name="test_func", cache_results=True, cache_dir="/tmp")
+def test_function_cache_file_path(tmp_path):
+    """Test the location of the cache files."""
+    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
 
-    cache_key = "test_key"
-    cache_file = func._get_cache_file_path(cache_key)
-    assert cache_file.startswith("/tmp/")
-    assert "test_func" in cache_file
-    assert "test_key" in cache_file
+    func._get_tool_cache().set(func.name, "test_key", {"result": "test_data"}, ttl=func._get_cache_ttl())
+    assert (tmp_path / "tool_results" / "test_func" / "test_key.json").exists()
 
 
 def test_function_cache_operations(tmp_path):
     """Test caching operations (save and retrieve)."""
     import json
-    import os
+
+    from agno.utils.cache import CACHE_MISS, FileCache
 
     func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    tool_cache = func._get_tool_cache()
 
     # Test saving to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    tool_cache.set(func.name, "test_key", test_result, ttl=func._get_cache_ttl())
 
     # Verify cache file exists and contains correct data
-    assert os.path.exists(cache_file)
-    with open(cache_file, "r") as f:
+    cache_file = tmp_path / "tool_results" / "test_func" / "test_key.json"
+    with cache_file.open("r") as f:
         cached_data = json.load(f)
     assert cached_data["result"] == {"result": "test_data"}
 
-    # Test retrieving from cache
-    retrieved_result = func._get_cached_result(cache_file)
-    assert retrieved_result == test_result
+    # Test retrieving from cache, also from another process reading the files
+    assert tool_cache.get(func.name, "test_key") == test_result
+    assert FileCache(tmp_path / "tool_results").get(func.name, "test_key") == test_result
 
     # Test retrieving non-existent cache
-    non_existent_file = os.path.join(str(tmp_path), "non_existent.json")
-    assert func._get_cached_result(non_existent_file) is None
+    assert tool_cache.get(func.name, "non_existent") is CACHE_MISS
 
 
 def test_function_cache_ttl(tmp_path):
     """Test cache TTL functionality."""
-    import os
     import time
 
+    from agno.utils.cache import CACHE_MISS
+
     func = Function(
         name="test_func",
         cache_results=True,
         cache_dir=str(tmp_path),
         cache_ttl=1,  # 1 second TTL
     )
+    tool_cache = func._get_tool_cache()
 
     # Save test data to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    tool_cache.set(func.name, "test_key", test_result, ttl=func._get_cache_ttl())
 
     # Verify cache is valid immediately
-    assert func._get_cached_result(cache_file) == test_result
+    assert tool_cache.get(func.name, "test_key") == test_result
 
     # Wait for cache to expire
     time.sleep(1.1)
 
     # Verify cache is no longer valid
-    assert func._get_cached_result(cache_file) is None
+    assert tool_cache.get(func.name, "test_key") is CACHE_MISS
+
+
+def test_function_cache_ignores_legacy_entries(tmp_path):
+    """Entries written by previous versions have no expiry time, so they are not served."""
+    import json
+
+    from agno.utils.cache import CACHE_MISS
+
+    legacy_dir = tmp_path / "functions" / "test_func"
+    legacy_dir.mkdir(parents=True)
+    (legacy_dir / "test_key.json").write_text(json.dumps({"timestamp": 0, "result": "stale"}))
+
+    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    assert func._get_tool_cache().get(func.name, "test_key") is CACHE_MISS
 
 
 def test_function_call_initialization():
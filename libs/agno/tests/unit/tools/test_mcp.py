@@ -1,8 +1,22 @@
+import asyncio
+import time
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
+import anyio
 import pytest
+from mcp import StdioServerParameters
+from mcp.types import ListToolsResult, ServerNotification, Tool, ToolListChangedNotification
 
-from agno.tools.mcp import MCPTools, MultiMCPTools
+from agno.tools.mcp import (
+    MCPSessionPool,
+    MCPTools,
+    MultiMCPTools,
+    SSEClientParams,
+    StreamableHTTPClientParams,
+    _MCPConnection,
+    get_shared_mcp_session_pool,
+)
 
 
 @pytest.mark.asyncio
@@ -75,3 +89,171 @@ async def test_mcp_include_exclude_tools_bad_values(mcp_tools, kwargs):
     with pytest.raises(ValueError, match="not present in the toolkit"):
         tools.session = session_mock
         await tools.initialize()
+
+
+class FakeConnections:
+    """Opens pooled connections with mocked sessions instead of connecting to a server"""
+
+    def __init__(self, sessions):
+        self.sessions = iter(sessions)
+        self.num_opened = 0
+
+    async def open(self, connection):
+        self.num_opened += 1
+        connection.session = next(self.sessions)
+        connection.last_used_at = time.time()
+        connection._task = asyncio.create_task(asyncio.sleep(3600))
+
+    async def close(self, connection):
+        if connection._task is not None:
+            connection._task.cancel()
+        connection._task = None
+        connection.session = None
+
+
+def patch_connections(fake):
+    return (
+        patch.object(_MCPConnection, "open", lambda connection: fake.open(connection)),
+        patch.object(_MCPConnection, "close", lambda connection: fake.close(connection)),
+    )
+
+
+def get_tools_result(*names):
+    return ListToolsResult(tools=[Tool(name=name, inputSchema={"type": "object"}) for name in names])
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reconnects_lost_sessions():
+    broken_session = AsyncMock()
+    broken_session.call_tool.side_effect = anyio.ClosedResourceError()
+    healthy_session = AsyncMock()
+    healthy_session.call_tool.return_value = "result"
+    fake = FakeConnections([broken_session, healthy_session])
+
+    open_patch, close_patch = patch_connections(fake)
+    with open_patch, close_patch:
+        pool = MCPSessionPool(StdioServerParameters(command="npx", args=["foo"]))
+        await pool.connect()
+        assert await pool.call_tool("foo", {"a": 1}) == "result"
+        await pool.close()
+
+    assert fake.num_opened == 2
+    healthy_session.call_tool.assert_awaited_once_with("foo", {"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reconnects_after_failed_health_check():
+    stale_session = AsyncMock()
+    stale_session.send_ping.side_effect = anyio.BrokenResourceError()
+    healthy_session = AsyncMock()
+    fake = FakeConnections([stale_session, healthy_session])
+
+    open_patch, close_patch = patch_connections(fake)
+    with open_patch, close_patch:
+        pool = MCPSessionPool(StdioServerParameters(command="npx", args=["foo"]), health_check_interval=0)
+        await pool.connect()
+        await asyncio.sleep(0.01)
+        await pool.call_tool("foo")
+        await pool.close()
+
+    stale_session.call_tool.assert_not_awaited()
+    healthy_session.call_tool.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_pool_times_out_tool_calls():
+    async def slow_call(*args, **kwargs):
+        await asyncio.sleep(1)
+
+    session = AsyncMock()
+    session.call_tool.side_effect = slow_call
+    fake = FakeConnections([session])
+
+    open_patch, close_patch = patch_connections(fake)
+    with open_patch, close_patch:
+        pool = MCPSessionPool(StdioServerParameters(command="npx", args=["foo"]), call_timeout_seconds=0.05)
+        await pool.connect()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.call_tool("slow")
+        await pool.close()
+
+
+def test_session_pool_read_timeout_is_capped_by_the_transport_timeout():
+    stdio_pool = MCPSessionPool(StdioServerParameters(command="npx", args=["foo"]), timeout_seconds=10)
+    sse_pool = MCPSessionPool(SSEClientParams(url="http://localhost/sse", timeout=3), timeout_seconds=10)
+    http_pool = MCPSessionPool(
+        StreamableHTTPClientParams(url="http://localhost/mcp", timeout=timedelta(seconds=4)), timeout_seconds=10
+    )
+
+    assert stdio_pool._get_read_timeout_seconds() == 10
+    assert sse_pool._get_read_timeout_seconds() == 3
+    assert http_pool._get_read_timeout_seconds() == 4
+    assert (
+        MCPSessionPool(SSEClientParams(url="http://localhost/sse"), timeout_seconds=2)._get_read_timeout_seconds() == 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_pool_caches_tools_until_they_change():
+    session = AsyncMock()
+    session.list_tools.side_effect = [get_tools_result("foo"), get_tools_result("foo", "bar")]
+    fake = FakeConnections([session])
+    tools_changed = asyncio.Event()
+
+    async def on_tools_changed():
+        tools_changed.set()
+
+    open_patch, close_patch = patch_connections(fake)
+    with open_patch, close_patch:
+        pool = MCPSessionPool(StdioServerParameters(command="npx", args=["foo"]))
+        pool.add_tools_changed_callback(on_tools_changed)
+        await pool.connect()
+        assert [tool.name for tool in (await pool.list_tools()).tools] == ["foo"]
+        assert [tool.name for tool in (await pool.list_tools()).tools] == ["foo"]
+
+        await pool._handle_message(
+            ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed"))
+        )
+        await asyncio.wait_for(tools_changed.wait(), timeout=1)
+        assert [tool.name for tool in (await pool.list_tools()).tools] == ["foo", "bar"]
+        await pool.close()
+
+    assert session.list_tools.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_session_pool_is_closed_by_last_user():
+    fake = FakeConnections([AsyncMock()])
+    server_params = StdioServerParameters(command="npx", args=["foo"])
+
+    open_patch, close_patch = patch_connections(fake)
+    with open_patch, close_patch:
+        pool = get_shared_mcp_session_pool(server_params)
+        assert get_shared_mcp_session_pool(StdioServerParameters(command="npx", args=["foo"])) is pool
+        other_pool = get_shared_mcp_session_pool(StdioServerParameters(command="npx", args=["bar"]))
+        assert other_pool is not pool
+        await other_pool.release()
+        await pool.connect()
+
+        await pool.release()
+        assert pool.is_connected
+        await pool.release()
+        assert not pool.is_connected
+        assert get_shared_mcp_session_pool(server_params) is not pool
+
+
+@pytest.mark.asyncio
+async def test_multimcp_connects_to_servers_concurrently():
+    async def slow_connect(pool):
+        await asyncio.sleep(0.2)
+
+    async def list_tools(pool):
+        return get_tools_result(pool.server_params.args[0])
+
+    with patch.object(MCPSessionPool, "connect", slow_connect), patch.object(MCPSessionPool, "list_tools", list_tools):
+        tools = MultiMCPTools(commands=["npx foo", "npx bar", "npx baz"])
+        start = time.perf_counter()
+        await tools.connect()
+        assert time.perf_counter() - start < 0.5
+        assert list(tools.functions) == ["foo", "bar", "baz"]
+        await tools.close()
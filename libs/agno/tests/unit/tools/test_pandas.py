@@ -83,3 +83,20 @@ def test_run_dataframe_operation(pandas_tools):
         dataframe_name="nonexistent_df", operation="head", operation_parameters={"n": 2}
     )
     assert "Error running operation:" in result
+
+
+def test_run_dataframe_operation_result_guards():
+    tools = PandasTools(max_result_rows=2, result_format="csv")
+    tools.create_pandas_dataframe(
+        dataframe_name="test_df",
+        create_using_function="DataFrame",
+        function_parameters={"data": {"col1": [1, 2, 3], "col2": ["a", "b", "c"]}},
+    )
+
+    result = tools.run_dataframe_operation(dataframe_name="test_df", operation="head", operation_parameters={"n": 3})
+    lines = result.split("\n")
+    assert lines[:3] == [",col1,col2", "0,1,a", "1,2,b"]
+    assert "truncated to the first 2 rows" in lines[3]
+
+    result = tools.run_dataframe_operation(dataframe_name="test_df", operation="head", operation_parameters={"n": 1})
+    assert result == ",col1,col2\n0,1,a"
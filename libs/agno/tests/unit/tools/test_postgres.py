@@ -1,4 +1,4 @@
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import psycopg
 import pytest
@@ -243,3 +243,44 @@ class TestPostgresTools:
 
             # Verify readonly session was set
             assert mock_connection.read_only is True
+
+    def test_max_result_rows_uses_server_side_cursor(self, postgres_tools, mock_connection, mock_cursor):
+        """Test that SELECT results are fetched with a named cursor and truncated."""
+        mock_connection.autocommit = False
+        mock_cursor.description = [("id",), ("name",), ("salary",), ("department_id",)]
+        batches = [MOCK_EXPORT_DATA[:3], []]
+        mock_cursor.fetchmany.side_effect = lambda size: batches.pop(0)[:size]
+        postgres_tools.max_result_rows = 2
+
+        result = postgres_tools.run_query("SELECT * FROM employees;")
+
+        mock_connection.cursor.assert_called_with(name="agno_query")
+        mock_cursor.fetchall.assert_not_called()
+        lines = result.split("\n")
+        assert lines[:3] == ["id,name,salary,department_id", "1,Alice,75000,1", "2,Bob,80000,2"]
+        assert "truncated to the first 2 rows" in lines[3]
+
+    @pytest.mark.asyncio
+    async def test_async_run_query(self):
+        """Test that the async tools run queries on an async connection."""
+        async_cursor = MagicMock()
+        async_cursor.__aenter__.return_value = async_cursor
+        async_cursor.execute = AsyncMock()
+        async_cursor.fetchall = AsyncMock(return_value=MOCK_COUNT_RESULT)
+        async_cursor.description = [("count",)]
+        async_connection = MagicMock(closed=False, autocommit=False)
+        async_connection.cursor.return_value = async_cursor
+        async_connection.set_read_only = AsyncMock()
+
+        tools = PostgresTools(host="localhost", db_name="testdb", async_tools=True)
+        assert "arun_query" in tools.functions and "run_query" not in tools.functions
+
+        with patch("psycopg.AsyncConnection.connect", AsyncMock(return_value=async_connection)) as mock_connect:
+            assert await tools.arun_query("SELECT COUNT(*) FROM employees;") == "count\n3"
+            assert await tools.ashow_tables() == "count\n3"
+
+        mock_connect.assert_awaited_once()
+        async_connection.set_read_only.assert_awaited_once_with(True)
+        async_cursor.execute.assert_awaited_with(
+            "SELECT table_name FROM information_schema.tables WHERE table_schema = %s;", ("public",)
+        )
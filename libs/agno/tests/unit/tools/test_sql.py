@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from sqlalchemy import event
+
+from agno.tools.sql import SQLTools
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    tools = SQLTools(db_url=url)
+    tools.run_sql("CREATE TABLE employees (id INTEGER, name TEXT)")
+    tools.run_sql("INSERT INTO employees VALUES (1, 'Alice'), (2, 'Bob'), (3, 'Charlie'), (4, 'Dana')")
+    return url
+
+
+def test_engine_is_shared_by_toolkits(db_url):
+    tools = SQLTools(db_url=db_url)
+
+    assert SQLTools(db_url=db_url).db_engine is tools.db_engine
+    assert SQLTools(db_url=db_url, engine_kwargs={"echo": False}).db_engine is not tools.db_engine
+    assert SQLTools(db_url=db_url, share_engine=False).db_engine is not tools.db_engine
+
+
+def test_run_sql_query(db_url):
+    tools = SQLTools(db_url=db_url)
+
+    assert json.loads(tools.list_tables()) == ["employees"]
+    assert json.loads(tools.run_sql_query("SELECT * FROM employees", limit=2)) == [
+        {"id": 1, "name": "Alice"},
+        {"id": 2, "name": "Bob"},
+    ]
+    assert len(json.loads(tools.run_sql_query("SELECT * FROM employees", limit=None))) == 4
+    assert json.loads(tools.run_sql_query("UPDATE employees SET name = 'Eve' WHERE id = 4")) == []
+
+
+def test_max_result_rows_truncates_results(db_url):
+    tools = SQLTools(db_url=db_url, max_result_rows=3)
+
+    result = tools.run_sql_query("SELECT * FROM employees", limit=None)
+    rows, notice = result.rsplit("\n", 1)
+    assert len(json.loads(rows)) == 3
+    assert "truncated to the first 3 rows" in notice
+
+    # Rows left out by the requested limit are not reported as truncated
+    assert len(json.loads(tools.run_sql_query("SELECT * FROM employees", limit=2))) == 2
+    assert len(json.loads(tools.run_sql_query("SELECT * FROM employees WHERE id > 1", limit=None))) == 3
+
+
+def test_compact_result_formats(db_url):
+    query = "SELECT * FROM employees WHERE id < 3"
+
+    assert json.loads(SQLTools(db_url=db_url, result_format="columnar").run_sql_query(query)) == {
+        "columns": ["id", "name"],
+        "rows": [[1, "Alice"], [2, "Bob"]],
+    }
+    assert SQLTools(db_url=db_url, result_format="csv").run_sql_query(query) == "id,name\n1,Alice\n2,Bob"
+
+
+@pytest.mark.asyncio
+async def test_async_tools_without_async_engine(db_url):
+    tools = SQLTools(db_url=db_url, async_tools=True, max_result_rows=2, result_format="csv")
+
+    assert list(tools.functions) == ["alist_tables", "adescribe_table", "arun_sql_query"]
+    assert json.loads(await tools.alist_tables()) == ["employees"]
+    assert json.loads(await tools.adescribe_table("employees"))[0]["name"] == "id"
+    result = await tools.arun_sql_query("SELECT name FROM employees", limit=None)
+    assert result.startswith("name\nAlice\nBob\n")
+    assert "truncated" in result
+
+
+def test_only_bounded_select_queries_use_a_server_side_cursor(db_url):
+    tools = SQLTools(db_url=db_url, share_engine=False, max_result_rows=3)
+    streamed = {}
+
+    @event.listens_for(tools.db_engine, "before_execute")
+    def record_stream_results(conn, clauseelement, multiparams, params, execution_options):
+        streamed[str(clauseelement)] = clauseelement.get_execution_options().get("stream_results", False)
+
+    tools.run_sql_query("SELECT * FROM employees")
+    tools.run_sql_query("INSERT INTO employees VALUES (5, 'Frank')")
+    tools.run_sql_query("UPDATE employees SET name = 'Eve' WHERE id = 4")
+
+    assert streamed == {
+        "SELECT * FROM employees": True,
+        "INSERT INTO employees VALUES (5, 'Frank')": False,
+        "UPDATE employees SET name = 'Eve' WHERE id = 4": False,
+    }
+    # Results are only streamed when they are bounded by max_result_rows
+    assert not SQLTools(db_url=db_url)._use_server_side_cursor("SELECT * FROM employees")
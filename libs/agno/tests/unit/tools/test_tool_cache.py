@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from agno.tools.cache import ToolCache
+from agno.tools.function import Function, FunctionCall
+from agno.tools.toolkit import Toolkit
+from agno.utils.cache import CACHE_MISS, FileCache, InMemoryCache, SqliteCache
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    memory = InMemoryCache(max_entries=2)
+    memory.set("fn", "a", 1)
+    memory.set("fn", "b", 2)
+    assert memory.get("fn", "a") == 1  # "b" is now the least recently used
+    memory.set("fn", "c", 3)
+
+    assert memory.get("fn", "b") is CACHE_MISS
+    assert memory.get("fn", "a") == 1
+    assert memory.get("fn", "c") == 3
+
+
+def test_in_memory_cache_size_and_ttl():
+    memory = InMemoryCache(max_size_bytes=10)
+    memory.set("fn", "big", "x" * 100)
+    assert memory.get("fn", "big") is CACHE_MISS
+
+    memory.set("fn", "short", "ok", ttl=0)
+    time.sleep(0.01)
+    assert memory.get("fn", "short") is CACHE_MISS
+    assert len(memory) == 0
+
+
+def test_shared_tier_fills_memory_tier(tmp_path):
+    shared = SqliteCache(db_file=tmp_path / "tool_cache.db")
+    ToolCache(shared=shared).set("fn", "key", {"answer": 42})
+
+    # A new process only shares the SQLite tier
+    tool_cache = ToolCache(shared=shared)
+    assert tool_cache.memory is not None
+    assert tool_cache.memory.get("fn", "key") is CACHE_MISS
+    assert tool_cache.get("fn", "key") == {"answer": 42}
+    assert tool_cache.memory.get("fn", "key") == {"answer": 42}
+
+    tool_cache.clear("fn")
+    assert shared.get("fn", "key") is CACHE_MISS
+
+
+def test_file_cache_skips_non_serializable_results(tmp_path):
+    file_cache = FileCache(cache_dir=tmp_path)
+    file_cache.set("fn", "key", object())
+    assert file_cache.get("fn", "key") is CACHE_MISS
+
+    file_cache.set("fn", "key", [1, 2])
+    assert file_cache.get("fn", "key") == [1, 2]
+    assert file_cache.get_path("fn", "key").exists()
+
+
+def test_function_call_reports_cache_hits():
+    calls = []
+
+    def add(a: int, b: int) -> int:
+        calls.append((a, b))
+        return a + b
+
+    tool_cache = ToolCache()
+    func = Function.from_callable(add)
+    func.tool_cache = tool_cache
+
+    first = FunctionCall(function=func, arguments={"a": 1, "b": 2})
+    assert first.execute().result == 3
+    assert first.cache_hit is False
+
+    second = FunctionCall(function=func, arguments={"a": 1, "b": 2})
+    assert second.execute().result == 3
+    assert second.cache_hit is True
+
+    assert calls == [(1, 2)]
+    assert tool_cache.stats.to_dict() == {"hits": 1, "misses": 1, "coalesced": 0}
+
+
+def test_function_call_without_cache_has_no_cache_status():
+    func = Function.from_callable(lambda: "result")
+    call = FunctionCall(function=func, arguments={})
+    call.execute()
+    assert call.cache_hit is None
+
+
+def test_identical_concurrent_calls_run_once():
+    num_calls = 0
+    started = threading.Event()
+
+    def slow_lookup(query: str) -> str:
+        nonlocal num_calls
+        num_calls += 1
+        started.set()
+        time.sleep(0.2)
+        return f"result for {query}"
+
+    tool_cache = ToolCache()
+    func = Function.from_callable(slow_lookup)
+    func.tool_cache = tool_cache
+
+    def run_call() -> FunctionCall:
+        call = FunctionCall(function=func, arguments={"query": "agno"})
+        call.execute()
+        return call
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(run_call)
+        started.wait()
+        others = [executor.submit(run_call) for _ in range(3)]
+        calls = [first.result()] + [f.result() for f in others]
+
+    assert num_calls == 1
+    assert all(call.result == "result for agno" for call in calls)
+    assert sorted(call.cache_hit for call in calls) == [False, True, True, True]  # type: ignore
+    assert tool_cache.stats.coalesced == 3
+
+
+def test_identical_concurrent_async_calls_run_once():
+    num_calls = 0
+
+    async def slow_lookup(query: str) -> str:
+        nonlocal num_calls
+        num_calls += 1
+        await asyncio.sleep(0.05)
+        return f"result for {query}"
+
+    func = Function.from_callable(slow_lookup)
+    func.tool_cache = ToolCache()
+
+    async def run_calls():
+        calls = [FunctionCall(function=func, arguments={"query": "agno"}) for _ in range(5)]
+        await asyncio.gather(*(call.aexecute() for call in calls))
+        return calls
+
+    calls = asyncio.run(run_calls())
+    assert num_calls == 1
+    assert [call.cache_hit for call in calls].count(False) == 1
+    assert all(call.result == "result for agno" for call in calls)
+
+
+def test_failed_calls_are_not_cached():
+    attempts = 0
+
+    def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ValueError("temporary failure")
+        return "ok"
+
+    func = Function.from_callable(flaky)
+    func.tool_cache = ToolCache()
+
+    assert FunctionCall(function=func, arguments={}).execute().status == "failure"
+    assert FunctionCall(function=func, arguments={}).execute().result == "ok"
+    assert attempts == 2
+
+
+def test_toolkit_passes_tool_cache_to_functions():
+    def ping() -> str:
+        return "pong"
+
+    tool_cache = ToolCache(ttl=60)
+    toolkit = Toolkit(name="ping_tools", tools=[ping], tool_cache=tool_cache)
+
+    func = toolkit.functions["ping"]
+    assert func.tool_cache is tool_cache
+    assert func._is_caching_enabled()
+    assert func._get_cache_ttl() is None
@@ -0,0 +1,91 @@
+import re
+
+from agno.agent.agent import Agent
+from agno.tools.output import ToolOutputManager
+from tests.unit.stubs import FakeModel
+
+LOG_LINES = [f"line {i}: {'error' if i % 1000 == 0 else 'ok'}" for i in range(1, 5001)]
+
+
+DUMP_LOGS_CALL = ("dump_logs", {})
+
+
+def dump_logs() -> str:
+    """Return the logs"""
+    return "\n".join(LOG_LINES)
+
+
+def get_output_id(content: str) -> str:
+    match = re.search(r"output_id '(output_\w+)'", content)
+    assert match is not None
+    return match.group(1)
+
+
+def test_small_outputs_are_not_spilled():
+    manager = ToolOutputManager(max_chars=100, page_chars=50)
+    assert manager.spill("short output", tool_name="tool", namespace="ns") == "short output"
+    assert manager.spill("x" * 200, tool_name="read_tool_output", namespace="ns") == "x" * 200
+
+
+def test_retrieval_tools_page_search_and_slice():
+    manager = ToolOutputManager(max_chars=1000, preview_chars=100, page_chars=1000)
+    output = "\n".join(LOG_LINES)
+    content = manager.spill(output, tool_name="dump_logs", namespace="ns")
+    assert content.startswith(output[:100])
+    assert len(content) < 1000
+
+    output_id = get_output_id(content)
+    tools = manager.get_toolkit("ns")
+    first_page = tools.read_tool_output(output_id, page=1)
+    assert first_page.startswith(f"[Page 1 of {-(-len(output) // 1000)}]\n{output[:1000]}")
+    assert "does not exist" in tools.read_tool_output(output_id, page=1000)
+
+    matches = tools.search_tool_output(output_id, "error", context_lines=1, max_matches=2)
+    assert matches.splitlines() == [
+        "[5 matching lines, showing the first 2]",
+        "999: line 999: ok",
+        "1000: line 1000: error",
+        "1001: line 1001: ok",
+        "1999: line 1999: ok",
+        "2000: line 2000: error",
+        "2001: line 2001: ok",
+    ]
+    assert tools.slice_tool_output(output_id, 10, 11) == "10: line 10: ok\n11: line 11: ok"
+
+    # Outputs are only visible in their namespace
+    assert "No stored output" in manager.get_toolkit("other").read_tool_output(output_id)
+
+
+def test_agent_sends_preview_and_stores_reference():
+    model = FakeModel(tool_calls=[DUMP_LOGS_CALL], chunks=["Done"])
+    manager = ToolOutputManager(max_chars=5000, preview_chars=500, page_chars=4000)
+    agent = Agent(model=model, tools=[dump_logs], tool_output_manager=manager)
+
+    run_output = agent.run("Find the errors in the logs")
+    assert run_output.content == "Done"
+
+    tool_message = next(m for m in model.requests[1] if m.role == "tool")
+    assert len(tool_message.content) < 1000  # type: ignore
+    output_id = get_output_id(tool_message.content)  # type: ignore
+
+    # The run keeps the reference, not the full output
+    assert run_output.tools[0].result == tool_message.content  # type: ignore
+    stored_tool_message = next(m for m in run_output.messages if m.role == "tool")  # type: ignore
+    assert stored_tool_message.content == tool_message.content
+
+    # The model can read the full output with the retrieval tools
+    tool_names = [tool["function"]["name"] for tool in agent._tools_for_model]  # type: ignore
+    assert {"read_tool_output", "search_tool_output", "slice_tool_output"} <= set(tool_names)
+    namespace = manager.get_namespace(run_id=run_output.run_id, session_id=run_output.session_id)
+    assert manager.get(namespace, output_id) == dump_logs()
+
+
+def test_run_scoped_outputs_are_dropped_after_the_run():
+    model = FakeModel(tool_calls=[DUMP_LOGS_CALL], chunks=["Done"])
+    manager = ToolOutputManager(max_chars=5000, preview_chars=500, page_chars=4000, scope="run")
+    agent = Agent(model=model, tools=[dump_logs], tool_output_manager=manager)
+
+    run_output = agent.run("Find the errors in the logs")
+    output_id = get_output_id(next(m for m in model.requests[1] if m.role == "tool").content)  # type: ignore
+    namespace = manager.get_namespace(run_id=run_output.run_id, session_id=run_output.session_id)
+    assert manager.get(namespace, output_id) is None
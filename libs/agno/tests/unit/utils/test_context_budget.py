@@ -0,0 +1,99 @@
+from agno.agent.agent import Agent
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.run.agent import RunOutput
+from agno.session.agent import AgentSession
+from agno.utils.context_budget import ContextBudget, apply_context_budget, split_into_turns
+from agno.utils.tokens import ApproximateTokenizer, Tokenizer, count_message_tokens
+
+
+class CountingTokenizer(Tokenizer):
+    """One token per word, counting how often it is called."""
+
+    name = "words"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count_tokens(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+
+def _turn(i: int, words: int = 10):
+    return [
+        Message(role="user", content=f"question {i} " + "word " * words),
+        Message(role="assistant", content=f"answer {i} " + "word " * words),
+    ]
+
+
+def test_count_message_tokens_is_cached():
+    tokenizer = CountingTokenizer()
+    message = Message(role="user", content="one two three")
+
+    assert count_message_tokens(message, tokenizer) == 3 + 4
+    assert count_message_tokens(message, tokenizer) == 3 + 4
+    assert tokenizer.calls == 1
+    # A different tokenizer has its own count
+    assert count_message_tokens(message, ApproximateTokenizer()) != count_message_tokens(message, tokenizer)
+
+
+def test_split_into_turns():
+    messages = _turn(1) + [Message(role="tool", content="result")] + _turn(2)
+    turns = split_into_turns(messages)
+    assert [len(turn) for turn in turns] == [3, 2]
+
+
+def test_budget_drops_oldest_turns_first():
+    history = _turn(1) + _turn(2) + _turn(3)
+    system = Message(role="system", content="You are helpful")
+    user = Message(role="user", content="new question")
+    # Each history message is 12 words + 4 overhead = 16 tokens, so a turn is 32 tokens
+    budget = ContextBudget(max_tokens=100, tokenizer=CountingTokenizer())
+
+    selected, include_additional, breakdown = apply_context_budget(budget, [system, user], history)
+
+    assert selected == history[2:]
+    assert include_additional is False
+    assert breakdown["history_tokens"] == 64
+    assert breakdown["dropped_history_messages"] == 2
+    assert breakdown["total_tokens"] <= 100
+
+
+def test_budget_per_model():
+    budget = ContextBudget(max_tokens=100, model_max_tokens={"small-model": 10})
+    assert budget.get_max_tokens("small-model") == 10
+    assert budget.get_max_tokens("other-model") == 100
+
+
+def test_additional_messages_come_after_recent_turns():
+    history = _turn(1) + _turn(2) + _turn(3)
+    user = Message(role="user", content="new question")
+    example = Message(role="user", content="example " + "word " * 40)
+    budget = ContextBudget(max_tokens=110, tokenizer=CountingTokenizer(), num_recent_turns=2)
+
+    selected, include_additional, _ = apply_context_budget(budget, [user], history, additional_messages=[example])
+
+    # The two recent turns fit, the example does not, and the oldest turn still does
+    assert include_additional is False
+    assert selected == history
+
+
+def test_agent_run_messages_respect_context_budget():
+    session = AgentSession(session_id="session_1")
+    session.runs = [RunOutput(run_id=f"run_{i}", messages=_turn(i, words=50)) for i in range(3)]
+    agent = Agent(
+        build_context=False,
+        add_history_to_context=True,
+        context_budget=ContextBudget(max_tokens=150, tokenizer=CountingTokenizer()),
+    )
+    run_response = RunOutput(run_id="run_3", metrics=Metrics())
+
+    run_messages = agent._get_run_messages(
+        run_response=run_response, input="new question", session=session, add_history_to_context=True
+    )
+
+    history_messages = [m for m in run_messages.messages if m.from_history]
+    assert [m.content.split()[1] for m in history_messages] == ["2", "2"]
+    assert run_messages.messages[-1].content == "new question"
+    assert run_response.metrics.additional_metrics["context_budget"]["dropped_history_messages"] == 4
@@ -0,0 +1,80 @@
+"""Guards the cold-start cost of the main entrypoints.
+
+Optional subsystems should only be imported on first use, so these tests fail when a module-level import pulls
+one of them back in, or when importing an entrypoint gets much slower.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Generous budgets for the cumulative import time, in milliseconds, to catch large regressions without flakiness
+IMPORT_TIME_BUDGETS_MS = {
+    "agno.agent": 1500,
+    "agno.team": 1500,
+    "agno.os": 3000,
+}
+
+# Modules that must not be loaded by importing the entrypoint
+LAZY_MODULES = {
+    "agno.agent": [
+        "agno.knowledge.knowledge",
+        "agno.memory.manager",
+        "agno.culture.manager",
+        "agno.utils.print_response.agent",
+        "rich.markdown",
+        "httpx",
+    ],
+    "agno.team": [
+        "agno.knowledge.knowledge",
+        "agno.memory.manager",
+        "agno.utils.print_response.team",
+        "rich.markdown",
+        "httpx",
+    ],
+    "agno.os": [
+        "agno.knowledge.knowledge",
+        "agno.os.routers.knowledge",
+        "agno.os.routers.evals",
+        "agno.os.routers.memory",
+        "agno.utils.print_response.workflow",
+        "rich.markdown",
+    ],
+}
+
+
+def get_import_times(module: str) -> Dict[str, int]:
+    """Import a module in a new interpreter and return the cumulative import time of each module, in microseconds"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        import_times.setdefault(name.strip(), int(cumulative))
+    return import_times
+
+
+@pytest.mark.parametrize("module", sorted(LAZY_MODULES))
+def test_optional_subsystems_are_imported_lazily(module):
+    import_times = get_import_times(module)
+    assert module in import_times
+    loaded = [lazy_module for lazy_module in LAZY_MODULES[module] if lazy_module in import_times]
+    assert loaded == [], f"Importing {module} loads {loaded}"
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_TIME_BUDGETS_MS))
+def test_import_time_budget(module):
+    # The first import can include compiling bytecode, so keep the fastest of a few runs
+    import_time_ms = min(get_import_times(module)[module] for _ in range(3)) / 1000
+    assert import_time_ms < IMPORT_TIME_BUDGETS_MS[module], (
+        f"Importing {module} took {import_time_ms:.0f}ms, over the budget of {IMPORT_TIME_BUDGETS_MS[module]}ms"
+    )
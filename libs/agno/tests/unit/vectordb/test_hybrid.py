@@ -0,0 +1,200 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.vectordb.base import VectorDb
+from agno.vectordb.bm25 import BM25Index
+from agno.vectordb.fusion import SEARCH_SCORES_KEY, FusionMethod, fuse_results
+from agno.vectordb.hybrid import HybridSearch
+
+
+class FakeVectorDb(VectorDb):
+    """Vector database without keyword search, returning its documents in insertion order"""
+
+    def __init__(self):
+        super().__init__(name="fake")
+        self.documents: List[Document] = []
+        self.search_calls: List[Dict[str, Any]] = []
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        self.search_calls.append({"query": query, "limit": limit, "filters": filters})
+        return [
+            doc for doc in self.documents if not filters or all(doc.meta_data.get(k) == v for k, v in filters.items())
+        ][:limit]
+
+    async def async_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None):
+        return self.search(query, limit, filters)
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.documents.extend(documents)
+
+    async def async_insert(self, content_hash, documents, filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    def upsert(self, content_hash, documents, filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    async def async_upsert(self, content_hash, documents, filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    def delete_by_name(self, name: str) -> bool:
+        self.documents = [doc for doc in self.documents if doc.name != name]
+        return True
+
+    def create(self) -> None: ...
+    async def async_create(self) -> None: ...
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return False
+
+    def drop(self) -> None: ...
+    async def async_drop(self) -> None: ...
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return True
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        return True
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None: ...
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return True
+
+    def get_supported_search_types(self) -> List[str]:
+        return ["vector"]
+
+
+def doc(content: str, **meta_data) -> Document:
+    return Document(content=content, name=content.split()[0], meta_data=meta_data)
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    a, b, c = doc("alpha"), doc("beta"), doc("gamma")
+    results = fuse_results({"vector": [a, b, c], "keyword": [b, c]}, method=FusionMethod.rrf, rrf_k=60)
+
+    # beta is ranked high by both signals, which beats first place in one signal only
+    assert [result.content for result in results] == ["beta", "gamma", "alpha"]
+    scores = results[0].meta_data[SEARCH_SCORES_KEY]
+    assert scores["vector"] == {"rank": 2, "score": None}
+    assert scores["keyword"] == {"rank": 1, "score": None}
+    assert scores["fused"] == pytest.approx(1 / 62 + 1 / 61)
+    # The input documents are not modified
+    assert SEARCH_SCORES_KEY not in b.meta_data
+
+
+def test_weighted_fusion_normalizes_scores_per_signal():
+    a, b = doc("alpha"), doc("beta")
+    results = fuse_results(
+        {"vector": [a, b], "keyword": [b, a]},
+        scores={"keyword": [1000.0, 10.0]},
+        method=FusionMethod.weighted,
+        weights={"vector": 0.4, "keyword": 0.6},
+    )
+    assert [result.content for result in results] == ["beta", "alpha"]
+    assert results[0].meta_data[SEARCH_SCORES_KEY]["keyword"]["score"] == 1000.0
+
+    custom = fuse_results({"vector": [a, b]}, method=lambda signals: -signals["vector"]["rank"], limit=1)
+    assert [result.content for result in custom] == ["alpha"]
+
+
+def test_bm25_index_ranks_and_filters():
+    index = BM25Index()
+    index.add(
+        [doc("thai green curry with coconut", cuisine="thai"), doc("tom kha gai coconut soup", cuisine="thai")],
+        content_hash="thai",
+    )
+    index.add([doc("pasta with tomato sauce", cuisine="italian")], content_hash="italian")
+
+    results = index.search("coconut soup", limit=5)
+    assert [document.content for document, _ in results] == [
+        "tom kha gai coconut soup",
+        "thai green curry with coconut",
+    ]
+    assert results[0][1] > results[1][1] > 0
+    assert index.search("coconut", filters={"cuisine": "italian"}) == []
+
+    assert index.remove_content_hash("thai") == 2
+    assert index.search("coconut") == []
+    assert len(index) == 1
+
+
+def test_hybrid_search_uses_local_keyword_index_for_databases_without_keyword_search():
+    vector_db = FakeVectorDb()
+    hybrid = HybridSearch(vector_db, candidate_multiplier=2)
+    hybrid.insert("hash", [doc("pasta with tomato sauce"), doc("rice noodles"), doc("tom kha gai coconut soup")])
+
+    results = hybrid.search("coconut soup", limit=2)
+
+    assert vector_db.search_calls[0]["limit"] == 4
+    # The only keyword match is ranked by both signals, so it comes first
+    assert results[0].content == "tom kha gai coconut soup"
+    assert set(results[0].meta_data[SEARCH_SCORES_KEY]) == {"vector", "keyword", "fused"}
+    assert set(results[1].meta_data[SEARCH_SCORES_KEY]) == {"vector", "fused"}
+
+    hybrid.delete_by_name("tom")
+    assert len(hybrid.keyword_index) == 2
+    # Attributes of the vector database are available on the wrapper
+    assert hybrid.documents is vector_db.documents
+
+
+@pytest.mark.asyncio
+async def test_async_hybrid_search_runs_both_signals():
+    vector_db = FakeVectorDb()
+    hybrid = HybridSearch(vector_db)
+    await hybrid.async_insert("hash", [doc("rice noodles", cuisine="thai"), doc("pasta", cuisine="italian")])
+
+    results = await hybrid.async_search("pasta", limit=5, filters={"cuisine": "italian"})
+
+    assert [result.content for result in results] == ["pasta"]
+    assert set(results[0].meta_data[SEARCH_SCORES_KEY]) == {"vector", "keyword", "fused"}
+
+
+def test_empty_keyword_index_is_rebuilt_or_reported_on_first_use(caplog):
+    vector_db = FakeVectorDb()
+    vector_db.insert("hash", [doc("pasta with tomato sauce"), doc("tom kha gai coconut soup")])
+
+    # After a restart the local index is empty, while the vector database still holds the documents
+    with caplog.at_level("WARNING", logger="agno"):
+        HybridSearch(vector_db).search("coconut soup", limit=2)
+    assert "keyword index of HybridSearch is empty" in caplog.text
+
+    hybrid = HybridSearch(vector_db, load_documents=lambda: vector_db.documents)
+    results = hybrid.search("coconut soup", limit=2)
+    assert len(hybrid.keyword_index) == 2
+    assert set(results[0].meta_data[SEARCH_SCORES_KEY]) == {"vector", "keyword", "fused"}
+
+
+@pytest.mark.asyncio
+async def test_async_search_rebuilds_the_keyword_index_off_the_event_loop():
+    vector_db = FakeVectorDb()
+    vector_db.insert("hash", [doc("pasta with tomato sauce"), doc("tom kha gai coconut soup")])
+    loading_threads = []
+
+    def load_documents() -> List[Document]:
+        loading_threads.append(threading.current_thread())
+        return vector_db.documents
+
+    hybrid = HybridSearch(vector_db, load_documents=load_documents)
+    results = await hybrid.async_search("coconut soup", limit=2)
+
+    assert loading_threads and loading_threads[0] is not threading.main_thread()
+    assert len(hybrid.keyword_index) == 2
+    assert results[0].content == "tom kha gai coconut soup"
@@ -1,12 +1,19 @@
+import asyncio
 import uuid
-from unittest.mock import MagicMock, patch
+from copy import deepcopy
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import URL, Engine
 from sqlalchemy.orm import Session
 
 from agno.knowledge.document import Document
+from agno.vectordb.fusion import FusionMethod
 from agno.vectordb.pgvector import PgVector
+from agno.vectordb.pgvector.pgvector import get_async_db_url
 from agno.vectordb.search import SearchType
 
 # Configuration for tests
@@ -677,3 +684,165 @@ def test_delete_by_metadata_complex(mock_pgvector):
         result = mock_pgvector.delete_by_metadata({"spicy": False})
         assert result is True
         mock_delete_by_metadata.assert_called_once_with({"spicy": False})
+
+
+class FakeAsyncResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeAsyncConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements: List[Any] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        return FakeAsyncResult(self.rows)
+
+
+class FakeAsyncEngine:
+    def __init__(self, rows=None):
+        self.connection = FakeAsyncConnection(rows or [])
+
+    def begin(self):
+        return self.connection
+
+    def connect(self):
+        return self.connection
+
+
+@pytest.fixture
+def async_embedder():
+    embedder = MagicMock()
+    embedder.dimensions = 3
+    embedder.async_get_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    embedder.async_get_embedding_and_usage = AsyncMock(return_value=([0.1, 0.2, 0.3], None))
+    embedder.enable_batch = False
+    return embedder
+
+
+def get_async_pgvector(embedder, async_db_engine=None, **kwargs) -> PgVector:
+    return PgVector(
+        table_name=TEST_TABLE,
+        schema=TEST_SCHEMA,
+        db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        embedder=embedder,
+        async_db_engine=async_db_engine,
+        **kwargs,
+    )
+
+
+def test_get_async_db_url():
+    assert get_async_db_url("postgresql://ai:ai@localhost/ai") == "postgresql+psycopg://ai:ai@localhost/ai"
+    assert get_async_db_url("postgresql+psycopg2://ai:ai@localhost/ai") == "postgresql+psycopg://ai:ai@localhost/ai"
+    assert get_async_db_url("postgresql+asyncpg://ai:ai@localhost/ai") == "postgresql+asyncpg://ai:ai@localhost/ai"
+
+
+def test_search_statements_are_reused_across_queries(async_embedder):
+    db = get_async_pgvector(async_embedder)
+    dialect = postgresql.dialect()
+
+    def compile_sql(stmt):
+        return str(stmt.compile(dialect=dialect))
+
+    assert compile_sql(db._get_vector_search_stmt([0.1, 0.2, 0.3], 5)) == compile_sql(
+        db._get_vector_search_stmt([0.3, 0.2, 0.1], 10)
+    )
+    assert compile_sql(db._get_hybrid_search_stmt("soup", [0.1, 0.2, 0.3], 5, {"a": 1})) == compile_sql(
+        db._get_hybrid_search_stmt("curry", [0.3, 0.2, 0.1], 5, {"a": 2})
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_search_runs_on_async_engine(async_embedder):
+    row = SimpleNamespace(
+        id="1", name="soup", meta_data={}, content="Tom Kha Gai", embedding=[0.1, 0.2, 0.3], usage=None
+    )
+    async_engine = FakeAsyncEngine(rows=[row])
+    db = get_async_pgvector(async_embedder, async_db_engine=async_engine, search_type=SearchType.hybrid)
+
+    with patch("asyncio.to_thread") as mock_to_thread:
+        results = await db.async_search("soup", limit=3, filters={"cuisine": "Thai"})
+        mock_to_thread.assert_not_called()
+
+    assert [doc.content for doc in results] == ["Tom Kha Gai"]
+    statements = [str(stmt) for stmt, _ in async_engine.connection.statements]
+    assert statements[0] == "SET LOCAL hnsw.ef_search = 5"
+    assert "hybrid_score" in statements[1]
+
+
+@pytest.mark.asyncio
+async def test_async_insert_writes_batches_on_async_engine(async_embedder):
+    async_engine = FakeAsyncEngine()
+    db = get_async_pgvector(async_embedder, async_db_engine=async_engine)
+
+    await db.async_insert(content_hash="hash", documents=create_test_documents(5), batch_size=2)
+
+    writes = async_engine.connection.statements
+    assert len(writes) == 3
+    assert [len(records) for _, records in writes] == [2, 2, 1]
+    assert writes[0][1][0]["embedding"] == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_async_engine_belongs_to_the_instance(async_embedder):
+    db = get_async_pgvector(async_embedder)
+    async_engine = db._get_async_engine()
+    assert async_engine is not None
+    assert async_engine is db._get_async_engine()
+    assert async_engine.url.drivername == "postgresql+psycopg"
+    assert get_async_pgvector(async_embedder)._get_async_engine() is not async_engine
+    # Copies share the engine, like the sync engine
+    assert deepcopy(db)._get_async_engine() is async_engine
+
+    await db.async_close()
+    assert db._async_engine is None
+    assert db._get_async_engine() is not async_engine
+    await db.async_close()
+
+
+def test_async_engine_of_a_previous_event_loop_is_replaced(async_embedder):
+    db = get_async_pgvector(async_embedder)
+
+    async def get_engine():
+        return db._get_async_engine()
+
+    first_engine = asyncio.run(get_engine())
+    second_engine = asyncio.run(get_engine())
+    assert second_engine is not first_engine
+    asyncio.run(db.async_close())
+
+
+@pytest.mark.asyncio
+async def test_async_hybrid_search_fuses_vector_and_keyword_rankings(async_embedder):
+    row = SimpleNamespace(
+        id="1", name="soup", meta_data={}, content="Tom Kha Gai", embedding=[0.1, 0.2, 0.3], usage=None
+    )
+    async_engine = FakeAsyncEngine(rows=[row])
+    db = get_async_pgvector(
+        async_embedder, async_db_engine=async_engine, search_type=SearchType.hybrid, fusion=FusionMethod.rrf
+    )
+
+    results = await db.async_search("soup", limit=3)
+
+    assert [doc.content for doc in results] == ["Tom Kha Gai"]
+    search_scores = results[0].meta_data["search_scores"]
+    assert search_scores["vector"]["rank"] == 1
+    assert search_scores["keyword"]["rank"] == 1
+    statements = [str(stmt) for stmt, _ in async_engine.connection.statements]
+    assert not any("hybrid_score" in statement for statement in statements)
+    # The keyword search only returns rows matching the query
+    assert any("@@" in statement for statement in statements)